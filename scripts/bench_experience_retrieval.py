@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from quant_eam.registry.experience_index import rebuild_experience_index
+from quant_eam.registry.experience_retrieval import ExperienceQuery, search_experience_cards
+
+WORDS = ["momentum", "crossover", "rsi", "meanrev", "breakout", "carry", "value", "buyhold", "pairs", "trend"]
+
+
+def _write_json(path: Path, obj: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _make_registry(root: Path, *, cards: int, dossiers: int) -> Path:
+    reg = root / "registry"
+    for i in range(dossiers):
+        _write_json(
+            root / "dossiers" / f"run{i:09d}" / "config_snapshot.json",
+            {"runspec": {"extensions": {"symbols": [f"S{i % 97:03d}", f"S{(i * 7) % 97:03d}"]}}},
+        )
+    for i in range(cards):
+        run_id = f"run{i % max(1, dossiers):09d}" if i < dossiers else f"run{i:09d}"
+        cdir = reg / "cards" / f"card_{i:09d}"
+        _write_json(
+            cdir / "card_v1.json",
+            {
+                "card_id": f"card_{i:09d}",
+                "title": f"{WORDS[i % 10]} {WORDS[(i // 10) % 10]} idea{i % 5000:04d}",
+                "status": "draft",
+                "primary_run_id": run_id,
+                "applicability": {"freq": "ohlcv_1d" if i % 2 else "ohlcv_1h"},
+                "extensions": {"tags": [WORDS[(i * 3) % 10]]},
+            },
+        )
+        ev = {"event_type": "PROMOTED", "new_status": "challenger"} if i % 500 == 0 else {"event_type": "CREATED", "notes": "synthetic"}
+        (cdir / "events.jsonl").write_text(json.dumps(ev) + "\n", encoding="utf-8")
+    return reg
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark experience retrieval: linear card scan vs inverted index.")
+    ap.add_argument("--cards", type=int, default=50_000)
+    ap.add_argument("--dossiers", type=int, default=2_000)
+    ap.add_argument("--repeat", type=int, default=5, help="indexed query repetitions")
+    args = ap.parse_args(argv)
+
+    queries = [
+        ExperienceQuery(query="pairs trend", top_k=10),
+        ExperienceQuery(query="break", symbols=["S005"], frequency="ohlcv_1h", top_k=10),
+        ExperienceQuery(query="idea4242", tags=["carry"], top_k=10),
+        ExperienceQuery(query="idea0042 S011", top_k=10),
+    ]
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        os.environ["EAM_ARTIFACT_ROOT"] = str(root)
+        t0 = time.perf_counter()
+        reg = _make_registry(root, cards=int(args.cards), dossiers=int(args.dossiers))
+        print(f"generated {args.cards} cards in {time.perf_counter() - t0:.1f}s")
+
+        t0 = time.perf_counter()
+        stats = rebuild_experience_index(reg)
+        print(f"index build: {time.perf_counter() - t0:.2f}s {stats}")
+
+        for q in queries:
+            t0 = time.perf_counter()
+            slow = search_experience_cards(q=q, reg_root=reg, use_index=False)
+            t_scan = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for _ in range(int(args.repeat)):
+                fast = search_experience_cards(q=q, reg_root=reg)
+            t_idx = (time.perf_counter() - t0) / max(1, int(args.repeat))
+            if fast != slow:
+                print(f"MISMATCH for query {q}", file=sys.stderr)
+                return 1
+            print(f"query={q.query!r:<16} scan={t_scan * 1000:9.1f}ms index={t_idx * 1000:8.2f}ms x{t_scan / max(t_idx, 1e-9):7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
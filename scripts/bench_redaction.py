@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from quant_eam.llm.redaction import sanitize_for_llm, sanitize_for_llm_reference
+
+
+def _evidence_pack(*, cards: int, rows: int) -> dict[str, object]:
+    data_root = os.getenv("EAM_DATA_ROOT", "/data")
+    art_root = os.getenv("EAM_ARTIFACT_ROOT", "/artifacts")
+    return {
+        "job_id": "job_bench",
+        "auth_token": "x" * 32,
+        "cards": [
+            {
+                "card_id": f"card_{i:06d}",
+                "title": f"momentum variant {i}",
+                "primary_run_id": f"run{i:09d}",
+                "dossier_path": f"{art_root}/dossiers/run{i:09d}",
+                "metrics": {"sharpe": 0.1 * (i % 17), "max_drawdown": -0.01 * (i % 9), "trade_count": i % 250},
+                "notes": "no paths in this sentence, only words " * 4,
+                "holdout_summary": {"pass": bool(i % 2)},
+            }
+            for i in range(cards)
+        ],
+        "rows": [
+            {"dt": f"2024-01-{1 + i % 28:02d}", "symbol": f"S{i % 97:03d}", "close": 100.0 + i, "source": f"{data_root}/lake/ohlcv_1d.csv"}
+            for i in range(rows)
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark LLM redaction: recursive reference vs compiled engine.")
+    ap.add_argument("--cards", type=int, default=200)
+    ap.add_argument("--rows", type=int, default=2_000)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    # Large limits so the whole pack is walked (defaults truncate lists at 50 items).
+    limits = {"max_list_items": 1_000_000, "max_dict_items": 1_000_000}
+    pack = _evidence_pack(cards=int(args.cards), rows=int(args.rows))
+    timings: dict[str, float] = {}
+    results = {}
+    for name, fn in (("reference", sanitize_for_llm_reference), ("compiled", sanitize_for_llm)):
+        t0 = time.perf_counter()
+        for _ in range(int(args.repeat)):
+            results[name] = fn(pack, **limits)
+        timings[name] = (time.perf_counter() - t0) / max(1, int(args.repeat))
+    if results["compiled"] != results["reference"]:
+        print("MISMATCH between compiled and reference redaction", file=sys.stderr)
+        return 1
+    ref, fast = timings["reference"], timings["compiled"]
+    print(f"cards={args.cards} rows={args.rows} reference={ref * 1000:8.2f}ms compiled={fast * 1000:8.2f}ms x{ref / max(fast, 1e-9):5.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,8 +3,16 @@ from __future__ import annotations
 
 import argparse
 import shutil
+import sys
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from quant_eam.llm.cassette import build_cassette_index, compact_cassette
+
 
 def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Promote a recorded cassette.jsonl into a deterministic fixtures location (Phase-28).")
@@ -12,6 +20,16 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--agent", required=True, help="agent id (e.g. intent_agent_v1)")
     ap.add_argument("--case", required=True, help="case name (e.g. ma_crossover_case)")
     ap.add_argument("--dest-root", default="tests/fixtures/cassettes", help="destination root (default: tests/fixtures/cassettes)")
+    ap.add_argument(
+        "--compact",
+        action="store_true",
+        help="keep only the first call per prompt_hash (replay results are unchanged)",
+    )
+    ap.add_argument(
+        "--index",
+        action="store_true",
+        help="write/refresh the prompt_hash -> byte offset sidecar index next to the destination",
+    )
     args = ap.parse_args(argv)
 
     src = Path(str(args.src)).resolve()
@@ -25,7 +43,12 @@ def main(argv: list[str] | None = None) -> int:
     dest_root = Path(str(args.dest_root))
     dest = dest_root / agent / case / "cassette.jsonl"
     dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest)
+    if bool(args.compact):
+        compact_cassette(src, dest, write_index=bool(args.index))
+    else:
+        shutil.copy2(src, dest)
+        if bool(args.index):
+            build_cassette_index(dest)
     print(dest.as_posix())
     return 0
 
@@ -15,6 +15,8 @@ from quant_eam.jobstore.llm_usage import (
     BudgetThresholds,
     UsageTotals,
     aggregate_totals,
+    budget_stop_reason,
+    canonical_json_chars,
     infer_job_id_from_agent_out_dir,
     load_llm_budget_policy,
     llm_usage_paths,
@@ -103,17 +105,7 @@ def _job_llm_budget_policy_path(job_id: str) -> str:
 
 
 def _budget_reason_from_would_exceed(w: dict[str, bool]) -> str:
-    # Stable priority order.
-    for k in (
-        "max_calls_per_job",
-        "max_prompt_chars_per_job",
-        "max_response_chars_per_job",
-        "max_wall_seconds_per_job",
-        "max_calls_per_agent_run",
-    ):
-        if w.get(k):
-            return f"exceeded_{k}"
-    return "budget_exceeded"
+    return budget_stop_reason(w)
 
 
 @dataclass(frozen=True)
@@ -1099,7 +1091,7 @@ def run_agent(
     # Job-level usage update (Phase-26) after a successful (non-blocked) agent run.
     if job_id and thresholds:
         prompt_chars = len(str(request_obj.get("system") or "")) + len(str(request_obj.get("user") or ""))
-        response_chars = len(json.dumps(response_bundle, sort_keys=True, separators=(",", ":"), ensure_ascii=True))
+        response_chars = canonical_json_chars(response_bundle)
         delta = UsageTotals(calls=1, prompt_chars=prompt_chars, response_chars=response_chars, wall_seconds=wall_s)
         totals2, _by, _sr = aggregate_totals(job_id=job_id, job_root=default_job_root())
         would_exceed_post = {
@@ -9,10 +9,12 @@ from typing import Any
 
 import pandas as pd
 
-from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid, run_adapter
+from quant_eam.backtest.scenario_batch import StressScenario, run_adapter_scenarios
+from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid
 from quant_eam.datacatalog.catalog import DataCatalog
 from quant_eam.policies.load import default_policies_dir, load_yaml
 from quant_eam.policies.resolve import load_policy_bundle
+from quant_eam.policies.store import policy_store
 
 
 class AttributionError(ValueError):
@@ -224,18 +226,20 @@ class RecomputeResult:
 
 
 def _find_bundle_path(policies_dir: Path, policy_bundle_id: str) -> Path:
-    for p in sorted([pp for pp in policies_dir.glob("policy_bundle*.y*ml") if pp.is_file()]):
-        doc = load_yaml(p)
+    store = policy_store()
+    for p in store.policy_files(policies_dir, "policy_bundle*.y*ml"):
+        doc = store.view(p)
         if isinstance(doc, dict) and str(doc.get("policy_bundle_id", "")).strip() == policy_bundle_id:
             return p
     raise AttributionError(f"policy_bundle_id not found in policies/: {policy_bundle_id!r}")
 
 
 def _load_policy_file_by_id(policies_dir: Path, policy_id: str) -> dict[str, Any]:
-    for p in sorted([pp for pp in policies_dir.glob("*.y*ml") if pp.is_file()]):
-        doc = load_yaml(p)
+    store = policy_store()
+    for p in store.policy_files(policies_dir):
+        doc = store.view(p)
         if isinstance(doc, dict) and str(doc.get("policy_id", "")).strip() == policy_id:
-            return doc
+            return load_yaml(p)
     raise AttributionError(f"policy_id not found in policies/: {policy_id!r}")
 
 
@@ -330,25 +334,20 @@ def _recompute_cost_sensitivity(
         out["params"] = params
         return out
 
+    # Gross (zero cost) and cost x2 share one prices alignment / signal compilation and one simulation pass.
     try:
-        gross = run_adapter(
+        gross_stats, x2_stats = run_adapter_scenarios(
             adapter_id=adapter_id,
             prices=prices,
-            lag_bars=lag_bars,
+            scenarios=[StressScenario(lag_bars=lag_bars, cost_multiplier=0.0), StressScenario(lag_bars=lag_bars, cost_multiplier=2.0)],
             execution_policy=execution_policy,
-            cost_policy=with_cost_bps(0.0),
+            cost_policy=with_cost_bps(1.0),
             signal_dsl=signal_dsl if isinstance(signal_dsl, dict) else None,
-        ).stats.get("total_return")
-        x2 = run_adapter(
-            adapter_id=adapter_id,
-            prices=prices,
-            lag_bars=lag_bars,
-            execution_policy=execution_policy,
-            cost_policy=with_cost_bps(2.0),
-            signal_dsl=signal_dsl if isinstance(signal_dsl, dict) else None,
-        ).stats.get("total_return")
+        )
     except BacktestInvalid as e:
         return RecomputeResult(gross_return=None, net_return_cost_x2=None, notes=f"recompute failed: {e}")
+    gross = gross_stats.get("total_return")
+    x2 = x2_stats.get("total_return")
 
     gross_f = float(gross) if isinstance(gross, (int, float)) else None
     x2_f = float(x2) if isinstance(x2, (int, float)) else None
@@ -6,10 +6,13 @@ from fastapi.staticfiles import StaticFiles
 from quant_eam.core.version import version_payload
 from quant_eam.api.read_only_api import router as read_only_router
 from quant_eam.api.jobs_api import router as jobs_router
+from quant_eam.api.metrics import RequestTimingMiddleware
+from quant_eam.api.metrics import router as metrics_router
 from quant_eam.api.snapshots_api import router as snapshots_router
 from quant_eam.api.ui_routes import router as ui_router
 
 app = FastAPI(title="quant-eam")
+app.add_middleware(RequestTimingMiddleware)
 
 
 @app.get("/healthz")
@@ -27,6 +30,8 @@ app.include_router(read_only_router)
 app.include_router(jobs_router)
 app.include_router(snapshots_router)
 app.include_router(ui_router)
+# Prometheus text metrics (spans/counters populated with EAM_TIMINGS=1).
+app.include_router(metrics_router)
 
 # Static assets for UI (no external CDN).
 _static_dir = (__import__("pathlib").Path(__file__).resolve().parents[1] / "ui" / "static")
@@ -0,0 +1,122 @@
+"""Server-side downsampling of dossier equity curves for chart endpoints.
+
+- `lttb`: Largest-Triangle-Three-Buckets. Keeps the first and last rows, plus one row per bucket that
+  maximizes the triangle area with the previously kept row and the next bucket's mean. Bucket means are
+  precomputed with cumulative sums; each bucket's choice is one vectorized argmax.
+- `minmax`: keeps the first and last rows, plus the min and max equity rows of each bucket. Selected
+  with one lexsort over (bucket, equity); no per-row Python loop. With room for a single inner row
+  (`max_points == 3`) it keeps the row farthest from the mean of the endpoints.
+
+x is the dt as epoch seconds when every dt parses, otherwise the row position.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+MIN_POINTS = 3
+ORIGINAL_ROWS_HEADER = "X-Original-Row-Count"
+
+
+def _x_values(dt: pd.Series) -> np.ndarray:
+    parsed = pd.to_datetime(dt, errors="coerce", utc=True)
+    if len(parsed) and not parsed.isna().any():
+        # Unit-independent (pandas may parse to s/ms/us/ns resolution).
+        return ((parsed - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)).to_numpy(dtype=float)
+    return np.arange(len(dt), dtype=float)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Row indices kept by LTTB (sorted, includes first and last)."""
+    n = len(y)
+    if max_points >= n or max_points < MIN_POINTS:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    every = (n - 2) / (max_points - 2)
+    k = np.arange(max_points - 2)
+    lo = (np.floor(k * every) + 1).astype(np.int64)  # bucket k: rows [lo, hi)
+    hi = np.minimum((np.floor((k + 1) * every) + 1).astype(np.int64), n - 1)
+    # Mean of the *next* bucket (the last bucket looks ahead to the final row).
+    nxt_lo = hi
+    nxt_hi = np.minimum((np.floor((k + 2) * every) + 1).astype(np.int64), n)
+    cx = np.concatenate([[0.0], np.cumsum(x)])
+    cy = np.concatenate([[0.0], np.cumsum(y)])
+    cnt = np.maximum(nxt_hi - nxt_lo, 1)
+    avg_x = (cx[nxt_hi] - cx[nxt_lo]) / cnt
+    avg_y = (cy[nxt_hi] - cy[nxt_lo]) / cnt
+
+    out = np.empty(max_points, dtype=np.int64)
+    out[0] = 0
+    a = 0
+    for i in range(max_points - 2):
+        xs = x[lo[i] : hi[i]]
+        ys = y[lo[i] : hi[i]]
+        area = np.abs((x[a] - avg_x[i]) * (ys - y[a]) - (x[a] - xs) * (avg_y[i] - y[a]))
+        a = int(lo[i] + int(np.argmax(area))) if len(area) else int(lo[i])
+        out[i + 1] = a
+    out[-1] = n - 1
+    return np.unique(out)
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """Row indices kept by min/max bucketing (sorted, includes first and last, at most `max_points`)."""
+    n = len(y)
+    if max_points >= n or max_points < MIN_POINTS:
+        return np.arange(n)
+    buckets = (max_points - 2) // 2
+    if buckets == 0:
+        # One inner slot: the min/max pair of a single bucket would exceed the cap.
+        yf = np.asarray(y, dtype=float)
+        j = 1 + int(np.argmax(np.abs(yf[1:-1] - (yf[0] + yf[-1]) / 2.0)))
+        return np.array([0, j, n - 1], dtype=np.int64)
+    inner = np.arange(1, n - 1)
+    bucket = (inner - 1) * buckets // max(1, n - 2)
+    yi = np.asarray(y, dtype=float)[inner]
+    order = np.lexsort((yi, bucket))  # by bucket, then equity ascending
+    b_sorted = bucket[order]
+    first = np.flatnonzero(np.r_[True, b_sorted[1:] != b_sorted[:-1]])
+    last = np.r_[first[1:] - 1, len(order) - 1]
+    keep = np.concatenate([[0, n - 1], inner[order[first]], inner[order[last]]])
+    return np.unique(keep)
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, *, max_points: int, method: str) -> np.ndarray:
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"unsupported method: {method!r} (supported: {', '.join(DOWNSAMPLE_METHODS)})")
+    # NaN equity never wins a bucket: treat it as the previous valid value for selection only.
+    y_sel = pd.Series(np.asarray(y, dtype=float)).ffill().fillna(0.0).to_numpy()
+    if method == "lttb":
+        return lttb_indices(x, y_sel, max_points)
+    return minmax_indices(y_sel, max_points)
+
+
+def _typed(v: Any) -> float | None:
+    f = float(v)
+    return f if math.isfinite(f) else None
+
+
+def read_curve_downsampled(path: Path, *, max_points: int, method: str = "lttb") -> tuple[list[dict[str, Any]], int]:
+    """Downsampled curve rows with numeric `equity` (float/None) plus the original row count.
+
+    Other columns are passed through as strings, like the undownsampled endpoint.
+    """
+    if int(max_points) < MIN_POINTS:
+        raise ValueError(f"max_points must be >= {MIN_POINTS}")
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    n = len(df)
+    if "equity" not in df.columns or "dt" not in df.columns:
+        raise ValueError("curve.csv must have columns: dt,equity")
+    equity = pd.to_numeric(df["equity"], errors="coerce").to_numpy(dtype=float)
+    idx = downsample_indices(_x_values(df["dt"]), equity, max_points=int(max_points), method=method)
+    sub = df.iloc[idx]
+    rows = sub.to_dict(orient="records")
+    for row, v in zip(rows, equity[idx].tolist()):
+        row["equity"] = _typed(v)
+    return rows, n
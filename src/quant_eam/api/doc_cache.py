@@ -0,0 +1,126 @@
+"""Parse-once cache for the governance markdown rendered by the UI (Whole View Framework, Playbook).
+
+The UI extractors in `ui_routes` are pure functions of one markdown file. This module
+
+- parses each file once into a `MarkdownDoc` (lines + heading tree), and
+- memoizes extractor outputs (`doc_cached`),
+
+both keyed by (absolute path, mtime_ns, size): editing the file changes the key, so the next request
+re-parses it. Cached extractor results are deep-copied on the way out because page handlers decorate
+the returned rows in place.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from quant_eam.core.lru_cache import LRUCache
+
+DEFAULT_MAX_ENTRIES = 512
+
+DocKey = tuple[str, int, int]
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Heading:
+    level: int  # number of leading '#'
+    title: str  # heading text without the '#' marker
+    line: int  # index into MarkdownDoc.lines
+
+
+@dataclass(frozen=True)
+class MarkdownDoc:
+    lines: tuple[str, ...]  # str.splitlines() of the file
+    headings: tuple[Heading, ...]  # in document order
+
+    def find_heading(self, level: int, contains: str) -> Heading | None:
+        """First heading of exactly `level` whose stripped line contains `contains`."""
+        for h in self.headings:
+            if h.level == level and contains in self.lines[h.line].strip():
+                return h
+        return None
+
+
+def _parse_headings(lines: tuple[str, ...]) -> tuple[Heading, ...]:
+    out: list[Heading] = []
+    for i, raw in enumerate(lines):
+        line = raw.strip()
+        if not line.startswith("#"):
+            continue
+        level = len(line) - len(line.lstrip("#"))
+        if line[level : level + 1] != " ":
+            continue
+        out.append(Heading(level=level, title=line[level + 1 :].strip(), line=i))
+    return tuple(out)
+
+
+def doc_key(path: Path) -> DocKey | None:
+    """(absolute path, mtime_ns, size), or None when `path` is not a regular file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not Path(path).is_file():
+        return None
+    return os.path.abspath(os.fspath(path)), int(st.st_mtime_ns), int(st.st_size)
+
+
+_DOCS = LRUCache(64)
+_RESULTS = LRUCache(DEFAULT_MAX_ENTRIES)
+
+
+def load_markdown_doc(path: Path) -> MarkdownDoc | None:
+    """Parsed document for `path` (None when it is not a file); re-parsed only when the file changes."""
+    key = doc_key(path)
+    if key is None:
+        return None
+    hit, doc = _DOCS.get(key)
+    if hit:
+        return doc
+    lines = tuple(Path(path).read_text(encoding="utf-8").splitlines())
+    doc = MarkdownDoc(lines=lines, headings=_parse_headings(lines))
+    _DOCS.put(key, doc)
+    return doc
+
+
+def markdown_lines(path: Path) -> list[str]:
+    """`path.read_text(encoding="utf-8").splitlines()`, served from the parsed-document cache."""
+    doc = load_markdown_doc(path)
+    if doc is None:
+        # Same error as reading the file directly.
+        return Path(path).read_text(encoding="utf-8").splitlines()
+    return list(doc.lines)
+
+
+def doc_cached(fn: Callable[..., T]) -> Callable[..., T]:
+    """Memoize an extractor `fn(path, *args)` per (document key, args); callers get a deep copy."""
+
+    @functools.wraps(fn)
+    def wrapper(path: Path, *args: Any) -> T:
+        key = doc_key(path)
+        if key is None:
+            return fn(path, *args)
+        ckey = (fn.__qualname__, key, args)
+        hit, value = _RESULTS.get(ckey)
+        if not hit:
+            value = fn(path, *args)
+            _RESULTS.put(ckey, value)
+        return copy.deepcopy(value)
+
+    return wrapper
+
+
+def clear_doc_cache() -> None:
+    _DOCS.clear()
+    _RESULTS.clear()
+
+
+def doc_cache_stats() -> dict[str, int]:
+    return {"doc_hits": _DOCS.hits, "doc_misses": _DOCS.misses, "result_hits": _RESULTS.hits, "result_misses": _RESULTS.misses}
@@ -0,0 +1,185 @@
+"""Execution model for heavy API/UI handlers: bounded executor, per-route admission limits, timeouts.
+
+Plain `def` routes run on Starlette's shared threadpool, so a few slow pandas/file-I/O handlers can starve
+cheap polling endpoints, and heavy work inside `async def` routes blocks the event loop. Handlers marked
+`@heavy_route(...)` (or `await run_heavy(...)` from async handlers) instead:
+
+- run on a dedicated, bounded executor (`EAM_API_HEAVY_WORKERS`, default min(8, cpu count));
+- are admitted only while the route has fewer than `max_concurrent` requests in flight
+  (`EAM_API_HEAVY_CONCURRENCY`, default 4). Over the limit the request is rejected at once with
+  `503` and `Retry-After` (`EAM_API_RETRY_AFTER_S`, default 1);
+- time out after `EAM_API_HEAVY_TIMEOUT_S` seconds (default 30) with `504`. A timed-out call keeps its
+  admission slot until its thread finishes, so runaway work applies backpressure instead of piling up.
+  Mutating handlers pass `timeout_s=None`: their work cannot be cancelled, so a 504 would report failure
+  for work that still completes (and a client retry would duplicate it).
+
+The request's contextvars are copied into the worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import enum
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+
+DEFAULT_HEAVY_WORKERS = 8
+DEFAULT_HEAVY_CONCURRENCY = 4
+DEFAULT_HEAVY_TIMEOUT_S = 30.0
+DEFAULT_RETRY_AFTER_S = 1
+
+T = TypeVar("T")
+
+
+class _Default(enum.Enum):
+    ENV = "env"
+
+
+# `timeout_s` default: read EAM_API_HEAVY_TIMEOUT_S (None disables the timeout).
+ENV_TIMEOUT = _Default.ENV
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "")).strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = str(os.getenv(name, "")).strip()
+    if not raw:
+        return default
+    try:
+        v = float(raw)
+    except ValueError:
+        return default
+    return v if v > 0 else default
+
+
+def heavy_workers_from_env() -> int:
+    return _env_int("EAM_API_HEAVY_WORKERS", min(DEFAULT_HEAVY_WORKERS, os.cpu_count() or 1))
+
+
+@dataclass
+class _RouteState:
+    in_flight: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+
+
+_LOCK = threading.Lock()
+_ROUTES: dict[str, _RouteState] = {}
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=heavy_workers_from_env(), thread_name_prefix="api-heavy")
+        return _EXECUTOR
+
+
+def reset_heavy_executor() -> None:
+    """Drop the executor and counters (the next heavy call re-reads the environment)."""
+    global _EXECUTOR
+    with _LOCK:
+        ex, _EXECUTOR = _EXECUTOR, None
+        _ROUTES.clear()
+    if ex is not None:
+        ex.shutdown(wait=False)
+
+
+def heavy_stats() -> dict[str, dict[str, int]]:
+    with _LOCK:
+        return {k: dict(vars(v)) for k, v in _ROUTES.items()}
+
+
+def _try_admit(route: str, max_concurrent: int) -> bool:
+    with _LOCK:
+        st = _ROUTES.setdefault(route, _RouteState())
+        if st.in_flight >= max_concurrent:
+            st.rejected += 1
+            return False
+        st.in_flight += 1
+        st.admitted += 1
+        return True
+
+
+def _release(route: str) -> None:
+    with _LOCK:
+        st = _ROUTES.get(route)
+        if st is not None and st.in_flight > 0:
+            st.in_flight -= 1
+
+
+async def run_heavy(
+    route: str,
+    fn: Callable[..., T],
+    /,
+    *args: Any,
+    max_concurrent: int | None = None,
+    timeout_s: float | None | _Default = ENV_TIMEOUT,
+    **kwargs: Any,
+) -> T:
+    """Run `fn(*args, **kwargs)` on the heavy executor under `route`'s admission limit and timeout.
+
+    `timeout_s=None` waits for the work to finish (use it for handlers that write state).
+    """
+    limit = int(max_concurrent) if max_concurrent is not None else _env_int("EAM_API_HEAVY_CONCURRENCY", DEFAULT_HEAVY_CONCURRENCY)
+    if timeout_s is ENV_TIMEOUT:
+        timeout: float | None = _env_float("EAM_API_HEAVY_TIMEOUT_S", DEFAULT_HEAVY_TIMEOUT_S)
+    else:
+        timeout = None if timeout_s is None else float(timeout_s)
+    if not _try_admit(route, limit):
+        retry_after = _env_int("EAM_API_RETRY_AFTER_S", DEFAULT_RETRY_AFTER_S)
+        raise HTTPException(
+            status_code=503,
+            detail=f"{route}: too many concurrent requests (limit {limit}); retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
+    ctx = contextvars.copy_context()
+    try:
+        fut = _executor().submit(ctx.run, functools.partial(fn, *args, **kwargs))
+    except BaseException:
+        _release(route)
+        raise
+    # The slot is held until the work itself finishes, even when the client already got a 504.
+    fut.add_done_callback(lambda _f: _release(route))
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(fut), timeout=timeout)
+    except TimeoutError:
+        with _LOCK:
+            _ROUTES.setdefault(route, _RouteState()).timed_out += 1
+        raise HTTPException(status_code=504, detail=f"{route}: timed out after {timeout:g}s") from None
+
+
+def heavy_route(
+    route: str,
+    *,
+    max_concurrent: int | None = None,
+    timeout_s: float | None | _Default = ENV_TIMEOUT,
+) -> Callable[[Callable[..., T]], Callable[..., Any]]:
+    """Turn a sync route handler into an async one that runs through `run_heavy` (signature preserved)."""
+
+    def deco(fn: Callable[..., T]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await run_heavy(route, fn, *args, max_concurrent=max_concurrent, timeout_s=timeout_s, **kwargs)
+
+        return wrapper
+
+    return deco
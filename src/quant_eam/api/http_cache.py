@@ -0,0 +1,234 @@
+"""Conditional GET (ETag / If-None-Match / Last-Modified) for dossier-backed API and UI responses.
+
+A response's validator is derived without reading its payload:
+
+- artifacts listed in `dossier_manifest.json` `hashes` contribute their recorded sha256 (the manifest
+  itself is parsed once per file version);
+- any other file (`gate_results.json`, diagnostics, index files, the manifest) contributes its stat
+  (size, mtime_ns), or `-` when missing;
+- files outside the dossier that the response also reads (e.g. the data snapshot behind candle charts)
+  contribute their absolute path and stat.
+
+Tree listings are cached per directory tree and reused while the mtime of every directory in it is
+unchanged (adding, removing or renaming an entry changes its parent directory's mtime).
+
+The strong ETag is a sha256 over the route name, the query parameters and those tokens. When every
+token is a manifest hash the payload is content-addressed (dossiers are append-only), so the response
+gets a long immutable `Cache-Control`; otherwise clients must revalidate (`no-cache`), which costs a
+stat per file and a 304.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request, Response
+
+from quant_eam.api.doc_cache import doc_key
+from quant_eam.core.lru_cache import LRUCache
+from quant_eam.core.version import version_payload
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+_MANIFESTS = LRUCache(256)
+_TREES = LRUCache(256)
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str  # quoted strong ETag
+    last_modified: float | None  # newest mtime (epoch seconds) of the files involved
+    immutable: bool  # every part is a manifest-hashed (content-addressed) artifact
+
+    def headers(self) -> dict[str, str]:
+        h = {
+            "ETag": self.etag,
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if self.immutable else REVALIDATE_CACHE_CONTROL,
+        }
+        if self.last_modified is not None:
+            h["Last-Modified"] = format_datetime(datetime.fromtimestamp(int(self.last_modified), tz=UTC), usegmt=True)
+        return h
+
+
+def _manifest_fields(dossier_dir: Path) -> tuple[dict[str, str], str]:
+    p = Path(dossier_dir) / "dossier_manifest.json"
+    key = doc_key(p)
+    if key is None:
+        return {}, ""
+    hit, fields = _MANIFESTS.get(key)
+    if hit:
+        return fields
+    try:
+        doc = json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        doc = None
+    raw = doc.get("hashes") if isinstance(doc, dict) else None
+    hashes = {str(k): str(v) for k, v in raw.items() if isinstance(v, str)} if isinstance(raw, dict) else {}
+    sid = doc.get("data_snapshot_id") if isinstance(doc, dict) else None
+    fields = (hashes, sid.strip() if isinstance(sid, str) else "")
+    _MANIFESTS.put(key, fields)
+    return fields
+
+
+def manifest_hashes(dossier_dir: Path) -> dict[str, str]:
+    """`hashes` of the dossier manifest (rel path -> sha256); {} when missing or unreadable."""
+    return _manifest_fields(dossier_dir)[0]
+
+
+def manifest_snapshot_id(dossier_dir: Path) -> str:
+    """`data_snapshot_id` of the dossier manifest; "" when missing or unreadable."""
+    return _manifest_fields(dossier_dir)[1]
+
+
+def _tree_files(root: Path) -> list[str]:
+    """Sorted posix paths, relative to `root`, of the files under it (symlinked dirs are not entered)."""
+    key = os.path.abspath(root)
+    hit, cached = _TREES.get(key)
+    if hit:
+        dirs, files = cached
+        try:
+            if all(os.stat(dp).st_mtime_ns == mt for dp, mt in dirs):
+                return files
+        except OSError:
+            pass
+    dirs: list[tuple[str, int]] = []
+    files = []
+    stack = [key]
+    while stack:
+        dp = stack.pop()
+        # Stat before listing: an entry added meanwhile leaves a newer mtime, so the cache entry goes stale.
+        dirs.append((dp, os.stat(dp).st_mtime_ns))
+        with os.scandir(dp) as it:
+            for e in it:
+                if e.is_dir():
+                    if not e.is_symlink():
+                        stack.append(e.path)
+                else:
+                    files.append(Path(os.path.relpath(e.path, key)).as_posix())
+    files.sort()
+    _TREES.put(key, (dirs, files))
+    return files
+
+
+class _Collector:
+    def __init__(self, dossier_dir: Path) -> None:
+        self.dossier_dir = Path(dossier_dir)
+        self.hashes = manifest_hashes(dossier_dir)
+        self.parts: list[str] = []
+        self.last_modified: float | None = None
+        self.immutable = True
+
+    def add_file(self, rel: str) -> None:
+        rel = Path(rel).as_posix()
+        try:
+            st = os.stat(self.dossier_dir / rel)
+        except OSError:
+            self.parts.append(f"{rel}:-")
+            self.immutable = False
+            return
+        self.last_modified = max(self.last_modified or 0.0, st.st_mtime)
+        sha = self.hashes.get(rel)
+        if sha is not None:
+            self.parts.append(f"{rel}:sha256:{sha}")
+        else:
+            self.parts.append(f"{rel}:stat:{st.st_size}:{st.st_mtime_ns}")
+            self.immutable = False
+
+    def add_tree(self, rel: str) -> None:
+        root = self.dossier_dir / rel
+        if not root.is_dir():
+            self.parts.append(f"{Path(rel).as_posix()}/:-")
+            self.immutable = False
+            return
+        try:
+            found = [(Path(rel) / f).as_posix() for f in _tree_files(root)]
+        except OSError:
+            found = []
+        for f in found:
+            self.add_file(f)
+        # Files can be added to a tree later: its listing is never content-addressed.
+        self.immutable = False
+
+    def add_external(self, path: Path) -> None:
+        p = Path(path).absolute().as_posix()
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.parts.append(f"ext:{p}:-")
+        else:
+            self.last_modified = max(self.last_modified or 0.0, st.st_mtime)
+            self.parts.append(f"ext:{p}:stat:{st.st_size}:{st.st_mtime_ns}")
+        self.immutable = False
+
+
+def dossier_validators(
+    dossier_dir: Path,
+    *,
+    route: str,
+    files: Iterable[str] = (),
+    trees: Iterable[str] = (),
+    external: Iterable[Path] = (),
+    params: dict[str, Any] | None = None,
+) -> Validators:
+    """Validators for a response built from `files` (and every file under `trees`) of one dossier,
+    plus `external` files read from outside it."""
+    c = _Collector(dossier_dir)
+    for rel in files:
+        c.add_file(rel)
+    for rel in trees:
+        c.add_tree(rel)
+    for p in external:
+        c.add_external(p)
+    h = hashlib.sha256()
+    # The code version is part of the key: a deploy may change how the same files are rendered.
+    head = {"route": route, "params": params or {}, "version": version_payload()}
+    h.update(json.dumps(head, sort_keys=True, default=str).encode("utf-8"))
+    for part in c.parts:
+        h.update(b"\n" + part.encode("utf-8"))
+    return Validators(etag=f'"{h.hexdigest()[:32]}"', last_modified=c.last_modified, immutable=c.immutable)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison: ignore W/ prefixes.
+    want = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == want for tag in header.split(","))
+
+
+def is_not_modified(request: Request, v: Validators) -> bool:
+    """RFC 9110 evaluation order: If-None-Match wins; If-Modified-Since only applies without it."""
+    inm = request.headers.get("if-none-match")
+    if inm is not None:
+        return _etag_matches(inm, v.etag)
+    ims = request.headers.get("if-modified-since")
+    if ims and v.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(ims)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return int(v.last_modified) <= since.timestamp()
+    return False
+
+
+def not_modified_response(v: Validators) -> Response:
+    return Response(status_code=304, headers=v.headers())
+
+
+def conditional(request: Request, response: Response, v: Validators) -> Response | None:
+    """304 response when the client copy is current; else set the validators on `response` and return None."""
+    if is_not_modified(request, v):
+        return not_modified_response(v)
+    response.headers.update(v.headers())
+    return None
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
 
+from quant_eam.api.execution import heavy_route
 from quant_eam.api.roots import dossiers_root
 from quant_eam.api.security import enforce_write_auth, require_child_dir, require_safe_id, require_safe_job_id
 from quant_eam.contracts import validate as contracts_validate
@@ -18,7 +19,6 @@ from quant_eam.jobstore.store import (
     create_job_from_ideaspec,
     default_job_root,
     job_paths,
-    list_job_ids,
     load_job_events,
     load_job_spec,
     spawn_child_job_from_proposal,
@@ -26,6 +26,7 @@ from quant_eam.jobstore.store import (
     write_outputs_index,
     BudgetExceeded,
 )
+from quant_eam.jobstore.summary import JOB_SORT_KEYS, list_job_summaries
 
 router = APIRouter()
 
@@ -723,6 +724,7 @@ def spawn_best(request: Request, job_id: str) -> dict[str, Any]:
 
 
 @router.get("/jobs/{job_id}/sweep/leaderboard")
+@heavy_route("sweep_leaderboard")
 def get_sweep_leaderboard(job_id: str) -> dict[str, Any]:
     job_id = require_safe_job_id(job_id)
     paths = job_paths(job_id, job_root=_job_root())
@@ -736,26 +738,40 @@ def get_sweep_leaderboard(job_id: str) -> dict[str, Any]:
     return {"job_id": job_id, "leaderboard": doc}
 
 
+MAX_JOBS_PAGE_LIMIT = 500
+
+
 @router.get("/jobs")
-def list_jobs() -> dict[str, Any]:
+def list_jobs(limit: int | None = None, offset: int = 0, state: str | None = None, sort: str = "job_id") -> dict[str, Any]:
+    """Job summaries. The state is the last event's type, read from the tail of events.jsonl.
+
+    `state` is a comma list filter; `sort` is `job_id` (default) or `updated` (newest first).
+    Without `limit`, every matching job is returned.
+    """
+    if sort not in JOB_SORT_KEYS:
+        raise HTTPException(status_code=422, detail=f"sort must be one of: {', '.join(JOB_SORT_KEYS)}")
+    if limit is not None:
+        limit = max(1, min(MAX_JOBS_PAGE_LIMIT, int(limit)))
+    offset = max(0, int(offset))
+    states = [x.strip() for x in state.split(",") if x.strip()] if state else None
+    page, total = list_job_summaries(job_root=_job_root(), states=states, sort=sort, offset=offset, limit=limit)
     out: list[dict[str, Any]] = []
-    for jid in list_job_ids(job_root=_job_root()):
-        try:
-            spec = load_job_spec(jid, job_root=_job_root())
-            events = load_job_events(jid, job_root=_job_root())
-        except Exception:
-            continue
-        state = str(events[-1].get("event_type")) if events else "unknown"
-        schema_version = spec.get("schema_version") if isinstance(spec, dict) else None
-        if schema_version == "job_spec_v1":
-            bp = spec.get("blueprint") if isinstance(spec, dict) else {}
-            bp_id = bp.get("blueprint_id") if isinstance(bp, dict) else None
-            title = bp.get("title") if isinstance(bp, dict) else None
-        else:
-            bp_id = spec.get("title") if isinstance(spec, dict) else None
-            title = spec.get("title") if isinstance(spec, dict) else None
-        out.append({"job_id": jid, "state": state, "schema_version": schema_version, "blueprint_id": bp_id, "title": title})
-    return {"jobs": out}
+    for js in page:
+        # Non-v1 (idea) jobs historically report their title as blueprint_id here.
+        bp_id = js.blueprint_id if js.schema_version == "job_spec_v1" else js.title
+        out.append(
+            {
+                "job_id": js.job_id,
+                "state": js.state,
+                "schema_version": js.schema_version,
+                "blueprint_id": bp_id,
+                "title": js.title,
+                "updated_at": datetime.fromtimestamp(js.updated_at_ns / 1e9, tz=UTC).isoformat(),
+            }
+        )
+    # A page may skip unreadable jobs, so the next page starts after the requested window.
+    end = total if limit is None else min(total, offset + limit)
+    return {"jobs": out, "total": total, "offset": offset, "limit": limit, "next_offset": end if end < total else None}
 
 
 @router.get("/jobs/{job_id}")
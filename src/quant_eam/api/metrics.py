@@ -0,0 +1,63 @@
+"""Prometheus-text `/metrics` endpoint and per-request timing middleware.
+
+`/metrics` always answers. Spans and counters (`core.timing`) are only populated when `EAM_TIMINGS=1`;
+heavy-route admission counters (`api.execution`) are always exported.
+With timings enabled, `RequestTimingMiddleware` records one `http <METHOD> <route template>` span per
+request (route templates keep the label set bounded).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from quant_eam.api.execution import heavy_stats
+from quant_eam.core.timing import record_span, render_prometheus, timings_enabled
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+class RequestTimingMiddleware:
+    """Pure ASGI middleware (no response buffering); a pass-through while timings are disabled."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope.get("type") != "http" or not timings_enabled():
+            await self.app(scope, receive, send)
+            return
+        # Starlette's router stores the matched route in the shared scope; the name is resolved afterwards.
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            await self.app(scope, receive, send)
+            ok = True
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            record_span(f"http {scope.get('method', '')} {route}", time.perf_counter() - t0, ok=ok)
+
+
+def _render_heavy_stats(prefix: str = "eam") -> str:
+    stats = sorted(heavy_stats().items())
+    lines: list[str] = []
+    for field, kind, help_text in (
+        ("in_flight", "gauge", "Heavy-route requests currently holding an admission slot."),
+        ("admitted", "counter", "Heavy-route requests admitted."),
+        ("rejected", "counter", "Heavy-route requests rejected with 503."),
+        ("timed_out", "counter", "Heavy-route requests answered with 504."),
+    ):
+        name = f"{prefix}_api_heavy_{field}" + ("_total" if kind == "counter" else "")
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        lines += [f'{name}{{route="{route}"}} {int(st[field])}' for route, st in stats]
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_prometheus() + _render_heavy_stats(), media_type=PROMETHEUS_CONTENT_TYPE)
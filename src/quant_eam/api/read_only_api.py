@@ -2,22 +2,39 @@ from __future__ import annotations
 
 import csv
 import json
+import zlib
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
+from quant_eam.api.curve_downsample import DOWNSAMPLE_METHODS, MIN_POINTS, ORIGINAL_ROWS_HEADER, read_curve_downsampled
+from quant_eam.api.execution import heavy_route
+from quant_eam.api.http_cache import conditional, dossier_validators
 from quant_eam.api.roots import dossiers_root, registry_root
 from quant_eam.api.security import require_child_dir, require_safe_id
+from quant_eam.api.table_index import (
+    TABLE_FORMATS,
+    iter_csv_chunks,
+    iter_row_dicts,
+    load_table_index,
+    parse_dt_bound,
+)
 from quant_eam.index.reader import list_jobs_from_index, list_runs_from_index
 from quant_eam.registry.experience_retrieval import ExperienceQuery, build_experience_pack_payload
 from quant_eam.registry.cards import list_cards as reg_list_cards
 from quant_eam.registry.cards import show_card as reg_show_card
 from quant_eam.registry.storage import registry_paths
+from quant_eam.registry.triallog import list_trials_page
 from quant_eam.registry.triallog import record_trial as _unused_record_trial  # noqa: F401
 
 router = APIRouter()
 
+MAX_TABLE_PAGE_LIMIT = 5000
+_NDJSON_BATCH_ROWS = 500
+
 
 def _load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
@@ -66,6 +83,7 @@ def index_jobs(limit: int = 50) -> dict[str, Any]:
 
 
 @router.get("/experience/search")
+@heavy_route("experience_search")
 def experience_search(q: str = "", symbols: str | None = None, frequency: str | None = None, tags: str | None = None, k: int = 5) -> dict[str, Any]:
     """Deterministic experience retrieval over registry cards (no embeddings)."""
     sym_list = [s.strip() for s in (symbols or "").split(",") if s.strip()] if symbols else []
@@ -76,7 +94,7 @@ def experience_search(q: str = "", symbols: str | None = None, frequency: str |
 
 
 @router.get("/runs/{run_id}")
-def get_run(run_id: str) -> dict[str, Any]:
+def get_run(run_id: str, request: Request, response: Response) -> Any:
     run_id = require_safe_id(run_id, kind="run_id")
     d = require_child_dir(dossiers_root(), run_id)
     if not d.is_dir():
@@ -88,6 +106,10 @@ def get_run(run_id: str) -> dict[str, Any]:
 
     _require_file(man_p)
     _require_file(met_p)
+    v = dossier_validators(d, route="run", files=[man_p.name, met_p.name, gate_p.name])
+    not_modified = conditional(request, response, v)
+    if not_modified is not None:
+        return not_modified
     dossier_manifest = _load_json(man_p)
     metrics = _load_json(met_p)
 
@@ -118,29 +140,197 @@ def get_run(run_id: str) -> dict[str, Any]:
 
 
 @router.get("/runs/{run_id}/curve")
-def get_curve(run_id: str) -> dict[str, Any]:
+def get_curve(run_id: str, request: Request, response: Response, max_points: int | None = None, method: str = "lttb") -> Any:
+    """Curve rows as stored (strings). With `max_points`, rows are downsampled server-side (`method`:
+    lttb|minmax), `equity` is numeric and the original row count is in the X-Original-Row-Count header."""
     run_id = require_safe_id(run_id, kind="run_id")
     d = require_child_dir(dossiers_root(), run_id)
     p = d / "curve.csv"
     _require_file(p)
-    return {"run_id": run_id, "rows": _read_csv_rows(p)}
+    v = dossier_validators(d, route="curve", files=[p.name], params={"max_points": max_points, "method": method})
+    not_modified = conditional(request, response, v)
+    if not_modified is not None:
+        return not_modified
+    if max_points is None:
+        return {"run_id": run_id, "rows": _read_csv_rows(p)}
+
+    if method not in DOWNSAMPLE_METHODS:
+        raise HTTPException(status_code=422, detail=f"method must be one of: {', '.join(DOWNSAMPLE_METHODS)}")
+    if int(max_points) < MIN_POINTS:
+        raise HTTPException(status_code=422, detail=f"max_points must be >= {MIN_POINTS}")
+    try:
+        rows, original_rows = read_curve_downsampled(p, max_points=int(max_points), method=method)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    response.headers[ORIGINAL_ROWS_HEADER] = str(original_rows)
+    return {
+        "run_id": run_id,
+        "rows": rows,
+        "downsample": {"method": method, "max_points": int(max_points), "original_rows": original_rows, "returned_rows": len(rows)},
+    }
 
 
-@router.get("/runs/{run_id}/trades")
-def get_trades(run_id: str) -> dict[str, Any]:
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    z = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        out = z.compress(chunk)
+        if out:
+            yield out
+    yield z.flush()
+
+
+def _ndjson_chunks(rows: Iterator[dict[str, Any]]) -> Iterator[bytes]:
+    batch: list[str] = []
+    for row in rows:
+        batch.append(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        if len(batch) >= _NDJSON_BATCH_ROWS:
+            yield ("\n".join(batch) + "\n").encode("utf-8")
+            batch = []
+    if batch:
+        yield ("\n".join(batch) + "\n").encode("utf-8")
+
+
+def _table_response(
+    *,
+    run_id: str,
+    filename: str,
+    request: Request,
+    response: Response,
+    offset: int,
+    limit: int | None,
+    symbol: str | None,
+    dt_from: str | None,
+    dt_to: str | None,
+    format: str,
+) -> Any:
+    """Page / filter / stream one dossier CSV table through its row-offset index (`api/table_index.py`).
+
+    JSON (default) returns `rows` plus `total` (matching rows), `offset`, `limit` and `next_offset`
+    (None on the last page); without `limit` every matching row is returned, as before. `ndjson` and
+    `csv` stream the matching rows (gzip-encoded when the client accepts it).
+    """
     run_id = require_safe_id(run_id, kind="run_id")
     d = require_child_dir(dossiers_root(), run_id)
-    p = d / "trades.csv"
+    p = d / filename
     _require_file(p)
-    return {"run_id": run_id, "rows": _read_csv_rows(p)}
+    if format not in TABLE_FORMATS:
+        raise HTTPException(status_code=422, detail=f"format must be one of: {', '.join(TABLE_FORMATS)}")
+    offset = max(0, int(offset))
+    if limit is not None:
+        limit = max(1, int(limit))
+        if format == "json":
+            limit = min(MAX_TABLE_PAGE_LIMIT, limit)
+    symbols = [x.strip() for x in symbol.split(",") if x.strip()] if symbol else None
+    use_gzip = format != "json" and "gzip" in request.headers.get("accept-encoding", "").lower()
+    v = dossier_validators(
+        d,
+        route=f"table:{filename}",
+        files=[filename],
+        params={"offset": offset, "limit": limit, "symbols": symbols, "dt_from": dt_from, "dt_to": dt_to, "format": format, "gzip": use_gzip},
+    )
+    not_modified = conditional(request, response, v)
+    if not_modified is not None:
+        return not_modified
+    try:
+        idx = load_table_index(p)
+        matched = idx.select(symbols=symbols, dt_from=parse_dt_bound(dt_from), dt_to=parse_dt_bound(dt_to))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    total = len(matched)
+    page = matched[offset:] if limit is None else matched[offset : offset + limit]
+    end = offset + len(page)
+    next_offset = end if end < total else None
+
+    if format == "json":
+        return {
+            "run_id": run_id,
+            "rows": list(iter_row_dicts(p, idx, page)),
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+        }
+
+    if format == "csv":
+        chunks, media_type = iter_csv_chunks(p, idx, page), "text/csv; charset=utf-8"
+    else:
+        chunks, media_type = _ndjson_chunks(iter_row_dicts(p, idx, page)), "application/x-ndjson"
+    headers = {"X-Total-Count": str(total), **v.headers()}
+    if next_offset is not None:
+        headers["X-Next-Offset"] = str(next_offset)
+    if use_gzip:
+        chunks = _gzip_stream(chunks)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+@router.get("/runs/{run_id}/trades")
+def get_trades(
+    run_id: str,
+    request: Request,
+    response: Response,
+    offset: int = 0,
+    limit: int | None = None,
+    symbol: str | None = None,
+    dt_from: str | None = None,
+    dt_to: str | None = None,
+    format: str = "json",
+) -> Any:
+    """Trades (`trades.csv`); `symbol` is a comma list and `dt_from <= entry_dt < dt_to`."""
+    return _table_response(
+        run_id=run_id, filename="trades.csv", request=request, response=response, offset=offset, limit=limit,
+        symbol=symbol, dt_from=dt_from, dt_to=dt_to, format=format,
+    )
+
+
+@router.get("/runs/{run_id}/positions")
+def get_positions(
+    run_id: str,
+    request: Request,
+    response: Response,
+    offset: int = 0,
+    limit: int | None = None,
+    symbol: str | None = None,
+    dt_from: str | None = None,
+    dt_to: str | None = None,
+    format: str = "json",
+) -> Any:
+    """Per-bar positions (`positions.csv`); same paging/filters/formats as `/trades`, on `dt`."""
+    return _table_response(
+        run_id=run_id, filename="positions.csv", request=request, response=response, offset=offset, limit=limit,
+        symbol=symbol, dt_from=dt_from, dt_to=dt_to, format=format,
+    )
+
+
+@router.get("/runs/{run_id}/turnover")
+def get_turnover(
+    run_id: str,
+    request: Request,
+    response: Response,
+    offset: int = 0,
+    limit: int | None = None,
+    dt_from: str | None = None,
+    dt_to: str | None = None,
+    format: str = "json",
+) -> Any:
+    """Per-bar turnover (`turnover.csv`); dt filters only (the table has no symbol column)."""
+    return _table_response(
+        run_id=run_id, filename="turnover.csv", request=request, response=response, offset=offset, limit=limit,
+        symbol=None, dt_from=dt_from, dt_to=dt_to, format=format,
+    )
 
 
 @router.get("/runs/{run_id}/artifacts")
-def list_run_artifacts(run_id: str) -> dict[str, Any]:
+def list_run_artifacts(run_id: str, request: Request, response: Response) -> Any:
     run_id = require_safe_id(run_id, kind="run_id")
     d = require_child_dir(dossiers_root(), run_id)
     man_p = d / "dossier_manifest.json"
     _require_file(man_p)
+    v = dossier_validators(d, route="artifacts", files=[man_p.name])
+    not_modified = conditional(request, response, v)
+    if not_modified is not None:
+        return not_modified
     man = _load_json(man_p)
     artifacts = man.get("artifacts") if isinstance(man, dict) else None
     if not isinstance(artifacts, dict):
@@ -157,11 +347,15 @@ def list_run_artifacts(run_id: str) -> dict[str, Any]:
 
 
 @router.get("/runs/{run_id}/diagnostics")
-def list_run_diagnostics(run_id: str) -> dict[str, Any]:
+def list_run_diagnostics(run_id: str, request: Request, response: Response) -> Any:
     run_id = require_safe_id(run_id, kind="run_id")
     d = require_child_dir(dossiers_root(), run_id)
     if not d.is_dir():
         raise HTTPException(status_code=404, detail="not found")
+    v = dossier_validators(d, route="diagnostics", trees=["diagnostics"])
+    not_modified = conditional(request, response, v)
+    if not_modified is not None:
+        return not_modified
 
     diag_root = d / "diagnostics"
     rows: list[dict[str, Any]] = []
@@ -197,7 +391,7 @@ def list_run_diagnostics(run_id: str) -> dict[str, Any]:
 
 
 @router.get("/runs/{run_id}/diagnostics/{diagnostic_id}")
-def get_run_diagnostic(run_id: str, diagnostic_id: str) -> dict[str, Any]:
+def get_run_diagnostic(run_id: str, diagnostic_id: str, request: Request, response: Response) -> Any:
     run_id = require_safe_id(run_id, kind="run_id")
     diagnostic_id = require_safe_id(diagnostic_id, kind="diagnostic_id")
     d = require_child_dir(dossiers_root(), run_id)
@@ -214,6 +408,10 @@ def get_run_diagnostic(run_id: str, diagnostic_id: str) -> dict[str, Any]:
     gate_spec_path = dd / "promotion_candidate" / "gate_spec.json"
     if not spec_path.is_file() or not report_path.is_file():
         raise HTTPException(status_code=404, detail="diagnostic artifacts incomplete")
+    v = dossier_validators(d, route="diagnostic", trees=[f"diagnostics/{diagnostic_id}"])
+    not_modified = conditional(request, response, v)
+    if not_modified is not None:
+        return not_modified
 
     output_files: list[str] = []
     if outputs_dir.is_dir():
@@ -245,22 +443,8 @@ def list_trials(limit: int = 50, offset: int = 0) -> dict[str, Any]:
     paths = registry_paths(registry_root())
     if not paths.trial_log.is_file():
         return {"trials": [], "total": 0}
-    lines = paths.trial_log.read_text(encoding="utf-8").splitlines()
-    events: list[dict[str, Any]] = []
-    for ln in lines:
-        ln = ln.strip()
-        if not ln:
-            continue
-        try:
-            doc = json.loads(ln)
-            if isinstance(doc, dict):
-                events.append(doc)
-        except json.JSONDecodeError:
-            continue
-    # Newest first.
-    events.reverse()
-    total = len(events)
-    page = events[offset : offset + limit]
+    # Newest first; served through the run_id -> byte offset sidecar index (no full log parse).
+    page, total = list_trials_page(registry_root=paths.registry_root, limit=limit, offset=offset)
     return {"trials": page, "total": total, "limit": limit, "offset": offset}
 
 
@@ -6,6 +6,7 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
+from quant_eam.api.execution import heavy_route
 from quant_eam.api.security import require_safe_id
 from quant_eam.data_lake.timeutil import parse_iso_datetime
 from quant_eam.datacatalog.catalog import DataCatalog
@@ -88,6 +89,7 @@ def get_snapshot_quality(snapshot_id: str) -> dict[str, Any]:
 
 
 @router.get("/snapshots/{snapshot_id}/preview/ohlcv")
+@heavy_route("snapshot_preview_ohlcv")
 def preview_ohlcv(
     snapshot_id: str,
     symbols: str,
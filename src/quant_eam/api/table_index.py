@@ -0,0 +1,240 @@
+"""Row-offset index for dossier CSV tables (trades / positions / turnover) served by the read-only API.
+
+One scan per file version records, for every data row, its byte range in the file plus the two filter
+keys (`symbol` and the row timestamp: `dt`, else `entry_dt`). Pages and filters are then answered from
+the index: matching rows are located with numpy masks and only their byte ranges are read back, so page
+N never parses pages 0..N-1.
+
+The index is kept in process (keyed by absolute path, mtime_ns and size, like `doc_cache`); dossiers
+are append-only evidence and the API never writes into them.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from quant_eam.api.doc_cache import doc_key
+from quant_eam.core.lru_cache import LRUCache
+
+TABLE_FORMATS = ("json", "ndjson", "csv")
+DT_COLUMNS = ("dt", "entry_dt")
+_READ_BYTES = 1024 * 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class TableIndex:
+    columns: tuple[str, ...]
+    header: bytes  # raw header line (with its newline)
+    starts: np.ndarray  # int64 byte offset of each data row
+    ends: np.ndarray  # int64 byte offset just past each data row (including its newline)
+    symbols: tuple[str, ...]  # distinct symbol values; empty when there is no symbol column
+    symbol_codes: np.ndarray  # int32 index into `symbols` per row (-1 when there is no symbol column)
+    dt_column: str | None
+    dt_seconds: np.ndarray  # float epoch seconds per row (NaN when missing/unparseable)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.starts)
+
+    def select(self, *, symbols: list[str] | None = None, dt_from: float | None = None, dt_to: float | None = None) -> np.ndarray:
+        """Row positions (file order) with symbol in `symbols` and dt_from <= dt < dt_to."""
+        mask = np.ones(self.row_count, dtype=bool)
+        if symbols is not None:
+            if "symbol" not in self.columns:
+                raise ValueError("table has no symbol column")
+            wanted = set(symbols)
+            codes = [i for i, s in enumerate(self.symbols) if s in wanted]
+            mask &= np.isin(self.symbol_codes, np.asarray(codes, dtype=np.int32))
+        if dt_from is not None or dt_to is not None:
+            if self.dt_column is None:
+                raise ValueError(f"table has no dt column ({'/'.join(DT_COLUMNS)})")
+            with np.errstate(invalid="ignore"):
+                if dt_from is not None:
+                    mask &= self.dt_seconds >= dt_from
+                if dt_to is not None:
+                    mask &= self.dt_seconds < dt_to
+        return np.flatnonzero(mask)
+
+
+def _split_record(text: str) -> list[str]:
+    if '"' in text:
+        return next(csv.reader([text]), [])
+    return text.rstrip("\r\n").split(",")
+
+
+def _iter_records(f: Any, pos: int) -> Iterator[tuple[int, int, bytes]]:
+    """(start, end, raw) per non-blank CSV record; a quoted field may span physical lines."""
+    start = pos
+    pending = b""
+    for line in f:
+        pos += len(line)
+        buf = pending + line if pending else line
+        if buf.count(b'"') % 2:
+            pending = buf  # still inside a quoted field
+            continue
+        pending = b""
+        if buf.strip(b"\r\n"):
+            yield start, pos, buf
+        start = pos
+    if pending.strip(b"\r\n"):
+        yield start, pos, pending
+
+
+def _to_seconds(values: Any) -> np.ndarray:
+    parsed = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce", utc=True, format="mixed")
+    return ((parsed - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)).to_numpy(dtype=float, na_value=np.nan)
+
+
+def build_table_index(path: Path) -> TableIndex:
+    with Path(path).open("rb") as f:
+        header = f.readline()
+        columns = tuple(_split_record(header.decode("utf-8-sig")))
+        sym_col = columns.index("symbol") if "symbol" in columns else None
+        dt_column = next((c for c in DT_COLUMNS if c in columns), None)
+        dt_col = columns.index(dt_column) if dt_column is not None else None
+
+        starts: list[int] = []
+        ends: list[int] = []
+        sym_values: list[str] = []
+        dt_values: list[str | None] = []
+        for start, end, raw in _iter_records(f, len(header)):
+            starts.append(start)
+            ends.append(end)
+            if sym_col is None and dt_col is None:
+                continue
+            fields = _split_record(raw.decode("utf-8"))
+            if sym_col is not None:
+                sym_values.append(fields[sym_col] if sym_col < len(fields) else "")
+            if dt_col is not None:
+                dt_values.append(fields[dt_col] if dt_col < len(fields) else None)
+
+    if sym_col is not None:
+        codes, uniques = pd.factorize(pd.Series(sym_values, dtype=object), sort=True)
+        symbols = tuple(str(s) for s in uniques)
+        symbol_codes = codes.astype(np.int32)
+    else:
+        symbols = ()
+        symbol_codes = np.full(len(starts), -1, dtype=np.int32)
+    dt_seconds = _to_seconds(dt_values) if dt_col is not None else np.full(len(starts), np.nan)
+    return TableIndex(
+        columns=columns,
+        header=header,
+        starts=np.asarray(starts, dtype=np.int64),
+        ends=np.asarray(ends, dtype=np.int64),
+        symbols=symbols,
+        symbol_codes=symbol_codes,
+        dt_column=dt_column,
+        dt_seconds=dt_seconds,
+    )
+
+
+_INDEXES = LRUCache(32)
+
+
+def load_table_index(path: Path) -> TableIndex:
+    """Index for `path`, rebuilt only when the file changes (raises OSError when missing)."""
+    key = doc_key(path)
+    if key is None:
+        raise FileNotFoundError(str(path))
+    hit, idx = _INDEXES.get(key)
+    if hit:
+        return idx
+    idx = build_table_index(path)
+    _INDEXES.put(key, idx)
+    return idx
+
+
+def clear_table_index_cache() -> None:
+    _INDEXES.clear()
+
+
+def parse_dt_bound(value: str | None) -> float | None:
+    """Epoch seconds of an ISO date/datetime query bound (naive values are UTC); None passes through."""
+    if value is None or not str(value).strip():
+        return None
+    try:
+        ts = pd.Timestamp(str(value).strip())
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid datetime: {value!r}") from e
+    if ts is pd.NaT:
+        raise ValueError(f"invalid datetime: {value!r}")
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    out = (ts - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)
+    if not math.isfinite(out):
+        raise ValueError(f"invalid datetime: {value!r}")
+    return float(out)
+
+
+def iter_row_bytes(path: Path, idx: TableIndex, rows: np.ndarray) -> Iterator[bytes]:
+    """Raw bytes of the selected rows, in order. Adjacent rows are read as one range."""
+    if len(rows) == 0:
+        return
+    starts = idx.starts[rows]
+    ends = idx.ends[rows]
+    # Break into runs of byte-adjacent rows.
+    breaks = np.flatnonzero(starts[1:] != ends[:-1]) + 1
+    run_lo = np.r_[0, breaks]
+    run_hi = np.r_[breaks, len(rows)]
+    with Path(path).open("rb") as f:
+        for lo, hi in zip(run_lo.tolist(), run_hi.tolist()):
+            pos = int(starts[lo])
+            stop = int(ends[hi - 1])
+            f.seek(pos)
+            while pos < stop:
+                block = f.read(min(_READ_BYTES, stop - pos))
+                if not block:
+                    return
+                pos += len(block)
+                yield block
+
+
+def _ensure_newline(block: bytes) -> bytes:
+    return block if block.endswith(b"\n") else block + b"\n"
+
+
+def _iter_lines(blocks: Iterator[bytes]) -> Iterator[str]:
+    tail = b""
+    for block in blocks:
+        buf = tail + block
+        cut = buf.rfind(b"\n") + 1
+        if cut:
+            yield from io.StringIO(buf[:cut].decode("utf-8"), newline="")
+        tail = buf[cut:]
+    if tail:
+        yield tail.decode("utf-8") + "\n"
+
+
+def iter_row_dicts(path: Path, idx: TableIndex, rows: np.ndarray) -> Iterator[dict[str, Any]]:
+    """Selected rows as `csv.DictReader` dicts (same values as reading the whole file), streamed."""
+    reader = csv.DictReader(_iter_lines(iter_row_bytes(path, idx, rows)), fieldnames=list(idx.columns))
+    for row in reader:
+        yield dict(row)
+
+
+def iter_csv_chunks(path: Path, idx: TableIndex, rows: np.ndarray) -> Iterator[bytes]:
+    """Header plus the selected rows as CSV bytes, batched to ~64 KiB chunks."""
+    yield _ensure_newline(idx.header.lstrip(b"\xef\xbb\xbf"))
+    pending: list[bytes] = []
+    size = 0
+    last = b"\n"
+    for block in iter_row_bytes(path, idx, rows):
+        pending.append(block)
+        size += len(block)
+        last = block
+        if size >= _STREAM_CHUNK_BYTES:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+    if not last.endswith(b"\n"):
+        yield b"\n"
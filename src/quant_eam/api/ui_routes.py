@@ -10,13 +10,23 @@ from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs
+from urllib.parse import parse_qs, urlencode
 
 import yaml
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
+from quant_eam.api.curve_downsample import DOWNSAMPLE_METHODS, MIN_POINTS, read_curve_downsampled
+from quant_eam.api.doc_cache import doc_cached, load_markdown_doc, markdown_lines
+from quant_eam.api.execution import heavy_route, run_heavy
+from quant_eam.api.http_cache import (
+    Validators,
+    dossier_validators,
+    is_not_modified,
+    manifest_snapshot_id,
+    not_modified_response,
+)
 from quant_eam.api.roots import dossiers_root, registry_root
 from quant_eam.api.security import enforce_write_auth, require_child_dir, require_safe_id, require_safe_job_id
 from quant_eam.contracts import validate as contracts_validate
@@ -26,13 +36,14 @@ from quant_eam.jobstore.store import (
     create_job_from_ideaspec,
     default_job_root,
     job_paths as jobs_job_paths,
-    list_job_ids as jobs_list_job_ids,
     load_job_events as jobs_load_events,
     load_job_spec as jobs_load_spec,
 )
+from quant_eam.jobstore.summary import JOB_SORT_KEYS, list_job_summaries
 from quant_eam.registry.cards import list_cards as reg_list_cards
 from quant_eam.registry.cards import show_card as reg_show_card
 from quant_eam.registry.storage import registry_paths
+from quant_eam.registry.triallog import list_trials_page
 from quant_eam.snapshots.catalog import SnapshotCatalog
 
 router = APIRouter()
@@ -444,7 +455,17 @@ def _read_csv_rows(path: Path) -> list[dict[str, str]]:
         return [dict(row) for row in r]
 
 
-def _plotly_equity_curve_html(curve_rows: list[dict[str, str]]) -> str:
+def _read_curve_rows(path: Path, *, max_points: int | None, method: str) -> list[dict[str, Any]]:
+    """curve.csv rows for charts; `max_points` downsamples server-side (None: every row)."""
+    if not path.is_file():
+        return []
+    if max_points is None:
+        return _read_csv_rows(path)
+    rows, _original_rows = read_curve_downsampled(path, max_points=int(max_points), method=method)
+    return rows
+
+
+def _plotly_equity_curve_html(curve_rows: list[dict[str, Any]]) -> str:
     try:
         import plotly.graph_objs as go
         from plotly.io import to_html
@@ -613,6 +634,7 @@ def ui_snapshots(request: Request) -> HTMLResponse:
 
 
 @router.api_route("/ui/snapshots/{snapshot_id}", methods=["GET", "HEAD"], response_class=HTMLResponse)
+@heavy_route("ui_snapshot_detail")
 def ui_snapshot_detail(
     request: Request,
     snapshot_id: str,
@@ -692,51 +714,47 @@ def ui_snapshot_detail(
     )
 
 
+UI_JOBS_PAGE_SIZE = 100
+
+
 @router.api_route("/ui/jobs", methods=["GET", "HEAD"], response_class=HTMLResponse)
-def ui_jobs(request: Request) -> HTMLResponse:
-    jobs: list[dict[str, Any]] = []
-    jr = _job_root()
-    for jid in jobs_list_job_ids(job_root=jr):
-        try:
-            spec = jobs_load_spec(jid, job_root=jr)
-            events = jobs_load_events(jid, job_root=jr)
-        except Exception:
-            continue
-        sv = spec.get("schema_version") if isinstance(spec, dict) else None
-        if sv == "job_spec_v1":
-            bp = spec.get("blueprint") if isinstance(spec, dict) else {}
-            blueprint_id = bp.get("blueprint_id") if isinstance(bp, dict) else None
-            title = bp.get("title") if isinstance(bp, dict) else None
-        else:
-            blueprint_id = None
-            title = spec.get("title") if isinstance(spec, dict) else None
-        jobs.append(
-            {
-                "job_id": jid,
-                "state": str(events[-1].get("event_type")) if events else "unknown",
-                "schema_version": sv,
-                "blueprint_id": blueprint_id,
-                "title": title,
-            }
-        )
+def ui_jobs(request: Request, state: str | None = None, sort: str = "updated", offset: int = 0, limit: int = UI_JOBS_PAGE_SIZE) -> HTMLResponse:
+    if sort not in JOB_SORT_KEYS:
+        raise HTTPException(status_code=422, detail=f"sort must be one of: {', '.join(JOB_SORT_KEYS)}")
+    limit = max(1, min(500, int(limit)))
+    offset = max(0, int(offset))
+    states = [x.strip() for x in state.split(",") if x.strip()] if state else None
+    page, total = list_job_summaries(job_root=_job_root(), states=states, sort=sort, offset=offset, limit=limit)
+    jobs = [
+        {"job_id": js.job_id, "state": js.state, "schema_version": js.schema_version, "blueprint_id": js.blueprint_id, "title": js.title}
+        for js in page
+    ]
 
-    return TEMPLATES.TemplateResponse(request, "jobs.html", {"jobs": jobs, "title": "Jobs"})
+    def _page_url(new_offset: int) -> str:
+        q = {"sort": sort, "offset": str(new_offset), "limit": str(limit)}
+        if state:
+            q["state"] = state
+        return "/ui/jobs?" + urlencode(q)
+
+    pager = {
+        "total": total,
+        "first": offset + 1 if jobs else 0,
+        "last": min(total, offset + limit) if jobs else 0,
+        "prev_url": _page_url(max(0, offset - limit)) if offset > 0 else None,
+        "next_url": _page_url(offset + limit) if offset + limit < total else None,
+        "state": state or "",
+        "sort": sort,
+    }
+    return TEMPLATES.TemplateResponse(request, "jobs.html", {"jobs": jobs, "pager": pager, "title": "Jobs"})
 
 
 def _recent_trials(limit: int = 20) -> list[dict[str, Any]]:
     paths = registry_paths(registry_root())
     if not paths.trial_log.is_file():
         return []
-    lines = [ln.strip() for ln in paths.trial_log.read_text(encoding="utf-8").splitlines() if ln.strip()]
-    out: list[dict[str, Any]] = []
-    for ln in reversed(lines[-limit:]):
-        try:
-            doc = json.loads(ln)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(doc, dict):
-            out.append(doc)
-    return out
+    # Newest first, read through the in-memory run_id offset index (only the page's lines are parsed).
+    page, _total = list_trials_page(registry_root=paths.registry_root, limit=limit, offset=0)
+    return page
 
 
 def _ui_index_context(*, idea_form: dict[str, str] | None = None, idea_form_error: str = "") -> dict[str, Any]:
@@ -984,10 +1002,11 @@ def _markdown_clean(text: str) -> str:
     return s
 
 
+@doc_cached
 def _extract_whole_view_constraints(path: Path) -> list[dict[str, str]]:
     if not path.is_file():
         return []
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     rows: list[dict[str, str]] = []
     current: dict[str, str] | None = None
@@ -1024,10 +1043,11 @@ def _extract_whole_view_constraints(path: Path) -> list[dict[str, str]]:
     return rows
 
 
+@doc_cached
 def _extract_whole_view_required_contracts(path: Path) -> list[dict[str, Any]]:
     if not path.is_file():
         return []
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     rows: list[dict[str, Any]] = []
     for raw in lines:
@@ -1054,6 +1074,7 @@ def _extract_whole_view_required_contracts(path: Path) -> list[dict[str, Any]]:
     return sorted(rows, key=lambda r: int(r.get("index") or 0))
 
 
+@doc_cached
 def _extract_whole_view_contracts_principles(path: Path) -> dict[str, Any]:
     default_section = "5. Contracts（Schema）体系：让 LLM/Codex 能产、Kernel 能编译、UI 能渲染"
     default_contracts_section = "5.1 必须落地的 Contracts（v1）"
@@ -1066,7 +1087,7 @@ def _extract_whole_view_contracts_principles(path: Path) -> dict[str, Any]:
             "trace_boundary_note": "",
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     in_contracts = False
     section = default_section
@@ -1248,12 +1269,13 @@ def _contracts_coverage_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_ia_checklist(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "8. UI 信息架构（不看源码的审阅体验）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -1290,12 +1312,13 @@ def _split_role_line(text: str) -> tuple[str, str]:
     return cleaned, ""
 
 
+@doc_cached
 def _extract_whole_view_agent_roles(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "6.4 Agents Plane（LLM + Codex，全部通过 harness 运行）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -1323,12 +1346,13 @@ def _extract_whole_view_agent_roles(path: Path) -> tuple[str, list[dict[str, Any
     return section, rows
 
 
+@doc_cached
 def _extract_whole_view_workflow_phases(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "3. Whole View 工作流（UI Checkpoint 驱动的状态机）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -1385,12 +1409,13 @@ def _extract_whole_view_workflow_phases(path: Path) -> tuple[str, list[dict[str,
     return section, rows
 
 
+@doc_cached
 def _extract_playbook_phase_flow(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "3. Phase 列表（推荐施工顺序）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -1450,12 +1475,13 @@ def _extract_playbook_phase_flow(path: Path) -> tuple[str, list[dict[str, Any]]]
     return section, rows
 
 
+@doc_cached
 def _extract_whole_view_object_model(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "4. 核心对象模型（系统只认这些 I/O）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -1516,12 +1542,13 @@ def _extract_whole_view_object_model(path: Path) -> tuple[str, list[dict[str, An
     return section, rows
 
 
+@doc_cached
 def _extract_playbook_phase_context(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "3. Phase 列表（推荐施工顺序）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -1736,12 +1763,13 @@ def _object_model_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_module_boundaries(path: Path) -> tuple[str, list[dict[str, Any]]]:
     default_section = "6. 模块（Modules）与职责边界（Deterministic vs Agent）"
     if not path.is_file():
         return default_section, []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     rows: list[dict[str, Any]] = []
@@ -2007,6 +2035,7 @@ def _module_boundaries_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_diagnostics_promotion(path: Path) -> dict[str, Any]:
     section_default = "7. Codex CLI 的定位：探索者 + 工具工，不是裁判"
     temporary_default = "7.1 临时诊断（Ephemeral Diagnostics）"
@@ -2020,7 +2049,7 @@ def _extract_whole_view_diagnostics_promotion(path: Path) -> dict[str, Any]:
             "promotion_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = section_default
     temporary_section = temporary_default
@@ -2075,6 +2104,7 @@ def _extract_whole_view_diagnostics_promotion(path: Path) -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_codex_role_boundary(path: Path) -> dict[str, Any]:
     section_default = "7. Codex CLI 的定位：探索者 + 工具工，不是裁判"
     temporary_default = "7.1 临时诊断（Ephemeral Diagnostics）"
@@ -2090,7 +2120,7 @@ def _extract_whole_view_codex_role_boundary(path: Path) -> dict[str, Any]:
             "governance_note": "",
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = section_default
     role_positioning = ""
@@ -2160,6 +2190,7 @@ def _extract_whole_view_codex_role_boundary(path: Path) -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_phase12_evidence(path: Path) -> dict[str, Any]:
     section_default = "Phase-12：Diagnostics（Codex 提出验证方法）+ 晋升 Gate"
     if not path.is_file():
@@ -2171,7 +2202,7 @@ def _extract_playbook_phase12_evidence(path: Path) -> dict[str, Any]:
             "acceptance_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = section_default
     current_heading = ""
@@ -2886,6 +2917,7 @@ def _ui_coverage_matrix_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_runtime_topology(path: Path) -> dict[str, Any]:
     default_section = "9. 仓库与运行形态（Linux + Docker + Python）"
     default_intro = "推荐仓库结构"
@@ -2897,7 +2929,7 @@ def _extract_whole_view_runtime_topology(path: Path) -> dict[str, Any]:
             "service_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     intro = default_intro
@@ -2953,6 +2985,7 @@ def _extract_whole_view_runtime_topology(path: Path) -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_section1_runtime_stack(path: Path) -> dict[str, Any]:
     section_default = "1. 技术栈建议（可替换，但先固定）"
     foundation_default = "1.1 基础"
@@ -2966,7 +2999,7 @@ def _extract_playbook_section1_runtime_stack(path: Path) -> dict[str, Any]:
             "service_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = section_default
     foundation_section = foundation_default
@@ -3020,6 +3053,7 @@ def _extract_playbook_section1_runtime_stack(path: Path) -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_runtime_phase_context(path: Path) -> tuple[str, list[dict[str, Any]]]:
     section, rows = _extract_playbook_phase_flow(path)
     runtime_keywords = ("docker", "compose", "api", "worker", "ui", "service", "orchestrator")
@@ -3177,6 +3211,7 @@ def _runtime_topology_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_preflight_checklist(path: Path) -> dict[str, Any]:
     default_section = "10. “不跑偏”检查清单（每次新增功能前先对齐）"
     if not path.is_file():
@@ -3185,7 +3220,7 @@ def _extract_whole_view_preflight_checklist(path: Path) -> dict[str, Any]:
             "checklist_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     checklist_rows: list[dict[str, Any]] = []
@@ -3247,6 +3282,7 @@ def _preflight_checklist_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_version_roadmap(path: Path) -> dict[str, Any]:
     default_section = "11. 版本路线（建议）"
     if not path.is_file():
@@ -3255,7 +3291,7 @@ def _extract_whole_view_version_roadmap(path: Path) -> dict[str, Any]:
             "milestone_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     milestone_rows: list[dict[str, Any]] = []
@@ -3317,6 +3353,7 @@ def _version_roadmap_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_system_definition(path: Path) -> dict[str, Any]:
     default_section = "0. 你要构建的系统是什么（Definition）"
     if not path.is_file():
@@ -3326,7 +3363,7 @@ def _extract_whole_view_system_definition(path: Path) -> dict[str, Any]:
             "capability_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     definition_statement = ""
@@ -3367,6 +3404,7 @@ def _extract_whole_view_system_definition(path: Path) -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_five_planes(path: Path) -> dict[str, Any]:
     default_section = "2. 总体架构：五个平面（Planes）"
     if not path.is_file():
@@ -3375,7 +3413,7 @@ def _extract_whole_view_five_planes(path: Path) -> dict[str, Any]:
             "plane_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     plane_rows: list[dict[str, Any]] = []
@@ -3449,12 +3487,13 @@ def _system_definition_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_whole_view_dossier_structure(path: Path) -> dict[str, Any]:
     default_root = "dossiers/<run_id>/"
     if not path.is_file():
         return {"section": "4.4 Dossier", "root_entry": default_root, "run_entries": []}
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = "4.4 Dossier"
     raw_entries: list[str] = []
@@ -3600,21 +3639,17 @@ def _dossier_evidence_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_bullets(path: Path, heading_contains: str) -> list[str]:
     if not path.is_file():
         return []
-    lines = path.read_text(encoding="utf-8").splitlines()
-    start_idx = -1
-    for i, raw in enumerate(lines):
-        line = raw.strip()
-        if line.startswith("### ") and heading_contains in line:
-            start_idx = i + 1
-            break
-    if start_idx < 0:
+    doc = load_markdown_doc(path)
+    heading = doc.find_heading(3, heading_contains) if doc is not None else None
+    if heading is None:
         return []
 
     out: list[str] = []
-    for raw in lines[start_idx:]:
+    for raw in doc.lines[heading.line + 1 :]:
         line = raw.strip()
         if line.startswith("### ") or line.startswith("## "):
             break
@@ -3636,6 +3671,7 @@ def _load_yaml_map(path: Path) -> dict[str, Any]:
     return loaded if isinstance(loaded, dict) else {}
 
 
+@doc_cached
 def _extract_playbook_phase8_evidence(path: Path) -> dict[str, Any]:
     section_default = "Phase-8：Agents v1（Intent / StrategySpec / Spec‑QA / Report / Improvement）"
     if not path.is_file():
@@ -3650,7 +3686,7 @@ def _extract_playbook_phase8_evidence(path: Path) -> dict[str, Any]:
             "acceptance_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = section_default
     current_heading = ""
@@ -3836,11 +3872,12 @@ def _agent_roles_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_phase_rows(path: Path) -> list[dict[str, Any]]:
     if not path.is_file():
         return []
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     rows: list[dict[str, Any]] = []
     for idx, raw in enumerate(lines, start=1):
@@ -4045,6 +4082,7 @@ def _playbook_phases_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_section0_principles(path: Path) -> dict[str, Any]:
     default_section = "0. 施工总原则（Codex 任务组织）"
     default_principle_section = "0.1 单次 Codex 任务必须满足"
@@ -4058,7 +4096,7 @@ def _extract_playbook_section0_principles(path: Path) -> dict[str, Any]:
             "quality_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = default_section
     principle_section = default_principle_section
@@ -4177,6 +4215,7 @@ def _playbook_tech_stack_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_section2_phase_template(path: Path) -> dict[str, Any]:
     section_default = "2. Phase 模板（后续你要我写每个 phase 标准内容，就按这个模板）"
     template_default = "Phase‑X 标准输出结构"
@@ -4188,7 +4227,7 @@ def _extract_playbook_section2_phase_template(path: Path) -> dict[str, Any]:
             "template_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     in_template = False
     section = section_default
@@ -4275,6 +4314,7 @@ def _playbook_phase_template_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_section4_codex_task_card(path: Path) -> dict[str, Any]:
     section_default = "4. 每个 Phase 给 Codex 的“标准任务卡模板”（你后续可反复复用）"
     template_default = "Codex Task Card Template"
@@ -4289,7 +4329,7 @@ def _extract_playbook_section4_codex_task_card(path: Path) -> dict[str, Any]:
             "acceptance_rows": [],
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     in_template = False
     section = section_default
@@ -4422,6 +4462,7 @@ def _playbook_codex_task_card_context() -> dict[str, Any]:
     }
 
 
+@doc_cached
 def _extract_playbook_section5_sequence(path: Path) -> dict[str, Any]:
     section_default = "5. 结束语（施工顺序建议）"
     if not path.is_file():
@@ -4435,7 +4476,7 @@ def _extract_playbook_section5_sequence(path: Path) -> dict[str, Any]:
             "automation_note": "",
         }
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = markdown_lines(path)
     in_section = False
     section = section_default
     intro = ""
@@ -5036,7 +5077,11 @@ async def ui_composer_compose(request: Request):
         weights = [equal for _ in card_ids]
     form_state["weights_by_card"] = {cid: str(weights[i]) for i, cid in enumerate(card_ids)}
 
-    code, out = composer_run_once(
+    # No timeout: the run writes a dossier (and maybe a card); a 504 would misreport finished work.
+    code, out = await run_heavy(
+        "composer_compose",
+        composer_run_once,
+        timeout_s=None,
         card_ids=card_ids,
         weights=weights,
         policy_bundle_path=Path(policy_bundle_path),
@@ -5326,19 +5371,89 @@ async def ui_submit_idea_job(request: Request):
     return RedirectResponse(url=f"/ui/jobs/{res['job_id']}", status_code=303)
 
 
+_UI_RUN_FILES = (
+    "dossier_manifest.json",
+    "metrics.json",
+    "gate_results.json",
+    "config_snapshot.json",
+    "risk_report.json",
+    "attribution_report.json",
+    "reports/attribution/report.md",
+    "segments_summary.json",
+    "curve.csv",
+    "trades.csv",
+)
+_UI_RUN_TREES = ("segments", "diagnostics")
+
+
+def _ui_run_snapshot_files(d: Path) -> list[Path]:
+    """Data snapshot files read by `_render_ui_run` (snapshot manifest + the OHLCV dataset)."""
+    sid = manifest_snapshot_id(d)
+    if not sid:
+        return []
+    try:
+        sid = require_safe_id(sid, kind="snapshot_id")
+    except HTTPException:
+        return []
+    snap_dir = Path(os.getenv("EAM_DATA_ROOT", "/data")) / "lake" / sid
+    return [snap_dir / "manifest.json", snap_dir / "ohlcv_1d.csv"]
+
+
 @router.api_route("/ui/runs/{run_id}", methods=["GET", "HEAD"], response_class=HTMLResponse)
-def ui_run(
+async def ui_run(
     request: Request,
     run_id: str,
     symbol: str | None = None,
     segment_id: str | None = None,
     diagnostic_id: str | None = None,
-) -> HTMLResponse:
+    max_points: int | None = None,
+    method: str = "lttb",
+) -> Response:
     run_id = require_safe_id(run_id, kind="run_id")
+    if max_points is not None and (method not in DOWNSAMPLE_METHODS or int(max_points) < MIN_POINTS):
+        raise HTTPException(status_code=422, detail=f"invalid downsampling: method in {DOWNSAMPLE_METHODS}, max_points >= {MIN_POINTS}")
     d = require_child_dir(dossiers_root(), run_id)
     if not d.is_dir():
         raise HTTPException(status_code=404, detail="not found")
+    # Validate against exactly what the page reads: its dossier files and trees, plus the snapshot files
+    # behind the candle chart. Revalidation is checked before heavy admission, so a 304 is never a 503.
+    validators = dossier_validators(
+        d,
+        route="ui_run",
+        files=_UI_RUN_FILES,
+        trees=_UI_RUN_TREES,
+        external=_ui_run_snapshot_files(d),
+        params=dict(sorted(request.query_params.items())),
+    )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    return await run_heavy(
+        "ui_run",
+        _render_ui_run,
+        request,
+        d,
+        validators,
+        run_id=run_id,
+        symbol=symbol,
+        segment_id=segment_id,
+        diagnostic_id=diagnostic_id,
+        max_points=max_points,
+        method=method,
+    )
+
 
+def _render_ui_run(
+    request: Request,
+    d: Path,
+    validators: Validators,
+    *,
+    run_id: str,
+    symbol: str | None,
+    segment_id: str | None,
+    diagnostic_id: str | None,
+    max_points: int | None,
+    method: str,
+) -> HTMLResponse:
     dossier_manifest = _load_json(d / "dossier_manifest.json")
     metrics = _load_json(d / "metrics.json")
     gate_results = _load_json(d / "gate_results.json") if (d / "gate_results.json").is_file() else {}
@@ -5385,10 +5500,10 @@ def ui_run(
     seg_dir = (d / "segments" / selected_id) if (selected_id and (d / "segments" / selected_id).is_dir()) else None
     if seg_dir is not None and (not is_holdout_view):
         metrics = _load_json(seg_dir / "metrics.json") if (seg_dir / "metrics.json").is_file() else metrics
-        curve_rows = _read_csv_rows(seg_dir / "curve.csv") if (seg_dir / "curve.csv").is_file() else []
+        curve_rows = _read_curve_rows(seg_dir / "curve.csv", max_points=max_points, method=method)
         trades_rows = _read_csv_rows(seg_dir / "trades.csv") if (seg_dir / "trades.csv").is_file() else []
     else:
-        curve_rows = _read_csv_rows(d / "curve.csv") if (d / "curve.csv").is_file() else []
+        curve_rows = _read_curve_rows(d / "curve.csv", max_points=max_points, method=method)
         trades_rows = _read_csv_rows(d / "trades.csv") if (d / "trades.csv").is_file() else []
 
     # Symbol selection: from runspec.extensions.symbols.
@@ -5512,7 +5627,7 @@ def ui_run(
             if isinstance(doc, dict):
                 selected_promotion_gate_spec = doc
 
-    return TEMPLATES.TemplateResponse(
+    resp = TEMPLATES.TemplateResponse(
         request,
         "run.html",
         {
@@ -5539,6 +5654,8 @@ def ui_run(
             "selected_promotion_gate_spec": selected_promotion_gate_spec,
         },
     )
+    resp.headers.update(validators.headers())
+    return resp
 
 
 @router.api_route("/ui/runs/{run_id}/gates", methods=["GET", "HEAD"], response_class=HTMLResponse)
@@ -5601,6 +5718,7 @@ def ui_card(request: Request, card_id: str) -> HTMLResponse:
 
 
 @router.api_route("/ui/jobs/{job_id}", methods=["GET", "HEAD"], response_class=HTMLResponse)
+@heavy_route("ui_job")
 def ui_job_detail(request: Request, job_id: str) -> HTMLResponse:
     job_id = require_safe_job_id(job_id)
     jr = _job_root()
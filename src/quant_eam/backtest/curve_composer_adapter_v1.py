@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid, BacktestResult
@@ -61,6 +62,86 @@ class CurveComposerStats:
     original_points: list[int]
 
 
+ALIGN_MODES = ("intersection", "union_ffill")
+
+
+@dataclass(frozen=True)
+class AlignedCurves:
+    """N component equity curves on one dt grid: `equity[t, i]` is component i at `dt[t]`."""
+
+    dt: list[pd.Timestamp]
+    equity: np.ndarray  # (T, N) float64
+    original_points: list[int]
+
+    def returns(self) -> np.ndarray:
+        """(T, N) simple returns; row 0 and undefined (0/0) returns are 0.0 (like `pct_change().fillna(0.0)`)."""
+        r = np.zeros_like(self.equity)
+        if len(self.equity) > 1:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r[1:] = self.equity[1:] / self.equity[:-1] - 1.0
+        r[np.isnan(r)] = 0.0
+        return r
+
+
+def align_curves(dossier_dirs: list[Path], *, align: str = "intersection") -> AlignedCurves:
+    """Load each component's curve.csv and align all of them in one merge.
+
+    - intersection: dt present in every component.
+    - union_ffill: every dt seen by any component from the latest component start onwards; a component
+      missing a dt carries its last equity forward (zero return on that dt).
+    """
+    if align not in ALIGN_MODES:
+        raise BacktestInvalid(f"unsupported align rule: {align!r} (supported: {', '.join(ALIGN_MODES)})")
+    if not dossier_dirs:
+        raise BacktestInvalid("dossier_dirs must be non-empty")
+    curves = [_load_curve_csv(Path(d) / "curve.csv") for d in dossier_dirs]
+    original_points = [int(len(c)) for c in curves]
+
+    # Long frame (component, dt, equity) -> wide (dt x component); curves are already de-duplicated on dt.
+    long = pd.concat([c.assign(comp=i) for i, c in enumerate(curves)], ignore_index=True)
+    wide = long.pivot(index="dt", columns="comp", values="equity").sort_index()
+    wide = wide.reindex(columns=range(len(curves)))
+    if align == "intersection":
+        wide = wide.dropna(how="any")
+        if wide.empty:
+            raise BacktestInvalid("no common dt intersection across component curves")
+    else:
+        wide = wide.ffill().dropna(how="any")
+        if wide.empty:
+            raise BacktestInvalid("no dt where every component curve has started")
+    return AlignedCurves(
+        dt=list(wide.index),
+        equity=wide.to_numpy(dtype=float, copy=True),
+        original_points=original_points,
+    )
+
+
+def _normalize_weight_rows(weights: np.ndarray) -> np.ndarray:
+    w = np.atleast_2d(np.asarray(weights, dtype=float))
+    s = w.sum(axis=1)
+    if not np.all(s > 0):
+        raise BacktestInvalid("weights sum must be > 0")
+    return w / s[:, None]
+
+
+def compose_equity_batch(aligned: AlignedCurves, weights: np.ndarray, *, base_equity: float = 1.0) -> np.ndarray:
+    """Composed equity for many weight vectors at once: (K, N) weights -> (K, T) equity curves.
+
+    Rows are normalized to sum to 1. Weighted returns are one matrix product, equity a cumprod. Use this
+    for allocation search; `compose_curves` keeps the reference summation order for published dossiers.
+    """
+    if base_equity <= 0:
+        raise BacktestInvalid("base_equity must be > 0")
+    w = _normalize_weight_rows(weights)
+    if w.shape[1] != aligned.equity.shape[1]:
+        raise BacktestInvalid("weights must have one column per component curve")
+    with np.errstate(invalid="ignore"):
+        comp_ret = aligned.returns() @ w.T  # (T, K)
+    growth = 1.0 + comp_ret
+    growth[0] = float(base_equity)
+    return np.cumprod(growth, axis=0).T
+
+
 def compose_curves(
     *,
     dossier_dirs: list[Path],
@@ -72,12 +153,15 @@ def compose_curves(
 
     MVP rules:
     - Read each component's `curve.csv` (dt,equity).
-    - Align on dt by intersection (default).
+    - Align on dt by intersection (default) or by union with forward-fill (`align="union_ffill"`).
     - Compute per-component returns on the aligned dt grid.
     - Compose returns = sum_i w_i * r_i, then rebuild composed equity from base_equity.
+
+    Columnar: the aligned (T, N) return matrix is reduced left to right over components and equity is a
+    cumprod, which reproduces the per-component/per-dt loop float for float.
     """
-    if align != "intersection":
-        raise BacktestInvalid(f"unsupported align rule: {align!r} (only 'intersection' supported in v1)")
+    if align not in ALIGN_MODES:
+        raise BacktestInvalid(f"unsupported align rule: {align!r} (supported: {', '.join(ALIGN_MODES)})")
     if len(dossier_dirs) != len(weights) or not dossier_dirs:
         raise BacktestInvalid("dossier_dirs and weights must have same non-zero length")
     if base_equity <= 0:
@@ -90,41 +174,19 @@ def compose_curves(
         raise BacktestInvalid("weights sum must be > 0")
     w = [x / s for x in w]
 
-    curves: list[pd.DataFrame] = []
-    dt_sets: list[set[pd.Timestamp]] = []
-    original_points: list[int] = []
-    for d in dossier_dirs:
-        cdf = _load_curve_csv(Path(d) / "curve.csv")
-        curves.append(cdf)
-        original_points.append(int(len(cdf)))
-        dt_sets.append(set(cdf["dt"].tolist()))
-
-    common = set.intersection(*dt_sets) if dt_sets else set()
-    if not common:
-        raise BacktestInvalid("no common dt intersection across component curves")
-    dt_common = sorted(common)
-
-    # Build aligned equity matrix.
-    eq_cols: list[pd.Series] = []
-    for df in curves:
-        aligned = df[df["dt"].isin(dt_common)].set_index("dt").reindex(dt_common)
-        if aligned["equity"].isna().any():
-            # Should not happen under intersection, but keep error explicit.
-            raise BacktestInvalid("alignment produced NaN equity values")
-        eq_cols.append(aligned["equity"].astype(float))
-
-    # Per-component returns on the aligned grid.
-    # Return at dt_common[k] refers to change from dt_common[k-1] -> dt_common[k].
-    rets = [col.pct_change().fillna(0.0) for col in eq_cols]
-    # Compose returns.
-    comp_ret = rets[0] * 0.0
-    for wi, ri in zip(w, rets, strict=True):
-        comp_ret = comp_ret + (ri * wi)
+    aligned = align_curves(dossier_dirs, align=align)
+    dt_common = aligned.dt
+    rets = aligned.returns()
+
+    # comp_ret = ((r_0 * 0.0 + r_0 * w_0) + r_1 * w_1) + ...: a cumsum over components accumulates in that order.
+    with np.errstate(invalid="ignore"):
+        terms = np.hstack([rets[:, :1] * 0.0, rets * np.asarray(w, dtype=float)[None, :]])
+        comp_ret = np.cumsum(terms, axis=1)[:, -1]
 
     # Rebuild equity from composed returns, anchored at base_equity on dt_common[0].
-    equity = [float(base_equity)]
-    for k in range(1, len(dt_common)):
-        equity.append(equity[-1] * (1.0 + float(comp_ret.iloc[k])))
+    growth = 1.0 + comp_ret
+    growth[0] = float(base_equity)
+    equity = np.cumprod(growth).tolist()
 
     curve_df = pd.DataFrame({"dt": [t.isoformat() for t in dt_common], "equity": equity})
 
@@ -146,6 +208,6 @@ def compose_curves(
         aligned_rows=int(len(dt_common)),
         dt_start=str(dt_common[0].date().isoformat()),
         dt_end=str(dt_common[-1].date().isoformat()),
-        original_points=original_points,
+        original_points=list(aligned.original_points),
     )
     return out, cc
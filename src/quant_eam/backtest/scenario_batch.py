@@ -0,0 +1,353 @@
+"""Scenario-batch backtests: one prices frame, many (lag_bars, cost multiplier) scenarios.
+
+Stress gates and attribution re-run the reference engine (`vectorbt_adapter_mvp.run_adapter`) once
+per scenario just to read `total_return`. This module shares the expensive parts across scenarios:
+
+- price alignment (sort, dt grid, per-(dt, symbol) open/close matrices) via `prepare_prices`
+- signal compilation (signal_dsl_v1 is compiled once; other lags are derived by shifting raw signals)
+
+and then simulates all scenarios together in a single pass over the dt grid. The simulation mirrors
+the reference engine operation by operation, so per-scenario stats are identical to `run_adapter`
+(trades/positions/curve frames are not produced; use `run_adapter` for evidence artifacts).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from quant_eam.backtest.signal_compiler import SignalCompileInvalid, compile_signal_dsl_v1
+from quant_eam.backtest.vectorbt_adapter_mvp import (
+    ADAPTER_ID_VECTORBT_SIGNAL_V1,
+    BacktestInvalid,
+    _bps_to_fraction,
+    _max_drawdown,
+    _sharpe_from_equity,
+    _validate_execution_policy,
+)
+
+
+@dataclass(frozen=True)
+class StressScenario:
+    lag_bars: int
+    cost_multiplier: float = 1.0  # applied to cost_policy commission_bps and slippage_bps
+
+
+@dataclass(frozen=True)
+class PreparedPrices:
+    """Price rows sorted like the reference engine, plus the aligned (dt x symbol) grid."""
+
+    df: pd.DataFrame  # sorted by (symbol, parsed dt), index 0..N-1
+    symbols: list[str]
+    symbol_rows: list[np.ndarray]  # per symbol: row positions in `df`, dt order
+    row_pos: np.ndarray  # (n_dt, n_sym) first row position for (dt, symbol), -1 if absent
+    open: np.ndarray  # (n_dt, n_sym)
+    close: np.ndarray  # (n_dt, n_sym)
+
+
+def prepare_prices(prices: pd.DataFrame) -> PreparedPrices:
+    """Sort and align a prices frame once so it can be reused by any number of scenario batches."""
+    needed_cols = {"dt", "symbol", "open", "close"}
+    missing = needed_cols - set(prices.columns)
+    if missing:
+        raise BacktestInvalid(f"missing required price columns: {sorted(missing)}")
+
+    df = prices.copy()
+    df["dt"] = pd.to_datetime(df["dt"])
+    df["symbol"] = df["symbol"].astype(str)
+    df = df.sort_values(["symbol", "dt"], kind="mergesort").reset_index(drop=True)
+
+    symbols = sorted(df["symbol"].unique().tolist())
+    if not symbols:
+        raise BacktestInvalid("no symbols in prices")
+
+    dt_codes, dt_uniques = pd.factorize(df["dt"], sort=True)
+    sym_codes = pd.Index(symbols).get_indexer(df["symbol"])
+    n_dt, n_sym = len(dt_uniques), len(symbols)
+
+    row_pos = np.full((n_dt, n_sym), -1, dtype=np.int64)
+    # Reverse assignment so the first row per (dt, symbol) wins (reference engine uses rows.iloc[0]).
+    rev = np.arange(len(df) - 1, -1, -1)
+    row_pos[dt_codes[rev], sym_codes[rev]] = rev
+
+    open_v = df["open"].to_numpy(dtype=float)
+    close_v = df["close"].to_numpy(dtype=float)
+    safe = np.where(row_pos >= 0, row_pos, 0)
+    open_m = np.where(row_pos >= 0, open_v[safe], np.nan)
+    close_m = np.where(row_pos >= 0, close_v[safe], np.nan)
+
+    symbol_rows = [np.flatnonzero(sym_codes == j) for j in range(n_sym)]
+    return PreparedPrices(df=df, symbols=symbols, symbol_rows=symbol_rows, row_pos=row_pos, open=open_m, close=close_m)
+
+
+def _buy_and_hold_flags(pp: PreparedPrices, lag_bars: int) -> tuple[np.ndarray, np.ndarray]:
+    """Lagged entry/exit flags per row: raw entry on the first bar, raw exit on bar n-1-lag."""
+    n_rows = len(pp.df)
+    entries = np.zeros(n_rows, dtype=bool)
+    exits = np.zeros(n_rows, dtype=bool)
+    for rows in pp.symbol_rows:
+        n = len(rows)
+        if lag_bars < n:
+            entries[rows[lag_bars]] = True
+        exit_k = max(0, n - 1 - lag_bars) + lag_bars
+        if exit_k < n:
+            exits[rows[exit_k]] = True
+    return entries, exits
+
+
+def _shift_rows(raw: np.ndarray, pp: PreparedPrices, lag_bars: int) -> np.ndarray:
+    out = np.zeros(len(raw), dtype=bool)
+    for rows in pp.symbol_rows:
+        if lag_bars < len(rows):
+            out[rows[lag_bars:]] = raw[rows[: len(rows) - lag_bars]]
+    return out
+
+
+def _compiled_raw_signals(pp: PreparedPrices, prices: pd.DataFrame, signal_dsl: dict[str, Any], lag_bars: int) -> tuple[np.ndarray, np.ndarray, str]:
+    try:
+        comp = compile_signal_dsl_v1(prices=prices, signal_dsl=signal_dsl, lag_bars=lag_bars)
+    except SignalCompileInvalid as e:
+        raise BacktestInvalid(str(e))
+    sig = comp.frame.copy()
+    sig["symbol"] = sig["symbol"].astype(str)
+    sig["_dt"] = pd.to_datetime(sig["dt"])
+    sig = sig.sort_values(["symbol", "_dt"], kind="mergesort").reset_index(drop=True)
+    if len(sig) != len(pp.df):
+        raise BacktestInvalid("compiled signals do not align with price rows")
+    entry_raw = sig["entry_raw"].astype(bool).fillna(False).to_numpy(dtype=bool)
+    exit_raw = sig["exit_raw"].astype(bool).fillna(False).to_numpy(dtype=bool)
+    return entry_raw, exit_raw, comp.dsl_fingerprint
+
+
+def _cost_fractions(cost_policy: dict[str, Any], multiplier: float) -> tuple[float, float]:
+    params = cost_policy.get("params")
+    if not isinstance(params, dict):
+        raise BacktestInvalid("cost_policy.params must be an object")
+    commission_bps = params.get("commission_bps")
+    slippage_bps = params.get("slippage_bps")
+    if not isinstance(commission_bps, (int, float)):
+        raise BacktestInvalid("cost_policy.params.commission_bps must be a number")
+    if not isinstance(slippage_bps, (int, float)):
+        raise BacktestInvalid("cost_policy.params.slippage_bps must be a number")
+    # Same arithmetic as scaling the policy doc first (bps * multiplier), then converting.
+    return _bps_to_fraction(float(commission_bps) * float(multiplier)), _bps_to_fraction(float(slippage_bps) * float(multiplier))
+
+
+def _simulate(
+    pp: PreparedPrices,
+    *,
+    entries: np.ndarray,  # (S, n_rows)
+    exits: np.ndarray,  # (S, n_rows)
+    exec_px: np.ndarray,  # (n_dt, n_sym)
+    commission: np.ndarray,  # (S,)
+    slippage: np.ndarray,  # (S,)
+) -> tuple[np.ndarray, np.ndarray]:
+    """Single pass over the dt grid for all scenarios; returns (equity (n_dt, S), trade_count (S,))."""
+    n_scen = entries.shape[0]
+    n_dt, n_sym = pp.row_pos.shape
+    present = pp.row_pos >= 0
+    safe = np.where(present, pp.row_pos, 0)
+    ent = entries[:, safe] & present  # (S, n_dt, n_sym)
+    ext = exits[:, safe] & present
+    ent_any = ent.any(axis=0)
+    ext_any = ext.any(axis=0)
+
+    cash = np.ones(n_scen, dtype=float)
+    qty = np.zeros((n_scen, n_sym), dtype=float)
+    in_pos = np.zeros((n_scen, n_sym), dtype=bool)
+    n_free = np.full(n_scen, n_sym, dtype=np.int64)
+    trades = np.zeros(n_scen, dtype=np.int64)
+    equity = np.empty((n_dt, n_scen), dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for d in range(n_dt):
+            # Entries first, then exits; symbols in sorted order (same as the reference engine).
+            for j in np.flatnonzero(ent_any[d]):
+                m = ent[:, d, j] & ~in_pos[:, j]
+                if not m.any():
+                    continue
+                alloc = cash[m] / np.maximum(1, n_free[m])
+                px = exec_px[d, j] * (1.0 + slippage[m])
+                q = np.where(px > 0, alloc / px, 0.0)
+                notional = q * px
+                fee = notional * commission[m]
+                cash[m] = cash[m] - (notional + fee)
+                qty[m, j] = q
+                in_pos[m, j] = True
+                n_free[m] -= 1
+            for j in np.flatnonzero(ext_any[d]):
+                m = ext[:, d, j] & in_pos[:, j]
+                if not m.any():
+                    continue
+                px = exec_px[d, j] * (1.0 - slippage[m])
+                notional = qty[m, j] * px
+                fee = notional * commission[m]
+                cash[m] = cash[m] + (notional - fee)
+                trades[m] += 1
+                qty[m, j] = 0.0
+                in_pos[m, j] = False
+                n_free[m] += 1
+            # Mark-to-market on close, accumulated in symbol order.
+            net = np.zeros(n_scen, dtype=float)
+            for j in np.flatnonzero(present[d]):
+                net = net + qty[:, j] * pp.close[d, j]
+            equity[d] = cash + net
+    return equity, trades
+
+
+@dataclass(frozen=True)
+class _ScenarioRun:
+    equity: np.ndarray  # (n_dt, S)
+    trades: np.ndarray  # (S,)
+    order_timing: str
+    fill_price: str
+    fracs: list[tuple[float, float]]
+    strategy_id: str
+    dsl_fingerprint: str | None
+
+
+def _run_scenarios(
+    *,
+    adapter_id: str,
+    prices: pd.DataFrame,
+    scenarios: list[StressScenario],
+    execution_policy: dict[str, Any],
+    cost_policy: dict[str, Any],
+    signal_dsl: dict[str, Any] | None,
+    prepared: PreparedPrices | None,
+) -> _ScenarioRun:
+    # Validation order and messages follow run_adapter.
+    if adapter_id != ADAPTER_ID_VECTORBT_SIGNAL_V1:
+        raise BacktestInvalid(f"unsupported adapter_id: {adapter_id!r}")
+    pp = prepared if prepared is not None else prepare_prices(prices)
+    for sc in scenarios:
+        if int(sc.lag_bars) < 1:
+            engine = "v1" if isinstance(signal_dsl, dict) else "MVP"
+            raise BacktestInvalid(f"lag_bars must be >= 1 for {engine} (no-lookahead default)")
+
+    order_timing, fill_price = _validate_execution_policy(execution_policy)
+    fracs = [_cost_fractions(cost_policy, sc.cost_multiplier) for sc in scenarios]
+
+    strategy_id = "buy_and_hold_mvp"
+    dsl_fp: str | None = None
+    flags: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    lags = sorted({int(sc.lag_bars) for sc in scenarios})
+    if isinstance(signal_dsl, dict):
+        entry_raw, exit_raw, dsl_fp = _compiled_raw_signals(pp, prices, signal_dsl, lags[0])
+        for lag in lags:
+            flags[lag] = (_shift_rows(entry_raw, pp, lag), _shift_rows(exit_raw, pp, lag))
+        strategy_id = "signal_dsl_v1"
+        ext = signal_dsl.get("extensions") if isinstance(signal_dsl.get("extensions"), dict) else {}
+        if isinstance(ext, dict) and isinstance(ext.get("strategy_id"), str) and ext.get("strategy_id"):
+            strategy_id = str(ext["strategy_id"])
+    else:
+        for lag in lags:
+            flags[lag] = _buy_and_hold_flags(pp, lag)
+
+    entries = np.stack([flags[int(sc.lag_bars)][0] for sc in scenarios])
+    exits = np.stack([flags[int(sc.lag_bars)][1] for sc in scenarios])
+    exec_px = pp.open if order_timing == "next_open" else pp.close
+    equity, trades = _simulate(
+        pp,
+        entries=entries,
+        exits=exits,
+        exec_px=exec_px,
+        commission=np.array([c for c, _s in fracs], dtype=float),
+        slippage=np.array([s for _c, s in fracs], dtype=float),
+    )
+    return _ScenarioRun(
+        equity=equity,
+        trades=trades,
+        order_timing=order_timing,
+        fill_price=fill_price,
+        fracs=fracs,
+        strategy_id=strategy_id,
+        dsl_fingerprint=dsl_fp,
+    )
+
+
+def run_adapter_scenarios(
+    *,
+    adapter_id: str,
+    prices: pd.DataFrame,
+    scenarios: list[StressScenario],
+    execution_policy: dict[str, Any],
+    cost_policy: dict[str, Any],
+    signal_dsl: dict[str, Any] | None = None,
+    prepared: PreparedPrices | None = None,
+) -> list[dict[str, Any]]:
+    """Backtest all `scenarios` on one prices frame; returns per-scenario stats in input order.
+
+    Stats match `run_adapter(...).stats` for the same lag_bars and scaled cost policy (plus
+    `cost_multiplier`; `signals_fingerprint` is not computed). Pass `prepared` to reuse alignment work
+    across calls on the same frame.
+    """
+    if not scenarios:
+        if adapter_id != ADAPTER_ID_VECTORBT_SIGNAL_V1:
+            raise BacktestInvalid(f"unsupported adapter_id: {adapter_id!r}")
+        return []
+    run = _run_scenarios(
+        adapter_id=adapter_id,
+        prices=prices,
+        scenarios=scenarios,
+        execution_policy=execution_policy,
+        cost_policy=cost_policy,
+        signal_dsl=signal_dsl,
+        prepared=prepared,
+    )
+
+    out: list[dict[str, Any]] = []
+    for i, sc in enumerate(scenarios):
+        eq = pd.Series(run.equity[:, i].tolist(), dtype=float)
+        commission_frac, slippage_frac = run.fracs[i]
+        stats: dict[str, Any] = {
+            "adapter_id": ADAPTER_ID_VECTORBT_SIGNAL_V1,
+            "strategy_id": run.strategy_id,
+            "lag_bars": int(sc.lag_bars),
+            "total_return": float(eq.iloc[-1] / 1.0 - 1.0) if not eq.empty else 0.0,
+            "max_drawdown": _max_drawdown(eq) if not eq.empty else 0.0,
+            "sharpe": _sharpe_from_equity(eq) if not eq.empty else None,
+            "trade_count": int(run.trades[i]),
+            "execution": {"order_timing": run.order_timing, "fill_price": run.fill_price},
+            "cost": {"commission_fraction": commission_frac, "slippage_fraction": slippage_frac},
+            "cost_multiplier": float(sc.cost_multiplier),
+        }
+        if run.dsl_fingerprint is not None:
+            stats["dsl_fingerprint"] = run.dsl_fingerprint
+        out.append(stats)
+    return out
+
+
+def run_adapter_minimal(
+    *,
+    adapter_id: str,
+    prices: pd.DataFrame,
+    lag_bars: int,
+    execution_policy: dict[str, Any],
+    cost_policy: dict[str, Any],
+    signal_dsl: dict[str, Any] | None = None,
+    prepared: PreparedPrices | None = None,
+) -> dict[str, Any]:
+    """Only `total_return` and `trade_count` (same values as `run_adapter(...).stats`).
+
+    No curve, trades, positions or turnover frames are built and no drawdown/sharpe is computed:
+    this is the holdout evaluation path, whose output is restricted to a minimal summary anyway.
+    """
+    run = _run_scenarios(
+        adapter_id=adapter_id,
+        prices=prices,
+        scenarios=[StressScenario(lag_bars=int(lag_bars))],
+        execution_policy=execution_policy,
+        cost_policy=cost_policy,
+        signal_dsl=signal_dsl,
+        prepared=prepared,
+    )
+    eq = run.equity[:, 0]
+    return {
+        "total_return": float(eq[-1] / 1.0 - 1.0) if len(eq) else 0.0,
+        "trade_count": int(run.trades[0]),
+        "lag_bars": int(lag_bars),
+    }
@@ -10,6 +10,7 @@ from typing import Any
 
 import pandas as pd
 
+from quant_eam.backtest.curve_composer_adapter_v1 import ALIGN_MODES
 from quant_eam.gaterunner.run import EXIT_OK as GATE_OK, run_once as gaterunner_run_once
 from quant_eam.registry.cards import create_card_from_run, show_card
 from quant_eam.registry.errors import RegistryInvalid
@@ -130,6 +131,7 @@ def run_once(
     policy_bundle_path: Path,
     register_card: bool,
     title: str | None,
+    align: str = "intersection",
 ) -> tuple[int, dict[str, Any]]:
     artifact_root = Path(os.getenv("EAM_ARTIFACT_ROOT", "/artifacts"))
     data_root = Path(os.getenv("EAM_DATA_ROOT", "/data"))
@@ -146,6 +148,8 @@ def run_once(
 
     if not card_ids:
         return EXIT_USAGE_OR_ERROR, {"error": "missing --card-ids"}
+    if align not in ALIGN_MODES:
+        return EXIT_INVALID, {"error": f"unsupported align rule: {align!r}"}
     if len(weights) != len(card_ids):
         return EXIT_INVALID, {"error": "weights count must equal card_ids count"}
     if (not allow_negative_weights) and any((w < 0) for w in weights):
@@ -179,7 +183,7 @@ def run_once(
         components=comps,
         dt_start=dt_start,
         dt_end=dt_end,
-        align="intersection",
+        align=str(align),
         base_equity=1.0,
     )
 
@@ -239,6 +243,12 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--policy-bundle", required=True, help="Path to composer policy bundle YAML.")
     parser.add_argument("--register-card", action="store_true", help="Record trial + create new experience card (PASS only).")
     parser.add_argument("--title", default=None, help="Card title (required when --register-card).")
+    parser.add_argument(
+        "--align",
+        choices=list(ALIGN_MODES),
+        default="intersection",
+        help="dt alignment of component curves (union_ffill: union grid, gaps forward-filled).",
+    )
     args = parser.parse_args(argv)
 
     try:
@@ -255,6 +265,7 @@ def main(argv: list[str] | None = None) -> int:
             policy_bundle_path=policy_bundle_path,
             register_card=bool(args.register_card),
             title=args.title,
+            align=str(args.align),
         )
         print(json.dumps(out, indent=2, sort_keys=True))
         return code
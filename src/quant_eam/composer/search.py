@@ -0,0 +1,311 @@
+"""Composer weight search: rank many allocations over existing sleeves, materialize only the top-k.
+
+Component curves are resolved and aligned once (`align_curves`). Candidate weight vectors live on the
+simplex (non-negative, sum=1) and come from a grid (`step`) or seeded random samples (uniform Dirichlet).
+All candidates are composed in one vectorized pass (`compose_equity_batch`) and scored with the composer
+metrics (sharpe / total_return / max_drawdown). Only the top-k candidates go through `composer.run.run_once`
+(dossier + gates); the ranking is recorded as a leaderboard:
+
+    <artifact_root>/composer_search/<search_id>/leaderboard.json
+
+`search_id` hashes the search spec (cards, align, mode, step/samples/seed, metric, top_k, policy bundle);
+rerunning the same search is a noop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from quant_eam.backtest.curve_composer_adapter_v1 import (
+    ALIGN_MODES,
+    align_curves,
+    compose_equity_batch,
+)
+from quant_eam.composer.run import (
+    EXIT_INVALID,
+    EXIT_OK,
+    EXIT_USAGE_OR_ERROR,
+    _canonical_json_sha256,
+    _parse_csv_list,
+)
+from quant_eam.composer.run import run_once as composer_run_once
+from quant_eam.contracts import validate as contracts_validate
+from quant_eam.policies.load import sha256_file
+from quant_eam.policies.resolve import load_policy_bundle
+from quant_eam.registry.cards import show_card
+from quant_eam.registry.errors import RegistryInvalid
+from quant_eam.registry.storage import default_registry_root
+
+SEARCH_MODES = ("grid", "random")
+SEARCH_METRICS = ("sharpe", "total_return", "max_drawdown")
+DEFAULT_MAX_CANDIDATES = 200_000
+WEIGHT_DECIMALS = 6
+
+
+def grid_weights(n: int, step: float) -> np.ndarray:
+    """All simplex points whose weights are multiples of `step` (1/step must be an integer), shape (K, n)."""
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    m = round(1.0 / float(step)) if step > 0 else 0
+    if m < 1 or abs(m * float(step) - 1.0) > 1e-9:
+        raise ValueError(f"grid step must divide 1.0: {step!r}")
+    # Stars and bars: choose n-1 bar positions among m+n-1 slots; gaps between bars are the integer parts.
+    rows = []
+    for bars in itertools.combinations(range(m + n - 1), n - 1):
+        edges = (-1, *bars, m + n - 1)
+        rows.append([edges[i + 1] - edges[i] - 1 for i in range(n)])
+    return np.asarray(rows, dtype=float).reshape(-1, n) / float(m)
+
+
+def random_simplex_weights(n: int, samples: int, seed: int) -> np.ndarray:
+    """`samples` uniform draws from the n-simplex (Dirichlet(1, ..., 1)), reproducible for a seed."""
+    if n < 1 or samples < 1:
+        raise ValueError("n and samples must be >= 1")
+    return np.random.default_rng(int(seed)).dirichlet(np.ones(n), size=int(samples))
+
+
+def batch_metrics(equity: np.ndarray, *, periods_per_year: int = 252) -> dict[str, np.ndarray]:
+    """Vectorized `total_return`, `max_drawdown`, `sharpe` for (K, T) equity rows (sharpe NaN where undefined).
+
+    Same definitions as the curve composer adapter: base = first point, drawdown vs running peak,
+    sharpe = mean/std(ddof=1) of simple returns scaled by sqrt(periods_per_year).
+    """
+    eq = np.atleast_2d(np.asarray(equity, dtype=float))
+    k, t = eq.shape
+    total_return = eq[:, -1] / eq[:, 0] - 1.0
+    max_drawdown = np.min(eq / np.maximum.accumulate(eq, axis=1) - 1.0, axis=1)
+    sharpe = np.full(k, np.nan)
+    if t >= 3:
+        r = eq[:, 1:] / eq[:, :-1] - 1.0
+        mu = r.mean(axis=1)
+        sigma = r.std(axis=1, ddof=1)
+        ok = sigma != 0.0
+        sharpe[ok] = mu[ok] / sigma[ok] * math.sqrt(periods_per_year)
+    return {"total_return": total_return, "max_drawdown": max_drawdown, "sharpe": sharpe}
+
+
+def rank_candidates(values: np.ndarray, *, higher_is_better: bool = True) -> np.ndarray:
+    """Candidate indices best-first; NaN scores last, ties keep candidate order."""
+    v = np.asarray(values, dtype=float)
+    key = -v if higher_is_better else v
+    key = np.where(np.isnan(key), np.inf, key)
+    return np.argsort(key, kind="stable")
+
+
+def _round_weights(w: np.ndarray) -> list[float]:
+    """Round to WEIGHT_DECIMALS; the largest weight absorbs the residual so the sum passes run_once's 1e-9 check."""
+    out = [round(float(x), WEIGHT_DECIMALS) for x in w]
+    j = int(np.argmax(w))
+    out[j] = 0.0
+    out[j] = 1.0 - sum(out)
+    return out
+
+
+def _float_or_none(v: Any) -> float | None:
+    try:
+        f = float(v)
+    except (TypeError, ValueError):
+        return None
+    return f if math.isfinite(f) else None
+
+
+def _write_json_atomic(path: Path, obj: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.parent / (path.name + ".tmp")
+    tmp.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def search_once(
+    *,
+    card_ids: list[str],
+    policy_bundle_path: Path,
+    mode: str = "grid",
+    step: float = 0.1,
+    samples: int = 1000,
+    seed: int = 0,
+    metric: str = "sharpe",
+    top_k: int = 3,
+    align: str = "intersection",
+    max_candidates: int = DEFAULT_MAX_CANDIDATES,
+) -> tuple[int, dict[str, Any]]:
+    artifact_root = Path(os.getenv("EAM_ARTIFACT_ROOT", "/artifacts"))
+    registry_root = default_registry_root(artifact_root=artifact_root)
+
+    if len(card_ids) < 2:
+        return EXIT_USAGE_OR_ERROR, {"error": "weight search needs at least two --card-ids"}
+    if len(set(card_ids)) != len(card_ids):
+        return EXIT_INVALID, {"error": "duplicate card_ids"}
+    if mode not in SEARCH_MODES:
+        return EXIT_INVALID, {"error": f"unsupported search mode: {mode!r}"}
+    if metric not in SEARCH_METRICS:
+        return EXIT_INVALID, {"error": f"unsupported metric: {metric!r}"}
+    if align not in ALIGN_MODES:
+        return EXIT_INVALID, {"error": f"unsupported align rule: {align!r}"}
+    if int(top_k) < 0:
+        return EXIT_INVALID, {"error": "top_k must be >= 0"}
+    # max_drawdown is negative; "higher" means less negative, so every metric ranks descending.
+    higher_is_better = True
+
+    bundle_doc = load_policy_bundle(policy_bundle_path)
+    spec = {
+        "schema_version": "composer_search_spec_v1",
+        "card_ids": list(card_ids),
+        "align": align,
+        "mode": mode,
+        "step": float(step) if mode == "grid" else None,
+        "samples": int(samples) if mode == "random" else None,
+        "seed": int(seed) if mode == "random" else None,
+        "metric": metric,
+        "top_k": int(top_k),
+        "policy_bundle_id": str(bundle_doc["policy_bundle_id"]),
+        "policy_bundle_sha256": sha256_file(policy_bundle_path),
+    }
+    search_id = _canonical_json_sha256(spec)[:12]
+    out_dir = artifact_root / "composer_search" / search_id
+    leaderboard_path = out_dir / "leaderboard.json"
+    if leaderboard_path.is_file():
+        return EXIT_OK, {"search_id": search_id, "leaderboard_path": leaderboard_path.as_posix(), "noop": True}
+
+    # Resolve cards -> primary runs once; the curves are loaded and aligned once for all candidates.
+    run_ids: list[str] = []
+    for cid in card_ids:
+        card = show_card(registry_root=registry_root, card_id=cid)
+        run_id = str(card.get("primary_run_id", "")).strip()
+        if not run_id:
+            return EXIT_INVALID, {"error": f"card missing primary_run_id: {cid}"}
+        run_ids.append(run_id)
+    aligned = align_curves([artifact_root / "dossiers" / r for r in run_ids], align=align)
+
+    n = len(card_ids)
+    if mode == "grid":
+        m = round(1.0 / float(step)) if step > 0 else 0
+        if m >= 1 and math.comb(m + n - 1, n - 1) > int(max_candidates):
+            return EXIT_INVALID, {"error": f"grid has {math.comb(m + n - 1, n - 1)} candidates (max {int(max_candidates)}); use a coarser step"}
+        try:
+            weights = grid_weights(n, float(step))
+        except ValueError as e:
+            return EXIT_INVALID, {"error": str(e)}
+    else:
+        if not (1 <= int(samples) <= int(max_candidates)):
+            return EXIT_INVALID, {"error": f"samples must be in [1, {int(max_candidates)}]"}
+        weights = random_simplex_weights(n, int(samples), int(seed))
+
+    scores = batch_metrics(compose_equity_batch(aligned, weights))
+    order = rank_candidates(scores[metric], higher_is_better=higher_is_better)
+
+    top: list[dict[str, Any]] = []
+    for rank, ci in enumerate(order[: int(top_k)].tolist(), start=1):
+        w = _round_weights(weights[ci])
+        code, out = composer_run_once(
+            card_ids=list(card_ids),
+            weights=w,
+            policy_bundle_path=policy_bundle_path,
+            register_card=False,
+            title=None,
+            align=align,
+        )
+        entry: dict[str, Any] = {
+            "rank": rank,
+            "candidate_index": int(ci),
+            "weights": dict(zip(card_ids, w, strict=True)),
+            "search_metric": _float_or_none(scores[metric][ci]),
+            "search_metrics": {k: _float_or_none(v[ci]) for k, v in sorted(scores.items())},
+            "composer_exit_code": int(code),
+            "run_id": out.get("run_id"),
+            "dossier_path": out.get("dossier_path"),
+            "gate_results_path": out.get("gate_results_path"),
+            "overall_pass": False,
+            "test_metric": None,
+        }
+        if code != EXIT_OK:
+            entry["error"] = out.get("error")
+        else:
+            dossier_dir = Path(str(out["dossier_path"]))
+            m_doc = json.loads((dossier_dir / "metrics.json").read_text(encoding="utf-8"))
+            entry["test_metric"] = _float_or_none(m_doc.get(metric))
+            gr_path = dossier_dir / "gate_results.json"
+            if gr_path.is_file():
+                entry["overall_pass"] = bool(json.loads(gr_path.read_text(encoding="utf-8")).get("overall_pass"))
+        top.append(entry)
+
+    best = next((t for t in top if t["overall_pass"]), None)
+    leaderboard = {
+        "schema_version": "composer_leaderboard_v1",
+        "search_id": search_id,
+        "spec": spec,
+        "metric": metric,
+        "higher_is_better": higher_is_better,
+        "components": [{"card_id": c, "run_id": r} for c, r in zip(card_ids, run_ids, strict=True)],
+        "aligned_rows": len(aligned.dt),
+        "candidates_total": int(weights.shape[0]),
+        "candidates_scored": int(np.count_nonzero(~np.isnan(scores[metric]))),
+        "top_k": int(top_k),
+        "best": {k: best.get(k) if best else None for k in ("rank", "weights", "search_metric", "test_metric", "run_id", "dossier_path", "gate_results_path")},
+        "top": top,
+        "extensions": {},
+    }
+    code, msg = contracts_validate.validate_payload(leaderboard)
+    if code != contracts_validate.EXIT_OK:
+        return EXIT_INVALID, {"error": f"composer leaderboard contract invalid: {msg}"}
+    _write_json_atomic(leaderboard_path, leaderboard)
+    return EXIT_OK, {
+        "search_id": search_id,
+        "leaderboard_path": leaderboard_path.as_posix(),
+        "candidates_total": leaderboard["candidates_total"],
+        "best": leaderboard["best"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m quant_eam.composer.search")
+    parser.add_argument("--card-ids", required=True, help="Comma-separated card_ids (sleeves) to allocate across.")
+    parser.add_argument("--policy-bundle", required=True, help="Path to composer policy bundle YAML.")
+    parser.add_argument("--mode", choices=list(SEARCH_MODES), default="grid", help="Candidate generator.")
+    parser.add_argument("--step", type=float, default=0.1, help="Grid step (grid mode; 1/step must be an integer).")
+    parser.add_argument("--samples", type=int, default=1000, help="Random simplex samples (random mode).")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (random mode).")
+    parser.add_argument("--metric", choices=list(SEARCH_METRICS), default="sharpe", help="Ranking metric (higher is better).")
+    parser.add_argument("--top-k", type=int, default=3, help="Candidates materialized as dossiers (+ gates).")
+    parser.add_argument("--align", choices=list(ALIGN_MODES), default="intersection", help="dt alignment of component curves.")
+    parser.add_argument("--max-candidates", type=int, default=DEFAULT_MAX_CANDIDATES, help="Refuse searches larger than this.")
+    args = parser.parse_args(argv)
+
+    try:
+        policy_bundle_path = Path(args.policy_bundle)
+        if not policy_bundle_path.is_file():
+            print(json.dumps({"error": f"policy bundle not found: {policy_bundle_path.as_posix()}"}), file=sys.stderr)
+            return EXIT_USAGE_OR_ERROR
+        code, out = search_once(
+            card_ids=_parse_csv_list(args.card_ids),
+            policy_bundle_path=policy_bundle_path,
+            mode=str(args.mode),
+            step=float(args.step),
+            samples=int(args.samples),
+            seed=int(args.seed),
+            metric=str(args.metric),
+            top_k=int(args.top_k),
+            align=str(args.align),
+            max_candidates=int(args.max_candidates),
+        )
+        print(json.dumps(out, indent=2, sort_keys=True))
+        return code
+    except RegistryInvalid as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return EXIT_INVALID
+    except Exception as e:  # noqa: BLE001
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return EXIT_USAGE_OR_ERROR
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
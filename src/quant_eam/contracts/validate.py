@@ -45,6 +45,7 @@ SCHEMA_VERSION_TO_FILE = {
     "llm_session_v1": "llm_session_schema_v1.json",
     "llm_usage_report_v1": "llm_usage_report_schema_v1.json",
     "output_guard_report_v1": "output_guard_report_schema_v1.json",
+    "composer_leaderboard_v1": "composer_leaderboard_v1.json",
 }
 
 DSL_VERSION_TO_FILE = {
@@ -0,0 +1,192 @@
+"""File hashing with a verified-hash cache and chunked (Merkle) manifests.
+
+- `VerifiedHashCache` remembers sha256 digests per path, keyed by the file fingerprint
+  (size, mtime_ns, inode). A file whose fingerprint is unchanged is not re-read. Callers can bound
+  that trust by age or number of hits. The process-wide instance backs `policies.load.sha256_file`
+  and the snapshot integrity gate's opt-in stat cache.
+- A chunk manifest records the sha256 of each fixed-size chunk of a file, a Merkle root over the
+  chunk digests, the full-file sha256 and the fingerprint at write time. Chunks can be verified in
+  parallel (hashlib releases the GIL), and a mismatch names the corrupt byte ranges.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+CHUNK_MANIFEST_SCHEMA_VERSION = "chunk_manifest_v1"
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+_READ_BYTES = 1024 * 1024
+
+Fingerprint = tuple[int, int, int]
+
+
+def file_fingerprint(path: Path) -> Fingerprint:
+    """(size, mtime_ns, inode) of `path` (raises OSError when missing)."""
+    st = os.stat(path)
+    return int(st.st_size), int(st.st_mtime_ns), int(st.st_ino)
+
+
+def sha256_file_uncached(path: Path) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_READ_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class VerifiedHashCache:
+    """Thread-safe path -> (fingerprint, sha256) map.
+
+    Entries also carry when the digest was verified (monotonic clock) and how often it was served.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Fingerprint, str, float, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    def lookup(self, path: Path, *, max_age_s: float | None = None, max_uses: int | None = None) -> str | None:
+        """Cached digest when the file fingerprint is unchanged, else None.
+
+        An entry verified more than `max_age_s` seconds ago, or already served `max_uses` times, is
+        dropped and None is returned, so the caller re-hashes the file.
+        """
+        try:
+            fp = file_fingerprint(path)
+        except OSError:
+            return None
+        key = self._key(path)
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is None or ent[0] != fp:
+                return None
+            _, sha, verified_at, uses = ent
+            expired = max_age_s is not None and time.monotonic() - verified_at >= max_age_s
+            if expired or (max_uses is not None and uses >= max_uses):
+                del self._entries[key]
+                return None
+            self._entries[key] = (fp, sha, verified_at, uses + 1)
+        return sha
+
+    def record(self, path: Path, sha256: str, fingerprint: Fingerprint | None = None) -> None:
+        """Remember a digest verified for `fingerprint` (default: the current one)."""
+        try:
+            fp = fingerprint if fingerprint is not None else file_fingerprint(path)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[self._key(path)] = (fp, str(sha256), time.monotonic(), 0)
+
+    def sha256(self, path: Path) -> str:
+        hit = self.lookup(path)
+        if hit is not None:
+            return hit
+        # Fingerprint before reading: a concurrent write changes mtime/size, so the entry goes stale.
+        fp = file_fingerprint(path)
+        digest = sha256_file_uncached(path)
+        self.record(path, digest, fp)
+        return digest
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CACHE = VerifiedHashCache()
+
+
+def verified_hash_cache() -> VerifiedHashCache:
+    return _CACHE
+
+
+def cached_sha256_file(path: Path) -> str:
+    return _CACHE.sha256(path)
+
+
+def _merkle_root(leaves: list[str]) -> str:
+    level = [bytes.fromhex(x) for x in leaves] or [hashlib.sha256(b"").digest()]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def build_chunk_manifest(path: Path, *, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> dict[str, Any]:
+    """One sequential pass: full-file sha256 plus per-chunk digests and their Merkle root."""
+    chunk_bytes = max(1, int(chunk_bytes))
+    fp = file_fingerprint(path)
+    full = hashlib.sha256()
+    chunks: list[str] = []
+    with Path(path).open("rb") as f:
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            full.update(block)
+            chunks.append(hashlib.sha256(block).hexdigest())
+    return {
+        "schema_version": CHUNK_MANIFEST_SCHEMA_VERSION,
+        "sha256": full.hexdigest(),
+        "size": fp[0],
+        "chunk_bytes": chunk_bytes,
+        "chunks": chunks,
+        "merkle_root": _merkle_root(chunks),
+        "fingerprint": {"size": fp[0], "mtime_ns": fp[1], "inode": fp[2]},
+    }
+
+
+def chunk_manifest_anchored(manifest: dict[str, Any], *, sha256: str, merkle_root: str) -> bool:
+    """True when `manifest` records `sha256` and its chunk digests hash to the given `merkle_root`.
+
+    `merkle_root` must come from a trusted source (the snapshot manifest); the chunk file alone proves nothing.
+    """
+    chunks = manifest.get("chunks")
+    if not isinstance(chunks, list) or not all(isinstance(c, str) for c in chunks):
+        return False
+    if int(manifest.get("chunk_bytes") or 0) <= 0 or str(manifest.get("sha256") or "") != sha256:
+        return False
+    try:
+        return str(manifest.get("merkle_root") or "") == merkle_root == _merkle_root(chunks)
+    except ValueError:
+        return False
+
+
+def verify_chunk_manifest(path: Path, manifest: dict[str, Any], *, workers: int | None = None) -> list[dict[str, int]]:
+    """Re-hash every chunk (in parallel) and return the corrupt ranges ([] = file matches the manifest).
+
+    Each entry is `{"index", "offset", "length"}`; a size mismatch is reported on the affected tail chunks.
+    """
+    chunk_bytes = int(manifest.get("chunk_bytes") or 0)
+    expected = manifest.get("chunks")
+    if chunk_bytes <= 0 or not isinstance(expected, list):
+        raise ValueError("invalid chunk manifest")
+    size = os.stat(path).st_size
+    n = max(len(expected), (size + chunk_bytes - 1) // chunk_bytes)
+
+    def _check(i: int) -> dict[str, int] | None:
+        with Path(path).open("rb") as f:
+            f.seek(i * chunk_bytes)
+            block = f.read(chunk_bytes)
+        want = expected[i] if i < len(expected) else None
+        if want is not None and hashlib.sha256(block).hexdigest() == want:
+            return None
+        return {"index": i, "offset": i * chunk_bytes, "length": len(block) if block else chunk_bytes}
+
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    if workers <= 1 or n <= 1:
+        results = [_check(i) for i in range(n)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(int(workers), n), thread_name_prefix="chunk-verify") as ex:
+            results = list(ex.map(_check, range(n)))
+    return [r for r in results if r is not None]
@@ -0,0 +1,284 @@
+"""Shared helpers for append-only JSONL logs: byte-offset indexes and reverse (tail) reads.
+
+An `OffsetIndex` maps a key field of each JSON line to the byte offset of its first occurrence and
+keeps the ordered (key, offset, end) span of every line. It covers the log bytes [0, size). Blank or
+unparseable lines are kept as spans with key None, so consecutive spans are contiguous
+(`offset == previous end`) and a missing span is always detectable.
+
+The index can be persisted as a sidecar JSONL file. Each sidecar row is `{"key", "offset", "end"}`, one
+per log line and in log order. A sidecar is accepted only when its spans start at 0, are contiguous and
+end at or before the log's EOF. Bytes past the last span are scanned and appended. Any other sidecar is
+rebuilt from the log.
+
+Callers keep one `OffsetIndex` per log in a process-local cache guarded by their own lock.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+REVERSE_BLOCK_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+Span = tuple[str | None, int, int]
+
+
+def canonical_line(obj: dict[str, Any]) -> bytes:
+    return (json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True) + "\n").encode("utf-8")
+
+
+def parse_line(raw: bytes, *, strict: bool = False) -> dict[str, Any] | None:
+    """JSON object on one line; None for blank/non-object lines (and invalid JSON unless `strict`)."""
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        doc = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        if strict:
+            raise
+        return None
+    return doc if isinstance(doc, dict) else None
+
+
+def iter_jsonl_reverse(
+    path: Path, *, strict: bool = False, block_size: int = REVERSE_BLOCK_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Yield JSONL objects newest-first by reading fixed-size blocks backwards from EOF."""
+    with Path(path).open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        carry = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + carry).split(b"\n")
+            # The first segment may be cut mid-line; keep it until the preceding block is read.
+            carry = parts[0]
+            for raw in reversed(parts[1:]):
+                doc = parse_line(raw, strict=strict)
+                if doc is not None:
+                    yield doc
+        doc = parse_line(carry, strict=strict)
+        if doc is not None:
+            yield doc
+
+
+def tail_jsonl(
+    path: Path, limit: int, *, strict: bool = False, block_size: int = REVERSE_BLOCK_SIZE
+) -> list[dict[str, Any]]:
+    """Last `limit` JSONL objects in file order, reading only the tail of the file."""
+    if limit <= 0 or not Path(path).is_file():
+        return []
+    out: list[dict[str, Any]] = []
+    for doc in iter_jsonl_reverse(path, strict=strict, block_size=block_size):
+        out.append(doc)
+        if len(out) >= limit:
+            break
+    out.reverse()
+    return out
+
+
+@dataclass
+class OffsetIndex:
+    """Ordered spans of a JSONL log plus key -> offset of the first line with that key."""
+
+    size: int = 0
+    mtime_ns: int = 0
+    persisted: int = -1  # log bytes covered by the sidecar; -1 = no sidecar in sync
+    sidecar_bytes: int = -1  # sidecar file size after this index last wrote or read it
+    spans: list[Span] = field(default_factory=list)
+    records: list[tuple[str, int]] = field(default_factory=list)
+    first: dict[str, int] = field(default_factory=dict)
+
+    def add(self, key: str | None, offset: int, end: int) -> None:
+        self.spans.append((key, offset, end))
+        if key is not None:
+            self.records.append((key, offset))
+            if key:
+                self.first.setdefault(key, offset)
+        self.size = end
+
+
+def scan_spans(path: Path, key_field: str, start: int = 0) -> list[Span]:
+    """Spans of every line from byte `start` (key None for blank/unparseable lines)."""
+    out: list[Span] = []
+    with Path(path).open("rb") as f:
+        f.seek(start)
+        off = start
+        for raw in f:
+            end = off + len(raw)
+            doc = parse_line(raw)
+            out.append((str(doc.get(key_field, "")) if doc is not None else None, off, end))
+            off = end
+    return out
+
+
+def read_line_at(path: Path, offset: int) -> dict[str, Any] | None:
+    try:
+        with Path(path).open("rb") as f:
+            f.seek(offset)
+            return parse_line(f.readline())
+    except OSError:
+        return None
+
+
+def load_sidecar(sidecar: Path, size: int) -> OffsetIndex | None:
+    """Sidecar index if its spans are contiguous from 0 and within `size` log bytes, else None."""
+    idx = OffsetIndex()
+    try:
+        with Path(sidecar).open("rb") as f:
+            for raw in f:
+                e = parse_line(raw, strict=True)
+                if e is None:
+                    return None
+                key, off, end = e.get("key"), int(e["offset"]), int(e["end"])
+                if off != idx.size or end <= off or end > size:
+                    return None
+                idx.add(None if key is None else str(key), off, end)
+            idx.sidecar_bytes = f.tell()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    idx.persisted = idx.size
+    return idx
+
+
+def write_sidecar(sidecar: Path, idx: OffsetIndex, spans: list[Span], *, append: bool) -> None:
+    """Persist `spans`; on failure the index is marked as not persisted.
+
+    An append is only made when the sidecar is exactly as this index last left it and covers the bytes
+    right before the first new span; otherwise the whole index is rewritten, so the sidecar never gains
+    a gap or a duplicate span.
+    """
+    sidecar = Path(sidecar)
+    if append:
+        if not spans:
+            return
+        try:
+            current = sidecar.stat().st_size
+        except OSError:
+            current = -1
+        if idx.persisted != spans[0][1] or current != idx.sidecar_bytes:
+            append, spans = False, idx.spans
+    data = b"".join(canonical_line({"end": e, "key": k, "offset": o}) for k, o, e in spans)
+    try:
+        if append:
+            with sidecar.open("ab") as f:
+                f.write(data)
+            idx.sidecar_bytes += len(data)
+        else:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            tmp = sidecar.with_name(sidecar.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, sidecar)
+            idx.sidecar_bytes = len(data)
+    except OSError as e:
+        logger.warning("failed to write JSONL offset index %s: %s", sidecar.as_posix(), e)
+        idx.persisted = -1
+        return
+    idx.persisted = spans[-1][2] if spans else 0
+
+
+def _last_span_matches(path: Path, idx: OffsetIndex, key_field: str, size: int) -> bool:
+    """Cheap check that the log still holds the indexed bytes: the last span re-reads to the same key."""
+    if idx.size > size:
+        return False
+    if not idx.spans:
+        return idx.size == 0
+    key, off, end = idx.spans[-1]
+    try:
+        with Path(path).open("rb") as f:
+            f.seek(off)
+            raw = f.read(end - off)
+    except OSError:
+        return False
+    if len(raw) != end - off or (end < size and not raw.endswith(b"\n")):
+        return False
+    doc = parse_line(raw)
+    if key is None:
+        return doc is None
+    return doc is not None and str(doc.get(key_field, "")) == key
+
+
+def refresh_index(
+    path: Path,
+    key_field: str,
+    cached: OffsetIndex | None,
+    *,
+    sidecar: Path | None = None,
+    persist: bool = False,
+    rebuild: bool = False,
+) -> OffsetIndex:
+    """Return an index covering the whole log at `path`.
+
+    Starts from `cached` (or the sidecar), checks it still describes the log and scans only bytes
+    appended since; otherwise rebuilds from the log. The sidecar is written only when `persist` is set
+    (read-only callers pass False and keep the result in memory).
+    """
+    try:
+        st = Path(path).stat()
+    except FileNotFoundError:
+        return OffsetIndex()
+    size = int(st.st_size)
+    idx = None if rebuild else cached
+    if idx is not None and idx.size == size and idx.mtime_ns == st.st_mtime_ns:
+        return idx
+    if idx is None and not rebuild and sidecar is not None and Path(sidecar).is_file():
+        idx = load_sidecar(sidecar, size)
+    if idx is not None and not _last_span_matches(path, idx, key_field, size):
+        idx = None
+    if idx is None:
+        idx = OffsetIndex()
+        for k, o, e in scan_spans(path, key_field, 0):
+            idx.add(k, o, e)
+        if persist and sidecar is not None:
+            write_sidecar(sidecar, idx, idx.spans, append=False)
+    elif idx.size < size:
+        new_spans = scan_spans(path, key_field, idx.size)
+        for k, o, e in new_spans:
+            idx.add(k, o, e)
+        if persist and sidecar is not None:
+            write_sidecar(sidecar, idx, new_spans, append=True)
+    elif persist and sidecar is not None and idx.persisted != idx.size:
+        write_sidecar(sidecar, idx, idx.spans, append=False)
+    idx.size = size
+    idx.mtime_ns = int(st.st_mtime_ns)
+    return idx
+
+
+def append_indexed(
+    path: Path,
+    obj: dict[str, Any],
+    key_field: str,
+    idx: OffsetIndex,
+    *,
+    sidecar: Path | None = None,
+    persist: bool = False,
+) -> OffsetIndex:
+    """Append `obj` as one canonical line and return the index extended to cover it.
+
+    `idx` should come from `refresh_index` under the caller's lock. If another writer appended since,
+    the new tail is rescanned instead of being recorded at a guessed offset.
+    """
+    p = Path(path)
+    line = canonical_line(obj)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    with p.open("ab") as f:
+        off = f.seek(0, os.SEEK_END)
+        f.write(line)
+    end = off + len(line)
+    if idx.size != off:
+        return refresh_index(p, key_field, idx, sidecar=sidecar, persist=persist)
+    span: Span = (str(obj.get(key_field, "")), off, end)
+    idx.add(*span)
+    idx.mtime_ns = int(p.stat().st_mtime_ns)
+    if persist and sidecar is not None:
+        write_sidecar(sidecar, idx, [span], append=True)
+    return idx
@@ -0,0 +1,271 @@
+"""Lightweight spans, timers and counters (stdlib only) for the hot paths.
+
+Enable with `EAM_TIMINGS=1` (or `set_timings_enabled(True)`). While disabled, `span()` returns a shared
+no-op context manager, `@timed` calls straight through and `incr()` returns immediately. Each of these
+costs one module-global check.
+
+- `span(name)` / `@timed(name)` measure wall time (`time.perf_counter`). Durations are aggregated
+  process-wide per span name into a fixed-bucket histogram, with sum, count, max and an error count.
+  `render_prometheus()` exposes them as Prometheus text (served at `/metrics`).
+- The current span and the active collector live in contextvars, so nesting is tracked per request/task.
+  Threads only inherit them through a copied context (`contextvars.copy_context().run`).
+- `collect_spans()` (or `@timed(name, collect=True)`) additionally records every span and counter finished
+  inside it. `write_timings_json` dumps that record (e.g. a dossier's `timings.json` when
+  `EAM_DOSSIER_TIMINGS=1`).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+TIMINGS_SCHEMA_VERSION = "timings_v1"
+DURATION_BUCKETS_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_TRUE = {"1", "true", "yes", "on"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _env_flag(name: str) -> bool:
+    return str(os.getenv(name, "")).strip().lower() in _TRUE
+
+
+_enabled: bool | None = None
+
+
+def timings_enabled() -> bool:
+    global _enabled
+    if _enabled is None:
+        _enabled = _env_flag("EAM_TIMINGS")
+    return _enabled
+
+
+def set_timings_enabled(value: bool | None) -> None:
+    """Force timings on/off; `None` re-reads `EAM_TIMINGS` on next use."""
+    global _enabled
+    _enabled = None if value is None else bool(value)
+
+
+def dossier_timings_enabled() -> bool:
+    return timings_enabled() and _env_flag("EAM_DOSSIER_TIMINGS")
+
+
+@dataclass
+class _SpanStats:
+    count: int = 0
+    errors: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(DURATION_BUCKETS_S))
+
+
+_LOCK = threading.Lock()
+_SPANS: dict[str, _SpanStats] = {}
+_COUNTERS: dict[str, float] = {}
+
+
+@dataclass
+class SpanCollector:
+    """Spans and counters finished inside one `collect_spans()` block."""
+
+    started: float = field(default_factory=time.perf_counter)
+    spans: list[dict[str, Any]] = field(default_factory=list)
+    counters: dict[str, float] = field(default_factory=dict)
+
+    def to_json_obj(self) -> dict[str, Any]:
+        return {
+            "schema_version": TIMINGS_SCHEMA_VERSION,
+            "elapsed_s": round(time.perf_counter() - self.started, 6),
+            "spans": list(self.spans),
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+
+_CURRENT_SPAN: contextvars.ContextVar[str | None] = contextvars.ContextVar("eam_current_span", default=None)
+_COLLECTOR: contextvars.ContextVar[SpanCollector | None] = contextvars.ContextVar("eam_span_collector", default=None)
+
+
+def record_span(name: str, duration_s: float, *, ok: bool = True) -> None:
+    """Add one finished span to the process-wide aggregates."""
+    with _LOCK:
+        st = _SPANS.get(name)
+        if st is None:
+            st = _SPANS[name] = _SpanStats()
+        st.count += 1
+        st.total_s += duration_s
+        st.max_s = max(st.max_s, duration_s)
+        if not ok:
+            st.errors += 1
+        for i, bound in enumerate(DURATION_BUCKETS_S):
+            if duration_s <= bound:
+                st.buckets[i] += 1
+                break
+
+
+def incr(name: str, n: float = 1) -> None:
+    """Increment counter `name` (no-op while timings are disabled)."""
+    if not timings_enabled():
+        return
+    col = _COLLECTOR.get()
+    with _LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + n
+        if col is not None:
+            col.counters[name] = col.counters.get(name, 0) + n
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+@contextmanager
+def _span(name: str) -> Iterator[None]:
+    parent = _CURRENT_SPAN.get()
+    token = _CURRENT_SPAN.set(name)
+    t0 = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        dt = time.perf_counter() - t0
+        _CURRENT_SPAN.reset(token)
+        record_span(name, dt, ok=ok)
+        col = _COLLECTOR.get()
+        if col is not None:
+            col.spans.append(
+                {
+                    "name": name,
+                    "parent": parent,
+                    "start_s": round(t0 - col.started, 6),
+                    "duration_s": round(dt, 6),
+                    "ok": ok,
+                }
+            )
+
+
+def span(name: str) -> Any:
+    """Context manager timing the enclosed block as `name`."""
+    if not timings_enabled():
+        return _NOOP
+    return _span(name)
+
+
+@contextmanager
+def collect_spans() -> Iterator[SpanCollector | None]:
+    """Record spans/counters finished in this context (yields None while timings are disabled)."""
+    if not timings_enabled():
+        yield None
+        return
+    col = SpanCollector()
+    token = _COLLECTOR.set(col)
+    try:
+        yield col
+    finally:
+        _COLLECTOR.reset(token)
+
+
+def current_collector() -> SpanCollector | None:
+    return _COLLECTOR.get()
+
+
+def timed(name: str, *, collect: bool = False) -> Callable[[F], F]:
+    """Decorator form of `span(name)`; `collect=True` also opens a `collect_spans()` block."""
+
+    def deco(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not timings_enabled():
+                return fn(*args, **kwargs)
+            if collect:
+                with collect_spans(), _span(name):
+                    return fn(*args, **kwargs)
+            with _span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
+
+
+def write_timings_json(path: Path, **extra: Any) -> bool:
+    """Write the active collector as JSON to `path` (returns False when nothing is being collected)."""
+    col = _COLLECTOR.get()
+    if col is None:
+        return False
+    doc = {**col.to_json_obj(), **extra}
+    Path(path).write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return True
+
+
+def timing_snapshot() -> dict[str, Any]:
+    with _LOCK:
+        spans = {
+            k: {"count": v.count, "errors": v.errors, "total_s": v.total_s, "max_s": v.max_s, "buckets": list(v.buckets)}
+            for k, v in _SPANS.items()
+        }
+        counters = dict(_COUNTERS)
+    return {"enabled": timings_enabled(), "spans": spans, "counters": counters}
+
+
+def reset_timings() -> None:
+    with _LOCK:
+        _SPANS.clear()
+        _COUNTERS.clear()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(v: float) -> str:
+    if isinstance(v, int) or (isinstance(v, float) and v.is_integer() and not math.isinf(v)):
+        return str(int(v))
+    return repr(float(v))
+
+
+def render_prometheus(prefix: str = "eam") -> str:
+    """Prometheus text exposition (format 0.0.4) of span histograms and counters."""
+    snap = timing_snapshot()
+    lines = [
+        f"# HELP {prefix}_timings_enabled Whether span timing is enabled (EAM_TIMINGS).",
+        f"# TYPE {prefix}_timings_enabled gauge",
+        f"{prefix}_timings_enabled {1 if snap['enabled'] else 0}",
+        f"# HELP {prefix}_span_seconds Wall time of instrumented spans.",
+        f"# TYPE {prefix}_span_seconds histogram",
+    ]
+    spans = sorted(snap["spans"].items())
+    for name, st in spans:
+        lab = _label(name)
+        cum = 0
+        for bound, n in zip(DURATION_BUCKETS_S, st["buckets"]):
+            cum += n
+            lines.append(f'{prefix}_span_seconds_bucket{{span="{lab}",le="{bound:g}"}} {cum}')
+        lines.append(f'{prefix}_span_seconds_bucket{{span="{lab}",le="+Inf"}} {st["count"]}')
+        lines.append(f'{prefix}_span_seconds_sum{{span="{lab}"}} {_num(st["total_s"])}')
+        lines.append(f'{prefix}_span_seconds_count{{span="{lab}"}} {st["count"]}')
+    lines += [f"# HELP {prefix}_span_max_seconds Longest observed span.", f"# TYPE {prefix}_span_max_seconds gauge"]
+    lines += [f'{prefix}_span_max_seconds{{span="{_label(name)}"}} {_num(st["max_s"])}' for name, st in spans]
+    lines += [f"# HELP {prefix}_span_errors_total Spans that exited with an exception.", f"# TYPE {prefix}_span_errors_total counter"]
+    lines += [f'{prefix}_span_errors_total{{span="{_label(name)}"}} {st["errors"]}' for name, st in spans]
+    lines += [f"# HELP {prefix}_events_total Instrumentation counters.", f"# TYPE {prefix}_events_total counter"]
+    lines += [f'{prefix}_events_total{{name="{_label(k)}"}} {_num(v)}' for k, v in sorted(snap["counters"].items())]
+    return "\n".join(lines) + "\n"
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import csv
-import hashlib
 import json
 import os
 from dataclasses import dataclass
@@ -9,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+from quant_eam.core.hashing import build_chunk_manifest
 from quant_eam.data_lake.timeutil import parse_daily_dt, parse_iso_datetime, taipei_tz, to_iso
 from quant_eam.policies.load import default_policies_dir, load_yaml
 from quant_eam.contracts import validate as contracts_validate
@@ -22,14 +22,6 @@ def _utc_now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 @dataclass(frozen=True)
 class DatasetSummary:
     dataset_id: str
@@ -60,6 +52,10 @@ class DataLake:
     def dataset_csv_path(self, snapshot_id: str, dataset_id: str) -> Path:
         return self.snapshot_dir(snapshot_id) / f"{dataset_id}.csv"
 
+    def dataset_chunks_path(self, snapshot_id: str, dataset_id: str) -> Path:
+        """Chunk (Merkle) manifest of the dataset CSV, used for fast/parallel integrity verification."""
+        return self.snapshot_dir(snapshot_id) / f"{dataset_id}.chunks.json"
+
     def manifest_path(self, snapshot_id: str) -> Path:
         return self.snapshot_dir(snapshot_id) / "manifest.json"
 
@@ -241,7 +237,11 @@ class DataLake:
                     }
                 )
 
-        sha = _sha256_file(csv_path)
+        chunk_manifest = build_chunk_manifest(csv_path)
+        sha = str(chunk_manifest["sha256"])
+        self.dataset_chunks_path(snapshot_id, dataset_id).write_text(
+            json.dumps(chunk_manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
         symbols = sorted({str(r["symbol"]) for r in deduped})
 
         dataset_summary = DatasetSummary(
@@ -279,6 +279,8 @@ class DataLake:
                         "asof_latency_policy_id": str(policy.get("policy_id", "")),
                         "asof_rule": str(policy.get("params", {}).get("asof_rule", "")),
                         "quality_report_ref": quality_path.as_posix(),
+                        "chunk_bytes": int(chunk_manifest["chunk_bytes"]),
+                        "chunk_merkle_root": str(chunk_manifest["merkle_root"]),
                     },
                 }
             ],
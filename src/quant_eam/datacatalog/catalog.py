@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import csv
+import functools
 import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
+from quant_eam.core.timing import incr, timed
 from quant_eam.data_lake.timeutil import parse_daily_dt, parse_iso_datetime, taipei_tz, to_iso
 
 
@@ -19,6 +21,19 @@ class QueryStats:
 MARKET_ASOF_HINTS = ("_day", "_min", "_transaction", "_tick", "_dk", "ohlcv")
 
 
+@functools.lru_cache(maxsize=65536)
+def _daily_dt(raw: str) -> datetime:
+    return parse_daily_dt(raw).dt
+
+
+_Candidate = tuple[tuple[str, datetime], int, dict[str, Any]]  # (sort key, file position, row)
+
+
+def _ohlcv_sort_key(row: dict[str, Any]) -> tuple[str, datetime]:
+    """(symbol, parsed dt) order of `query_ohlcv` (raises ValueError on an unparseable dt)."""
+    return str(row.get("symbol", "")), _daily_dt(str(row.get("dt", "")))
+
+
 class DataCatalog:
     def __init__(self, root: Path | None = None) -> None:
         if root is None:
@@ -28,12 +43,15 @@ class DataCatalog:
     def _dataset_path(self, snapshot_id: str, dataset_id: str) -> Path:
         return self.root / "lake" / snapshot_id / f"{dataset_id}.csv"
 
-    def _read_dataset_rows(self, *, snapshot_id: str, dataset_id: str) -> list[dict[str, Any]]:
+    def _iter_dataset_rows(self, *, snapshot_id: str, dataset_id: str) -> Iterator[dict[str, Any]]:
         path = self._dataset_path(snapshot_id, dataset_id)
         if not path.is_file():
             raise FileNotFoundError(path)
         with path.open("r", newline="", encoding="utf-8") as f:
-            return list(csv.DictReader(f))
+            yield from csv.DictReader(f)
+
+    def _read_dataset_rows(self, *, snapshot_id: str, dataset_id: str) -> list[dict[str, Any]]:
+        return list(self._iter_dataset_rows(snapshot_id=snapshot_id, dataset_id=dataset_id))
 
     @staticmethod
     def _is_market_dataset(dataset_id: str) -> bool:
@@ -57,6 +75,22 @@ class DataCatalog:
             return str(value) in {str(v) for v in condition}
         return str(value) == str(condition)
 
+    @classmethod
+    def _match_row(cls, row: dict[str, Any], filters: dict[str, Any]) -> bool:
+        return all(cls._match_filter(row.get(field), cond) for field, cond in filters.items())
+
+    @staticmethod
+    def _available_by(av_raw: str, asof_dt: datetime) -> bool:
+        """Market as-of rule for a non-empty `available_at`: it parses and is <= as_of."""
+        try:
+            return parse_iso_datetime(av_raw) <= asof_dt
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _ohlcv_filters(symbols: Iterable[str], start: str, end: str) -> dict[str, Any]:
+        return {"symbol": sorted(symbols), "dt": {"gte": str(start), "lte": str(end)}}
+
     @staticmethod
     def _infer_dtypes(rows: list[dict[str, Any]]) -> dict[str, str]:
         if not rows:
@@ -102,6 +136,7 @@ class DataCatalog:
                 out[col] = "object"
         return out
 
+    @timed("datacatalog.query_dataset")
     def query_dataset(
         self,
         *,
@@ -119,16 +154,7 @@ class DataCatalog:
         rows_before_filter = len(rows)
         applied_filters = filters or {}
         if applied_filters:
-            filtered: list[dict[str, Any]] = []
-            for row in rows:
-                ok = True
-                for field, cond in applied_filters.items():
-                    if not self._match_filter(row.get(field), cond):
-                        ok = False
-                        break
-                if ok:
-                    filtered.append(row)
-            rows = filtered
+            rows = [row for row in rows if self._match_row(row, applied_filters)]
 
         rows_before_asof = len(rows)
         asof_dt = parse_iso_datetime(as_of)
@@ -136,18 +162,11 @@ class DataCatalog:
         is_market = self._is_market_dataset(dataset_id)
         has_available_at = any(str(r.get("available_at", "")).strip() for r in rows)
         if is_market and has_available_at:
-            gated: list[dict[str, Any]] = []
-            for row in rows:
-                av_raw = str(row.get("available_at", "")).strip()
-                if not av_raw:
-                    continue
-                try:
-                    av = parse_iso_datetime(av_raw)
-                except Exception:
-                    continue
-                if av <= asof_dt:
-                    gated.append(row)
-            rows = gated
+            rows = [
+                row
+                for row in rows
+                if (av_raw := str(row.get("available_at", "")).strip()) and self._available_by(av_raw, asof_dt)
+            ]
             as_of_applied = {
                 "rule": "available_at<=as_of",
                 "as_of": to_iso(asof_dt),
@@ -183,6 +202,8 @@ class DataCatalog:
                     keep.add(key)
             rows = [{k: v for k, v in row.items() if k in keep} for row in rows]
 
+        incr("datacatalog.rows_scanned", rows_before_filter)
+        incr("datacatalog.rows_returned", len(rows))
         dtypes = self._infer_dtypes(rows)
         columns = list(rows[0].keys()) if rows else (list(fields) if fields else [])
         return {
@@ -222,17 +243,91 @@ class DataCatalog:
         result = self.query_dataset(
             snapshot_id=snapshot_id,
             dataset_id=dataset_id,
-            filters={
-                "symbol": sorted(sym_set),
-                "dt": {"gte": str(start), "lte": str(end)},
-            },
+            filters=self._ohlcv_filters(sym_set, start, end),
             as_of=as_of,
             fields=fields,
             adjust="raw",
         )
         rows = list(result.get("rows", []))
-        rows.sort(key=lambda rr: (str(rr.get("symbol", "")), parse_daily_dt(str(rr.get("dt", ""))).dt))
+        rows.sort(key=_ohlcv_sort_key)
         asof_meta = result.get("as_of_applied", {}) if isinstance(result, dict) else {}
         rows_before = int(asof_meta.get("rows_before_asof", len(rows)))
         rows_after = int(asof_meta.get("rows_after_asof", len(rows)))
         return rows, QueryStats(rows_before_asof=rows_before, rows_after_asof=rows_after)
+
+    @timed("datacatalog.sample_ohlcv")
+    def sample_ohlcv(
+        self,
+        *,
+        snapshot_id: str,
+        symbols: list[str],
+        start: str,
+        end: str,
+        as_of: str,
+        max_rows: int,
+        per_symbol: bool = False,
+        dataset_id: str = "ohlcv_1d",
+    ) -> tuple[list[dict[str, Any]], QueryStats]:
+        """Leading rows of `query_ohlcv` (same filters, as-of rule and (symbol, dt) order) in one streamed scan.
+
+        Returns the first `max_rows` rows, or with `per_symbol` the first `max(1, max_rows // n_symbols)` rows
+        of each symbol. Rows go through the same reader, filters, as-of rule and sort key as `query_ohlcv`;
+        only bounded candidate buffers are kept in memory, and the QueryStats counts are exact.
+        """
+        sym_set = {s.strip() for s in symbols if s.strip()}
+        if not sym_set:
+            raise ValueError("symbols must be non-empty")
+        limit = max(1, int(max_rows))
+        if per_symbol:
+            limit = max(1, limit // len(sym_set))
+        filters = self._ohlcv_filters(sym_set, start, end)
+        asof_dt = parse_iso_datetime(as_of)
+        is_market = self._is_market_dataset(dataset_id)
+        # Candidates sorted by (sort key, file position) reproduce the stable sort of query_ohlcv. `gated`
+        # holds rows passing the as-of rule; `ungated` holds every filtered row and is only used when no row
+        # carries available_at (or for reference datasets).
+        gated: dict[str, list[_Candidate]] = {}
+        ungated: dict[str, list[_Candidate]] = {}
+        ungated_error: ValueError | None = None
+        rows_before = 0
+        rows_after = 0
+        has_available_at = False
+        scanned = 0
+
+        def _push(buffers: dict[str, list[_Candidate]], cand: _Candidate) -> None:
+            buf = buffers.setdefault(cand[0][0] if per_symbol else "", [])
+            buf.append(cand)
+            if len(buf) > 2 * limit + 64:
+                buf.sort(key=lambda c: c[:2])
+                del buf[limit:]
+
+        for seq, row in enumerate(self._iter_dataset_rows(snapshot_id=snapshot_id, dataset_id=dataset_id)):
+            scanned = seq + 1
+            if not self._match_row(row, filters):
+                continue
+            rows_before += 1
+            av_raw = str(row.get("available_at", "")).strip()
+            if av_raw:
+                has_available_at = True
+                if is_market and self._available_by(av_raw, asof_dt):
+                    rows_after += 1
+                    _push(gated, (_ohlcv_sort_key(row), seq, row))
+            if is_market and has_available_at:
+                ungated.clear()
+            elif ungated_error is None:
+                try:
+                    _push(ungated, (_ohlcv_sort_key(row), seq, row))
+                except ValueError as e:
+                    # Only fatal if the ungated rows end up being returned (query_ohlcv sorts those).
+                    ungated_error = e
+
+        incr("datacatalog.rows_scanned", scanned)
+        if is_market and has_available_at:
+            buffers = gated
+        else:
+            if ungated_error is not None:
+                raise ungated_error
+            buffers = ungated
+            rows_after = rows_before
+        out = [c[2] for bucket in sorted(buffers) for c in sorted(buffers[bucket], key=lambda c: c[:2])[:limit]]
+        return out, QueryStats(rows_before_asof=rows_before, rows_after_asof=rows_after)
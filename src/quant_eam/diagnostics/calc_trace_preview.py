@@ -1,7 +1,19 @@
+"""Calc trace preview: a small, as-of filtered table of prices, intermediates and raw/lagged signals.
+
+The preview is sized for interactive review:
+- rows are sampled while streaming the snapshot (`DataCatalog.sample_ohlcv`): the first `max_rows` rows in
+  (symbol, dt) order (`sample_mode="head"`), or the first `max_rows // n_symbols` rows of every symbol
+  (`"per_symbol"`). `rows_before_asof` / `rows_after_asof` still count the full query;
+- eligibility (`available_at <= as_of`) is evaluated once per distinct `available_at` value;
+- the CSV is formatted column-wise and written in chunks, and its sha256 is computed while writing
+  (`csv_sha256` in `trace_meta.json`).
+"""
+
 from __future__ import annotations
 
 import csv
 import hashlib
+import io
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,6 +27,12 @@ from quant_eam.datacatalog.catalog import DataCatalog
 from quant_eam.policies.resolve import load_policy_bundle, resolve_asof_latency_policy
 
 
+TRACE_SAMPLE_MODES = ("head", "per_symbol")
+DEFAULT_TRACE_MAX_ROWS = 20
+_WRITE_CHUNK_ROWS = 4096
+_SIGNAL_COLS = ("entry_raw", "exit_raw", "entry_lagged", "exit_lagged")
+
+
 @dataclass(frozen=True)
 class TraceMeta:
     snapshot_id: str
@@ -26,6 +44,9 @@ class TraceMeta:
     lag_bars_used: int
     dsl_fingerprint: str
     signals_fingerprint: str
+    sample_mode: str = "head"
+    max_rows: int = DEFAULT_TRACE_MAX_ROWS
+    csv_sha256: str = ""
 
 
 def _load_json(path: Path) -> Any:
@@ -53,6 +74,43 @@ def _trade_lag_bars_default_from_policy_bundle(policy_bundle_path: Path) -> int:
     return 1
 
 
+def _bool_text(v: Any) -> str:
+    return "true" if v is not None and bool(v) else "false"
+
+
+def write_trace_csv(
+    path: Path,
+    fieldnames: list[str],
+    columns: dict[str, pd.Series],
+    *,
+    chunk_rows: int = _WRITE_CHUNK_ROWS,
+) -> tuple[int, str]:
+    """Write string columns as CSV in row chunks, hashing the bytes as they are written.
+
+    Returns (rows_written, sha256 of the file). The bytes match `csv.DictWriter(fieldnames=...)` on the
+    equivalent row dicts.
+    """
+    names = list(fieldnames)
+    values = [columns[c].tolist() for c in names]
+    n = len(values[0]) if values else 0
+    h = hashlib.sha256()
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    with Path(path).open("wb") as f:
+        w.writerow(names)
+        for lo in range(0, n, max(1, int(chunk_rows))):
+            w.writerows(zip(*(v[lo : lo + chunk_rows] for v in values)))
+            data = buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+            h.update(data)
+            f.write(data)
+        data = buf.getvalue().encode("utf-8")
+        h.update(data)
+        f.write(data)
+    return n, h.hexdigest()
+
+
 def run_calc_trace_preview(
     *,
     out_dir: Path,
@@ -66,9 +124,13 @@ def run_calc_trace_preview(
     calc_trace_plan_path: Path,
     data_root: Path,
     dataset_id: str = "ohlcv_1d",
+    max_rows: int | None = None,
+    sample_mode: str | None = None,
 ) -> tuple[Path, Path, TraceMeta]:
     """Execute a minimal calc trace preview using DataCatalog (as_of filtered).
 
+    `max_rows` / `sample_mode` override the calc_trace_plan sample (defaults: 20 rows, "head").
+
     Output CSV columns (minimum):
     dt,symbol,close,available_at,eligible,entry_raw,entry_lagged
     """
@@ -89,15 +151,28 @@ def run_calc_trace_preview(
         symbols = [str(s) for s in (sample.get("symbols") or symbols) if str(s).strip()] or symbols
         start = str(sample.get("start") or start)
         end = str(sample.get("end") or end)
-        max_rows = int(sample.get("max_rows") or 20)
+        plan_max_rows = int(sample.get("max_rows") or DEFAULT_TRACE_MAX_ROWS)
+        plan_mode = str(sample.get("sample_mode") or "head")
     else:
-        max_rows = 20
+        plan_max_rows = DEFAULT_TRACE_MAX_ROWS
+        plan_mode = "head"
+    max_rows = max(1, int(max_rows)) if max_rows is not None else plan_max_rows
+    sample_mode = str(sample_mode or plan_mode)
+    if sample_mode not in TRACE_SAMPLE_MODES:
+        raise ValueError(f"sample_mode must be one of: {', '.join(TRACE_SAMPLE_MODES)}")
 
     cat = DataCatalog(root=data_root)
-    rows, stats = cat.query_ohlcv(snapshot_id=snapshot_id, symbols=symbols, start=start, end=end, as_of=as_of, dataset_id=dataset_id)
-
-    # Keep only the first max_rows (stable order already symbol,dt).
-    rows = rows[:max_rows]
+    # Sampled rows in (symbol, dt) order; stats count the full as-of query.
+    rows, stats = cat.sample_ohlcv(
+        snapshot_id=snapshot_id,
+        symbols=symbols,
+        start=start,
+        end=end,
+        as_of=as_of,
+        max_rows=max_rows,
+        per_symbol=sample_mode == "per_symbol",
+        dataset_id=dataset_id,
+    )
 
     # Determine lag bars from policy bundle (SSOT). We read policy_bundle_path as metadata from outputs;
     # orchestrator does not pass it in explicitly in v1.
@@ -136,33 +211,30 @@ def run_calc_trace_preview(
     px_keep = prices_df[["dt", "symbol", "close", "available_at"]].copy()
     merged = pd.merge(px_keep, comp_df, on=["dt", "symbol"], how="left", sort=False)
 
-    # Build output rows for CSV; eligible computed vs as_of (even though DataCatalog enforces availability).
-    out_rows: list[dict[str, Any]] = []
-    for rec in merged.sort_values(["symbol", "dt"], kind="mergesort").to_dict(orient="records"):
-        eligible = bool(parse_iso_datetime(str(rec.get("available_at"))) <= asof_dt)
-        row: dict[str, Any] = {
-            "dt": str(rec.get("dt")),
-            "symbol": str(rec.get("symbol")),
-            "close": str(rec.get("close")),
-            "available_at": str(rec.get("available_at")),
-            "eligible": "true" if eligible else "false",
-        }
-        # Intermediates first (stable ordering).
-        for c in comp.intermediate_cols:
-            if c in rec:
-                row[c] = "" if rec[c] is None else str(rec[c])
-        for k in ("entry_raw", "exit_raw", "entry_lagged", "exit_lagged"):
-            v = bool(rec.get(k)) if rec.get(k) is not None else False
-            row[k] = "true" if v else "false"
-        out_rows.append(row)
+    merged = merged.sort_values(["symbol", "dt"], kind="mergesort")
+
+    # Eligibility vs as_of (even though DataCatalog enforces availability), parsed once per distinct value.
+    av_text = merged["available_at"].map(str)
+    eligible_by_av = {v: parse_iso_datetime(v) <= asof_dt for v in av_text.unique()}
+    columns: dict[str, pd.Series] = {
+        "dt": merged["dt"].map(str),
+        "symbol": merged["symbol"].map(str),
+        "close": merged["close"].map(str),
+        "available_at": av_text,
+        "eligible": av_text.map(lambda v: "true" if eligible_by_av[v] else "false"),
+    }
+    # Intermediates first (stable ordering).
+    for c in comp.intermediate_cols:
+        if c in merged.columns:
+            columns[c] = merged[c].map(lambda v: "" if v is None else str(v))
+        else:
+            columns[c] = pd.Series([""] * len(merged), index=merged.index, dtype=object)
+    for k in _SIGNAL_COLS:
+        columns[k] = merged[k].map(_bool_text) if k in merged.columns else pd.Series(["false"] * len(merged), index=merged.index, dtype=object)
 
     out_csv = out_dir / "calc_trace_preview.csv"
-    with out_csv.open("w", newline="", encoding="utf-8") as f:
-        fieldnames = ["dt", "symbol", "close", "available_at", "eligible", *comp.intermediate_cols, "entry_raw", "exit_raw", "entry_lagged", "exit_lagged"]
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in out_rows:
-            w.writerow(r)
+    fieldnames = ["dt", "symbol", "close", "available_at", "eligible", *comp.intermediate_cols, *_SIGNAL_COLS]
+    rows_written, csv_sha = write_trace_csv(out_csv, fieldnames, columns)
 
     meta = TraceMeta(
         snapshot_id=snapshot_id,
@@ -170,10 +242,13 @@ def run_calc_trace_preview(
         as_of=as_of,
         rows_before_asof=int(stats.rows_before_asof),
         rows_after_asof=int(stats.rows_after_asof),
-        rows_written=len(out_rows),
+        rows_written=int(rows_written),
         lag_bars_used=int(lag_bars),
         dsl_fingerprint=str(comp.dsl_fingerprint),
         signals_fingerprint=str(comp.signals_fingerprint),
+        sample_mode=sample_mode,
+        max_rows=int(max_rows),
+        csv_sha256=csv_sha,
     )
     meta_path = out_dir / "trace_meta.json"
     meta_path.write_text(json.dumps(meta.__dict__, indent=2, sort_keys=True) + "\n", encoding="utf-8")
@@ -9,6 +9,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from quant_eam.core.timing import timed
+
 
 def _utc_now_iso() -> str:
     sde = os.getenv("SOURCE_DATE_EPOCH")
@@ -50,6 +52,7 @@ class DossierWriter:
     def dossier_dir(self, run_id: str) -> Path:
         return self.artifact_root / "dossiers" / run_id
 
+    @timed("dossier.write")
     def write(
         self,
         *,
@@ -85,15 +88,20 @@ class DossierWriter:
             # Write non-manifest artifacts first.
             (tmp_dir / "reports").mkdir(parents=True, exist_ok=True)
 
-            def wjson(rel: str, obj: Any) -> None:
+            # sha256 of each written artifact, taken from the bytes in memory (no re-read for the manifest).
+            written: dict[str, str] = {}
+
+            def wbytes(rel: str, b: bytes) -> None:
                 p = tmp_dir / rel
                 p.parent.mkdir(parents=True, exist_ok=True)
-                p.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+                p.write_bytes(b)
+                written[Path(rel).as_posix()] = _sha256_bytes(b)
+
+            def wjson(rel: str, obj: Any) -> None:
+                wbytes(rel, (json.dumps(obj, indent=2, sort_keys=True) + "\n").encode("utf-8"))
 
             def wtext(rel: str, text: str) -> None:
-                p = tmp_dir / rel
-                p.parent.mkdir(parents=True, exist_ok=True)
-                p.write_text(text, encoding="utf-8")
+                wbytes(rel, text.encode("utf-8"))
 
             wjson("config_snapshot.json", config_snapshot)
             wjson("data_manifest.json", data_manifest)
@@ -129,7 +137,8 @@ class DossierWriter:
             for _, rel in artifacts.items():
                 p = tmp_dir / rel
                 if p.is_file():
-                    hashes[rel] = _sha256_file(p)
+                    known = written.get(Path(rel).as_posix())
+                    hashes[rel] = known if known is not None else _sha256_file(p)
             dossier_manifest["hashes"] = hashes
             wjson("dossier_manifest.json", dossier_manifest)
 
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 import argparse
+import contextvars
 import json
 import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from quant_eam.contracts import validate as contracts_validate
-from quant_eam.gates.registry import run_gate
-from quant_eam.gates.types import GateContext
+from quant_eam.core.timing import span, timed
+from quant_eam.gates.data_provider import GateDataProvider
+from quant_eam.gates.registry import is_parallel_safe, run_gate
+from quant_eam.gates.result_cache import GateResultCache, gate_cache_from_env
+from quant_eam.gates.types import GateContext, GateResult
 from quant_eam.policies.load import load_yaml
 from quant_eam.policies.resolve import load_policy_bundle, resolve_asof_latency_policy
+from quant_eam.policies.store import policy_store
 
 EXIT_OK = 0
 EXIT_USAGE_OR_ERROR = 1
@@ -29,6 +37,64 @@ MANDATORY_GATES: list[dict[str, Any]] = [
 ]
 
 
+DEFAULT_GATE_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class GateTask:
+    """One planned gate invocation (the gate is a function of `ctx` + `params` only)."""
+
+    ctx: GateContext
+    gate_id: str
+    gate_version: str
+    params: dict[str, Any]
+
+
+def gate_workers_from_env() -> int:
+    raw = str(os.getenv("EAM_GATE_WORKERS", "")).strip()
+    if not raw:
+        return min(DEFAULT_GATE_WORKERS, os.cpu_count() or 1)
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return 1
+
+
+def execute_gate_plan(
+    plan: list[GateTask],
+    *,
+    workers: int = 1,
+    cache: GateResultCache | None = None,
+    force_recompute: bool = False,
+) -> list[GateResult]:
+    """Run planned gates and return their results in plan order.
+
+    Parallel-safe gates (see `gates.registry.is_parallel_safe`) are submitted to a thread pool; the
+    others run serially in plan order on the calling thread while the pool works. `cache` and
+    `force_recompute` are passed through to `run_gate`.
+    """
+
+    def _run(t: GateTask) -> GateResult:
+        with span(f"gate.{t.gate_id}"):
+            return run_gate(
+                ctx=t.ctx, gate_id=t.gate_id, gate_version=t.gate_version, params=t.params, cache=cache, force_recompute=force_recompute
+            )
+
+    if workers <= 1 or len(plan) <= 1:
+        return [_run(t) for t in plan]
+    parallel = [i for i, t in enumerate(plan) if is_parallel_safe(t.gate_id, t.gate_version)]
+    out: list[GateResult | None] = [None] * len(plan)
+    with ThreadPoolExecutor(max_workers=max(1, min(int(workers), len(parallel))), thread_name_prefix="gate") as ex:
+        # Each worker runs in a copy of the caller's context (timing spans nest under the gate run).
+        futs: dict[int, Future[GateResult]] = {i: ex.submit(contextvars.copy_context().run, _run, plan[i]) for i in parallel}
+        for i, t in enumerate(plan):
+            if i not in futs:
+                out[i] = _run(t)
+        for i, f in futs.items():
+            out[i] = f.result()
+    return [r for r in out if r is not None]
+
+
 def _load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
@@ -55,9 +121,10 @@ def _load_policy_file(policies_dir: Path, filename: str, expected_policy_id: str
 
 
 def _find_policy_file_by_id(policies_dir: Path, expected_policy_id: str) -> Path | None:
-    for p in sorted([pp for pp in policies_dir.glob("*.y*ml") if pp.is_file()]):
+    store = policy_store()
+    for p in store.policy_files(policies_dir):
         try:
-            doc = load_yaml(p)
+            doc = store.view(p)
         except Exception:  # noqa: BLE001
             continue
         if isinstance(doc, dict) and doc.get("policy_id") == expected_policy_id:
@@ -130,7 +197,19 @@ def _merge_gates(suite_gates: list[dict[str, Any]], mandatory_gates: list[dict[s
     return merged
 
 
-def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
+@timed("gaterunner.run_once")
+def run_once(
+    *, dossier_dir: Path, policy_bundle_path: Path, workers: int | None = None, force_recompute: bool = False
+) -> tuple[int, str]:
+    """Run the gate suite for one dossier and write `gate_results.json`.
+
+    `workers` > 1 runs independent gates concurrently (default: `EAM_GATE_WORKERS`); the output is
+    byte-identical to serial execution. With `EAM_GATE_CACHE=1`, cacheable gates are served from the
+    content-addressed gate result cache; `force_recompute` bypasses lookups (audits) and refreshes it.
+    """
+    if workers is None:
+        workers = gate_workers_from_env()
+    cache = gate_cache_from_env()
     gate_results_path = dossier_dir / "gate_results.json"
     if gate_results_path.is_file():
         return EXIT_OK, json.dumps(
@@ -181,6 +260,8 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
     except Exception as e:  # noqa: BLE001
         return EXIT_INVALID, f"INVALID: {e}"
 
+    # One price cache per invocation: run-level and per-segment gates share loaded frames.
+    data = GateDataProvider()
     ctx = GateContext(
         dossier_dir=dossier_dir,
         policies_dir=policies_dir,
@@ -194,6 +275,7 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
         dossier_manifest=dossier_manifest,
         config_snapshot=config_snapshot,
         metrics=metrics,
+        data=data,
     )
 
     suite_gates = _gate_list_from_suite(gate_suite)
@@ -208,6 +290,13 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
 
     always_invalid_on_fail = {"basic_sanity", "determinism_guard", "gate_no_lookahead_v1", "data_snapshot_integrity_v1"}
 
+    def _invalidates(gate_id: str, gr: GateResult) -> bool:
+        return (not gr.passed) and (
+            (gate_id in always_invalid_on_fail)
+            or ("error" in gr.metrics)
+            or (isinstance(gr.metrics.get("missing_artifacts"), list) and bool(gr.metrics.get("missing_artifacts")))
+        )
+
     # Phase-21: multi-segment evaluation protocol. When runspec.segments.list exists, we:
     # - run run-level gates once
     # - run segment-specific gates per test segment
@@ -245,26 +334,25 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
         rs2["segments"] = segs2
         return rs2
 
-    if isinstance(seg_list, list) and seg_list:
-        # Run-level gates (exclude segment-specific + holdout gate).
+    def _tasks_for(c: GateContext, keep: Callable[[str], bool]) -> list[GateTask]:
+        out: list[GateTask] = []
         for g in gates:
             gate_id = str(g.get("gate_id"))
-            gate_version = str(g.get("gate_version"))
-            params = g.get("params") if isinstance(g.get("params"), dict) else {}
-            if gate_id in segment_specific_gate_ids or gate_id == holdout_gate_id:
+            if not keep(gate_id):
                 continue
+            params = g.get("params") if isinstance(g.get("params"), dict) else {}
+            out.append(GateTask(ctx=c, gate_id=gate_id, gate_version=str(g.get("gate_version")), params=params))
+        return out
 
-            gr = run_gate(ctx=ctx, gate_id=gate_id, gate_version=gate_version, params=params)
-            results.append(gr.to_json_obj())
-
-            if (not gr.passed) and (
-                (gate_id in always_invalid_on_fail)
-                or ("error" in gr.metrics)
-                or (isinstance(gr.metrics.get("missing_artifacts"), list) and bool(gr.metrics.get("missing_artifacts")))
-            ):
-                invalid = True
+    # Build the full execution plan first, then run it (possibly concurrently) and assemble rows in plan order.
+    plan: list[GateTask] = []
+    if isinstance(seg_list, list) and seg_list:
+        # Run-level gates (exclude segment-specific + holdout gate).
+        run_level = _tasks_for(ctx, lambda gid: gid not in segment_specific_gate_ids and gid != holdout_gate_id)
+        plan.extend(run_level)
 
-        # Per-test segment gates.
+        # Per-test segment gates. Each entry is either a ready-made error row or a slice of the plan.
+        seg_entries: list[tuple[str, dict[str, Any] | None, list[GateTask]]] = []
         for seg in seg_list:
             if not isinstance(seg, dict):
                 continue
@@ -277,8 +365,12 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
             seg_metrics_path = dossier_dir / "segments" / segment_id / "metrics.json"
             if not seg_metrics_path.is_file():
                 invalid = True
-                segment_results.append(
-                    {"segment_id": segment_id, "kind": "test", "overall_pass": False, "invalid": True, "gates": [], "error": "missing segments/<segment_id>/metrics.json"}
+                seg_entries.append(
+                    (
+                        segment_id,
+                        {"segment_id": segment_id, "kind": "test", "overall_pass": False, "invalid": True, "gates": [], "error": "missing segments/<segment_id>/metrics.json"},
+                        [],
+                    )
                 )
                 continue
             try:
@@ -300,35 +392,11 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
                 dossier_manifest=dossier_manifest,
                 config_snapshot=config_snapshot,
                 metrics=(seg_metrics if isinstance(seg_metrics, dict) else {}),
+                data=data,
             )
-
-            seg_gate_rows: list[dict[str, Any]] = []
-            for g in gates:
-                gate_id = str(g.get("gate_id"))
-                gate_version = str(g.get("gate_version"))
-                if gate_id not in segment_specific_gate_ids:
-                    continue
-                params = g.get("params") if isinstance(g.get("params"), dict) else {}
-                gr = run_gate(ctx=ctx2, gate_id=gate_id, gate_version=gate_version, params=params)
-                obj = _rewrite_evidence_artifacts(gr.to_json_obj(), segment_id=segment_id)
-                seg_gate_rows.append(obj)
-                if (not gr.passed) and (
-                    (gate_id in always_invalid_on_fail)
-                    or ("error" in gr.metrics)
-                    or (isinstance(gr.metrics.get("missing_artifacts"), list) and bool(gr.metrics.get("missing_artifacts")))
-                ):
-                    invalid = True
-
-            segment_results.append(
-                {
-                    "segment_id": segment_id,
-                    "kind": "test",
-                    "holdout": False,
-                    "overall_pass": all(bool(r.get("pass")) for r in seg_gate_rows) if seg_gate_rows else True,
-                    "gates": seg_gate_rows,
-                    "artifacts": {"metrics": f"segments/{segment_id}/metrics.json", "curve": f"segments/{segment_id}/curve.csv", "trades": f"segments/{segment_id}/trades.csv"},
-                }
-            )
+            seg_tasks = _tasks_for(ctx2, lambda gid: gid in segment_specific_gate_ids)
+            plan.extend(seg_tasks)
+            seg_entries.append((segment_id, None, seg_tasks))
 
         # Holdout gate once (minimal-only output).
         holdout_seg = None
@@ -336,7 +404,10 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
             if isinstance(seg, dict) and str(seg.get("kind") or "") == "holdout":
                 holdout_seg = seg
                 break
+        holdout_tasks: list[GateTask] = []
+        holdout_segment_id = ""
         if isinstance(holdout_seg, dict):
+            holdout_segment_id = str(holdout_seg.get("segment_id") or "holdout_000")
             rs_h = _runspec_with_segment(kind="holdout", seg_obj=holdout_seg)
             ctx_h = GateContext(
                 dossier_dir=dossier_dir,
@@ -351,44 +422,62 @@ def run_once(*, dossier_dir: Path, policy_bundle_path: Path) -> tuple[int, str]:
                 dossier_manifest=dossier_manifest,
                 config_snapshot=config_snapshot,
                 metrics=metrics,
+                data=data,
+            )
+            holdout_tasks = _tasks_for(ctx_h, lambda gid: gid == holdout_gate_id)
+            plan.extend(holdout_tasks)
+
+        done = iter(execute_gate_plan(plan, workers=workers, cache=cache, force_recompute=force_recompute))
+
+        for t in run_level:
+            gr = next(done)
+            results.append(gr.to_json_obj())
+            if _invalidates(t.gate_id, gr):
+                invalid = True
+
+        for segment_id, error_row, seg_tasks in seg_entries:
+            if error_row is not None:
+                segment_results.append(error_row)
+                continue
+            seg_gate_rows: list[dict[str, Any]] = []
+            for t in seg_tasks:
+                gr = next(done)
+                seg_gate_rows.append(_rewrite_evidence_artifacts(gr.to_json_obj(), segment_id=segment_id))
+                if _invalidates(t.gate_id, gr):
+                    invalid = True
+            segment_results.append(
+                {
+                    "segment_id": segment_id,
+                    "kind": "test",
+                    "holdout": False,
+                    "overall_pass": all(bool(r.get("pass")) for r in seg_gate_rows) if seg_gate_rows else True,
+                    "gates": seg_gate_rows,
+                    "artifacts": {"metrics": f"segments/{segment_id}/metrics.json", "curve": f"segments/{segment_id}/curve.csv", "trades": f"segments/{segment_id}/trades.csv"},
+                }
+            )
+
+        for _t in holdout_tasks:
+            obj = next(done).to_json_obj()
+            if bool(obj.get("metrics", {}).get("holdout_present")):
+                holdout_summary = {
+                    "pass": bool(obj.get("pass")),
+                    "summary": str(obj.get("metrics", {}).get("summary", ""))[:240],
+                    "metrics_minimal": obj.get("metrics", {}).get("metrics_minimal") if isinstance(obj.get("metrics", {}).get("metrics_minimal"), dict) else {},
+                }
+            segment_results.append(
+                {"segment_id": holdout_segment_id, "kind": "holdout", "holdout": True, "overall_pass": bool(obj.get("pass")), "gates": [obj], "artifacts": {}}
             )
-            for g in gates:
-                gate_id = str(g.get("gate_id"))
-                gate_version = str(g.get("gate_version"))
-                if gate_id != holdout_gate_id:
-                    continue
-                params = g.get("params") if isinstance(g.get("params"), dict) else {}
-                gr = run_gate(ctx=ctx_h, gate_id=gate_id, gate_version=gate_version, params=params)
-                obj = gr.to_json_obj()
-                if bool(obj.get("metrics", {}).get("holdout_present")):
-                    holdout_summary = {
-                        "pass": bool(obj.get("pass")),
-                        "summary": str(obj.get("metrics", {}).get("summary", ""))[:240],
-                        "metrics_minimal": obj.get("metrics", {}).get("metrics_minimal") if isinstance(obj.get("metrics", {}).get("metrics_minimal"), dict) else {},
-                    }
-                segment_results.append(
-                    {"segment_id": str(holdout_seg.get("segment_id") or "holdout_000"), "kind": "holdout", "holdout": True, "overall_pass": bool(obj.get("pass")), "gates": [obj], "artifacts": {}}
-                )
 
         overall_pass = all(bool(r.get("pass")) for r in results) and all(bool(sr.get("overall_pass")) for sr in segment_results)
     else:
         # Legacy single-segment gating.
-        for g in gates:
-            gate_id = str(g.get("gate_id"))
-            gate_version = str(g.get("gate_version"))
-            params = g.get("params") if isinstance(g.get("params"), dict) else {}
-
-            gr = run_gate(ctx=ctx, gate_id=gate_id, gate_version=gate_version, params=params)
+        plan = _tasks_for(ctx, lambda gid: True)
+        for t, gr in zip(plan, execute_gate_plan(plan, workers=workers, cache=cache, force_recompute=force_recompute)):
             results.append(gr.to_json_obj())
-
-            if (not gr.passed) and (
-                (gate_id in always_invalid_on_fail)
-                or ("error" in gr.metrics)
-                or (isinstance(gr.metrics.get("missing_artifacts"), list) and bool(gr.metrics.get("missing_artifacts")))
-            ):
+            if _invalidates(t.gate_id, gr):
                 invalid = True
 
-            if gate_id == holdout_gate_id and bool(gr.metrics.get("holdout_present")):
+            if t.gate_id == holdout_gate_id and bool(gr.metrics.get("holdout_present")):
                 holdout_summary = {
                     "pass": bool(gr.passed),
                     "summary": str(gr.metrics.get("summary", ""))[:240],
@@ -436,6 +525,17 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="python -m quant_eam.gaterunner.run")
     parser.add_argument("--dossier", required=True, help="Path to a dossier directory (append-only evidence bundle).")
     parser.add_argument("--policy-bundle", required=True, help="Path to policy_bundle_v1.yaml (read-only).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Run independent gates on this many threads (default: EAM_GATE_WORKERS or min(4, cpu_count); 1 = serial).",
+    )
+    parser.add_argument(
+        "--force-recompute",
+        action="store_true",
+        help="Recompute every gate even when EAM_GATE_CACHE=1 holds a cached result (audits); refreshes the cache.",
+    )
     args = parser.parse_args(argv)
 
     try:
@@ -448,7 +548,9 @@ def main(argv: list[str] | None = None) -> int:
             print(f"ERROR: policy bundle not found: {policy_bundle_path}", file=sys.stderr)
             return EXIT_USAGE_OR_ERROR
 
-        code, msg = run_once(dossier_dir=dossier_dir, policy_bundle_path=policy_bundle_path)
+        code, msg = run_once(
+            dossier_dir=dossier_dir, policy_bundle_path=policy_bundle_path, workers=args.workers, force_recompute=bool(args.force_recompute)
+        )
         if code == EXIT_OK:
             print(msg)
         else:
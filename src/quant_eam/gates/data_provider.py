@@ -0,0 +1,100 @@
+"""Per-run price cache shared by the gates of one GateRunner invocation.
+
+Several gates re-query the same (snapshot, symbols, segment, dataset) price frame: no-lookahead,
+the lag/cost stress gates and risk compliance, and again per test segment. `GateDataProvider`
+loads each distinct frame once (thread-safe, so it also works with parallel gate execution) and
+hands out a read-only `PriceFrame`. `PriceFrame.derived` memoizes structures built from the frame
+(the stress gates share the aligned backtest inputs), also once per name under concurrency.
+
+Frames are shared between gates: callers must not mutate `PriceFrame.df` (backtest adapters copy
+their input before adding columns).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from quant_eam.gates.util import Segment, query_prices_df
+
+PriceKey = tuple[str, str, tuple[str, ...], str, str, str, str]
+
+
+class PriceFrame:
+    """A loaded price frame (sorted by symbol, dt) plus memoized structures derived from it."""
+
+    def __init__(self, df: pd.DataFrame, stats: dict[str, int]) -> None:
+        self.df = df
+        self.stats = stats
+        self._derived: dict[str, Any] = {}
+        self._name_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def derived(self, name: str, build: Callable[[], Any]) -> Any:
+        """Memoize a read-only structure derived from this frame (e.g. aligned backtest inputs).
+
+        Concurrent callers for the same `name` wait for the first build. `build` exceptions propagate
+        and nothing is cached.
+        """
+        with self._lock:
+            if name in self._derived:
+                return self._derived[name]
+            name_lock = self._name_locks.setdefault(name, threading.Lock())
+        with name_lock:
+            with self._lock:
+                if name in self._derived:
+                    return self._derived[name]
+            value = build()
+            with self._lock:
+                self._derived[name] = value
+            return value
+
+
+class GateDataProvider:
+    """Cache of price frames for one GateRunner invocation (do not share across dossiers)."""
+
+    def __init__(self) -> None:
+        self._frames: dict[PriceKey, PriceFrame] = {}
+        self._key_locks: dict[PriceKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def prices(
+        self,
+        *,
+        data_root: Path | None,
+        snapshot_id: str,
+        symbols: list[str],
+        seg: Segment,
+        dataset_id: str = "ohlcv_1d",
+    ) -> PriceFrame:
+        key: PriceKey = (
+            "" if data_root is None else Path(data_root).as_posix(),
+            str(snapshot_id),
+            tuple(symbols),
+            seg.start,
+            seg.end,
+            seg.as_of,
+            str(dataset_id),
+        )
+        with self._lock:
+            pf = self._frames.get(key)
+            if pf is not None:
+                return pf
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Concurrent callers for the same key wait for the first load instead of querying again.
+        with key_lock:
+            with self._lock:
+                pf = self._frames.get(key)
+            if pf is not None:
+                return pf
+            df, stats = query_prices_df(data_root=data_root, snapshot_id=snapshot_id, symbols=symbols, seg=seg, dataset_id=dataset_id)
+            pf = PriceFrame(df, stats)
+            with self._lock:
+                self._frames[key] = pf
+                self.loads += 1
+            return pf
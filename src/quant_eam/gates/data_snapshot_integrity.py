@@ -1,21 +1,118 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+from quant_eam.core.hashing import (
+    chunk_manifest_anchored,
+    file_fingerprint,
+    sha256_file_uncached,
+    verified_hash_cache,
+    verify_chunk_manifest,
+)
 from quant_eam.gates.types import GateContext, GateEvidence, GateResult
 from quant_eam.snapshots.catalog import SnapshotCatalog, safe_snapshot_id
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _env_flag(name: str) -> bool:
+    return str(os.getenv(name, "")).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _full_verify_requested(params: dict[str, Any]) -> bool:
+    return bool(params.get("full_verify")) or _env_flag("EAM_SNAPSHOT_FULL_VERIFY")
+
+
+def _trust_stat_cache_requested(params: dict[str, Any]) -> bool:
+    return bool(params.get("trust_stat_cache")) or _env_flag("EAM_SNAPSHOT_TRUST_STAT_CACHE")
+
+
+DEFAULT_STAT_CACHE_MAX_AGE_S = 3600.0
+DEFAULT_STAT_CACHE_MAX_USES = 100
+
+
+def _stat_cache_limits(params: dict[str, Any]) -> tuple[float, int]:
+    """(max_age_s, max_uses) for trusted stat-cache entries; past either, the dataset is fully re-hashed."""
+    age = params.get("stat_cache_max_age_s", os.getenv("EAM_SNAPSHOT_STAT_CACHE_MAX_AGE_S"))
+    uses = params.get("stat_cache_max_uses", os.getenv("EAM_SNAPSHOT_STAT_CACHE_MAX_USES"))
+    try:
+        max_age_s = float(age) if age not in (None, "") else DEFAULT_STAT_CACHE_MAX_AGE_S
+    except (TypeError, ValueError):
+        max_age_s = DEFAULT_STAT_CACHE_MAX_AGE_S
+    try:
+        max_uses = int(uses) if uses not in (None, "") else DEFAULT_STAT_CACHE_MAX_USES
+    except (TypeError, ValueError):
+        max_uses = DEFAULT_STAT_CACHE_MAX_USES
+    return max(0.0, max_age_s), max(0, max_uses)
+
+
+def _load_chunk_manifest(data_file: Path) -> dict[str, Any] | None:
+    # DataLake writes `<dataset_id>.chunks.json` next to `<dataset_id>.csv`.
+    p = data_file.with_suffix(".chunks.json")
+    try:
+        doc = json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return doc if isinstance(doc, dict) else None
+
+
+def _dataset_sha256(
+    data_file: Path,
+    *,
+    manifest_sha: str | None,
+    full_verify: bool,
+    merkle_root: str | None = None,
+    trust_stat_cache: bool = False,
+    stat_cache_limits: tuple[float, int] = (DEFAULT_STAT_CACHE_MAX_AGE_S, DEFAULT_STAT_CACHE_MAX_USES),
+) -> tuple[str, list[dict[str, int]]]:
+    """sha256 of the dataset CSV plus corrupt chunk ranges (when a chunk manifest can localize them).
+
+    - full_verify: re-read the whole file serially. Neither the stat cache nor the chunk manifest is used.
+    - trust_stat_cache (explicit opt-in): reuse a digest this process verified for the same
+      (path, size, mtime_ns, inode), until it is `max_age_s` old or was reused `max_uses` times.
+    - default: when `<dataset>.chunks.json` records the manifest sha256 and the `chunk_merkle_root`
+      anchored in the snapshot manifest, its chunks are re-hashed in parallel. All chunks matching
+      proves the manifest sha256. Otherwise the whole file is re-read.
+    - on a mismatch, a chunk manifest for the expected sha256 localizes the corrupt byte ranges.
+    """
+    cache = verified_hash_cache()
+    if trust_stat_cache and not full_verify:
+        max_age_s, max_uses = stat_cache_limits
+        cached = cache.lookup(data_file, max_age_s=max_age_s, max_uses=max_uses)
+        if cached is not None:
+            return cached, []
+    cm = _load_chunk_manifest(data_file) if manifest_sha else None
+    corrupt: list[dict[str, int]] = []
+    if (
+        not full_verify
+        and cm is not None
+        and manifest_sha
+        and merkle_root
+        and chunk_manifest_anchored(cm, sha256=manifest_sha, merkle_root=merkle_root)
+    ):
+        fp = file_fingerprint(data_file)
+        try:
+            corrupt = verify_chunk_manifest(data_file, cm)
+            if not corrupt:
+                cache.record(data_file, manifest_sha, fp)
+                return manifest_sha, []
+        except (OSError, ValueError):
+            corrupt = []
+    # Fingerprint before reading: a concurrent write changes it, so the cache entry goes stale.
+    fp = file_fingerprint(data_file)
+    sha = sha256_file_uncached(data_file)
+    cache.record(data_file, sha, fp)
+    if not manifest_sha or sha == manifest_sha:
+        return sha, []
+    if corrupt:
+        return sha, corrupt
+    if cm is None or str(cm.get("sha256") or "") != manifest_sha:
+        return sha, []
+    try:
+        return sha, verify_chunk_manifest(data_file, cm)
+    except (OSError, ValueError):
+        return sha, []
 
 
 def _find_dataset(manifest: dict[str, Any], dataset_id: str) -> dict[str, Any] | None:
@@ -43,8 +140,13 @@ def run_data_snapshot_integrity_v1(ctx: GateContext, params: dict[str, Any] | No
     - Snapshot manifest / ingest_manifest / quality_report must be contract-valid.
     - Recompute dataset CSV sha256 and match manifest + ingest_manifest (if present).
     - Enforce minimal self-consistency between manifest and quality_report.
+
+    The dataset is verified on every run (see `_dataset_sha256`): in parallel chunks when the manifest
+    anchors a chunk manifest, else by a full re-read. `params.full_verify` forces the full re-read.
+    `params.trust_stat_cache` opts into reusing digests this process already verified, bounded by
+    `stat_cache_max_age_s` / `stat_cache_max_uses`.
     """
-    _ = params or {}
+    params = params or {}
 
     # Evidence anchor: snapshot_id comes from the run evidence (runspec/dossier_manifest).
     snapshot_id_raw = str(ctx.runspec.get("data_snapshot_id", "")).strip()
@@ -99,6 +201,7 @@ def run_data_snapshot_integrity_v1(ctx: GateContext, params: dict[str, Any] | No
         errors.append("manifest missing datasets[] entry")
         data_file = None
         manifest_sha = None
+        merkle_root = None
         manifest_row_count = None
         manifest_dt_min = None
         manifest_dt_max = None
@@ -108,6 +211,8 @@ def run_data_snapshot_integrity_v1(ctx: GateContext, params: dict[str, Any] | No
         file_s = str(ds.get("file") or "").strip()
         data_file = Path(file_s) if file_s else None
         manifest_sha = str(ds.get("sha256") or "")
+        ds_ext = ds.get("extensions") if isinstance(ds.get("extensions"), dict) else {}
+        merkle_root = str(ds_ext.get("chunk_merkle_root") or "") or None
         manifest_row_count = ds.get("row_count")
         manifest_dt_min = ds.get("dt_min")
         manifest_dt_max = ds.get("dt_max")
@@ -118,9 +223,17 @@ def run_data_snapshot_integrity_v1(ctx: GateContext, params: dict[str, Any] | No
             errors.append("data file missing (manifest.datasets[].file not found)")
 
     actual_sha = None
+    corrupt_chunks: list[dict[str, int]] = []
     if data_file and data_file.is_file():
         try:
-            actual_sha = _sha256_file(data_file)
+            actual_sha, corrupt_chunks = _dataset_sha256(
+                data_file,
+                manifest_sha=manifest_sha,
+                full_verify=_full_verify_requested(params),
+                merkle_root=merkle_root,
+                trust_stat_cache=_trust_stat_cache_requested(params),
+                stat_cache_limits=_stat_cache_limits(params),
+            )
         except Exception as e:  # noqa: BLE001
             errors.append(f"failed to hash data file: {e}")
 
@@ -160,6 +273,8 @@ def run_data_snapshot_integrity_v1(ctx: GateContext, params: dict[str, Any] | No
         "manifest_row_count": manifest_row_count,
         "quality_rows_after_dedupe": (quality_report.get("rows_after_dedupe") if isinstance(quality_report, dict) else None),
     }
+    if corrupt_chunks:
+        metrics["corrupt_chunks"] = corrupt_chunks[:50]
     if errors:
         metrics["errors"] = errors
 
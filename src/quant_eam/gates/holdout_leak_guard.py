@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import os
 import re
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Iterable
+from typing import IO, Any, BinaryIO, Iterable, Iterator
 
+from quant_eam.core.hashing import file_fingerprint, verified_hash_cache
 from quant_eam.gates.types import GateContext, GateEvidence, GateResult
 
 
@@ -17,6 +24,7 @@ class _Leak:
     snippet: str
 
 
+_READ_CHARS = 1024 * 1024
 _NUM_RE = re.compile(r"(?:^|[^0-9])([0-9]+(?:\\.[0-9]+)?%?)(?:$|[^0-9])")
 
 
@@ -47,9 +55,45 @@ def _walk_holdout_keys(obj: Any, *, path: str = "") -> Iterable[tuple[str, str]]
             yield from _walk_holdout_keys(v, path=p2)
 
 
-def _scan_json(path: Path, *, rel: str) -> tuple[list[_Leak], list[str]]:
+_SCAN_CACHE_MAX_ENTRIES = 4096
+_PARALLEL_MIN_BYTES = 1024 * 1024
+DEFAULT_SCAN_WORKERS = 4
+
+# (content sha256, kind) -> (leaks with file="", error suffixes to append to the file's rel path).
+_ScanOutcome = tuple[tuple[_Leak, ...], tuple[str, ...]]
+_SCAN_CACHE: OrderedDict[tuple[str, str], _ScanOutcome] = OrderedDict()
+_SCAN_CACHE_LOCK = threading.Lock()
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that feeds every byte it returns into sha256 (hash while scanning: one read per file)."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self.sha256 = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        n = self._f.readinto(b)
+        if n:
+            self.sha256.update(memoryview(b)[:n])
+        return n or 0
+
+
+def _iter_lines(text: IO[str]) -> Iterator[str]:
+    # Physical lines (newline="" keeps \r, \r\n, \n), each split like str.splitlines: the numbering equals
+    # read_text().splitlines() without holding the whole file.
+    for raw in text:
+        yield from raw.splitlines()
+
+
+def _scan_json_stream(text: IO[str], *, rel: str) -> tuple[list[_Leak], list[str]]:
     try:
-        doc = json.loads(path.read_text(encoding="utf-8"))
+        doc = json.load(text)
+    except UnicodeDecodeError:
+        raise
     except Exception as e:  # noqa: BLE001
         return ([], [f"{rel}: JSON parse error: {type(e).__name__}: {e}"])
 
@@ -66,15 +110,10 @@ def _scan_json(path: Path, *, rel: str) -> tuple[list[_Leak], list[str]]:
     return leaks, []
 
 
-def _scan_jsonl(path: Path, *, rel: str) -> tuple[list[_Leak], list[str]]:
+def _scan_jsonl_stream(text: IO[str], *, rel: str) -> tuple[list[_Leak], list[str]]:
     leaks: list[_Leak] = []
     errors: list[str] = []
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except Exception as e:  # noqa: BLE001
-        return ([], [f"{rel}: read error: {type(e).__name__}: {e}"])
-
-    for i, line in enumerate(lines, start=1):
+    for i, line in enumerate(_iter_lines(text), start=1):
         if not line.strip():
             continue
         try:
@@ -88,14 +127,9 @@ def _scan_jsonl(path: Path, *, rel: str) -> tuple[list[_Leak], list[str]]:
     return leaks, errors
 
 
-def _scan_md(path: Path, *, rel: str) -> tuple[list[_Leak], list[str]]:
+def _scan_md_stream(text: IO[str], *, rel: str) -> tuple[list[_Leak], list[str]]:
     leaks: list[_Leak] = []
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except Exception as e:  # noqa: BLE001
-        return ([], [f"{rel}: read error: {type(e).__name__}: {e}"])
-
-    for i, line in enumerate(lines, start=1):
+    for i, line in enumerate(_iter_lines(text), start=1):
         low = line.lower()
         if "holdout" not in low:
             continue
@@ -105,25 +139,104 @@ def _scan_md(path: Path, *, rel: str) -> tuple[list[_Leak], list[str]]:
     return leaks, []
 
 
-def _scan_paths(paths: list[Path], *, base: Path) -> tuple[list[_Leak], list[str]]:
-    leaks: list[_Leak] = []
-    errors: list[str] = []
+_SCANNERS = {"json": _scan_json_stream, "jsonl": _scan_jsonl_stream, "md": _scan_md_stream}
+
+
+def _scan_file(path: Path, *, rel: str, kind: str) -> tuple[list[_Leak], list[str]]:
+    """Scan one file, streaming; unchanged content (same sha256) is served from the scan cache."""
+    cache = verified_hash_cache()
+    sha = cache.lookup(path)
+    if sha is not None:
+        with _SCAN_CACHE_LOCK:
+            hit = _SCAN_CACHE.get((sha, kind))
+            if hit is not None:
+                _SCAN_CACHE.move_to_end((sha, kind))
+        if hit is not None:
+            leaks_c, errs_c = hit
+            return [replace(l, file=rel) for l in leaks_c], [rel + e for e in errs_c]
+
+    read_error = "JSON parse error" if kind == "json" else "read error"
+    try:
+        fp = file_fingerprint(path)
+        with path.open("rb") as f:
+            hr = _HashingReader(f)
+            # JSON is decoded like read_text (newline translation); line scanners keep raw line breaks.
+            text = io.TextIOWrapper(io.BufferedReader(hr), encoding="utf-8", newline=None if kind == "json" else "")
+            leaks, errors = _SCANNERS[kind](text, rel=rel)
+            while text.read(_READ_CHARS):  # drain so the digest covers the whole file
+                pass
+    except Exception as e:  # noqa: BLE001
+        return ([], [f"{rel}: {read_error}: {type(e).__name__}: {e}"])
+
+    digest = hr.sha256.hexdigest()
+    cache.record(path, digest, fp)
+    outcome: _ScanOutcome = (
+        tuple(replace(l, file="") for l in leaks),
+        tuple(e[len(rel):] for e in errors),
+    )
+    with _SCAN_CACHE_LOCK:
+        _SCAN_CACHE[(digest, kind)] = outcome
+        _SCAN_CACHE.move_to_end((digest, kind))
+        while len(_SCAN_CACHE) > _SCAN_CACHE_MAX_ENTRIES:
+            _SCAN_CACHE.popitem(last=False)
+    return leaks, errors
+
+
+def _shards_by_size(sizes: list[int], n: int) -> list[list[int]]:
+    """Greedy largest-first assignment of item indices to `n` shards of roughly equal byte size."""
+    shards: list[list[int]] = [[] for _ in range(n)]
+    loads = [0] * n
+    for i in sorted(range(len(sizes)), key=lambda k: (-sizes[k], k)):
+        j = loads.index(min(loads))
+        shards[j].append(i)
+        loads[j] += sizes[i]
+    return [s for s in shards if s]
+
+
+def _scan_paths(paths: list[Path], *, base: Path, workers: int | None = None) -> tuple[list[_Leak], list[str]]:
+    """Scan targets; large scans are sharded by file size over a thread pool.
+
+    Findings and errors are concatenated in `paths` order, so the output is the same for any `workers`.
+    """
+    items: list[tuple[Path, str, str]] = []
     for p in paths:
         try:
             rel = p.relative_to(base).as_posix()
         except Exception:
             rel = p.as_posix()
+        kind = p.suffix.lower().lstrip(".")
+        if kind in _SCANNERS:
+            items.append((p, rel, kind))
 
-        if p.suffix.lower() == ".json":
-            l, e = _scan_json(p, rel=rel)
-        elif p.suffix.lower() == ".jsonl":
-            l, e = _scan_jsonl(p, rel=rel)
-        elif p.suffix.lower() == ".md":
-            l, e = _scan_md(p, rel=rel)
-        else:
-            continue
-        leaks.extend(l)
-        errors.extend(e)
+    sizes: list[int] = []
+    for p, _rel, _kind in items:
+        try:
+            sizes.append(int(os.stat(p).st_size))
+        except OSError:
+            sizes.append(0)
+
+    if workers is None:
+        workers = min(DEFAULT_SCAN_WORKERS, os.cpu_count() or 1)
+    results: list[tuple[list[_Leak], list[str]] | None] = [None] * len(items)
+
+    def _run_shard(shard: list[int]) -> None:
+        for i in shard:
+            p, rel, kind = items[i]
+            results[i] = _scan_file(p, rel=rel, kind=kind)
+
+    if workers <= 1 or len(items) <= 1 or sum(sizes) < _PARALLEL_MIN_BYTES:
+        _run_shard(list(range(len(items))))
+    else:
+        shards = _shards_by_size(sizes, min(int(workers), len(items)))
+        with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="leak-scan") as ex:
+            list(ex.map(_run_shard, shards))
+
+    leaks: list[_Leak] = []
+    errors: list[str] = []
+    for r in results:
+        if r is not None:
+            leaks.extend(r[0])
+            errors.extend(r[1])
     return leaks, errors
 
 
@@ -164,7 +277,7 @@ def _collect_scan_targets(ctx: GateContext) -> tuple[list[Path], list[str]]:
 
 
 def run_holdout_leak_guard_v1(ctx: GateContext, params: dict[str, Any] | None) -> GateResult:
-    _ = params or {}
+    params = params or {}
     targets, errs = _collect_scan_targets(ctx)
     if errs:
         return GateResult(
@@ -179,7 +292,11 @@ def run_holdout_leak_guard_v1(ctx: GateContext, params: dict[str, Any] | None) -
     artifact_root_raw = (ctx.config_snapshot.get("env", {}) or {}).get("EAM_ARTIFACT_ROOT")
     base = Path(str(artifact_root_raw)) if isinstance(artifact_root_raw, str) else ctx.dossier_dir
 
-    leaks, parse_errors = _scan_paths(targets, base=base)
+    try:
+        workers = int(params["workers"]) if params.get("workers") is not None else None
+    except (TypeError, ValueError):
+        workers = None
+    leaks, parse_errors = _scan_paths(targets, base=base, workers=workers)
     if parse_errors:
         return GateResult(
             gate_id="holdout_leak_guard_v1",
@@ -4,7 +4,12 @@ from pathlib import Path
 from typing import Any
 
 from quant_eam.gates.types import GateContext, GateEvidence, GateResult
-from quant_eam.gates.util import extract_segment, extract_symbols
+from quant_eam.gates.util import (
+    extract_segment,
+    extract_symbols,
+    load_prices,
+    prepared_prices_or_none,
+)
 from quant_eam.holdout.vault import HoldoutInvalid, evaluate_holdout_minimal
 
 
@@ -46,6 +51,8 @@ def run_gate_holdout_passfail_v1(ctx: GateContext, params: dict[str, Any] | None
 
     lag_bars = int(ctx.metrics.get("lag_bars") or 1)
     lag_bars = max(1, lag_bars)
+    # Holdout prices go through the run's shared provider; the frame never leaves this gate.
+    pf = load_prices(ctx, data_root=data_root, snapshot_id=snapshot_id, symbols=symbols, seg=holdout_seg, dataset_id=dataset_id)
     try:
         h = evaluate_holdout_minimal(
             data_root=data_root,
@@ -58,6 +65,8 @@ def run_gate_holdout_passfail_v1(ctx: GateContext, params: dict[str, Any] | None
             execution_policy=ctx.execution_policy,
             cost_policy=ctx.cost_policy,
             params=params,
+            prices=pf.df,
+            prepared=prepared_prices_or_none(pf),
         )
     except HoldoutInvalid as e:
         return GateResult(
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any
 
 from quant_eam.gates.types import GateContext, GateEvidence, GateResult
-from quant_eam.gates.util import count_asof_violations, extract_segment, extract_symbols, query_prices_df
+from quant_eam.gates.util import count_asof_violations, extract_segment, extract_symbols, gate_data_root, load_prices
 
 
 def run_gate_no_lookahead_v1(ctx: GateContext, params: dict[str, Any] | None) -> GateResult:
@@ -25,18 +24,9 @@ def run_gate_no_lookahead_v1(ctx: GateContext, params: dict[str, Any] | None) ->
     snapshot_id = str(runspec.get("data_snapshot_id", ""))
     symbols = extract_symbols(runspec)
 
-    data_root_raw = (ctx.config_snapshot.get("env", {}) or {}).get("EAM_DATA_ROOT")
-    data_root = None
-    if isinstance(data_root_raw, str) and data_root_raw.strip():
-        data_root = Path(data_root_raw)
-
-    prices, stats = query_prices_df(
-        data_root=data_root,
-        snapshot_id=snapshot_id,
-        symbols=symbols,
-        seg=seg,
-    )
-    violations = count_asof_violations(prices, seg.as_of)
+    pf = load_prices(ctx, data_root=gate_data_root(ctx), snapshot_id=snapshot_id, symbols=symbols, seg=seg)
+    stats = pf.stats
+    violations = count_asof_violations(pf.df, seg.as_of)
     passed = violations == 0
     metrics: dict[str, Any] = {
         "rows_before_asof": int(stats["rows_before_asof"]),
@@ -12,9 +12,51 @@ from quant_eam.gates.no_lookahead import run_gate_no_lookahead_v1
 from quant_eam.gates.risk_policy_compliance import run_risk_policy_compliance_v1
 from quant_eam.gates.stress_cost import run_gate_cost_x2_v1
 from quant_eam.gates.stress_lag import run_gate_delay_plus_1bar_v1
+from quant_eam.gates.result_cache import GateResultCache, gate_cache_key, with_cache_hit
 from quant_eam.gates.types import GateContext, GateFn, GateResult
 
 
+# Gates that only read the dossier/policies/data snapshot and return a result derived from
+# (ctx, params); they may run concurrently. `risk_policy_compliance_v1` also writes its own
+# `risk_report.json` evidence (write-once), which no other gate reads.
+_PARALLEL_SAFE: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("basic_sanity", "v1"),
+        ("determinism_guard", "v1"),
+        ("data_snapshot_integrity_v1", "v1"),
+        ("components_integrity_v1", "v1"),
+        ("gate_no_lookahead_v1", "v1"),
+        ("gate_delay_plus_1bar_v1", "v1"),
+        ("gate_cost_x2_v1", "v1"),
+        ("gate_holdout_passfail_v1", "v1"),
+        ("holdout_leak_guard_v1", "v1"),
+        ("risk_policy_compliance_v1", "v1"),
+    }
+)
+
+
+# Gates whose result is a pure function of the inputs hashed by `gates.result_cache.gate_cache_key`
+# (dossier artifacts, policies, data snapshot). Gates that scan other dossiers/jobs, verify files on
+# disk or write evidence are always recomputed.
+_CACHEABLE: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("gate_no_lookahead_v1", "v1"),
+        ("gate_delay_plus_1bar_v1", "v1"),
+        ("gate_cost_x2_v1", "v1"),
+        ("gate_holdout_passfail_v1", "v1"),
+    }
+)
+
+
+def is_cacheable(gate_id: str, gate_version: str) -> bool:
+    return (str(gate_id), str(gate_version)) in _CACHEABLE
+
+
+def is_parallel_safe(gate_id: str, gate_version: str) -> bool:
+    """True when the gate is independent of other gates and may run on a worker thread."""
+    return (str(gate_id), str(gate_version)) in _PARALLEL_SAFE
+
+
 def get_gate(gate_id: str, gate_version: str) -> GateFn | None:
     key = (str(gate_id), str(gate_version))
     return {
@@ -32,8 +74,15 @@ def get_gate(gate_id: str, gate_version: str) -> GateFn | None:
 
 
 def run_gate(
-    *, ctx: GateContext, gate_id: str, gate_version: str, params: dict[str, Any] | None = None
+    *,
+    ctx: GateContext,
+    gate_id: str,
+    gate_version: str,
+    params: dict[str, Any] | None = None,
+    cache: GateResultCache | None = None,
+    force_recompute: bool = False,
 ) -> GateResult:
+    """Run one gate; cacheable gates consult `cache` first (`force_recompute` recomputes and refreshes the entry)."""
     fn = get_gate(gate_id, gate_version)
     if fn is None:
         return GateResult(
@@ -43,4 +92,16 @@ def run_gate(
             status="fail",
             metrics={"error": f"unsupported gate_id/gate_version: {gate_id!r}/{gate_version!r}"},
         )
-    return fn(ctx, params)
+    if cache is None or not is_cacheable(gate_id, gate_version):
+        return fn(ctx, params)
+    key = gate_cache_key(ctx, gate_id=gate_id, gate_version=gate_version, params=params)
+    if key is None:
+        return fn(ctx, params)
+    if not force_recompute:
+        hit = cache.get(key)
+        if hit is not None:
+            return with_cache_hit(hit, key)
+    gr = fn(ctx, params)
+    if "error" not in gr.metrics:
+        cache.put(key, gr)
+    return gr
@@ -0,0 +1,180 @@
+"""Content-addressed cache of gate results (opt-in, under the artifact root).
+
+A cacheable gate is a pure function of its inputs, so its result is stored under a key that hashes
+exactly those inputs:
+- gate_id, gate_version, params
+- `dossier_manifest.hashes` (sha256 of every dossier artifact)
+- sha256 of each loaded policy document (bundle, execution, cost, asof latency, risk, gate suite)
+- sha256 of the data snapshot manifest (which records the dataset file sha256s)
+- the gate's runspec and metrics (GateRunner derives per-segment contexts from the same dossier)
+
+Layout: `<artifact_root>/gate_cache/<key>.json`. Hits refresh the entry mtime; once the cache holds
+more than `max_entries` files the least recently used ones are evicted. Results that carry an error
+are never stored, and contexts whose snapshot manifest cannot be read are not cacheable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from quant_eam.api.roots import artifact_root
+from quant_eam.data_lake.lake import DataLake
+from quant_eam.gates.types import GateContext, GateEvidence, GateResult
+from quant_eam.gates.util import gate_data_root
+from quant_eam.policies.load import sha256_file
+
+CACHE_SCHEMA_VERSION = "gate_cache_entry_v1"
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def _canonical_json_sha256(obj: Any) -> str:
+    b = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str).encode("utf-8")
+    return hashlib.sha256(b).hexdigest()
+
+
+def _snapshot_sha256(ctx: GateContext) -> str | None:
+    snapshot_id = str(ctx.runspec.get("data_snapshot_id", "")).strip()
+    if not snapshot_id:
+        return None
+    try:
+        return sha256_file(DataLake(gate_data_root(ctx)).manifest_path(snapshot_id))
+    except OSError:
+        return None
+
+
+def gate_cache_key(ctx: GateContext, *, gate_id: str, gate_version: str, params: dict[str, Any] | None) -> str | None:
+    """Canonical key for one gate invocation (None: inputs cannot be pinned, do not cache)."""
+    hashes = ctx.dossier_manifest.get("hashes")
+    snapshot_sha = _snapshot_sha256(ctx)
+    if not isinstance(hashes, dict) or not hashes or snapshot_sha is None:
+        return None
+    policies = {
+        "policy_bundle": ctx.policy_bundle,
+        "execution_policy": ctx.execution_policy,
+        "cost_policy": ctx.cost_policy,
+        "asof_latency_policy": ctx.asof_latency_policy,
+        "risk_policy": ctx.risk_policy,
+        "gate_suite": ctx.gate_suite,
+    }
+    return _canonical_json_sha256(
+        {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "gate_id": str(gate_id),
+            "gate_version": str(gate_version),
+            "params": params or {},
+            "dossier_hashes": hashes,
+            "policy_sha256": {k: _canonical_json_sha256(v) for k, v in policies.items()},
+            "data_snapshot_sha256": snapshot_sha,
+            "runspec_sha256": _canonical_json_sha256(ctx.runspec),
+            "metrics_sha256": _canonical_json_sha256(ctx.metrics),
+        }
+    )
+
+
+def _result_from_json_obj(obj: dict[str, Any]) -> GateResult:
+    ev = obj.get("evidence")
+    evidence = None
+    if isinstance(ev, dict):
+        arts = ev.get("artifacts")
+        notes = ev.get("notes")
+        evidence = GateEvidence(
+            artifacts=[str(a) for a in arts] if isinstance(arts, list) else None,
+            notes=str(notes) if notes is not None else None,
+        )
+    thresholds = obj.get("thresholds")
+    return GateResult(
+        gate_id=str(obj["gate_id"]),
+        gate_version=str(obj["gate_version"]),
+        passed=bool(obj["pass"]),
+        status=str(obj["status"]) if obj.get("status") is not None else None,
+        metrics=dict(obj.get("metrics") or {}),
+        thresholds=dict(thresholds) if isinstance(thresholds, dict) else None,
+        evidence=evidence,
+    )
+
+
+class GateResultCache:
+    """Gate result store keyed by `gate_cache_key` (safe to share between gate worker threads)."""
+
+    def __init__(self, root: Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.root = Path(root)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> GateResult | None:
+        p = self._path(key)
+        try:
+            doc = json.loads(p.read_text(encoding="utf-8"))
+            if not isinstance(doc, dict) or doc.get("schema_version") != CACHE_SCHEMA_VERSION or doc.get("key") != key:
+                raise ValueError("stale gate cache entry")
+            gr = _result_from_json_obj(doc["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(p)  # LRU: a hit makes the entry the most recently used.
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return gr
+
+    def put(self, key: str, gr: GateResult) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        doc = {"schema_version": CACHE_SCHEMA_VERSION, "key": key, "result": gr.to_json_obj()}
+        tmp = self.root / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.replace(self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, str]] = []
+        with os.scandir(self.root) as it:
+            for e in it:
+                if e.name.endswith(".json") and not e.name.startswith("."):
+                    try:
+                        entries.append((int(e.stat().st_mtime_ns), e.name))
+                    except OSError:
+                        continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _mtime, name in entries[: len(entries) - self.max_entries]:
+            (self.root / name).unlink(missing_ok=True)
+
+
+def with_cache_hit(gr: GateResult, key: str) -> GateResult:
+    """Return `gr` with the cache hit recorded in its evidence."""
+    ev = gr.evidence or GateEvidence()
+    return GateResult(
+        gate_id=gr.gate_id,
+        gate_version=gr.gate_version,
+        passed=gr.passed,
+        status=gr.status,
+        metrics=gr.metrics,
+        thresholds=gr.thresholds,
+        evidence=GateEvidence(artifacts=ev.artifacts, notes=ev.notes, cache={"hit": True, "key": key}),
+    )
+
+
+def gate_cache_from_env() -> GateResultCache | None:
+    """`EAM_GATE_CACHE=1` enables the cache under `<artifact_root>/gate_cache` (size: `EAM_GATE_CACHE_MAX_ENTRIES`)."""
+    if str(os.getenv("EAM_GATE_CACHE", "")).strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    raw = str(os.getenv("EAM_GATE_CACHE_MAX_ENTRIES", "")).strip()
+    try:
+        max_entries = int(raw) if raw else DEFAULT_MAX_ENTRIES
+    except ValueError:
+        max_entries = DEFAULT_MAX_ENTRIES
+    return GateResultCache(artifact_root() / "gate_cache", max_entries=max_entries)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from pathlib import Path
 from typing import Any
 
-from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid, run_adapter
+from quant_eam.backtest.scenario_batch import StressScenario, run_adapter_scenarios
+from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid
 from quant_eam.gates.types import GateContext, GateEvidence, GateResult
-from quant_eam.gates.util import extract_segment, extract_symbols, query_prices_df
+from quant_eam.gates.util import (
+    extract_segment,
+    extract_symbols,
+    gate_data_root,
+    load_prices,
+    prepared_prices_or_none,
+)
 
 
 def _mul_cost_bps(cost_policy: dict[str, Any], factor: float) -> dict[str, Any]:
@@ -40,23 +46,23 @@ def run_gate_cost_x2_v1(ctx: GateContext, params: dict[str, Any] | None) -> Gate
     symbols = extract_symbols(runspec)
     adapter_id = str((runspec.get("adapter", {}) or {}).get("adapter_id", ""))
 
-    data_root_raw = (ctx.config_snapshot.get("env", {}) or {}).get("EAM_DATA_ROOT")
-    data_root = Path(data_root_raw) if isinstance(data_root_raw, str) and data_root_raw.strip() else None
-
-    prices, stats = query_prices_df(data_root=data_root, snapshot_id=snapshot_id, symbols=symbols, seg=seg)
+    # The price frame is shared with the other gates of this run (read-only; the adapter copies it).
+    pf = load_prices(ctx, data_root=gate_data_root(ctx), snapshot_id=snapshot_id, symbols=symbols, seg=seg)
+    stats = pf.stats
 
     baseline_lag = int(ctx.metrics.get("lag_bars") or 1)
     baseline_lag = max(1, baseline_lag)
 
     stressed_cost_policy = _mul_cost_bps(ctx.cost_policy, 2.0)
     try:
-        stressed = run_adapter(
+        stressed_stats = run_adapter_scenarios(
             adapter_id=adapter_id,
-            prices=prices,
-            lag_bars=baseline_lag,
+            prices=pf.df,
+            scenarios=[StressScenario(lag_bars=baseline_lag, cost_multiplier=2.0)],
             execution_policy=deepcopy(ctx.execution_policy),
-            cost_policy=stressed_cost_policy,
-        )
+            cost_policy=deepcopy(ctx.cost_policy),
+            prepared=prepared_prices_or_none(pf),
+        )[0]
     except BacktestInvalid as e:
         return GateResult(
             gate_id="gate_cost_x2_v1",
@@ -73,7 +79,7 @@ def run_gate_cost_x2_v1(ctx: GateContext, params: dict[str, Any] | None) -> Gate
     except Exception:
         baseline_total_return_f = 0.0
 
-    stressed_total_return_f = float(stressed.stats.get("total_return") or 0.0)
+    stressed_total_return_f = float(stressed_stats.get("total_return") or 0.0)
 
     max_return_drop = float(params.get("max_return_drop", 0.10))
     passed = stressed_total_return_f >= (baseline_total_return_f - max_return_drop)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from pathlib import Path
 from typing import Any
 
-from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid, run_adapter
+from quant_eam.backtest.scenario_batch import StressScenario, run_adapter_scenarios
+from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid
 from quant_eam.gates.types import GateContext, GateEvidence, GateResult
-from quant_eam.gates.util import Segment, extract_segment, extract_symbols, query_prices_df
+from quant_eam.gates.util import (
+    extract_segment,
+    extract_symbols,
+    gate_data_root,
+    load_prices,
+    prepared_prices_or_none,
+)
 
 
 def _baseline_lag(ctx: GateContext) -> int:
@@ -44,22 +50,22 @@ def run_gate_delay_plus_1bar_v1(ctx: GateContext, params: dict[str, Any] | None)
     adapter_id = str((runspec.get("adapter", {}) or {}).get("adapter_id", ""))
 
     # Data root from config snapshot (runner writes it), fallback to env default via DataCatalog(None).
-    data_root_raw = (ctx.config_snapshot.get("env", {}) or {}).get("EAM_DATA_ROOT")
-    data_root = Path(data_root_raw) if isinstance(data_root_raw, str) and data_root_raw.strip() else None
-
-    prices, stats = query_prices_df(data_root=data_root, snapshot_id=snapshot_id, symbols=symbols, seg=seg)
+    # The price frame is shared with the other gates of this run (read-only; the adapter copies it).
+    pf = load_prices(ctx, data_root=gate_data_root(ctx), snapshot_id=snapshot_id, symbols=symbols, seg=seg)
+    stats = pf.stats
 
     baseline_lag = _baseline_lag(ctx)
     stressed_lag = baseline_lag + 1
 
     try:
-        stressed = run_adapter(
+        stressed_stats = run_adapter_scenarios(
             adapter_id=adapter_id,
-            prices=prices,
-            lag_bars=stressed_lag,
+            prices=pf.df,
+            scenarios=[StressScenario(lag_bars=stressed_lag)],
             execution_policy=deepcopy(ctx.execution_policy),
             cost_policy=deepcopy(ctx.cost_policy),
-        )
+            prepared=prepared_prices_or_none(pf),
+        )[0]
     except BacktestInvalid as e:
         return GateResult(
             gate_id="gate_delay_plus_1bar_v1",
@@ -76,7 +82,7 @@ def run_gate_delay_plus_1bar_v1(ctx: GateContext, params: dict[str, Any] | None)
     except Exception:
         baseline_total_return_f = 0.0
 
-    stressed_total_return_f = float(stressed.stats.get("total_return") or 0.0)
+    stressed_total_return_f = float(stressed_stats.get("total_return") or 0.0)
 
     max_return_drop = float(params.get("max_return_drop", 0.05))
     passed = stressed_total_return_f >= (baseline_total_return_f - max_return_drop)
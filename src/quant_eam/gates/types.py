@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from quant_eam.gates.data_provider import GateDataProvider
 
 
 @dataclass(frozen=True)
 class GateEvidence:
     artifacts: list[str] | None = None
     notes: str | None = None
+    # Set when the result was served from the gate result cache: {"hit": true, "key": <sha256>}.
+    cache: dict[str, Any] | None = None
 
 
 @dataclass(frozen=True)
@@ -38,6 +43,8 @@ class GateResult:
                 ev["artifacts"] = list(self.evidence.artifacts)
             if self.evidence.notes is not None:
                 ev["notes"] = str(self.evidence.notes)
+            if self.evidence.cache is not None:
+                ev["cache"] = dict(self.evidence.cache)
             obj["evidence"] = ev
         return obj
 
@@ -56,6 +63,8 @@ class GateContext:
     dossier_manifest: dict[str, Any]
     config_snapshot: dict[str, Any]
     metrics: dict[str, Any]
+    # Per-run price cache shared by all gates of one GateRunner invocation (None: query directly).
+    data: GateDataProvider | None = field(default=None, compare=False, repr=False)
 
 
 GateFn = Callable[[GateContext, dict[str, Any] | None], GateResult]
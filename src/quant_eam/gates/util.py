@@ -2,13 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from quant_eam.backtest.scenario_batch import PreparedPrices, prepare_prices
+from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid
 from quant_eam.datacatalog.catalog import DataCatalog
 from quant_eam.data_lake.timeutil import parse_iso_datetime
 
+if TYPE_CHECKING:
+    from quant_eam.gates.data_provider import PriceFrame
+    from quant_eam.gates.types import GateContext
+
 
 @dataclass(frozen=True)
 class Segment:
@@ -70,6 +76,45 @@ def query_prices_df(
     return df, {"rows_before_asof": int(stats.rows_before_asof), "rows_after_asof": int(stats.rows_after_asof)}
 
 
+def gate_data_root(ctx: GateContext) -> Path | None:
+    """Data root recorded by the runner in config_snapshot.env (None: DataCatalog default)."""
+    raw = (ctx.config_snapshot.get("env", {}) or {}).get("EAM_DATA_ROOT")
+    return Path(raw) if isinstance(raw, str) and raw.strip() else None
+
+
+def load_prices(
+    ctx: GateContext,
+    *,
+    data_root: Path | None,
+    snapshot_id: str,
+    symbols: list[str],
+    seg: Segment,
+    dataset_id: str = "ohlcv_1d",
+) -> PriceFrame:
+    """Price frame for a gate: served from `ctx.data` when the runner attached a provider.
+
+    The returned frame may be shared with other gates and must be treated as read-only.
+    """
+    if ctx.data is not None:
+        return ctx.data.prices(data_root=data_root, snapshot_id=snapshot_id, symbols=symbols, seg=seg, dataset_id=dataset_id)
+    from quant_eam.gates.data_provider import PriceFrame
+
+    df, stats = query_prices_df(data_root=data_root, snapshot_id=snapshot_id, symbols=symbols, seg=seg, dataset_id=dataset_id)
+    return PriceFrame(df, stats)
+
+
+def prepared_prices_or_none(pf: PriceFrame) -> PreparedPrices | None:
+    """The frame's shared `prepare_prices` result, or None when the prices are invalid.
+
+    With None the backtest re-raises the error itself, after validating the adapter and policies, so the
+    reported error is the same as without the shared preparation.
+    """
+    try:
+        return pf.derived("backtest.prepared_prices", lambda: prepare_prices(pf.df))
+    except BacktestInvalid:
+        return None
+
+
 def count_asof_violations(df: pd.DataFrame, as_of: str) -> int:
     asof_dt = parse_iso_datetime(as_of)
     v = 0
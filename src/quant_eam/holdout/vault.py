@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
-from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid, BacktestResult, run_adapter
+from quant_eam.backtest.scenario_batch import PreparedPrices, prepare_prices, run_adapter_minimal
+from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid
 from quant_eam.gates.util import Segment, query_prices_df
 
+DEFAULT_HOLDOUT_WORKERS = 4
+
 
 @dataclass(frozen=True)
 class HoldoutResult:
@@ -22,6 +27,76 @@ class HoldoutInvalid(ValueError):
     pass
 
 
+@dataclass(frozen=True)
+class HoldoutRequest:
+    """Inputs of one minimal holdout evaluation (one run's holdout segment)."""
+
+    data_root: Path | None
+    snapshot_id: str
+    dataset_id: str
+    symbols: tuple[str, ...]
+    seg: Segment
+    adapter_id: str
+    lag_bars: int
+    execution_policy: dict[str, Any] = field(compare=False)
+    cost_policy: dict[str, Any] = field(compare=False)
+    params: dict[str, Any] | None = field(default=None, compare=False)
+
+    def prices_key(self) -> tuple[str, str, str, tuple[str, ...], Segment]:
+        root = "" if self.data_root is None else Path(self.data_root).as_posix()
+        return (root, self.snapshot_id, self.dataset_id, tuple(self.symbols), self.seg)
+
+
+def _minimal_result(*, total_return: float, trade_count: int, lag_bars: int, params: dict[str, Any]) -> HoldoutResult:
+    # Minimal pass/fail rule: configurable via gate params.
+    # Default is permissive (pass) to avoid accidental leakage-driven optimization pressure in MVP.
+    min_total_return = params.get("min_total_return")
+    if min_total_return is None:
+        passed = True
+        summary = "holdout evaluated (minimal output); no threshold configured"
+    else:
+        try:
+            thr = float(min_total_return)
+        except Exception as e:
+            raise HoldoutInvalid("min_total_return must be a number") from e
+        passed = total_return >= thr
+        summary = f"holdout total_return={total_return:.6f} threshold={thr:.6f}"
+
+    metrics_minimal: dict[str, Any] = {
+        "total_return": total_return,
+        "trade_count": int(trade_count),
+        "lag_bars": int(lag_bars),
+        # Do not include per-bar curve or trades. Do not include sharpe/max_dd by default.
+    }
+    return HoldoutResult(passed=passed, summary=summary, metrics_minimal=metrics_minimal)
+
+
+def _evaluate(req: HoldoutRequest, prices: pd.DataFrame, prepared: PreparedPrices | None) -> HoldoutResult:
+    try:
+        stats = run_adapter_minimal(
+            adapter_id=req.adapter_id,
+            prices=prices,
+            lag_bars=req.lag_bars,
+            execution_policy=req.execution_policy,
+            cost_policy=req.cost_policy,
+            prepared=prepared,
+        )
+    except BacktestInvalid as e:
+        raise HoldoutInvalid(str(e)) from e
+
+    tr = stats.get("total_return")
+    try:
+        tr_f = float(tr) if tr is not None else 0.0
+    except Exception:
+        tr_f = 0.0
+    return _minimal_result(
+        total_return=tr_f,
+        trade_count=int(stats.get("trade_count") or 0),
+        lag_bars=req.lag_bars,
+        params=req.params or {},
+    )
+
+
 def evaluate_holdout_minimal(
     *,
     data_root: Path | None,
@@ -34,52 +109,100 @@ def evaluate_holdout_minimal(
     execution_policy: dict[str, Any],
     cost_policy: dict[str, Any],
     params: dict[str, Any] | None = None,
+    prices: pd.DataFrame | None = None,
+    prepared: PreparedPrices | None = None,
 ) -> HoldoutResult:
-    """Run holdout evaluation but return only pass/fail + minimal summary (no curves/trades output)."""
-    params = params or {}
-    prices, _stats = query_prices_df(
+    """Run holdout evaluation but return only pass/fail + minimal summary (no curves/trades output).
+
+    The backtest runs on the minimal simulation path (`run_adapter_minimal`): same total_return and
+    trade_count as the full adapter, without materializing curve/trades/positions/turnover frames.
+    `prices` (and its `prepare_prices` grid) may be passed by callers that already loaded the holdout
+    frame (read-only).
+    """
+    req = HoldoutRequest(
         data_root=data_root,
         snapshot_id=snapshot_id,
-        symbols=symbols,
-        seg=seg,
         dataset_id=dataset_id,
+        symbols=tuple(symbols),
+        seg=seg,
+        adapter_id=adapter_id,
+        lag_bars=int(lag_bars),
+        execution_policy=execution_policy,
+        cost_policy=cost_policy,
+        params=params,
     )
-    try:
-        bt: BacktestResult = run_adapter(
-            adapter_id=adapter_id,
-            prices=prices,
-            lag_bars=lag_bars,
-            execution_policy=deepcopy(execution_policy),
-            cost_policy=deepcopy(cost_policy),
+    if prices is None:
+        prices, _stats = query_prices_df(
+            data_root=data_root,
+            snapshot_id=snapshot_id,
+            symbols=list(symbols),
+            seg=seg,
+            dataset_id=dataset_id,
         )
-    except BacktestInvalid as e:
-        raise HoldoutInvalid(str(e)) from e
+    return _evaluate(req, prices, prepared)
 
-    tr = bt.stats.get("total_return")
+
+def holdout_workers_from_env() -> int:
+    raw = str(os.getenv("EAM_HOLDOUT_WORKERS", "")).strip()
+    if not raw:
+        return min(DEFAULT_HOLDOUT_WORKERS, os.cpu_count() or 1)
     try:
-        tr_f = float(tr) if tr is not None else 0.0
-    except Exception:
-        tr_f = 0.0
+        return max(1, int(raw))
+    except ValueError:
+        return 1
 
-    # Minimal pass/fail rule: configurable via gate params.
-    # Default is permissive (pass) to avoid accidental leakage-driven optimization pressure in MVP.
-    min_total_return = params.get("min_total_return")
-    if min_total_return is None:
-        passed = True
-        summary = "holdout evaluated (minimal output); no threshold configured"
-    else:
-        try:
-            thr = float(min_total_return)
-        except Exception as e:
-            raise HoldoutInvalid("min_total_return must be a number") from e
-        passed = tr_f >= thr
-        summary = f"holdout total_return={tr_f:.6f} threshold={thr:.6f}"
 
-    metrics_minimal: dict[str, Any] = {
-        "total_return": tr_f,
-        "trade_count": int(bt.stats.get("trade_count") or 0),
-        "lag_bars": int(lag_bars),
-        # Do not include per-bar curve or trades. Do not include sharpe/max_dd by default.
-    }
-    return HoldoutResult(passed=passed, summary=summary, metrics_minimal=metrics_minimal)
+def evaluate_holdouts_minimal(
+    requests: list[HoldoutRequest],
+    *,
+    workers: int | None = None,
+) -> list[HoldoutResult | HoldoutInvalid]:
+    """Evaluate many holdouts (e.g. every sweep trial) concurrently; results in request order.
+
+    Requests on the same (data_root, snapshot, dataset, symbols, segment) share one price query and
+    one aligned price grid. Each item is the `HoldoutResult` or the `HoldoutInvalid` describing why
+    that holdout could not be evaluated; one bad request does not abort the others. Output is the
+    same restricted summary as `evaluate_holdout_minimal`.
+    """
+    if workers is None:
+        workers = holdout_workers_from_env()
+
+    frames: dict[tuple[Any, ...], tuple[pd.DataFrame, PreparedPrices | None]] = {}
+    key_locks: dict[tuple[Any, ...], threading.Lock] = {}
+    lock = threading.Lock()
+
+    def _prices(req: HoldoutRequest) -> tuple[pd.DataFrame, PreparedPrices | None]:
+        key = req.prices_key()
+        with lock:
+            key_lock = key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            hit = frames.get(key)
+            if hit is None:
+                df, _stats = query_prices_df(
+                    data_root=req.data_root,
+                    snapshot_id=req.snapshot_id,
+                    symbols=list(req.symbols),
+                    seg=req.seg,
+                    dataset_id=req.dataset_id,
+                )
+                try:
+                    pp: PreparedPrices | None = prepare_prices(df)
+                except BacktestInvalid:
+                    pp = None  # _evaluate re-raises in run_adapter's validation order.
+                hit = (df, pp)
+                frames[key] = hit
+            return hit
+
+    def _one(req: HoldoutRequest) -> HoldoutResult | HoldoutInvalid:
+        try:
+            df, pp = _prices(req)
+            return _evaluate(req, df, pp)
+        except HoldoutInvalid as e:
+            return e
+        except (ValueError, OSError) as e:
+            return HoldoutInvalid(str(e))
 
+    if workers <= 1 or len(requests) <= 1:
+        return [_one(r) for r in requests]
+    with ThreadPoolExecutor(max_workers=min(int(workers), len(requests)), thread_name_prefix="holdout") as ex:
+        return list(ex.map(_one, requests))
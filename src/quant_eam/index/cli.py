@@ -5,7 +5,7 @@ import json
 import sys
 from pathlib import Path
 
-from quant_eam.index.indexer import build_all_indexes
+from quant_eam.index.indexer import build_all_indexes, build_runs_index
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -15,10 +15,19 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Artifact root to scan (default: env EAM_ARTIFACT_ROOT or /artifacts).",
     )
+    p.add_argument(
+        "--run-id",
+        action="append",
+        default=None,
+        help="Only (re)index the given dossier run_id(s) (repeatable; post-run refresh).",
+    )
     args = p.parse_args(argv)
 
     ar = Path(args.artifact_root) if args.artifact_root else None
-    res = build_all_indexes(artifact_root_dir=ar)
+    if args.run_id:
+        res = {"runs": build_runs_index(artifact_root_dir=ar, run_ids=list(args.run_id))}
+    else:
+        res = build_all_indexes(artifact_root_dir=ar)
     sys.stdout.write(json.dumps(res, indent=2, sort_keys=True) + "\n")
     return 0
 
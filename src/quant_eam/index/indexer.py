@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import re
 from dataclasses import dataclass
@@ -12,6 +13,8 @@ from quant_eam.jobstore.store import default_job_root
 from quant_eam.registry.storage import registry_paths
 
 
+logger = logging.getLogger(__name__)
+
 SAFE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
 
 
@@ -70,32 +73,140 @@ class IndexPaths:
     root: Path
     runs_index: Path
     jobs_index: Path
+    runs_state: Path
 
 
 def index_paths(*, artifact_root_dir: Path | None = None) -> IndexPaths:
     ar = Path(artifact_root_dir) if artifact_root_dir is not None else artifact_root()
     idx = ar / "index"
-    return IndexPaths(root=idx, runs_index=idx / "runs_index.jsonl", jobs_index=idx / "jobs_index.jsonl")
+    return IndexPaths(
+        root=idx,
+        runs_index=idx / "runs_index.jsonl",
+        jobs_index=idx / "jobs_index.jsonl",
+        runs_state=idx / "runs_index_state.json",
+    )
+
+
+def _write_json_atomic(path: Path, obj: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.parent / (path.name + ".tmp")
+    tmp.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return int(path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return int(path.stat().st_size)
+    except OSError:
+        return 0
+
+
+def _jsonl_ids_from_offset(path: Path, key: str, start: int) -> set[str]:
+    """Like `_jsonl_existing_ids`, but only parses rows appended after byte `start`."""
+    out: set[str] = set()
+    if not path.is_file():
+        return out
+    with path.open("rb") as f:
+        f.seek(start)
+        for raw in f:
+            try:
+                doc = json.loads(raw.decode("utf-8").strip() or "null")
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if isinstance(doc, dict) and isinstance(doc.get(key), str):
+                out.add(str(doc[key]))
+    return out
+
+
+def _empty_runs_state() -> dict[str, Any]:
+    return {
+        "schema_version": "runs_index_state_v1",
+        "runs_index_bytes": 0,
+        "dossiers_root_mtime_ns": None,
+        "runs": {},
+        "pending": [],
+        "cards": {"dir_mtime_ns": None, "files": {}},
+    }
 
 
-def _scan_cards_by_run_id() -> dict[str, list[str]]:
-    """Return mapping run_id -> [card_id,...] (sorted)."""
+def _load_runs_state(idxp: IndexPaths) -> dict[str, Any]:
+    """Load the persisted high-water mark and reconcile it with runs_index.jsonl.
+
+    If other writers appended to the index since the state was saved, only the appended tail is
+    parsed. If the index shrank or the state is unreadable, ids are recovered with a full read.
+    """
+    size = _file_size(idxp.runs_index)
+    st: dict[str, Any] | None = None
+    if idxp.runs_state.is_file():
+        try:
+            doc = _load_json(idxp.runs_state)
+            if isinstance(doc, dict) and doc.get("schema_version") == "runs_index_state_v1":
+                st = doc
+        except Exception:  # noqa: BLE001
+            st = None
+    if st is None or not isinstance(st.get("runs"), dict) or int(st.get("runs_index_bytes") or 0) > size:
+        st = _empty_runs_state()
+        # Unknown dir mtimes (None) force a listing on the next build.
+        st["runs"] = {rid: None for rid in sorted(_jsonl_existing_ids(idxp.runs_index, "run_id"))}
+    elif int(st.get("runs_index_bytes") or 0) < size:
+        for rid in _jsonl_ids_from_offset(idxp.runs_index, "run_id", int(st["runs_index_bytes"])):
+            st["runs"].setdefault(rid, None)
+        st["dossiers_root_mtime_ns"] = None
+    st["runs_index_bytes"] = size
+    if not isinstance(st.get("pending"), list):
+        st["pending"] = []
+    if not isinstance(st.get("cards"), dict) or not isinstance(st["cards"].get("files"), dict):
+        st["cards"] = {"dir_mtime_ns": None, "files": {}}
+    return st
+
+
+def _cards_by_run_id_cached(state: dict[str, Any]) -> dict[str, list[str]]:
+    """Return mapping run_id -> [card_id,...] (sorted), re-parsing only card files whose (mtime, size) changed."""
     rr = registry_root()
     paths = registry_paths(rr)
+    cache = state["cards"]
+    files: dict[str, Any] = cache["files"]
     m: dict[str, list[str]] = {}
     if not paths.cards_dir.is_dir():
+        cache["dir_mtime_ns"] = None
+        cache["files"] = {}
         return m
-    for p in sorted(paths.cards_dir.glob("*.json")):
-        if not p.is_file():
-            continue
-        try:
-            doc = _load_json(p)
-        except Exception:  # noqa: BLE001
-            continue
-        if not isinstance(doc, dict):
-            continue
-        rid = str(doc.get("primary_run_id") or "").strip()
-        cid = str(doc.get("card_id") or p.stem).strip()
+    dir_mtime = _mtime_ns(paths.cards_dir)
+    if dir_mtime is None or dir_mtime != cache.get("dir_mtime_ns"):
+        fresh: dict[str, Any] = {}
+        for p in sorted(paths.cards_dir.glob("*.json")):
+            try:
+                fst = p.stat()
+            except OSError:
+                continue
+            if not p.is_file():
+                continue
+            sig = [int(fst.st_mtime_ns), int(fst.st_size)]
+            prev = files.get(p.name)
+            if isinstance(prev, list) and len(prev) == 4 and prev[:2] == sig:
+                fresh[p.name] = prev
+                continue
+            rid, cid = "", ""
+            try:
+                doc = _load_json(p)
+                if isinstance(doc, dict):
+                    rid = str(doc.get("primary_run_id") or "").strip()
+                    cid = str(doc.get("card_id") or p.stem).strip()
+            except Exception as e:  # noqa: BLE001
+                # Cached as unlinked until the card file changes again.
+                logger.warning("runs index: unreadable card %s: %s", p.as_posix(), e)
+            fresh[p.name] = sig + [rid, cid]
+        cache["files"] = files = fresh
+        cache["dir_mtime_ns"] = dir_mtime
+    for name in sorted(files):
+        _sig_m, _sig_s, rid, cid = files[name]
         if not (_is_safe_id(rid) and _is_safe_id(cid)):
             continue
         m.setdefault(rid, []).append(cid)
@@ -104,80 +215,130 @@ def _scan_cards_by_run_id() -> dict[str, list[str]]:
     return m
 
 
-def build_runs_index(*, artifact_root_dir: Path | None = None, limit: int | None = None) -> dict[str, Any]:
-    """Append-only build for runs_index.jsonl (id-deduped).
+def _runs_index_row(d: Path, rid: str, cards_by_run: dict[str, list[str]]) -> dict[str, Any]:
+    # Minimal, deterministic fields.
+    snapshot_id = None
+    policy_bundle_id = None
+    overall_pass = None
+
+    man_p = d / "dossier_manifest.json"
+    cfg_p = d / "config_snapshot.json"
+    gate_p = d / "gate_results.json"
+    try:
+        if man_p.is_file():
+            man = _load_json(man_p)
+            if isinstance(man, dict):
+                snapshot_id = str(man.get("data_snapshot_id") or "").strip() or None
+        if cfg_p.is_file():
+            cfg = _load_json(cfg_p)
+            if isinstance(cfg, dict):
+                policy_bundle_id = str(cfg.get("policy_bundle_id") or "").strip() or None
+                rs = cfg.get("runspec") if isinstance(cfg.get("runspec"), dict) else {}
+                if isinstance(rs, dict) and not policy_bundle_id:
+                    policy_bundle_id = str(rs.get("policy_bundle_id") or "").strip() or None
+        if gate_p.is_file():
+            gate = _load_json(gate_p)
+            if isinstance(gate, dict) and "overall_pass" in gate:
+                overall_pass = bool(gate.get("overall_pass"))
+    except Exception:  # noqa: BLE001
+        # Index should be best-effort; do not fail build.
+        snapshot_id = snapshot_id or None
+        policy_bundle_id = policy_bundle_id or None
+        overall_pass = overall_pass if isinstance(overall_pass, bool) else None
 
-    Returns summary dict for logging/tests.
+    return {
+        "schema_version": "runs_index_v1",
+        "indexed_at": _utc_now_iso(),
+        "run_id": rid,
+        "snapshot_id": snapshot_id,
+        "policy_bundle_id": policy_bundle_id,
+        "overall_pass": overall_pass,
+        # Stable relative refs (prevent traversal).
+        "dossier_path": f"dossiers/{rid}",
+        "card_ids": cards_by_run.get(rid, []),
+    }
+
+
+def build_runs_index(
+    *,
+    artifact_root_dir: Path | None = None,
+    limit: int | None = None,
+    run_ids: list[str] | None = None,
+) -> dict[str, Any]:
+    """Incremental, append-only build for runs_index.jsonl (id-deduped).
+
+    A persisted high-water mark (`runs_index_state.json`: dossiers root mtime, indexed run ids with
+    their dossier dir mtimes, pending runs and card file signatures) lets a rebuild visit only:
+    - new dossier dirs (the root is listed only when its mtime changed),
+    - pending runs (indexed before gate results existed) whose dir mtime changed; a refreshed row is
+      appended and readers take the newest row per run_id.
+    `run_ids` restricts the visit to the given dossiers (post-run refresh hook).
+
+    Returns summary dict for logging/tests: `indexed` rows appended, `skipped_existing` visited dirs
+    already indexed, and `total_seen` dossier dirs visited by this build (not every dossier: 0 when the
+    dossiers root is unchanged and no pending run changed).
     """
     idxp = index_paths(artifact_root_dir=artifact_root_dir)
-    existing = _jsonl_existing_ids(idxp.runs_index, "run_id")
-    cards_by_run = _scan_cards_by_run_id()
-
     root = dossiers_root()
     if not root.is_dir():
         return {"indexed": 0, "skipped_existing": 0, "total_seen": 0, "index_path": idxp.runs_index.as_posix()}
 
-    run_dirs = sorted([p for p in root.iterdir() if p.is_dir()], key=lambda p: p.name)
+    state = _load_runs_state(idxp)
+    known: dict[str, Any] = state["runs"]
+    pending: set[str] = {str(x) for x in state["pending"] if isinstance(x, str)}
+
+    root_mtime = _mtime_ns(root)
+    if run_ids is not None:
+        names = sorted({str(r) for r in run_ids})
+    elif root_mtime is not None and root_mtime == state.get("dossiers_root_mtime_ns"):
+        names = []
+    else:
+        names = sorted(e.name for e in os.scandir(root) if e.is_dir())
+    # Revisit pending runs only if their dossier dir changed since they were indexed.
+    changed_pending = sorted(
+        rid for rid in pending if (run_ids is None or rid in names) and _mtime_ns(root / rid) != known.get(rid)
+    )
+
     total_seen = 0
     indexed = 0
     skipped = 0
+    cards_by_run: dict[str, list[str]] | None = None
+    complete = True
 
-    for d in run_dirs:
-        rid = d.name
+    for rid in sorted(set(names) | set(changed_pending)):
         if not _is_safe_id(rid):
             continue
+        d = root / rid
+        if not d.is_dir():
+            continue
         total_seen += 1
-        if rid in existing:
+        refresh = rid in changed_pending
+        if rid in known and not refresh:
             skipped += 1
+            if known.get(rid) is None:
+                known[rid] = _mtime_ns(d)
             continue
+        if limit is not None and indexed >= int(limit):
+            complete = False
+            break
 
-        # Minimal, deterministic fields.
-        snapshot_id = None
-        policy_bundle_id = None
-        overall_pass = None
-
-        man_p = d / "dossier_manifest.json"
-        cfg_p = d / "config_snapshot.json"
-        gate_p = d / "gate_results.json"
-        try:
-            if man_p.is_file():
-                man = _load_json(man_p)
-                if isinstance(man, dict):
-                    snapshot_id = str(man.get("data_snapshot_id") or "").strip() or None
-            if cfg_p.is_file():
-                cfg = _load_json(cfg_p)
-                if isinstance(cfg, dict):
-                    policy_bundle_id = str(cfg.get("policy_bundle_id") or "").strip() or None
-                    rs = cfg.get("runspec") if isinstance(cfg.get("runspec"), dict) else {}
-                    if isinstance(rs, dict) and not policy_bundle_id:
-                        policy_bundle_id = str(rs.get("policy_bundle_id") or "").strip() or None
-            if gate_p.is_file():
-                gate = _load_json(gate_p)
-                if isinstance(gate, dict) and "overall_pass" in gate:
-                    overall_pass = bool(gate.get("overall_pass"))
-        except Exception:  # noqa: BLE001
-            # Index should be best-effort; do not fail build.
-            snapshot_id = snapshot_id or None
-            policy_bundle_id = policy_bundle_id or None
-            overall_pass = overall_pass if isinstance(overall_pass, bool) else None
-
-        obj: dict[str, Any] = {
-            "schema_version": "runs_index_v1",
-            "indexed_at": _utc_now_iso(),
-            "run_id": rid,
-            "snapshot_id": snapshot_id,
-            "policy_bundle_id": policy_bundle_id,
-            "overall_pass": overall_pass,
-            # Stable relative refs (prevent traversal).
-            "dossier_path": f"dossiers/{rid}",
-            "card_ids": cards_by_run.get(rid, []),
-        }
+        if cards_by_run is None:
+            cards_by_run = _cards_by_run_id_cached(state)
+        dir_mtime = _mtime_ns(d)
+        obj = _runs_index_row(d, rid, cards_by_run)
+        known[rid] = dir_mtime
+        if obj["overall_pass"] is None:
+            pending.add(rid)
+        else:
+            pending.discard(rid)
         _append_jsonl(idxp.runs_index, obj)
-        existing.add(rid)
         indexed += 1
 
-        if limit is not None and indexed >= int(limit):
-            break
+    if run_ids is None and complete:
+        state["dossiers_root_mtime_ns"] = root_mtime
+    state["pending"] = sorted(pending)
+    state["runs_index_bytes"] = _file_size(idxp.runs_index)
+    _write_json_atomic(idxp.runs_state, state)
 
     return {
         "indexed": indexed,
@@ -288,8 +449,9 @@ def build_jobs_index(*, artifact_root_dir: Path | None = None, limit: int | None
                         if isinstance(ev, dict):
                             events.append(ev)
             state = _job_last_state(events)
-        except Exception:  # noqa: BLE001
-            pass
+        except Exception as e:  # noqa: BLE001
+            # Best-effort row: fields read before the error are kept.
+            logger.warning("jobs index: partial row for %s: %s", jid, e)
 
         obj: dict[str, Any] = {
             "schema_version": "jobs_index_v1",
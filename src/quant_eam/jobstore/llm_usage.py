@@ -116,6 +116,25 @@ class UsageTotals:
     wall_seconds: float
 
 
+def canonical_json_chars(obj: dict[str, Any]) -> int:
+    """Budgeted size of a response: length of its canonical JSON (same serializer as usage events)."""
+    return len(_canonical_line(obj))
+
+
+def budget_stop_reason(would_exceed: dict[str, bool]) -> str:
+    """Map a would_exceed map to a stable stop_reason (fixed priority order)."""
+    for k in (
+        "max_calls_per_job",
+        "max_prompt_chars_per_job",
+        "max_response_chars_per_job",
+        "max_wall_seconds_per_job",
+        "max_calls_per_agent_run",
+    ):
+        if would_exceed.get(k):
+            return f"exceeded_{k}"
+    return "budget_exceeded"
+
+
 def _zero_totals() -> UsageTotals:
     return UsageTotals(calls=0, prompt_chars=0, response_chars=0, wall_seconds=0.0)
 
@@ -0,0 +1,172 @@
+"""Summary-only job listing: state, title and last update without parsing full event logs.
+
+A job's state is the `event_type` of the last event in `events.jsonl`. That line is found by reading the
+file backwards in blocks from EOF (`core.jsonl_index.iter_jsonl_reverse`), so the cost does not grow with
+the job's history. The spec
+fields used by listings (`schema_version`, blueprint id/title) are extracted once per `job_spec.json`
+version.
+
+Both extractions are memoized per file stat (size, mtime_ns): `events.jsonl` is append-only, so an append
+changes the key. Without a state filter, `list_job_summaries` summarizes only the requested page and the
+total is the number of job directories. A state filter needs every job's state, so every job is summarized;
+only jobs that changed since the previous call have their spec and event tail re-read.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from quant_eam.core.jsonl_index import iter_jsonl_reverse
+from quant_eam.core.lru_cache import LRUCache
+from quant_eam.jobstore.store import default_job_root, job_paths, list_job_ids
+
+JOB_SORT_KEYS = ("job_id", "updated")
+_TAIL_BLOCK_SIZE = 8 * 1024
+_CACHE_MAX_ENTRIES = 8192
+
+
+@dataclass(frozen=True)
+class JobSummary:
+    job_id: str
+    state: str  # last event_type, "unknown" when there are no events
+    schema_version: str | None
+    blueprint_id: str | None
+    title: str | None
+    updated_at_ns: int  # mtime of events.jsonl (job_spec.json when there are no events)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def read_last_jsonl_row(path: Path, *, block_size: int = _TAIL_BLOCK_SIZE) -> dict[str, Any] | None:
+    """Last JSON object line of a JSONL file (blank and non-object lines skipped), reading backwards from EOF.
+
+    Raises ValueError when that line is not valid JSON (as a full `iter_jsonl` read would).
+    """
+    return next(iter_jsonl_reverse(path, strict=True, block_size=block_size), None)
+
+
+_SPEC_FIELDS = LRUCache(_CACHE_MAX_ENTRIES)
+_LAST_STATE = LRUCache(_CACHE_MAX_ENTRIES)
+
+
+def clear_job_summary_cache() -> None:
+    _SPEC_FIELDS.clear()
+    _LAST_STATE.clear()
+
+
+def _spec_fields(path: Path, st: os.stat_result) -> tuple[str | None, str | None, str | None]:
+    key = (path.as_posix(), int(st.st_mtime_ns), int(st.st_size))
+    hit, value = _SPEC_FIELDS.get(key)
+    if hit:
+        return value
+    spec = json.loads(path.read_text(encoding="utf-8"))
+    sv = spec.get("schema_version") if isinstance(spec, dict) else None
+    if sv == "job_spec_v1":
+        bp = spec.get("blueprint") if isinstance(spec, dict) else {}
+        blueprint_id = bp.get("blueprint_id") if isinstance(bp, dict) else None
+        title = bp.get("title") if isinstance(bp, dict) else None
+    else:
+        blueprint_id = None
+        title = spec.get("title") if isinstance(spec, dict) else None
+    value = (sv, blueprint_id, title)
+    _SPEC_FIELDS.put(key, value)
+    return value
+
+
+def _last_state(path: Path, st: os.stat_result | None) -> str:
+    if st is None:
+        return "unknown"
+    key = (path.as_posix(), int(st.st_mtime_ns), int(st.st_size))
+    hit, value = _LAST_STATE.get(key)
+    if hit:
+        return value
+    ev = read_last_jsonl_row(path)
+    value = str(ev.get("event_type")) if ev is not None else "unknown"
+    _LAST_STATE.put(key, value)
+    return value
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def load_job_summary(job_id: str, *, job_root: Path | None = None) -> JobSummary:
+    """Summary of one job (raises OSError/ValueError on a missing spec or unreadable last event)."""
+    paths = job_paths(job_id, job_root=job_root)
+    spec_st = os.stat(paths.job_spec)
+    sv, blueprint_id, title = _spec_fields(paths.job_spec, spec_st)
+    ev_st = _stat_or_none(paths.events)
+    return JobSummary(
+        job_id=str(job_id),
+        state=_last_state(paths.events, ev_st),
+        schema_version=sv,
+        blueprint_id=blueprint_id,
+        title=title,
+        updated_at_ns=int((ev_st or spec_st).st_mtime_ns),
+    )
+
+
+def list_job_summaries(
+    *,
+    job_root: Path | None = None,
+    states: Iterable[str] | None = None,
+    sort: str = "job_id",
+    offset: int = 0,
+    limit: int | None = None,
+) -> tuple[list[JobSummary], int]:
+    """One page of job summaries plus the number of jobs matching `states`.
+
+    `sort="job_id"` is ascending job id (the historical listing order); `sort="updated"` is newest
+    update first. Jobs whose spec or last event cannot be read are skipped, like the full listing. Without
+    `states` the total counts job directories and only `ids[offset:offset+limit]` are summarized, so a page
+    may hold fewer than `limit` jobs; with `states` the total counts readable matching jobs.
+    """
+    if sort not in JOB_SORT_KEYS:
+        raise ValueError(f"sort must be one of: {', '.join(JOB_SORT_KEYS)}")
+    jr = Path(job_root or default_job_root())
+    ids = list_job_ids(job_root=jr)
+    want = {str(s) for s in states} if states is not None else None
+
+    if sort == "updated":
+        # Newest first by events.jsonl mtime (one stat per job, no reads).
+        def _updated(jid: str) -> int:
+            paths = job_paths(jid, job_root=jr)
+            st = _stat_or_none(paths.events) or _stat_or_none(paths.job_spec)
+            return int(st.st_mtime_ns) if st is not None else 0
+
+        ids = sorted(ids, key=lambda jid: (-_updated(jid), jid))
+
+    offset = max(0, int(offset))
+    page: list[JobSummary] = []
+    if want is None:
+        end = None if limit is None else offset + int(limit)
+        for jid in ids[offset:end]:
+            try:
+                page.append(load_job_summary(jid, job_root=jr))
+            except (OSError, ValueError):
+                continue
+        return page, len(ids)
+
+    # A state filter needs every job's state; unchanged jobs are served from the per-stat caches.
+    total = 0
+    for jid in ids:
+        in_page = total >= offset and (limit is None or len(page) < int(limit))
+        try:
+            s = load_job_summary(jid, job_root=jr)
+        except (OSError, ValueError):
+            continue
+        if want is not None and s.state not in want:
+            continue
+        if in_page:
+            page.append(s)
+        total += 1
+    return page, total
@@ -2,10 +2,26 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from quant_eam.core.jsonl_index import (
+    REVERSE_BLOCK_SIZE,
+    OffsetIndex,
+    append_indexed,
+    canonical_line,
+    parse_line,
+    read_line_at,
+    refresh_index,
+    tail_jsonl,
+    write_sidecar,
+)
+
+INDEX_SUFFIX = ".index.jsonl"
+
 
 def _canonical_bytes(obj: Any) -> bytes:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
@@ -20,46 +36,135 @@ def prompt_hash_v1(*, request: dict[str, Any]) -> str:
     return sha256_hex({"v": 1, "request": request})
 
 
-def _jsonl_append(path: Path, obj: dict[str, Any]) -> None:
+def _jsonl_append(path: Path, obj: dict[str, Any]) -> int:
+    """Append one canonical JSON line and return the byte offset it was written at."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
-
-
-def _iter_jsonl(path: Path) -> list[dict[str, Any]]:
-    if not path.is_file():
-        return []
-    out: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for ln in f:
-            ln = ln.strip()
-            if not ln:
+    with path.open("ab") as f:
+        off = f.seek(0, os.SEEK_END)
+        f.write(canonical_line(obj))
+    return int(off)
+
+
+def _tail_jsonl(path: Path, limit: int, *, block_size: int = REVERSE_BLOCK_SIZE) -> list[dict[str, Any]]:
+    """Return the last `limit` JSON objects by reading fixed-size blocks backwards from EOF."""
+    return tail_jsonl(path, limit, strict=True, block_size=block_size)
+
+
+def cassette_index_path(path: Path) -> Path:
+    """Sidecar index location for a cassette (e.g. cassette.jsonl -> cassette.index.jsonl)."""
+    p = Path(path)
+    stem = p.name.removesuffix(".jsonl")
+    return p.with_name(stem + INDEX_SUFFIX)
+
+
+# prompt_hash offset index per cassette path (see quant_eam.core.jsonl_index).
+_INDEX_CACHE: dict[str, OffsetIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _load_index(path: Path, *, rebuild: bool = False) -> OffsetIndex:
+    """Return an up-to-date prompt_hash index for `path` (caller must hold _INDEX_LOCK).
+
+    The sidecar is only maintained once it exists (see `build_cassette_index`).
+    """
+    sidecar = cassette_index_path(path)
+    idx = refresh_index(
+        path,
+        "prompt_hash",
+        _INDEX_CACHE.get(path.as_posix()),
+        sidecar=sidecar,
+        persist=sidecar.is_file(),
+        rebuild=rebuild,
+    )
+    _INDEX_CACHE[path.as_posix()] = idx
+    return idx
+
+
+def build_cassette_index(path: Path) -> Path:
+    """(Re)build the persisted sidecar index for a cassette and return its path.
+
+    Once a sidecar exists, `CassetteStore` keeps it in sync on append and uses it to warm lookups
+    in new processes without rescanning the cassette.
+    """
+    p = Path(path)
+    sidecar = cassette_index_path(p)
+    with _INDEX_LOCK:
+        idx = _load_index(p, rebuild=True)
+        write_sidecar(sidecar, idx, idx.spans, append=False)
+    return sidecar
+
+
+def compact_cassette(src: Path, dest: Path, *, write_index: bool = True) -> dict[str, int]:
+    """Write a compacted copy of a cassette keeping only the first call per prompt_hash.
+
+    Replay always resolves to the first matching line, so dropping later duplicates does not change
+    replay results. Lines are kept in their original order and byte encoding.
+    """
+    src_p, dest_p = Path(src), Path(dest)
+    seen: set[str] = set()
+    kept: list[bytes] = []
+    lines_in = 0
+    with src_p.open("rb") as f:
+        for raw in f:
+            doc = parse_line(raw, strict=True)
+            if doc is None:
                 continue
-            doc = json.loads(ln)
-            if isinstance(doc, dict):
-                out.append(doc)
-    return out
+            lines_in += 1
+            h = str(doc.get("prompt_hash", ""))
+            if h:
+                if h in seen:
+                    continue
+                seen.add(h)
+            kept.append(raw if raw.endswith(b"\n") else raw + b"\n")
+    dest_p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest_p.with_name(dest_p.name + ".tmp")
+    tmp.write_bytes(b"".join(kept))
+    os.replace(tmp, dest_p)
+    if write_index:
+        build_cassette_index(dest_p)
+    else:
+        with _INDEX_LOCK:
+            _INDEX_CACHE.pop(dest_p.as_posix(), None)
+    return {"lines_in": lines_in, "lines_out": len(kept), "dropped": lines_in - len(kept)}
 
 
 @dataclass(frozen=True)
 class CassetteStore:
     path: Path
 
+    @property
+    def index_path(self) -> Path:
+        return cassette_index_path(self.path)
+
     def append_call(self, call_obj: dict[str, Any]) -> None:
-        _jsonl_append(self.path, call_obj)
+        p = Path(self.path)
+        with _INDEX_LOCK:
+            idx = _load_index(p)
+            sidecar = self.index_path
+            _INDEX_CACHE[p.as_posix()] = append_indexed(
+                p, call_obj, "prompt_hash", idx, sidecar=sidecar, persist=sidecar.is_file()
+            )
 
     def replay_response(self, prompt_hash: str) -> dict[str, Any] | None:
-        """Return response_json for the first matching prompt_hash, else None."""
-        for doc in _iter_jsonl(self.path):
-            if str(doc.get("prompt_hash", "")) == str(prompt_hash):
-                r = doc.get("response_json")
-                return r if isinstance(r, dict) else None
+        """Return response_json for the first matching prompt_hash, else None.
+
+        A miss or a stale offset is retried once against an index rebuilt from the cassette.
+        """
+        h = str(prompt_hash)
+        p = Path(self.path)
+        with _INDEX_LOCK:
+            for rebuild in (False, True):
+                off = _load_index(p, rebuild=rebuild).first.get(h)
+                if off is None:
+                    continue
+                doc = read_line_at(p, off)
+                if doc is not None and str(doc.get("prompt_hash", "")) == h:
+                    r = doc.get("response_json")
+                    return r if isinstance(r, dict) else None
         return None
 
-    def tail_calls(self, limit: int = 50) -> list[dict[str, Any]]:
-        docs = _iter_jsonl(self.path)
-        if limit <= 0:
-            return []
-        return docs[-limit:]
+    def rebuild_index(self) -> Path:
+        return build_cassette_index(self.path)
 
+    def tail_calls(self, limit: int = 50) -> list[dict[str, Any]]:
+        return _tail_jsonl(Path(self.path), int(limit))
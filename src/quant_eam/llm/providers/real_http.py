@@ -1,13 +1,160 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import importlib.util
 import json
 import os
+import threading
 import time
+import weakref
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
 
+from quant_eam.jobstore.llm_usage import (
+    BudgetThresholds,
+    UsageTotals,
+    aggregate_totals,
+    budget_stop_reason,
+    canonical_json_chars,
+)
+
+_LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def _env_int(name: str, default: int, *, lo: int, hi: int) -> int:
+    try:
+        v = int(os.getenv(name, str(default)))
+    except Exception:  # noqa: BLE001
+        v = default
+    return max(lo, min(hi, v))
+
+
+def _env_float(name: str, default: float, *, lo: float) -> float:
+    try:
+        v = float(os.getenv(name, str(default)))
+    except Exception:  # noqa: BLE001
+        v = default
+    return max(lo, v)
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 is used when requested (default: auto) and the optional `h2` package is installed."""
+    raw = str(os.getenv("EAM_LLM_REAL_HTTP2", "auto")).strip().lower()
+    if raw in ("0", "false", "no", "off"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HTTPPoolConfig:
+    timeout_s: float
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry_s: float
+    http2: bool
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_s,
+        )
+
+
+def pool_config_from_env() -> HTTPPoolConfig:
+    max_conn = _env_int("EAM_LLM_REAL_MAX_CONNECTIONS", 10, lo=1, hi=256)
+    return HTTPPoolConfig(
+        timeout_s=_env_float("EAM_LLM_REAL_TIMEOUT_SECONDS", 30.0, lo=1.0),
+        max_connections=max_conn,
+        max_keepalive_connections=min(max_conn, _env_int("EAM_LLM_REAL_MAX_KEEPALIVE", 5, lo=0, hi=256)),
+        keepalive_expiry_s=_env_float("EAM_LLM_REAL_KEEPALIVE_EXPIRY_SECONDS", 30.0, lo=0.0),
+        http2=_http2_enabled(),
+    )
+
+
+_CLIENTS: dict[HTTPPoolConfig, httpx.Client] = {}
+# Async connections belong to the event loop that opened them, so async clients are kept per loop.
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[HTTPPoolConfig, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS_LOCK = threading.Lock()
+
+
+def shared_client(cfg: HTTPPoolConfig) -> httpx.Client:
+    """Return the process-wide keep-alive client for `cfg` (created on first use)."""
+    with _CLIENTS_LOCK:
+        c = _CLIENTS.get(cfg)
+        if c is None or c.is_closed:
+            c = httpx.Client(timeout=cfg.timeout_s, limits=cfg.limits(), http2=cfg.http2)
+            _CLIENTS[cfg] = c
+        return c
+
+
+def shared_async_client(cfg: HTTPPoolConfig) -> httpx.AsyncClient:
+    """Return the keep-alive async client for `cfg` on the running event loop (created on first use)."""
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        per_loop = _ASYNC_CLIENTS.setdefault(loop, {})
+        c = per_loop.get(cfg)
+        if c is None or c.is_closed:
+            c = httpx.AsyncClient(timeout=cfg.timeout_s, limits=cfg.limits(), http2=cfg.http2)
+            per_loop[cfg] = c
+        return c
+
+
+async def aclose_shared_async_clients() -> None:
+    """Close the async clients of the running event loop (call before the loop shuts down)."""
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        clients = list(_ASYNC_CLIENTS.pop(loop, {}).values())
+    for c in clients:
+        await c.aclose()
+
+
+def close_shared_clients() -> None:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for c in clients:
+        c.close()
+
+
+atexit.register(close_shared_clients)
+
+
+def _parse_completion(r: httpx.Response) -> dict[str, Any]:
+    if r.status_code >= 400:
+        raise ValueError(f"real provider HTTP {r.status_code}: {r.text[:500]}")
+    doc = r.json()
+    if not isinstance(doc, dict):
+        raise ValueError("real provider response must be a JSON object")
+    out = doc.get("json")
+    if not isinstance(out, dict):
+        raise ValueError("real provider response must contain object field 'json'")
+    return out
+
+
+@dataclass(frozen=True)
+class BatchCallResult:
+    """Outcome of one call in `complete_json_many` (same index as the input call)."""
+
+    index: int
+    json: dict[str, Any] | None
+    error: str | None = None
+    stop_reason: str | None = None
+    prompt_chars: int = 0
+    response_chars: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return isinstance(self.json, dict)
+
 
 @dataclass(frozen=True)
 class RealHTTPProvider:
@@ -35,8 +182,10 @@ class RealHTTPProvider:
       }
 
     Notes:
-    - Tests/CI must use cassette replay; this provider must not be called in tests.
+    - Tests/CI must use cassette replay; this provider must not reach the network in tests
+      (a test may opt in to a loopback stub server with EAM_LLM_TEST_ALLOW_LOOPBACK=1).
     - Timeouts/retries are implemented to avoid hanging the worker.
+    - Calls share a long-lived keep-alive connection pool (HTTP/2 when `h2` is installed).
     """
 
     provider_id: str = "real"
@@ -47,40 +196,36 @@ class RealHTTPProvider:
             raise ValueError("EAM_LLM_REAL_BASE_URL is required for real provider")
         key = str(os.getenv("EAM_LLM_REAL_API_KEY", "")).strip() or None
         model = str(os.getenv("EAM_LLM_REAL_MODEL", "")).strip() or "default"
-        try:
-            timeout = float(os.getenv("EAM_LLM_REAL_TIMEOUT_SECONDS", "30"))
-        except Exception:  # noqa: BLE001
-            timeout = 30.0
-        timeout = max(1.0, timeout)
-        try:
-            retries = int(os.getenv("EAM_LLM_REAL_RETRIES", "2"))
-        except Exception:  # noqa: BLE001
-            retries = 2
-        retries = max(0, min(5, retries))
+        timeout = _env_float("EAM_LLM_REAL_TIMEOUT_SECONDS", 30.0, lo=1.0)
+        retries = _env_int("EAM_LLM_REAL_RETRIES", 2, lo=0, hi=5)
         return base.rstrip("/"), key, model, timeout, retries
 
-    def complete_json(
-        self,
-        *,
-        system: str,
-        user: str,
-        schema: dict[str, Any],
-        temperature: float = 0.0,
-        seed: int | None = None,
-    ) -> dict[str, Any]:
+    def _network_guard(self) -> None:
         # Hard guard: tests/CI must never perform network IO.
-        # (Phase-28 rollout requires replay-only in CI.)
+        # (Phase-28 rollout requires replay-only in CI.) A test that runs its own loopback stub server
+        # opts in explicitly; every other test is blocked whatever the base URL.
         if os.getenv("PYTEST_CURRENT_TEST"):
-            raise ValueError("real provider network is disabled in tests; use EAM_LLM_MODE=replay with a cassette")
+            host = urlsplit(str(os.getenv("EAM_LLM_REAL_BASE_URL", "")).strip()).hostname or ""
+            allow = str(os.getenv("EAM_LLM_TEST_ALLOW_LOOPBACK", "")).strip().lower() in ("1", "true", "yes", "on")
+            if not (allow and host in _LOOPBACK_HOSTS):
+                raise ValueError("real provider network is disabled in tests; use EAM_LLM_MODE=replay with a cassette")
         if str(os.getenv("EAM_LLM_DISABLE_NETWORK", "")).strip().lower() in ("1", "true", "yes", "on"):
             raise ValueError("real provider network disabled by EAM_LLM_DISABLE_NETWORK")
 
-        base, api_key, model, timeout_s, retries = self._cfg()
-        url = f"{base}/complete_json"
+    def _prepare(
+        self,
+        *,
+        model: str,
+        api_key: str | None,
+        system: str,
+        user: str,
+        schema: dict[str, Any],
+        temperature: float,
+        seed: int | None,
+    ) -> tuple[dict[str, str], str]:
         headers: dict[str, str] = {"content-type": "application/json"}
         if api_key:
             headers["authorization"] = f"Bearer {api_key}"
-
         req = {
             "model": model,
             "system": str(system),
@@ -89,21 +234,29 @@ class RealHTTPProvider:
             "temperature": float(temperature),
             "seed": seed,
         }
+        return headers, json.dumps(req)
+
+    def complete_json(
+        self,
+        *,
+        system: str,
+        user: str,
+        schema: dict[str, Any],
+        temperature: float = 0.0,
+        seed: int | None = None,
+    ) -> dict[str, Any]:
+        self._network_guard()
+        base, api_key, model, _timeout_s, retries = self._cfg()
+        url = f"{base}/complete_json"
+        headers, body = self._prepare(
+            model=model, api_key=api_key, system=system, user=user, schema=schema, temperature=temperature, seed=seed
+        )
+        client = shared_client(pool_config_from_env())
 
         last_err: Exception | None = None
         for attempt in range(retries + 1):
             try:
-                with httpx.Client(timeout=timeout_s) as client:
-                    r = client.post(url, headers=headers, content=json.dumps(req))
-                if r.status_code >= 400:
-                    raise ValueError(f"real provider HTTP {r.status_code}: {r.text[:500]}")
-                doc = r.json()
-                if not isinstance(doc, dict):
-                    raise ValueError("real provider response must be a JSON object")
-                out = doc.get("json")
-                if not isinstance(out, dict):
-                    raise ValueError("real provider response must contain object field 'json'")
-                return out
+                return _parse_completion(client.post(url, headers=headers, content=body))
             except Exception as e:  # noqa: BLE001
                 last_err = e
                 if attempt >= retries:
@@ -111,3 +264,118 @@ class RealHTTPProvider:
                 # Small deterministic-ish backoff (doesn't matter for offline tests).
                 time.sleep(0.2 * float(attempt + 1))
         raise ValueError(f"real provider failed after retries: {last_err}")
+
+    async def complete_json_many(
+        self,
+        calls: list[dict[str, Any]],
+        *,
+        job_id: str | None = None,
+        job_root: Path | None = None,
+        thresholds: BudgetThresholds | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[BatchCallResult]:
+        """Run independent completions concurrently and return results in input order.
+
+        Each call is a mapping with `system`, `user`, `schema` and optional `temperature`/`seed`.
+        When `job_id` and `thresholds` are given, the job-level budget from `jobstore.llm_usage` is applied:
+        - calls/prompt chars are admitted up front in input order (deterministic); the batch counts as one
+          agent run for `max_calls_per_agent_run`,
+        - response chars/wall seconds are checked as calls finish; calls not yet started once the budget
+          is exhausted are not sent.
+        Budget-blocked or failed calls carry `error`/`stop_reason` instead of `json`.
+        This method does not write usage events; callers record them as for `complete_json`.
+        Requests share the keep-alive async client of the running event loop (`shared_async_client`).
+        """
+        self._network_guard()
+        base, api_key, model, _timeout_s, retries = self._cfg()
+        url = f"{base}/complete_json"
+        cfg = pool_config_from_env()
+        if max_concurrency is None:
+            max_concurrency = _env_int("EAM_LLM_REAL_MAX_CONCURRENCY", 4, lo=1, hi=64)
+        sem = asyncio.Semaphore(max(1, min(int(max_concurrency), cfg.max_connections)))
+
+        used = UsageTotals(calls=0, prompt_chars=0, response_chars=0, wall_seconds=0.0)
+        if job_id and thresholds:
+            used, _by_agent, _stop = aggregate_totals(job_id=job_id, job_root=job_root)
+
+        results: list[BatchCallResult | None] = [None] * len(calls)
+        admitted: list[tuple[int, dict[str, str], str, int]] = []
+        calls_n, prompt_n = used.calls, used.prompt_chars
+        for i, c in enumerate(calls):
+            system, user = str(c.get("system") or ""), str(c.get("user") or "")
+            pchars = len(system) + len(user)
+            if job_id and thresholds:
+                would_exceed = {
+                    "max_calls_per_job": (calls_n + 1) > thresholds.max_calls_per_job,
+                    "max_prompt_chars_per_job": (prompt_n + pchars) > thresholds.max_prompt_chars_per_job,
+                }
+                if thresholds.max_calls_per_agent_run is not None:
+                    would_exceed["max_calls_per_agent_run"] = (len(admitted) + 1) > int(
+                        thresholds.max_calls_per_agent_run
+                    )
+                if any(would_exceed.values()):
+                    reason = budget_stop_reason(would_exceed)
+                    results[i] = BatchCallResult(index=i, json=None, error="budget_blocked_precall", stop_reason=reason)
+                    continue
+            calls_n += 1
+            prompt_n += pchars
+            headers, body = self._prepare(
+                model=model,
+                api_key=api_key,
+                system=system,
+                user=user,
+                schema=c.get("schema") if isinstance(c.get("schema"), dict) else {"type": "object"},
+                temperature=float(c.get("temperature", 0.0) or 0.0),
+                seed=c.get("seed"),
+            )
+            admitted.append((i, headers, body, pchars))
+
+        state = {"response_chars": used.response_chars, "wall_seconds": used.wall_seconds}
+
+        def _post_budget_reason() -> str | None:
+            if not (job_id and thresholds):
+                return None
+            would_exceed = {
+                "max_response_chars_per_job": state["response_chars"] > thresholds.max_response_chars_per_job,
+                "max_wall_seconds_per_job": state["wall_seconds"] > thresholds.max_wall_seconds_per_job,
+            }
+            return budget_stop_reason(would_exceed) if any(would_exceed.values()) else None
+
+        async def _one(client: httpx.AsyncClient, i: int, headers: dict[str, str], body: str, pchars: int) -> None:
+            async with sem:
+                reason = _post_budget_reason()
+                if reason:
+                    results[i] = BatchCallResult(index=i, json=None, error="budget_exhausted", stop_reason=reason)
+                    return
+                t0 = time.perf_counter()
+                last_err: Exception | None = None
+                for attempt in range(retries + 1):
+                    try:
+                        out = _parse_completion(await client.post(url, headers=headers, content=body))
+                        dt = time.perf_counter() - t0
+                        rchars = canonical_json_chars(out)
+                        state["response_chars"] += rchars
+                        state["wall_seconds"] += dt
+                        results[i] = BatchCallResult(
+                            index=i, json=out, prompt_chars=pchars, response_chars=rchars, wall_seconds=dt
+                        )
+                        return
+                    except Exception as e:  # noqa: BLE001
+                        last_err = e
+                        if attempt >= retries:
+                            break
+                        await asyncio.sleep(0.2 * float(attempt + 1))
+                dt = time.perf_counter() - t0
+                state["wall_seconds"] += dt
+                results[i] = BatchCallResult(
+                    index=i,
+                    json=None,
+                    error=f"real provider failed after retries: {last_err}",
+                    prompt_chars=pchars,
+                    wall_seconds=dt,
+                )
+
+        if admitted:
+            client = shared_async_client(cfg)
+            await asyncio.gather(*(_one(client, i, h, b, pc) for i, h, b, pc in admitted))
+        return [r if r is not None else BatchCallResult(index=i, json=None, error="not_run") for i, r in enumerate(results)]
@@ -1,7 +1,26 @@
+"""Sanitization of LLM inputs: drop sensitive keys, replace host root paths, truncate deterministically.
+
+`sanitize_for_llm` is the compiled engine used by the agents harness:
+
+- sensitive keys are classified with one precompiled fragment regex, memoized per key;
+- known roots are found with one precompiled alternation regex per environment (EAM_DATA_ROOT,
+  EAM_ARTIFACT_ROOT, EAM_JOB_ROOT). Strings without a root are returned after that single scan. When no
+  root overlaps another (the default `/data` + `/artifacts` layout), the replacement is done in the same
+  single pass. Nested roots (e.g. a job root under the artifact root) are replaced with the ordered
+  `str.replace` passes, since their result depends on the pass order;
+- the payload is walked with an explicit stack instead of one Python call per node (the canonical JSON
+  encoding behind `sanitized_sha256` still bounds how deep a payload can be).
+
+Its output and `RedactionSummary` are identical to `sanitize_for_llm_reference`, the original recursive
+implementation kept as the parity reference (see `scripts/bench_redaction.py`).
+"""
+
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -28,6 +47,75 @@ def _is_sensitive_key(k: str) -> bool:
     return any(f in kl for f in SENSITIVE_KEY_FRAGMENTS)
 
 
+_SENSITIVE_KEY_RE = re.compile("|".join(re.escape(f) for f in SENSITIVE_KEY_FRAGMENTS))
+_DEFAULT_ROOTS = (("/data", "<EAM_DATA_ROOT>"), ("/artifacts", "<EAM_ARTIFACT_ROOT>"))
+_PLACEHOLDERS = ("<EAM_DATA_ROOT>", "<EAM_ARTIFACT_ROOT>", "<EAM_JOB_ROOT>")
+
+
+@functools.lru_cache(maxsize=8192)
+def is_sensitive_key(k: str) -> bool:
+    return _SENSITIVE_KEY_RE.search(k.lower()) is not None
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """True when an occurrence of `a` can overlap an occurrence of `b` (containment or suffix/prefix)."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:n]) or b.endswith(a[:n]) for n in range(1, min(len(a), len(b))))
+
+
+class RootReplacer:
+    """Compiled `_replace_known_roots` for one set of root passes (same output and count)."""
+
+    def __init__(self, passes: tuple[tuple[str, str], ...]) -> None:
+        self.passes = passes
+        first: dict[str, str] = {}
+        for root, placeholder in passes:
+            first.setdefault(root, placeholder)
+        self._placeholder = first
+        self._any = re.compile("|".join(re.escape(r) for r in sorted(first, key=len, reverse=True)))
+        roots = list(first)
+        # One left-to-right pass equals the ordered replace passes when occurrences of different roots
+        # can never overlap and no placeholder can create or complete a root occurrence.
+        self.single_pass = not any(
+            _overlaps(a, b) for i, a in enumerate(roots) for b in roots[i + 1 :]
+        ) and not any("<" in r or ">" in r or any(r in p for p in _PLACEHOLDERS) for r in roots)
+
+    def __call__(self, s: str) -> tuple[str, int]:
+        if self._any.search(s) is None:
+            return s, 0
+        if self.single_pass:
+            hit: set[str] = set()
+
+            def _sub(m: re.Match[str]) -> str:
+                hit.add(m.group(0))
+                return self._placeholder[m.group(0)]
+
+            return self._any.sub(_sub, s), len(hit)
+        replaced = 0
+        for root, placeholder in self.passes:
+            if root in s:
+                s = s.replace(root, placeholder)
+                replaced += 1
+        return s, replaced
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_roots(data_root: str, artifact_root: str, job_root: str) -> RootReplacer:
+    roots = {data_root: "<EAM_DATA_ROOT>", artifact_root: "<EAM_ARTIFACT_ROOT>", job_root: "<EAM_JOB_ROOT>"}
+    passes = tuple((k, v) for k, v in roots.items() if k) + _DEFAULT_ROOTS
+    return RootReplacer(passes)
+
+
+def root_replacer() -> RootReplacer:
+    """Replacer for the current EAM_DATA_ROOT / EAM_ARTIFACT_ROOT / EAM_JOB_ROOT (compiled once per value set)."""
+    return _compile_roots(
+        os.getenv("EAM_DATA_ROOT", "/data"),
+        os.getenv("EAM_ARTIFACT_ROOT", "/artifacts"),
+        os.getenv("EAM_JOB_ROOT", ""),
+    )
+
+
 def _replace_known_roots(s: str) -> tuple[str, int]:
     """Replace absolute root paths with stable placeholders (to avoid leaking host structure)."""
     replaced = 0
@@ -73,6 +161,9 @@ class RedactionSummary:
         }
 
 
+_REMOVED = object()
+
+
 def sanitize_for_llm(
     obj: Any,
     *,
@@ -81,6 +172,92 @@ def sanitize_for_llm(
     max_list_items: int = 50,
     max_dict_items: int = 200,
 ) -> tuple[Any, RedactionSummary]:
+    replace_roots = root_replacer()
+    removed: list[str] = []
+    trunc_str = 0
+    trunc_list = 0
+    trunc_dict = 0
+    replaced_paths = 0
+
+    box: list[Any] = [None]
+    # (value, parent path, segment, depth, output container, slot); pre-order, children pushed reversed.
+    # Paths are only materialized for containers and removed keys.
+    stack: list[tuple[Any, Any, Any, int, Any, Any]] = [(obj, None, None, 0, box, 0)]
+    while stack:
+        x, ppath, seg, depth, parent, slot = stack.pop()
+        if x is _REMOVED:
+            removed.append(f"{ppath}/{seg}")
+            continue
+        if depth > max_depth:
+            parent[slot] = "<TRUNCATED_DEPTH>"
+            continue
+        if isinstance(x, str):
+            s = x
+        elif isinstance(x, dict):
+            path = f"{ppath}/{seg}" if ppath is not None else ""
+            # Deterministic key order (sorted) and cap size.
+            keys = sorted([str(k) for k in x])
+            if len(keys) > max_dict_items:
+                trunc_dict += 1
+                keys = keys[:max_dict_items]
+            out: dict[str, Any] = {}
+            parent[slot] = out
+            children = []
+            for k in keys:
+                if is_sensitive_key(k):
+                    children.append((_REMOVED, path, k, depth, None, None))
+                    continue
+                out[k] = None
+                children.append((x.get(k), path, k, depth + 1, out, k))
+            stack.extend(reversed(children))
+            continue
+        elif isinstance(x, list):
+            path = f"{ppath}/{seg}" if ppath is not None else ""
+            xs = x
+            if len(xs) > max_list_items:
+                trunc_list += 1
+                xs = xs[:max_list_items]
+            items: list[Any] = [None] * len(xs)
+            parent[slot] = items
+            stack.extend((xs[i], path, i, depth + 1, items, i) for i in range(len(xs) - 1, -1, -1))
+            continue
+        elif isinstance(x, (int, float, bool)) or x is None:
+            parent[slot] = x
+            continue
+        else:
+            # Path and anything else: stable string form.
+            s = str(x)
+        s2, rep = replace_roots(s)
+        replaced_paths += rep
+        if len(s2) > max_str_chars:
+            trunc_str += 1
+            s2 = s2[:max_str_chars] + "<TRUNCATED>"
+        parent[slot] = s2
+
+    sanitized = box[0]
+    sanitized_sha = sha256_hex(sanitized)
+    return (
+        sanitized,
+        RedactionSummary(
+            removed_keys=removed,
+            truncated_strings=trunc_str,
+            truncated_lists=trunc_list,
+            truncated_dicts=trunc_dict,
+            replaced_paths=replaced_paths,
+            sanitized_sha256=sanitized_sha,
+        ),
+    )
+
+
+def sanitize_for_llm_reference(
+    obj: Any,
+    *,
+    max_depth: int = 10,
+    max_str_chars: int = 20_000,
+    max_list_items: int = 50,
+    max_dict_items: int = 200,
+) -> tuple[Any, RedactionSummary]:
+    """Original recursive implementation (parity reference for `sanitize_for_llm`)."""
     removed: list[str] = []
     trunc_str = 0
     trunc_list = 0
@@ -8,6 +8,7 @@ from typing import Any
 
 from quant_eam.contracts import validate as contracts_validate
 from quant_eam.compiler.compile import compile_blueprint_to_runspec
+from quant_eam.core.timing import timed
 from quant_eam.gaterunner.run import EXIT_OK as GATE_OK
 from quant_eam.gaterunner.run import run_once as gaterunner_run_once
 from quant_eam.jobstore.store import (
@@ -206,6 +207,7 @@ def _data_root() -> Path:
     return Path(os.getenv("EAM_DATA_ROOT", "/data"))
 
 
+@timed("orchestrator.advance_job_once")
 def advance_job_once(*, job_id: str) -> dict[str, Any]:
     """Advance a single job until blocked (WAITING_APPROVAL) or terminal (DONE/ERROR)."""
     spec = load_job_spec(job_id)
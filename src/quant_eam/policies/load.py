@@ -1,26 +1,45 @@
 from __future__ import annotations
 
-import hashlib
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
-import yaml
+from quant_eam.core.hashing import cached_sha256_file
+from quant_eam.policies.store import policy_store
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    """sha256 of a file; unchanged files (same size/mtime_ns/inode) are served from the verified-hash cache."""
+    return cached_sha256_file(path)
 
 
 def load_yaml(path: Path) -> Any:
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+    """Parsed YAML (mutable copy); parsed once per file version by the process-wide policy store."""
+    return policy_store().load(path)
+
+
+_REPO_ROOTS: dict[tuple[str, str], Path] = {}
+_REPO_ROOTS_LOCK = threading.Lock()
 
 
 def find_repo_root() -> Path:
+    """Nearest directory with a `policies/` dir ($EAM_REPO, then cwd and its parents, then this package's parents).
+
+    Memoized per ($EAM_REPO, cwd).
+    """
+    key = (os.getenv("EAM_REPO") or "", os.getcwd())
+    with _REPO_ROOTS_LOCK:
+        hit = _REPO_ROOTS.get(key)
+    if hit is not None and (hit / "policies").is_dir():
+        return hit
+    root = _find_repo_root_uncached()
+    with _REPO_ROOTS_LOCK:
+        _REPO_ROOTS[key] = root
+    return root
+
+
+def _find_repo_root_uncached() -> Path:
     candidates: list[Path] = []
     env_root = os.getenv("EAM_REPO")
     if env_root:
@@ -45,11 +64,7 @@ def default_policies_dir() -> Path:
 
 def iter_policy_assets(policies_dir: Path) -> list[Path]:
     """Return policy asset files under policies_dir, excluding policies/examples/*."""
-    assets: list[Path] = []
-    for p in sorted(policies_dir.glob("*.y*ml")):
-        if p.is_file():
-            assets.append(p)
-    return assets
+    return list(policy_store().policy_files(policies_dir))
 
 
 def iter_policy_examples(policies_dir: Path) -> list[Path]:
@@ -0,0 +1,176 @@
+"""Process-wide policy store: parse-once YAML documents and cached policy-directory listings.
+
+Runs, gates, diagnostics, calc traces and every sweep trial resolve the same handful of policy files. The
+store parses each file once per version, with libyaml's `CSafeLoader` when PyYAML was built with it
+(else the pure-Python `SafeLoader`). Versions are keyed by the file fingerprint (size, mtime_ns, inode);
+editing a policy changes the key, and the next load re-parses it.
+
+- `view(path)` returns the shared cached document as an immutable view (`FrozenDict` / `FrozenList`, which
+  are still `dict` / `list` instances). It is for read-only lookups such as policy_id scans.
+- `load(path)` returns a fresh mutable copy of the cached document (what `policies.load.load_yaml`
+  returns), so callers may edit it.
+- `policy_files(dir)` caches the sorted `*.y*ml` listing of a directory, keyed by the directory mtime.
+- `index(dir)` maps policy_id -> path for the files in `dir`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NoReturn
+
+import yaml
+
+from quant_eam.core.hashing import file_fingerprint
+
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+DEFAULT_MAX_DOCS = 1024
+
+
+def _immutable(*_args: Any, **_kwargs: Any) -> NoReturn:
+    raise TypeError("policy documents from the policy store are read-only; use load() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """Read-only dict view of a cached policy document (json-serializable, `isinstance(x, dict)`)."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _immutable  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore[assignment]
+
+    def __copy__(self) -> dict[str, Any]:
+        return thaw(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (thaw(self),))
+
+
+class FrozenList(list):
+    """Read-only list view of a cached policy document (json-serializable, `isinstance(x, list)`)."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable  # type: ignore[assignment]
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable  # type: ignore[assignment]
+
+    def __copy__(self) -> list[Any]:
+        return thaw(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (thaw(self),))
+
+
+def freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        out = FrozenDict()
+        for k, v in obj.items():
+            dict.__setitem__(out, k, freeze(v))
+        return out
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Plain mutable deep copy of a (possibly frozen) document."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+def parse_yaml_text(text: str) -> Any:
+    return yaml.load(text, Loader=_LOADER)  # CSafeLoader/SafeLoader only
+
+
+class PolicyStore:
+    """Thread-safe cache of parsed YAML documents and policy-directory listings."""
+
+    def __init__(self, max_docs: int = DEFAULT_MAX_DOCS) -> None:
+        self.max_docs = max(1, int(max_docs))
+        self._docs: OrderedDict[str, tuple[tuple[int, int, int], Any]] = OrderedDict()
+        self._dirs: dict[str, tuple[int, tuple[Path, ...]]] = {}
+        self._lock = threading.Lock()
+        self.parses = 0
+        self.hits = 0
+
+    def view(self, path: Path) -> Any:
+        """Cached immutable document for `path` (raises OSError / yaml.YAMLError like a direct load)."""
+        key = os.path.abspath(os.fspath(path))
+        # Fingerprint before reading: a concurrent write changes mtime/size, so the entry goes stale.
+        fp = file_fingerprint(Path(path))
+        with self._lock:
+            ent = self._docs.get(key)
+            if ent is not None and ent[0] == fp:
+                self._docs.move_to_end(key)
+                self.hits += 1
+                return ent[1]
+        doc = freeze(parse_yaml_text(Path(path).read_text(encoding="utf-8")))
+        with self._lock:
+            self.parses += 1
+            self._docs[key] = (fp, doc)
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.max_docs:
+                self._docs.popitem(last=False)
+        return doc
+
+    def load(self, path: Path) -> Any:
+        """Mutable copy of the cached document for `path`."""
+        return thaw(self.view(path))
+
+    def policy_files(self, policies_dir: Path, pattern: str = "*.y*ml") -> tuple[Path, ...]:
+        """Sorted regular files matching `pattern` directly under `policies_dir` (cached per directory mtime)."""
+        d = Path(policies_dir)
+        try:
+            mtime = os.stat(d).st_mtime_ns
+        except OSError:
+            return ()
+        key = f"{os.path.abspath(os.fspath(d))}\0{pattern}"
+        with self._lock:
+            ent = self._dirs.get(key)
+        if ent is not None and ent[0] == mtime:
+            return ent[1]
+        files = tuple(sorted(p for p in d.glob(pattern) if p.is_file()))
+        with self._lock:
+            self._dirs[key] = (mtime, files)
+        return files
+
+    def index(self, policies_dir: Path, *, skip_invalid: bool = False) -> dict[str, Path]:
+        """policy_id -> path for the policy files in `policies_dir` (later files win, like a sorted scan)."""
+        idx: dict[str, Path] = {}
+        for p in self.policy_files(policies_dir):
+            try:
+                doc = self.view(p)
+            except (OSError, yaml.YAMLError):
+                if skip_invalid:
+                    continue
+                raise
+            if isinstance(doc, dict) and isinstance(doc.get("policy_id"), str):
+                idx[str(doc["policy_id"])] = p
+        return idx
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._dirs.clear()
+            self.parses = 0
+            self.hits = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"docs": len(self._docs), "parses": self.parses, "hits": self.hits}
+
+
+_STORE = PolicyStore()
+
+
+def policy_store() -> PolicyStore:
+    return _STORE
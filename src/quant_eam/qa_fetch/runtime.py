@@ -11,6 +11,8 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from quant_eam.core.timing import timed
+
 from .resolver import resolve_fetch
 from .mongo_bridge import resolve_mongo_fetch_callable
 from .mysql_bridge import resolve_mysql_fetch_callable
@@ -68,6 +70,7 @@ class FetchExecutionResult:
     data: Any | None = None
 
 
+@timed("qa_fetch.execute_by_intent")
 def execute_fetch_by_intent(
     intent: FetchIntent | dict[str, Any],
     *,
@@ -119,6 +122,7 @@ def execute_fetch_by_intent(
     )
 
 
+@timed("qa_fetch.execute_by_name")
 def execute_fetch_by_name(
     *,
     function: str,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -11,6 +12,8 @@ from quant_eam.registry.storage import RegistryPaths, _jsonl_append, iter_jsonl,
 from quant_eam.registry.triallog import get_trial
 
 
+logger = logging.getLogger(__name__)
+
 ALLOWED_STATUSES = ["draft", "challenger", "champion", "retired"]
 TRANSITIONS: dict[str, str] = {
     "draft": "challenger",
@@ -49,6 +52,21 @@ def _compute_effective_status(card_base: dict[str, Any], events: list[dict[str,
     return status if status in ALLOWED_STATUSES else "draft"
 
 
+def _reindex_card(paths: RegistryPaths, card_id: str) -> None:
+    # Keep the experience retrieval index in sync. The card write already succeeded, so an index
+    # failure is logged and the index is marked dirty (the next search re-reads every card).
+    from quant_eam.registry.experience_index import (
+        mark_experience_index_dirty,
+        update_experience_card,
+    )
+
+    try:
+        update_experience_card(paths.registry_root, card_id)
+    except Exception:
+        logger.exception("experience index update failed for card %s", card_id)
+        mark_experience_index_dirty(paths.registry_root)
+
+
 def create_card_from_run(
     *,
     run_id: str,
@@ -145,6 +163,7 @@ def create_card_from_run(
         "notes": "card created from Gate PASS trial",
     }
     _jsonl_append(events_jsonl, created_event)
+    _reindex_card(paths, card_id)
 
     out = dict(card)
     out["effective_status"] = "draft"
@@ -193,6 +212,31 @@ def promote_card(
         "new_status": new_status,
     }
     _jsonl_append(events_path, ev)
+    _reindex_card(paths, card_id)
+    return ev
+
+
+def annotate_card(*, card_id: str, notes: str, registry_root: Path) -> dict[str, Any]:
+    """Append an ANNOTATED event carrying free-text notes (searchable by experience retrieval)."""
+    paths = registry_paths(registry_root)
+    card_id = str(card_id).strip()
+    if not card_id:
+        raise RegistryInvalid("card_id must be non-empty")
+    notes = str(notes).strip()
+    if not notes:
+        raise RegistryInvalid("notes must be non-empty")
+    if not _card_json_path(paths, card_id).is_file():
+        raise RegistryInvalid(f"card not found: {card_id}")
+
+    ev = {
+        "event_version": 1,
+        "event_type": "ANNOTATED",
+        "recorded_at": new_recorded_at(),
+        "card_id": card_id,
+        "notes": notes,
+    }
+    _jsonl_append(_card_events_path(paths, card_id), ev)
+    _reindex_card(paths, card_id)
     return ev
 
 
@@ -6,8 +6,15 @@ import os
 import sys
 from pathlib import Path
 
-from quant_eam.registry.cards import create_card_from_run, list_cards, promote_card, show_card
+from quant_eam.registry.cards import (
+    annotate_card,
+    create_card_from_run,
+    list_cards,
+    promote_card,
+    show_card,
+)
 from quant_eam.registry.errors import RegistryInvalid
+from quant_eam.registry.experience_index import rebuild_experience_index
 from quant_eam.registry.storage import default_registry_root
 from quant_eam.registry.triallog import record_trial
 
@@ -37,8 +44,14 @@ def main(argv: list[str] | None = None) -> int:
     p_prom.add_argument("--new-status", required=True, choices=["draft", "challenger", "champion", "retired"])
     p_prom.add_argument("--allow-skip", action="store_true", help="Allow skipping intermediate states (default false).")
 
+    p_ann = sub.add_parser("annotate-card", help="Append notes to a card (event-sourced).")
+    p_ann.add_argument("--card-id", required=True)
+    p_ann.add_argument("--notes", required=True)
+
     sub.add_parser("list-cards", help="List cards (computed effective status).")
 
+    sub.add_parser("rebuild-experience-index", help="Rebuild the experience retrieval index from card dirs.")
+
     p_show = sub.add_parser("show-card", help="Show a card base record + events.")
     p_show.add_argument("--card-id", required=True)
 
@@ -78,6 +91,15 @@ def main(argv: list[str] | None = None) -> int:
             _print_json(ev)
             return EXIT_OK
 
+        if args.cmd == "annotate-card":
+            ev = annotate_card(card_id=str(args.card_id), notes=str(args.notes), registry_root=rr)
+            _print_json(ev)
+            return EXIT_OK
+
+        if args.cmd == "rebuild-experience-index":
+            _print_json(rebuild_experience_index(rr))
+            return EXIT_OK
+
         if args.cmd == "list-cards":
             _print_json({"cards": list_cards(registry_root=rr)})
             return EXIT_OK
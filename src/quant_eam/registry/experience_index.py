@@ -0,0 +1,356 @@
+"""Persisted inverted index for experience card retrieval.
+
+The index is an append-only journal `<registry_root>/experience_index.jsonl`:
+- `{"op": "put", "key": <card dir>, "doc": {...}}` searchable fields of one card (see `_card_doc`)
+- `{"op": "del", "key": <card dir>}`
+- `{"op": "meta", ...}` dossiers root mtime the index was last reconciled against
+
+Postings (title/tags/notes tokens, symbols, frequency, effective status) are rebuilt in memory when the
+journal is loaded and cached per process. The registry writers keep the index current
+(`update_experience_card` is called when cards are created, promoted or annotated), so a search only
+reconciles when the cards dir mtime, the journal size or the dossiers root mtime changed, or the index is
+marked dirty. Its cost does not grow with the number of cards otherwise.
+
+A reconcile compares each card's signature (card_v1.json/events.jsonl stat), so edits made inside an
+existing card dir that bypass the writers are seen by an audit (`load_experience_index(..., audit=True)`)
+or `rebuild_experience_index`.
+
+Searches (read paths) reconcile in memory only. Records they derive are kept as pending and written by
+the next writer.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from quant_eam.api.roots import dossiers_root
+from quant_eam.registry.experience_retrieval import _TOKEN_RE, _card_doc, _PreparedQuery
+from quant_eam.registry.storage import registry_paths
+
+INDEX_FILENAME = "experience_index.jsonl"
+_COMPACT_MIN_LINES = 1000
+
+
+def experience_index_path(registry_root: Path) -> Path:
+    return Path(registry_root) / INDEX_FILENAME
+
+
+def _canonical_line(obj: dict[str, Any]) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return int(path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _card_sig(card_dir: Path) -> list[int | None]:
+    out: list[int | None] = []
+    for name in ("card_v1.json", "events.jsonl"):
+        try:
+            st = (card_dir / name).stat()
+            out.extend([int(st.st_mtime_ns), int(st.st_size)])
+        except OSError:
+            out.extend([None, None])
+    return out
+
+
+def _doc_tokens(doc: dict[str, Any]) -> set[str]:
+    text = " ".join([str(doc.get("title_l") or ""), str(doc.get("tags_l") or ""), str(doc.get("notes_l") or "")])
+    return {m.group(0) for m in _TOKEN_RE.finditer(text)}
+
+
+@dataclass
+class ExperienceIndex:
+    registry_root: Path
+    docs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    tokens: dict[str, set[str]] = field(default_factory=dict)
+    symbols: dict[str, set[str]] = field(default_factory=dict)
+    freq: dict[str, set[str]] = field(default_factory=dict)
+    status: dict[str, set[str]] = field(default_factory=dict)
+    meta: dict[str, Any] = field(default_factory=dict)
+    journal_bytes: int = 0
+    journal_lines: int = 0
+    pending: list[dict[str, Any]] = field(default_factory=list)  # applied in memory, not yet journaled
+    dirty: bool = False  # re-read every card on the next reconcile (a card update failed)
+    _reconciled_state: tuple[int | None, int, int | None] | None = field(default=None, repr=False)
+    _suffixes: list[tuple[str, str]] | None = field(default=None, repr=False)  # sorted (suffix, term)
+
+    # --- in-memory postings ---
+
+    def _postings(self, doc: dict[str, Any]) -> list[tuple[dict[str, set[str]], str]]:
+        out: list[tuple[dict[str, set[str]], str]] = [(self.tokens, t) for t in _doc_tokens(doc)]
+        out.extend((self.symbols, str(s).upper()) for s in (doc.get("symbols") or []))
+        if doc.get("freq"):
+            out.append((self.freq, str(doc["freq"])))
+        out.append((self.status, str(doc.get("effective_status") or "")))
+        return out
+
+    def _apply(self, rec: dict[str, Any]) -> None:
+        op = rec.get("op")
+        if op == "meta":
+            self.meta = {k: v for k, v in rec.items() if k != "op"}
+            return
+        key = rec.get("key")
+        if not isinstance(key, str) or not key:
+            return
+        self._suffixes = None
+        old = self.docs.pop(key, None)
+        if old is not None:
+            for table, term in self._postings(old):
+                keys = table.get(term)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del table[term]
+        if op == "put" and isinstance(rec.get("doc"), dict):
+            doc = rec["doc"]
+            self.docs[key] = doc
+            for table, term in self._postings(doc):
+                table.setdefault(term, set()).add(key)
+
+    # --- journal ---
+
+    def _replay_from(self, path: Path, start: int) -> None:
+        with path.open("rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                start += len(raw)
+                ln = raw.strip()
+                if not ln:
+                    continue
+                try:
+                    rec = json.loads(ln.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                if isinstance(rec, dict):
+                    self._apply(rec)
+                    self.journal_lines += 1
+        self.journal_bytes = start
+
+    def _append(self, recs: list[dict[str, Any]], *, persist: bool = True) -> None:
+        """Apply `recs`; journal them (with any pending records) only when `persist` is set."""
+        if not persist:
+            for r in recs:
+                self._apply(r)
+            self.pending.extend(recs)
+            return
+        path = experience_index_path(self.registry_root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Pick up lines appended by other processes before extending the journal.
+        if path.is_file() and path.stat().st_size > self.journal_bytes:
+            self._replay_from(path, self.journal_bytes)
+        # Records derived by earlier in-memory reconciles are re-applied after the replay.
+        recs = self.pending + recs
+        self.pending = []
+        if not recs:
+            return
+        data = "".join(_canonical_line(r) + "\n" for r in recs).encode("utf-8")
+        with path.open("ab") as f:
+            f.write(data)
+        for r in recs:
+            self._apply(r)
+        self.journal_bytes += len(data)
+        self.journal_lines += len(recs)
+        if self.journal_lines >= _COMPACT_MIN_LINES and self.journal_lines > 2 * (len(self.docs) + 1):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal as one put per card plus the current meta line."""
+        path = experience_index_path(self.registry_root)
+        recs = [{"op": "put", "key": k, "doc": self.docs[k]} for k in sorted(self.docs)]
+        recs.append({"op": "meta", **self.meta})
+        data = "".join(_canonical_line(r) + "\n" for r in recs).encode("utf-8")
+        tmp = path.parent / (path.name + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        self.journal_bytes = len(data)
+        self.journal_lines = len(recs)
+        self.pending = []
+
+    # --- maintenance ---
+
+    def put_card_dir(self, card_dir: Path) -> dict[str, Any] | None:
+        doc = _card_doc(card_dir)
+        if doc is None:
+            if card_dir.name in self.docs:
+                self._append([{"op": "del", "key": card_dir.name}])
+            return None
+        doc["sig"] = _card_sig(card_dir)
+        self._append([{"op": "put", "key": card_dir.name, "doc": doc}])
+        return doc
+
+    def reconcile(self, *, persist: bool = True) -> None:
+        """Bring the index in line with the card dirs.
+
+        - every card dir: re-index when its file signature (card_v1.json/events.jsonl stat) changed,
+          or unconditionally when the index was marked dirty; drop removed cards.
+        - dossiers root mtime changed: retry symbol resolution for cards indexed without symbols.
+
+        With `persist=False` (read paths) the changes are applied in memory and left pending.
+        """
+        cards_dir = registry_paths(self.registry_root).cards_dir
+        dossiers_mtime = _mtime_ns(dossiers_root())
+        dirty, self.dirty = self.dirty, False
+        recs: list[dict[str, Any]] = []
+
+        refreshed: set[str] = set()
+        present: set[str] = set()
+        if cards_dir.is_dir():
+            for e in sorted(os.scandir(cards_dir), key=lambda e: e.name):
+                if not e.is_dir():
+                    continue
+                d = Path(e.path)
+                present.add(e.name)
+                old = self.docs.get(e.name)
+                sig = _card_sig(d)
+                if old is not None and old.get("sig") == sig and not dirty:
+                    continue
+                refreshed.add(e.name)
+                doc = _card_doc(d)
+                if doc is None:
+                    if old is not None:
+                        recs.append({"op": "del", "key": e.name})
+                    continue
+                doc["sig"] = sig
+                if doc != old:
+                    recs.append({"op": "put", "key": e.name, "doc": doc})
+        recs.extend({"op": "del", "key": k} for k in sorted(set(self.docs) - present))
+        if dossiers_mtime != self.meta.get("dossiers_root_mtime_ns"):
+            for k in sorted(self.docs):
+                if k in refreshed or self.docs[k].get("symbols"):
+                    continue
+                doc = _card_doc(cards_dir / k)
+                if doc is not None and doc.get("symbols"):
+                    doc["sig"] = _card_sig(cards_dir / k)
+                    recs.append({"op": "put", "key": k, "doc": doc})
+
+        meta = {"dossiers_root_mtime_ns": dossiers_mtime}
+        if recs or meta != self.meta:
+            recs.append({"op": "meta", **meta})
+        self._append(recs, persist=persist)
+
+    def refresh(self) -> None:
+        """Reconcile in memory only when the cards dir mtime, journal size or dossiers root mtime changed.
+
+        Also reconciles when the index is marked dirty. Otherwise no card dir is listed or stat'ed.
+        """
+        cards_dir = registry_paths(self.registry_root).cards_dir
+        state = (_mtime_ns(cards_dir), self.journal_bytes, _mtime_ns(dossiers_root()))
+        if state == self._reconciled_state and not self.dirty:
+            return
+        self.reconcile(persist=False)
+        self._reconciled_state = state
+
+    # --- query ---
+
+    def _terms_containing(self, tok: str) -> set[str]:
+        """Indexed tokens that contain `tok`, via a sorted suffix list (prefix search over suffixes)."""
+        if self._suffixes is None:
+            self._suffixes = sorted({(term[i:], term) for term in self.tokens for i in range(len(term))})
+        sfx = self._suffixes
+        out: set[str] = set()
+        i = bisect.bisect_left(sfx, (tok, ""))
+        while i < len(sfx) and sfx[i][0].startswith(tok):
+            out.add(sfx[i][1])
+            i += 1
+        return out
+
+    def candidate_docs(self, pq: _PreparedQuery) -> list[dict[str, Any]]:
+        """Return docs that can score > 0 for `pq`, in card dir order (superset of the matches).
+
+        Query tokens are [a-z0-9_] only, so a substring hit in title/tags/notes always falls inside one
+        indexed token; champion/challenger cards always score via the status bonus.
+        """
+        if not pq.merged_tokens and not pq.wanted_set and not pq.wanted_freq:
+            keys: set[str] = set(self.docs)
+        else:
+            keys = set()
+            for tok in pq.merged_tokens:
+                if not tok:
+                    continue
+                for term in self._terms_containing(tok):
+                    keys |= self.tokens[term]
+                keys |= self.symbols.get(tok.upper(), set())
+            for s in pq.wanted_set:
+                keys |= self.symbols.get(s, set())
+            if pq.wanted_freq:
+                keys |= self.freq.get(pq.wanted_freq, set())
+            keys |= self.status.get("champion", set())
+            keys |= self.status.get("challenger", set())
+        return [self.docs[k] for k in sorted(keys)]
+
+
+_CACHE: dict[str, ExperienceIndex] = {}
+_LOCK = threading.Lock()
+
+
+def _load_locked(registry_root: Path) -> ExperienceIndex:
+    rr = Path(registry_root)
+    path = experience_index_path(rr)
+    idx = _CACHE.get(rr.as_posix())
+    size = int(path.stat().st_size) if path.is_file() else 0
+    if idx is None or size < idx.journal_bytes:
+        idx = ExperienceIndex(registry_root=rr)
+        _CACHE[rr.as_posix()] = idx
+    if size > idx.journal_bytes:
+        idx._replay_from(path, idx.journal_bytes)
+    return idx
+
+
+def load_experience_index(registry_root: Path, *, reconcile: bool = True, audit: bool = False) -> ExperienceIndex:
+    """Return the (process-cached) experience index, refreshed in memory (never writes the journal).
+
+    `audit=True` checks every card's file signature, picking up edits that bypassed the registry writers.
+    """
+    with _LOCK:
+        idx = _load_locked(registry_root)
+        if audit:
+            idx.reconcile(persist=False)
+        elif reconcile:
+            idx.refresh()
+        return idx
+
+
+def update_experience_card(registry_root: Path, card_id: str) -> None:
+    """Re-index one card after it was created, promoted or annotated.
+
+    Writes the journal (including records pending from in-memory reconciles). No-op when the registry
+    has neither a journal nor an index loaded in this process (it is built on the first search).
+    """
+    rr = Path(registry_root)
+    with _LOCK:
+        if not experience_index_path(rr).is_file() and rr.as_posix() not in _CACHE:
+            return
+        idx = _load_locked(rr)
+        idx.put_card_dir(registry_paths(rr).cards_dir / str(card_id))
+
+
+def mark_experience_index_dirty(registry_root: Path) -> None:
+    """Force the next reconcile to re-read every card (used when a card update could not be indexed)."""
+    with _LOCK:
+        idx = _CACHE.get(Path(registry_root).as_posix())
+        if idx is not None:
+            idx.dirty = True
+
+
+def rebuild_experience_index(registry_root: Path) -> dict[str, int]:
+    """Drop and rebuild the index from the card dirs (audit / recovery)."""
+    rr = Path(registry_root)
+    with _LOCK:
+        experience_index_path(rr).unlink(missing_ok=True)
+        _CACHE.pop(rr.as_posix(), None)
+        idx = _load_locked(rr)
+        idx.reconcile()
+        idx.compact()
+        return {"cards": len(idx.docs), "tokens": len(idx.tokens), "symbols": len(idx.symbols)}
@@ -126,14 +126,54 @@ class ExperienceMatch:
     ranking_explain: list[dict[str, Any]]
 
 
-def search_experience_cards(*, q: ExperienceQuery, reg_root: Path | None = None) -> list[ExperienceMatch]:
-    """Deterministic, evidence-first registry search (no embeddings, no network IO)."""
-    reg_root = reg_root or registry_root()
-    paths = registry_paths(reg_root)
-    cards_dir = paths.cards_dir
-    if not cards_dir.is_dir():
-        return []
+def _card_doc(card_dir: Path) -> dict[str, Any] | None:
+    """Extract the searchable fields of one card dir (card_v1.json + events + dossier symbols)."""
+    card_json = card_dir / "card_v1.json"
+    if not card_json.is_file():
+        return None
+    try:
+        base = _load_json(card_json)
+    except Exception:
+        return None
+    if not isinstance(base, dict):
+        return None
+    evs = _read_jsonl(card_dir / "events.jsonl")
+    eff = _effective_status(base, evs)
+
+    run_id = str(base.get("primary_run_id") or "")
+    app = base.get("applicability") if isinstance(base.get("applicability"), dict) else {}
+    evidence = base.get("evidence") if isinstance(base.get("evidence"), dict) else {}
+    dossier_path_hint = str(evidence.get("dossier_path") or "").strip() or None
+    # tags: read from extensions.tags when present (metadata only).
+    ext = base.get("extensions") if isinstance(base.get("extensions"), dict) else {}
+    tags = ext.get("tags") if isinstance(ext.get("tags"), list) else []
+    title = str(base.get("title") or "")
+
+    return {
+        "card_id": str(base.get("card_id") or card_dir.name),
+        "run_id": run_id,
+        "title": title,
+        "policy_bundle_id": str(base.get("policy_bundle_id") or "").strip() or None,
+        "freq": str(app.get("freq") or "").strip() or None,
+        "dossier_path_hint": dossier_path_hint,
+        "effective_status": eff,
+        # Pull symbols from dossier config snapshot (best-effort).
+        "symbols": _load_run_symbols_from_dossier(run_id=run_id, dossier_path_hint=dossier_path_hint),
+        "title_l": title.lower(),
+        "tags_l": " ".join([str(t) for t in tags]).lower(),
+        "notes_l": " ".join([str(ev.get("notes") or "") for ev in evs if isinstance(ev, dict)]).lower(),
+    }
+
 
+@dataclass(frozen=True)
+class _PreparedQuery:
+    merged_tokens: list[str]
+    wanted_set: set[str]
+    wanted_freq: str | None
+    top_k: int
+
+
+def _prepare_query(q: ExperienceQuery) -> _PreparedQuery:
     top_k = max(1, min(50, int(q.top_k)))
     query_text = str(q.query or "")
     query_tokens = _tokenize(query_text)
@@ -150,6 +190,104 @@ def search_experience_cards(*, q: ExperienceQuery, reg_root: Path | None = None)
     wanted_set = {s.upper() for s in wanted_symbols}
 
     wanted_freq = str(q.frequency).strip() if isinstance(q.frequency, str) and q.frequency.strip() else None
+    return _PreparedQuery(merged_tokens=merged_tokens, wanted_set=wanted_set, wanted_freq=wanted_freq, top_k=top_k)
+
+
+def _score_doc(doc: dict[str, Any], pq: _PreparedQuery, run_id_to_index: dict[str, dict[str, Any]]) -> ExperienceMatch | None:
+    merged_tokens, wanted_set, wanted_freq = pq.merged_tokens, pq.wanted_set, pq.wanted_freq
+    eff = str(doc["effective_status"])
+    run_id = str(doc["run_id"])
+    pb = doc.get("policy_bundle_id")
+    freq = doc.get("freq")
+    sym_list = list(doc.get("symbols") or [])
+    sym_set = {s.upper() for s in sym_list}
+
+    # Ranking: simple token match scoring + optional structured matches.
+    # Keep weights conservative; output must explain why.
+    score = 0.0
+    explain: list[dict[str, Any]] = []
+
+    def add(reason: str, *, field: str, token: str | None, weight: float) -> None:
+        nonlocal score
+        score += float(weight)
+        explain.append({"reason": reason, "field": field, "token": token, "weight": float(weight)})
+
+    title_l = str(doc["title_l"])
+    tags_l = str(doc["tags_l"])
+    notes_l = str(doc["notes_l"])
+
+    for tok in merged_tokens:
+        if tok and tok in title_l:
+            add("token_in_title", field="title", token=tok, weight=5.0)
+        if tok and tok in tags_l:
+            add("token_in_tags", field="tags", token=tok, weight=3.0)
+        if tok and tok in notes_l:
+            add("token_in_notes", field="notes", token=tok, weight=2.0)
+        # symbols: allow matching query tokens (e.g. "AAA") as well.
+        if tok and tok.upper() in sym_set:
+            add("token_in_symbols", field="symbols", token=tok.upper(), weight=4.0)
+
+    # Structured symbol match.
+    if wanted_set and sym_set:
+        common = sorted(wanted_set & sym_set)
+        if common:
+            add("symbols_intersection", field="symbols", token=",".join(common), weight=6.0)
+
+    # Frequency match.
+    if wanted_freq and freq and wanted_freq == freq:
+        add("frequency_match", field="frequency", token=wanted_freq, weight=2.0)
+
+    # Favor champion/challenger slightly when all else equal.
+    if eff == "champion":
+        add("status_bonus", field="effective_status", token=eff, weight=0.2)
+    elif eff == "challenger":
+        add("status_bonus", field="effective_status", token=eff, weight=0.1)
+
+    # If no match at all, skip unless empty query (then include for deterministic browse).
+    if (not merged_tokens) and (not wanted_set) and (not wanted_freq):
+        add("empty_query", field="query", token=None, weight=0.0)
+    elif score <= 0.0:
+        return None
+
+    # Stable explain ordering.
+    explain.sort(key=lambda r: (-float(r.get("weight") or 0.0), str(r.get("field") or ""), str(r.get("token") or "")))
+
+    # If index is available, prefer canonical policy_bundle_id from index when present.
+    idx_row = run_id_to_index.get(run_id, {})
+    if isinstance(idx_row, dict) and isinstance(idx_row.get("policy_bundle_id"), str) and idx_row.get("policy_bundle_id"):
+        pb = str(idx_row.get("policy_bundle_id"))
+
+    return ExperienceMatch(
+        card_id=str(doc["card_id"]),
+        run_id=run_id,
+        score=float(score),
+        effective_status=eff,
+        title=str(doc["title"]),
+        policy_bundle_id=pb,
+        symbols=sym_list,
+        ranking_explain=explain,
+    )
+
+
+def search_experience_cards(
+    *,
+    q: ExperienceQuery,
+    reg_root: Path | None = None,
+    use_index: bool = True,
+) -> list[ExperienceMatch]:
+    """Deterministic, evidence-first registry search (no embeddings, no network IO).
+
+    With `use_index` (default) candidates come from the persisted experience index
+    (`registry.experience_index`); otherwise every card dir is scanned. Scoring is shared, so
+    ranking and explain output are identical either way.
+    """
+    reg_root = reg_root or registry_root()
+    paths = registry_paths(reg_root)
+    cards_dir = paths.cards_dir
+    if not cards_dir.is_dir():
+        return []
+
+    pq = _prepare_query(q)
 
     # Optional index accelerators.
     runs_index_rows = list_runs_from_index(limit=2000)
@@ -159,105 +297,22 @@ def search_experience_cards(*, q: ExperienceQuery, reg_root: Path | None = None)
         if isinstance(rid, str) and rid:
             run_id_to_index[rid] = r
 
-    matches: list[ExperienceMatch] = []
-
-    for d in sorted([p for p in cards_dir.iterdir() if p.is_dir()], key=lambda p: p.name):
-        card_json = d / "card_v1.json"
-        if not card_json.is_file():
-            continue
-        try:
-            base = _load_json(card_json)
-        except Exception:
-            continue
-        if not isinstance(base, dict):
-            continue
-        evs = _read_jsonl(d / "events.jsonl")
-        eff = _effective_status(base, evs)
-
-        card_id = str(base.get("card_id") or d.name)
-        title = str(base.get("title") or "")
-        run_id = str(base.get("primary_run_id") or "")
-        pb = str(base.get("policy_bundle_id") or "").strip() or None
-        app = base.get("applicability") if isinstance(base.get("applicability"), dict) else {}
-        freq = str(app.get("freq") or "").strip() or None
-        evidence = base.get("evidence") if isinstance(base.get("evidence"), dict) else {}
-        dossier_path_hint = str(evidence.get("dossier_path") or "").strip() or None
+    if use_index:
+        from quant_eam.registry.experience_index import load_experience_index
 
-        # Pull symbols from dossier config snapshot (best-effort).
-        sym_list = _load_run_symbols_from_dossier(run_id=run_id, dossier_path_hint=dossier_path_hint)
-        sym_set = {s.upper() for s in sym_list}
-
-        # Ranking: simple token match scoring + optional structured matches.
-        # Keep weights conservative; output must explain why.
-        score = 0.0
-        explain: list[dict[str, Any]] = []
-
-        def add(reason: str, *, field: str, token: str | None, weight: float) -> None:
-            nonlocal score
-            score += float(weight)
-            explain.append({"reason": reason, "field": field, "token": token, "weight": float(weight)})
-
-        title_l = title.lower()
-        # tags: read from extensions.tags when present (metadata only).
-        ext = base.get("extensions") if isinstance(base.get("extensions"), dict) else {}
-        tags = ext.get("tags") if isinstance(ext.get("tags"), list) else []
-        tags_l = " ".join([str(t) for t in tags]).lower()
-
-        notes_l = " ".join([str(ev.get("notes") or "") for ev in evs if isinstance(ev, dict)]).lower()
-
-        for tok in merged_tokens:
-            if tok and tok in title_l:
-                add("token_in_title", field="title", token=tok, weight=5.0)
-            if tok and tok in tags_l:
-                add("token_in_tags", field="tags", token=tok, weight=3.0)
-            if tok and tok in notes_l:
-                add("token_in_notes", field="notes", token=tok, weight=2.0)
-            # symbols: allow matching query tokens (e.g. "AAA") as well.
-            if tok and tok.upper() in sym_set:
-                add("token_in_symbols", field="symbols", token=tok.upper(), weight=4.0)
-
-        # Structured symbol match.
-        if wanted_set and sym_set:
-            common = sorted(wanted_set & sym_set)
-            if common:
-                add("symbols_intersection", field="symbols", token=",".join(common), weight=6.0)
-
-        # Frequency match.
-        if wanted_freq and freq and wanted_freq == freq:
-            add("frequency_match", field="frequency", token=wanted_freq, weight=2.0)
-
-        # Favor champion/challenger slightly when all else equal.
-        if eff == "champion":
-            add("status_bonus", field="effective_status", token=eff, weight=0.2)
-        elif eff == "challenger":
-            add("status_bonus", field="effective_status", token=eff, weight=0.1)
-
-        # If no match at all, skip unless empty query (then include for deterministic browse).
-        if (not merged_tokens) and (not wanted_set) and (not wanted_freq):
-            add("empty_query", field="query", token=None, weight=0.0)
-        elif score <= 0.0:
-            continue
+        docs = load_experience_index(reg_root).candidate_docs(pq)
+    else:
+        docs = []
+        for d in sorted([p for p in cards_dir.iterdir() if p.is_dir()], key=lambda p: p.name):
+            doc = _card_doc(d)
+            if doc is not None:
+                docs.append(doc)
 
-        # Stable explain ordering.
-        explain.sort(key=lambda r: (-float(r.get("weight") or 0.0), str(r.get("field") or ""), str(r.get("token") or "")))
-
-        # If index is available, prefer canonical policy_bundle_id from index when present.
-        idx_row = run_id_to_index.get(run_id, {})
-        if isinstance(idx_row, dict) and isinstance(idx_row.get("policy_bundle_id"), str) and idx_row.get("policy_bundle_id"):
-            pb = str(idx_row.get("policy_bundle_id"))
-
-        matches.append(
-            ExperienceMatch(
-                card_id=card_id,
-                run_id=run_id,
-                score=float(score),
-                effective_status=eff,
-                title=title,
-                policy_bundle_id=pb,
-                symbols=sym_list,
-                ranking_explain=explain,
-            )
-        )
+    matches: list[ExperienceMatch] = []
+    for doc in docs:
+        m = _score_doc(doc, pq, run_id_to_index)
+        if m is not None:
+            matches.append(m)
 
     # Deterministic ranking + tie-breaks.
     status_rank = {"champion": 0, "challenger": 1, "draft": 2, "retired": 3}
@@ -270,7 +325,7 @@ def search_experience_cards(*, q: ExperienceQuery, reg_root: Path | None = None)
         )
 
     matches.sort(key=key)
-    return matches[:top_k]
+    return matches[: pq.top_k]
 
 
 def build_experience_pack_payload(*, q: ExperienceQuery, reg_root: Path | None = None) -> dict[str, Any]:
@@ -59,6 +59,7 @@ class RegistryPaths:
     registry_root: Path
     trial_log: Path
     cards_dir: Path
+    trial_index: Path
 
 
 def registry_paths(registry_root: Path) -> RegistryPaths:
@@ -67,6 +68,7 @@ def registry_paths(registry_root: Path) -> RegistryPaths:
         registry_root=rr,
         trial_log=rr / "trial_log.jsonl",
         cards_dir=rr / "cards",
+        trial_index=rr / "trial_log.index.jsonl",
     )
 
 
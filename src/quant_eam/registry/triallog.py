@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any
 
 from quant_eam.contracts import validate as contracts_validate
+from quant_eam.core.jsonl_index import (
+    OffsetIndex,
+    append_indexed,
+    parse_line,
+    read_line_at,
+    refresh_index,
+    write_sidecar,
+)
 from quant_eam.registry.errors import RegistryInvalid
-from quant_eam.registry.storage import RegistryPaths, _jsonl_append, iter_jsonl, new_recorded_at, registry_paths
+from quant_eam.registry.storage import RegistryPaths, new_recorded_at, registry_paths
 
 
 def _load_json(path: Path) -> Any:
@@ -18,13 +27,82 @@ def _require_file(p: Path) -> None:
         raise RegistryInvalid(f"missing required file: {p.as_posix()}")
 
 
+# run_id offset index per trial log path (see quant_eam.core.jsonl_index).
+_INDEX_CACHE: dict[str, OffsetIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _load_trial_index(paths: RegistryPaths, *, persist: bool = False, rebuild: bool = False) -> OffsetIndex:
+    """Return the run_id -> offset index for trial_log.jsonl (caller holds _INDEX_LOCK).
+
+    Warmed from the in-process cache or the `trial_log.index.jsonl` sidecar and extended by scanning only
+    bytes appended since. The sidecar is written only when `persist` is set (writers); readers keep the
+    result in memory so read-only callers never write into the registry.
+    """
+    key = paths.trial_log.as_posix()
+    idx = refresh_index(
+        paths.trial_log,
+        "run_id",
+        _INDEX_CACHE.get(key),
+        sidecar=paths.trial_index,
+        persist=persist,
+        rebuild=rebuild,
+    )
+    _INDEX_CACHE[key] = idx
+    return idx
+
+
+def rebuild_trial_index(*, registry_root: Path) -> int:
+    """Rebuild `trial_log.index.jsonl` from the log; returns the number of indexed trials."""
+    paths = registry_paths(registry_root)
+    with _INDEX_LOCK:
+        idx = _load_trial_index(paths, rebuild=True)
+        write_sidecar(paths.trial_index, idx, idx.spans, append=False)
+        return len(idx.records)
+
+
+def _append_trial(paths: RegistryPaths, ev: dict[str, Any]) -> None:
+    with _INDEX_LOCK:
+        idx = _load_trial_index(paths, persist=True)
+        _INDEX_CACHE[paths.trial_log.as_posix()] = append_indexed(
+            paths.trial_log, ev, "run_id", idx, sidecar=paths.trial_index, persist=True
+        )
+
+
 def _find_existing_trial(paths: RegistryPaths, run_id: str) -> dict[str, Any] | None:
-    for ev in iter_jsonl(paths.trial_log):
-        if str(ev.get("run_id", "")) == run_id:
-            return ev
+    # A miss or stale offset is retried once against an index rebuilt from the log, so idempotent
+    # re-recording never appends a duplicate because of an incomplete index.
+    with _INDEX_LOCK:
+        for rebuild in (False, True):
+            off = _load_trial_index(paths, rebuild=rebuild).first.get(str(run_id))
+            if off is None:
+                continue
+            doc = read_line_at(paths.trial_log, off)
+            if doc is not None and str(doc.get("run_id", "")) == str(run_id):
+                return doc
     return None
 
 
+def list_trials_page(*, registry_root: Path, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
+    """Newest-first page of trial events and the total count, reading only the page's lines."""
+    paths = registry_paths(registry_root)
+    with _INDEX_LOCK:
+        records = list(_load_trial_index(paths).records)
+    total = len(records)
+    hi = total - max(0, int(offset))
+    lo = max(0, hi - max(0, int(limit)))
+    page: list[dict[str, Any]] = []
+    if hi <= 0:
+        return page, total
+    with paths.trial_log.open("rb") as f:
+        for _rid, off in reversed(records[lo:hi]):
+            f.seek(off)
+            doc = parse_line(f.readline())
+            if doc is not None:
+                page.append(doc)
+    return page, total
+
+
 def record_trial(
     *,
     dossier_dir: Path,
@@ -107,7 +185,7 @@ def record_trial(
     if code2 != contracts_validate.EXIT_OK:
         raise RegistryInvalid(f"trial_event invalid: {msg2}")
 
-    _jsonl_append(paths.trial_log, ev)
+    _append_trial(paths, ev)
     return ev
 
 
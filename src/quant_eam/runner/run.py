@@ -20,11 +20,13 @@ from quant_eam.backtest.vectorbt_adapter_mvp import (
     run_adapter,
 )
 from quant_eam.contracts import validate as contracts_validate
+from quant_eam.core.timing import dossier_timings_enabled, span, timed, write_timings_json
 from quant_eam.data_lake.demo_ingest import main as demo_ingest_main
 from quant_eam.datacatalog.catalog import DataCatalog
 from quant_eam.dossier.writer import DossierAlreadyExists, DossierWriter
 from quant_eam.policies.load import default_policies_dir, load_yaml, sha256_file
 from quant_eam.policies.resolve import load_policy_bundle, resolve_asof_latency_policy
+from quant_eam.policies.store import policy_store
 
 EXIT_OK = 0
 EXIT_USAGE_OR_ERROR = 1
@@ -43,12 +45,8 @@ def _load_json(path: Path) -> Any:
 
 
 def _policy_index(policies_dir: Path) -> dict[str, Path]:
-    idx: dict[str, Path] = {}
-    for p in sorted([pp for pp in policies_dir.glob("*.y*ml") if pp.is_file()]):
-        doc = load_yaml(p)
-        if isinstance(doc, dict) and isinstance(doc.get("policy_id"), str):
-            idx[str(doc["policy_id"])] = p
-    return idx
+    # Parsed once per file version by the policy store (sweeps resolve the same bundle per trial).
+    return policy_store().index(policies_dir)
 
 
 def _load_policy_docs_from_bundle(bundle_path: Path) -> tuple[str, dict[str, Any], dict[str, Any], dict[str, Any], dict[str, str]]:
@@ -170,6 +168,7 @@ def _runspec_segments_list(runspec: dict[str, Any]) -> list[dict[str, Any]]:
     return out
 
 
+@timed("runner.run_once", collect=True)
 def run_once(
     *,
     runspec_path: Path,
@@ -189,9 +188,10 @@ def run_once(
         return EXIT_INVALID, "INVALID: runspec must be a JSON object"
 
     # 2) Load policies (read-only) and capture sha256.
-    bundle_id, execution_policy, cost_policy, asof_latency_policy, policy_shas = _load_policy_docs_from_bundle(
-        policy_bundle_path
-    )
+    with span("runner.load_policies"):
+        bundle_id, execution_policy, cost_policy, asof_latency_policy, policy_shas = _load_policy_docs_from_bundle(
+            policy_bundle_path
+        )
 
     # Ensure runspec references the same bundle id (no overrides).
     if str(runspec.get("policy_bundle_id")) != bundle_id:
@@ -218,6 +218,7 @@ def run_once(
 
         lag_bars = _trade_lag_bars_default(asof_latency_policy)
 
+        @timed("runner.segment")
         def run_segment(seg: dict[str, Any]) -> tuple[dict[str, Any], str, str, str, str, dict[str, Any]]:
             s_start = str(seg.get("start") or "")
             s_end = str(seg.get("end") or "")
@@ -639,6 +640,13 @@ def run_once(
             }
             out_path.write_text(json.dumps(components_json, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
+    # Optional timings.json (EAM_TIMINGS=1 + EAM_DOSSIER_TIMINGS=1); like components.json it is appended
+    # next to the immutable dossier files and is not part of the manifest.
+    if dossier_timings_enabled():
+        timings_path = paths.dossier_dir / "timings.json"
+        if not timings_path.exists():
+            write_timings_json(timings_path, run_id=run_id)
+
     # Validate dossier manifest against contract (must pass).
     dossier_manifest_path = paths.manifest
     code2, msg2 = contracts_validate.validate_json(dossier_manifest_path)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from quant_eam.api import read_only_api
+from quant_eam.api.app import app
+from quant_eam.api.execution import heavy_stats, reset_heavy_executor
+
+
+def test_heavy_routes_are_bounded_and_time_out(monkeypatch) -> None:
+    monkeypatch.setenv("EAM_API_HEAVY_WORKERS", "4")
+    monkeypatch.setenv("EAM_API_HEAVY_CONCURRENCY", "2")
+    monkeypatch.setenv("EAM_API_RETRY_AFTER_S", "3")
+    reset_heavy_executor()
+
+    gate = threading.Event()
+    started = threading.Semaphore(0)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def _slow_pack(*, q):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        started.release()
+        try:
+            gate.wait(10)
+            return {"query": q.query, "cards": []}
+        finally:
+            with lock:
+                active["now"] -= 1
+
+    monkeypatch.setattr(read_only_api, "build_experience_pack_payload", _slow_pack)
+    try:
+        with TestClient(app) as client, ThreadPoolExecutor(max_workers=8) as pool:
+            # Two requests occupy the route; the third is rejected immediately with Retry-After.
+            held = [pool.submit(client.get, "/experience/search", params={"q": f"h{i}"}) for i in range(2)]
+            assert started.acquire(timeout=5) and started.acquire(timeout=5)
+            r = client.get("/experience/search", params={"q": "over"})
+            assert r.status_code == 503 and r.headers["retry-after"] == "3"
+
+            # Cheap endpoints stay responsive while the heavy route is saturated.
+            t0 = time.perf_counter()
+            assert client.get("/healthz").status_code == 200
+            assert time.perf_counter() - t0 < 1.0
+
+            gate.set()
+            assert [f.result(timeout=10).status_code for f in held] == [200, 200]
+            assert client.get("/experience/search", params={"q": "again"}).json()["query"] == "again"
+
+            # Burst: every response is 200 or 503 (with Retry-After); never more than 2 in flight.
+            gate.clear()
+            burst = [pool.submit(client.get, "/experience/search", params={"q": f"b{i}"}) for i in range(8)]
+            time.sleep(0.3)
+            gate.set()
+            codes = [f.result(timeout=10) for f in burst]
+            assert {r.status_code for r in codes} <= {200, 503}
+            assert sum(r.status_code == 200 for r in codes) >= 2
+            assert all(r.headers.get("retry-after") == "3" for r in codes if r.status_code == 503)
+            assert active["peak"] <= 2
+
+            # Timeout: 504, and the slot stays held until the worker thread finishes.
+            monkeypatch.setenv("EAM_API_HEAVY_TIMEOUT_S", "0.2")
+            gate.clear()
+            r = client.get("/experience/search", params={"q": "slow"})
+            assert r.status_code == 504
+            stats = heavy_stats()["experience_search"]
+            assert stats["timed_out"] == 1 and stats["in_flight"] == 1
+            gate.set()
+            deadline = time.time() + 5
+            while heavy_stats()["experience_search"]["in_flight"] and time.time() < deadline:
+                time.sleep(0.01)
+            assert heavy_stats()["experience_search"]["in_flight"] == 0
+    finally:
+        gate.set()
+        reset_heavy_executor()
+
+
+def test_untimed_heavy_work_completes_and_ui_run_304_skips_admission(tmp_path, monkeypatch) -> None:
+    import asyncio
+
+    from quant_eam.api import ui_routes
+    from quant_eam.api.execution import run_heavy
+
+    monkeypatch.setenv("EAM_API_HEAVY_TIMEOUT_S", "0.05")
+    reset_heavy_executor()
+    try:
+        # timeout_s=None (mutating handlers): the caller gets the real result, not a 504.
+        assert asyncio.run(run_heavy("compose", lambda: time.sleep(0.2) or "done", timeout_s=None)) == "done"
+        assert heavy_stats()["compose"]["timed_out"] == 0
+
+        art = tmp_path / "artifacts"
+        d = art / "dossiers" / "run_a"
+        d.mkdir(parents=True)
+        (d / "metrics.json").write_text("{}", encoding="utf-8")
+        monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art))
+        validators = ui_routes.dossier_validators(
+            d, route="ui_run", files=ui_routes._UI_RUN_FILES, trees=ui_routes._UI_RUN_TREES, params={}
+        )
+
+        # Saturate the route: a conditional request is still answered with 304.
+        monkeypatch.setenv("EAM_API_HEAVY_CONCURRENCY", "1")
+        gate = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            held = pool.submit(asyncio.run, run_heavy("ui_run", gate.wait, 5, timeout_s=None))
+            deadline = time.time() + 5
+            while not heavy_stats().get("ui_run", {}).get("in_flight") and time.time() < deadline:
+                time.sleep(0.01)
+            r = TestClient(app).get("/ui/runs/run_a", headers={"If-None-Match": validators.etag})
+            gate.set()
+            held.result(timeout=5)
+        assert r.status_code == 304
+    finally:
+        reset_heavy_executor()
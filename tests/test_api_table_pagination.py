@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from quant_eam.api.app import app
+
+
+def _write_dossier(tmp_path: Path, monkeypatch) -> tuple[str, list[dict[str, str]]]:
+    art_root = tmp_path / "artifacts"
+    d = art_root / "dossiers" / "run_tables_001"
+    d.mkdir(parents=True)
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art_root))
+    buf = io.StringIO(newline="")
+    w = csv.writer(buf, lineterminator="\n")
+    w.writerow(["symbol", "entry_dt", "exit_dt", "pnl", "qty", "fees"])
+    for i in range(1000):
+        sym = ("AAA", "BBB", "CCC")[i % 3]
+        note = 'quoted,"multi\nline"' if i == 500 else "0.1"
+        w.writerow([sym, f"2024-01-{1 + i // 40:02d}T{i % 24:02d}:00:00+00:00", "", f"{i * 0.5}", "1", note])
+    (d / "trades.csv").write_text(buf.getvalue(), encoding="utf-8")
+    (d / "turnover.csv").write_text("dt,turnover\n2024-01-01,0.1\n2024-01-02,0.2\n2024-01-03,0.3", encoding="utf-8")
+    rows = list(csv.DictReader(io.StringIO(buf.getvalue(), newline="")))
+    return "run_tables_001", rows
+
+
+def test_trades_pagination_filters_and_streaming(tmp_path: Path, monkeypatch) -> None:
+    run_id, rows = _write_dossier(tmp_path, monkeypatch)
+    client = TestClient(app)
+
+    # Legacy call: every row, unchanged values.
+    r = client.get(f"/runs/{run_id}/trades")
+    assert r.status_code == 200
+    assert r.json()["rows"] == rows and r.json()["total"] == 1000 and r.json()["next_offset"] is None
+
+    # Pages walk the whole table without gaps, including the multi-line quoted row.
+    seen: list[dict[str, str]] = []
+    offset: int | None = 0
+    while offset is not None:
+        body = client.get(f"/runs/{run_id}/trades", params={"offset": offset, "limit": 130}).json()
+        assert body["total"] == 1000
+        seen.extend(body["rows"])
+        offset = body["next_offset"]
+    assert seen == rows
+
+    # Symbol + half-open dt range filters.
+    params = {"symbol": "AAA,CCC", "dt_from": "2024-01-05", "dt_to": "2024-01-10T00:00:00Z", "offset": 5, "limit": 20}
+    body = client.get(f"/runs/{run_id}/trades", params=params).json()
+    want = [x for x in rows if x["symbol"] in {"AAA", "CCC"} and "2024-01-05" <= x["entry_dt"] < "2024-01-10"]
+    assert body["total"] == len(want) and body["rows"] == want[5:25] and body["next_offset"] == 25
+
+    # NDJSON and CSV streams (gzip when accepted) carry the same rows.
+    r = client.get(f"/runs/{run_id}/trades", params={"format": "ndjson", "symbol": "BBB"}, headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200 and r.headers["content-encoding"] == "gzip"
+    assert r.headers["x-total-count"] == str(sum(1 for x in rows if x["symbol"] == "BBB"))
+    assert [json.loads(line) for line in r.text.splitlines()] == [x for x in rows if x["symbol"] == "BBB"]
+
+    with client.stream("GET", f"/runs/{run_id}/trades", params={"format": "csv", "offset": 490, "limit": 20}, headers={"Accept-Encoding": "gzip"}) as r:
+        raw = b"".join(r.iter_raw())
+    assert list(csv.DictReader(io.StringIO(gzip.decompress(raw).decode("utf-8"), newline=""))) == rows[490:510]
+    assert r.headers["x-next-offset"] == "510"
+
+    # turnover.csv: no symbol column, last line without a trailing newline.
+    body = client.get(f"/runs/{run_id}/turnover", params={"dt_from": "2024-01-02"}).json()
+    assert body["rows"] == [{"dt": "2024-01-02", "turnover": "0.2"}, {"dt": "2024-01-03", "turnover": "0.3"}]
+    assert client.get(f"/runs/{run_id}/turnover", params={"format": "csv"}).text == "dt,turnover\n2024-01-01,0.1\n2024-01-02,0.2\n2024-01-03,0.3\n"
+
+    assert client.get(f"/runs/{run_id}/trades", params={"format": "xml"}).status_code == 422
+    assert client.get(f"/runs/{run_id}/trades", params={"dt_from": "not-a-date"}).status_code == 422
+    assert client.get(f"/runs/{run_id}/positions").status_code == 404
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+from quant_eam.core.jsonl_index import iter_jsonl_reverse
 from quant_eam.index.indexer import build_all_indexes, index_paths
 
 
@@ -89,3 +91,70 @@ def test_phase25_indexer_append_only_and_stable(tmp_path: Path, monkeypatch) ->
     assert len(_read_jsonl(idxp.runs_index)) == 2
     assert len(_read_jsonl(idxp.jobs_index)) == 1
 
+
+
+def test_runs_index_incremental_high_water_mark_and_tail_reader(tmp_path: Path, monkeypatch, caplog) -> None:
+    from quant_eam.index import indexer as indexer_mod
+    from quant_eam.index.indexer import build_runs_index
+    from quant_eam.index.reader import list_runs_from_index
+
+    art = tmp_path / "artifacts"
+    reg = art / "registry"
+    dossiers = art / "dossiers"
+    (reg / "cards").mkdir(parents=True, exist_ok=True)
+    dossiers.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art))
+    monkeypatch.setenv("EAM_REGISTRY_ROOT", str(reg))
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    def _mk(rid: str, *, gated: bool) -> None:
+        d = dossiers / rid
+        d.mkdir(parents=True, exist_ok=True)
+        _write_json(d / "dossier_manifest.json", {"run_id": rid, "data_snapshot_id": "snap_001"})
+        if gated:
+            _write_json(d / "gate_results.json", {"overall_pass": True, "results": []})
+
+    for i in range(5):
+        _mk(f"run{i:09d}", gated=True)
+    _mk("run_pending01", gated=False)
+    assert build_runs_index(artifact_root_dir=art)["indexed"] == 6
+    idxp = index_paths(artifact_root_dir=art)
+    assert idxp.runs_state.is_file()
+
+    # No new/changed dossiers: no dossier content is read.
+    visited: list[str] = []
+    orig_row = indexer_mod._runs_index_row
+    monkeypatch.setattr(indexer_mod, "_runs_index_row", lambda d, rid, cards: visited.append(rid) or orig_row(d, rid, cards))
+    res = build_runs_index(artifact_root_dir=art)
+    assert res["indexed"] == 0 and visited == []
+    # total_seen counts dossier dirs visited by this build: none when the root is unchanged.
+    assert res["total_seen"] == 0 and res["skipped_existing"] == 0
+
+    # One new dossier + gate results landing for the pending run: only those two are visited.
+    _mk("run_new00001", gated=True)
+    _write_json(reg / "cards" / "card_new.json", {"card_id": "card_new", "primary_run_id": "run_new00001"})
+    (reg / "cards" / "card_bad.json").write_text("{", encoding="utf-8")
+    _write_json(dossiers / "run_pending01" / "gate_results.json", {"overall_pass": False, "results": []})
+    os.utime(dossiers / "run_pending01", ns=(1, 1))
+    with caplog.at_level("WARNING", logger="quant_eam.index.indexer"):
+        res = build_runs_index(artifact_root_dir=art)
+    assert any("card_bad.json" in r.getMessage() for r in caplog.records)
+    assert sorted(visited) == ["run_new00001", "run_pending01"]
+    assert res["indexed"] == 2
+    # The root changed, so it is listed: every dossier dir is seen, already-indexed ones are skipped.
+    assert res["total_seen"] == 7 and res["skipped_existing"] == 5
+
+    rows = list_runs_from_index(artifact_root_dir=art, limit=3)
+    assert [r["run_id"] for r in rows] == ["run_pending01", "run_new00001", "run000000004"]
+    assert rows[0]["overall_pass"] is False
+    assert rows[1]["card_ids"] == ["card_new"]
+    # Newest row per run_id wins; the full list has no duplicates.
+    all_rows = list_runs_from_index(artifact_root_dir=art, limit=100)
+    assert len(all_rows) == 7
+    assert list(iter_jsonl_reverse(idxp.runs_index, block_size=7)) == list(reversed(_read_jsonl(idxp.runs_index)))
+
+    # Targeted post-run refresh and recovery from a lost state file.
+    _mk("run_hook0001", gated=True)
+    assert build_runs_index(artifact_root_dir=art, run_ids=["run_hook0001"])["indexed"] == 1
+    idxp.runs_state.unlink()
+    assert build_runs_index(artifact_root_dir=art)["indexed"] == 0
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import random
+from pathlib import Path
+
+from quant_eam.datacatalog.catalog import DataCatalog
+from quant_eam.diagnostics.calc_trace_preview import run_calc_trace_preview
+
+AS_OF = "2024-03-01T00:00:00+08:00"
+
+
+def _write_lake(root: Path, symbols: list[str]) -> None:
+    rng = random.Random(7)
+    rows = []
+    for s in symbols:
+        for d in range(1, 60):
+            day = f"2024-{1 + d // 28:02d}-{1 + d % 28:02d}"
+            av = "" if rng.random() < 0.05 else f"{day}T16:00:00+08:00"
+            rows.append([s, day, 1, 1, 1, round(100 + rng.random() * 10, 3), 10, av])
+    rng.shuffle(rows)
+    lake = root / "lake" / "snap"
+    lake.mkdir(parents=True)
+    with (lake / "ohlcv_1d.csv").open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["symbol", "dt", "open", "high", "low", "close", "volume", "available_at"])
+        w.writerows(rows)
+
+
+def test_sample_ohlcv_matches_full_query_and_counts(tmp_path: Path) -> None:
+    symbols = [f"S{i:02d}" for i in range(20)]
+    _write_lake(tmp_path, symbols)
+    cat = DataCatalog(root=tmp_path)
+    q = {"snapshot_id": "snap", "symbols": symbols[:6], "start": "2024-01-03", "end": "2024-02-20", "as_of": AS_OF}
+    full, stats = cat.query_ohlcv(**q)
+    for n in (1, 7, 40, 10_000):
+        rows, s = cat.sample_ohlcv(**q, max_rows=n)
+        assert rows == full[:n] and s == stats
+    rows, s = cat.sample_ohlcv(**q, max_rows=13, per_symbol=True)
+    assert s == stats
+    assert rows == [r for sym in symbols[:6] for r in [x for x in full if x["symbol"] == sym][:2]]
+
+
+def test_trace_preview_sampling_and_hash_on_write(tmp_path: Path) -> None:
+    symbols = [f"S{i:02d}" for i in range(20)]
+    _write_lake(tmp_path / "data", symbols)
+    dsl = {
+        "dsl_version": "signal_dsl_v1",
+        "signals": {"entry": "entry", "exit": "exit"},
+        "expressions": {
+            "sma_fast": {"type": "op", "op": "sma", "args": [{"type": "var", "var_id": "close"}, {"type": "param", "param_id": "fast"}]},
+            "sma_slow": {"type": "op", "op": "sma", "args": [{"type": "var", "var_id": "close"}, {"type": "param", "param_id": "slow"}]},
+            "entry": {"type": "op", "op": "cross_above", "args": [{"type": "var", "var_id": "sma_fast"}, {"type": "var", "var_id": "sma_slow"}]},
+            "exit": {"type": "op", "op": "cross_below", "args": [{"type": "var", "var_id": "sma_fast"}, {"type": "var", "var_id": "sma_slow"}]},
+        },
+        "params": {"fast": 2, "slow": 3},
+        "execution": {"order_timing": "next_open", "cost_model": {"ref_policy": True}},
+        "extensions": {"policy_bundle_path": "policies/policy_bundle_v1.yaml"},
+    }
+    p_dsl, p_vars, p_plan = tmp_path / "dsl.json", tmp_path / "vars.json", tmp_path / "plan.json"
+    p_dsl.write_text(json.dumps(dsl), encoding="utf-8")
+    p_vars.write_text(json.dumps({"schema_version": "variable_dictionary_v1", "variables": []}), encoding="utf-8")
+    p_plan.write_text(
+        json.dumps({"samples": [{"symbols": symbols, "start": "2024-01-01", "end": "2024-03-01", "max_rows": 40, "sample_mode": "per_symbol"}]}),
+        encoding="utf-8",
+    )
+    kw = {
+        "snapshot_id": "snap",
+        "as_of": AS_OF,
+        "start": "2024-01-01",
+        "end": "2024-03-01",
+        "symbols": symbols,
+        "signal_dsl_path": p_dsl,
+        "variable_dictionary_path": p_vars,
+        "calc_trace_plan_path": p_plan,
+        "data_root": tmp_path / "data",
+    }
+    _rows, stats = DataCatalog(root=tmp_path / "data").query_ohlcv(
+        snapshot_id="snap", symbols=symbols, start="2024-01-01", end="2024-03-01", as_of=AS_OF
+    )
+
+    out_csv, meta_path, meta = run_calc_trace_preview(out_dir=tmp_path / "per_symbol", **kw)
+    with out_csv.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert meta.sample_mode == "per_symbol" and meta.rows_written == len(rows) == 40
+    assert sorted({r["symbol"] for r in rows}) == symbols
+    assert (meta.rows_before_asof, meta.rows_after_asof) == (stats.rows_before_asof, stats.rows_after_asof)
+    assert meta.csv_sha256 == hashlib.sha256(out_csv.read_bytes()).hexdigest()
+    assert json.loads(meta_path.read_text(encoding="utf-8"))["csv_sha256"] == meta.csv_sha256
+
+    out_csv, _meta_path, meta = run_calc_trace_preview(out_dir=tmp_path / "head", max_rows=5, sample_mode="head", **kw)
+    with out_csv.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["symbol"] for r in rows] == ["S00"] * 5 and all(r["eligible"] == "true" for r in rows)
+    assert meta.rows_after_asof == stats.rows_after_asof
+
+
+def test_sample_ohlcv_matches_full_query_on_malformed_rows(tmp_path: Path) -> None:
+    lake = tmp_path / "lake" / "snap"
+    lake.mkdir(parents=True)
+    (lake / "ohlcv_1d.csv").write_text(
+        "symbol,dt,open,high,low,close,volume,available_at\n"
+        "AAA,2024-01-03,1,1,1,10,1,2024-01-03T16:00:00+08:00\n"
+        "AAA,2024-01-02,1,1,1,11,1,not-a-date\n"
+        "BBB,2024-01-02,1,1,1,12,1,2024-01-02T16:00:00+08:00,EXTRA\n"
+        "BBB,2024-01-04,1,1,1,13\n"
+        "AAA,2024-01-05,1,1,1,14,1,2099-01-01T00:00:00+08:00\n"
+        "\n"
+        "BBB,2024-01-03,1,1,1,15,1,2024-01-03T16:00:00\n",
+        encoding="utf-8",
+    )
+    cat = DataCatalog(root=tmp_path)
+    q = {"snapshot_id": "snap", "symbols": ["AAA", "BBB"], "start": "2024-01-01", "end": "2024-01-31", "as_of": AS_OF}
+    full, stats = cat.query_ohlcv(**q)
+    assert [r["close"] for r in full] == ["10", "12", "15"]
+    for n in (1, 2, 10):
+        rows, s = cat.sample_ohlcv(**q, max_rows=n)
+        assert rows == full[:n] and s == stats
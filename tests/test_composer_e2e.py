@@ -277,3 +277,125 @@ def test_components_integrity_required_gate_ids_enforced(tmp_path: Path, monkeyp
         },
     )
     assert gr2.passed is False
+
+
+def test_compose_curves_matrix_engine_matches_loop_and_supports_union_ffill(tmp_path: Path) -> None:
+    import numpy as np
+    import pandas as pd
+
+    from quant_eam.backtest.curve_composer_adapter_v1 import (
+        align_curves,
+        compose_curves,
+        compose_equity_batch,
+    )
+
+    rng = np.random.default_rng(7)
+    days = pd.date_range("2024-01-01", periods=60, freq="D")
+    dirs: list[Path] = []
+    for i in range(5):
+        keep = np.sort(rng.choice(len(days), size=50 - i, replace=False))
+        eq = np.cumprod(1.0 + rng.normal(0.0, 0.01, size=len(keep))) * (1.0 + i)
+        d = tmp_path / f"comp{i}"
+        d.mkdir()
+        pd.DataFrame({"dt": [days[k].isoformat() for k in keep], "equity": eq}).to_csv(d / "curve.csv", index=False)
+        dirs.append(d)
+    weights = [0.5, 1.5, 1.0, 0.25, 0.75]
+
+    # Loop reference (intersection): per-component pct_change, weighted sum, compounding loop.
+    frames = [pd.read_csv(d / "curve.csv", parse_dates=["dt"]).set_index("dt")["equity"] for d in dirs]
+    common = sorted(set.intersection(*[set(f.index) for f in frames]))
+    w = [x / sum(weights) for x in weights]
+    rets = [f.reindex(common).pct_change().fillna(0.0) for f in frames]
+    comp = rets[0] * 0.0
+    for wi, ri in zip(w, rets):
+        comp = comp + ri * wi
+    ref = [2.0]
+    for k in range(1, len(common)):
+        ref.append(ref[-1] * (1.0 + float(comp.iloc[k])))
+
+    bt, cc = compose_curves(dossier_dirs=dirs, weights=weights, base_equity=2.0)
+    assert bt.equity_curve["equity"].tolist() == ref
+    assert cc.aligned_rows == len(common)
+
+    # union_ffill: union grid from the latest first observation, gaps carry equity forward.
+    al = align_curves(dirs, align="union_ffill")
+    start = max(f.index.min() for f in frames)
+    grid = sorted({t for f in frames for t in f.index if t >= start})
+    assert al.dt == grid
+    union = sorted({t for f in frames for t in f.index})
+    assert np.array_equal(al.equity[:, 1], frames[1].reindex(union).ffill().loc[grid].to_numpy())
+    _, cc_u = compose_curves(dossier_dirs=dirs, weights=weights, align="union_ffill")
+    assert cc_u.aligned_rows == len(grid) > cc.aligned_rows
+
+    # Batch: many weight vectors at once (matrix product); matches the single composition to rounding.
+    W = np.vstack([weights, np.eye(5)[2], np.full(5, 0.2)])
+    eq = compose_equity_batch(align_curves(dirs), W, base_equity=2.0)
+    assert eq.shape == (3, len(common))
+    assert np.allclose(eq[0], ref, rtol=1e-12, atol=0.0)
+    assert np.allclose(eq[1], 2.0 * frames[2].reindex(common).to_numpy() / frames[2].reindex(common).iloc[0], rtol=1e-12)
+
+
+def test_weight_search_ranks_batch_and_materializes_top_k(tmp_path: Path, monkeypatch) -> None:
+    import numpy as np
+    import pandas as pd
+
+    from quant_eam.backtest.curve_composer_adapter_v1 import _max_drawdown, _sharpe_from_equity
+    from quant_eam.composer.search import (
+        batch_metrics,
+        grid_weights,
+        random_simplex_weights,
+        search_once,
+    )
+
+    # Candidate generators stay on the simplex; random samples are reproducible under a seed.
+    g = grid_weights(3, 0.25)
+    assert g.shape == (15, 3) and np.allclose(g.sum(axis=1), 1.0) and (g >= 0).all()
+    r1 = random_simplex_weights(4, 500, seed=11)
+    assert np.array_equal(r1, random_simplex_weights(4, 500, seed=11))
+    assert np.allclose(r1.sum(axis=1), 1.0)
+
+    # Vectorized metrics agree with the adapter's per-curve definitions.
+    eq = np.cumprod(1.0 + np.random.default_rng(3).normal(0.0, 0.01, size=(4, 40)), axis=1)
+    m = batch_metrics(eq)
+    for k in range(4):
+        s = pd.Series(eq[k])
+        assert np.isclose(m["sharpe"][k], _sharpe_from_equity(s), rtol=1e-10)
+        assert np.isclose(m["max_drawdown"][k], _max_drawdown(s), rtol=1e-12)
+        assert np.isclose(m["total_return"][k], eq[k, -1] / eq[k, 0] - 1.0)
+
+    data_root = tmp_path / "data"
+    art_root = tmp_path / "artifacts"
+    reg_root = tmp_path / "registry"
+    for d in (data_root, art_root, reg_root):
+        d.mkdir()
+    monkeypatch.setenv("EAM_DATA_ROOT", str(data_root))
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art_root))
+    monkeypatch.setenv("EAM_REGISTRY_ROOT", str(reg_root))
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    c1 = _make_card(tmp_path, snap="demo_snap_comp_search_001", title="c1", monkeypatch=monkeypatch)
+    c2 = _make_card(tmp_path, snap="demo_snap_comp_search_002", title="c2", monkeypatch=monkeypatch)
+    n_before = len(list((art_root / "dossiers").iterdir()))
+
+    bundle = _repo_root() / "policies" / "policy_bundle_curve_composer_v1.yaml"
+    code, out = search_once(card_ids=[c1, c2], policy_bundle_path=bundle, mode="random", samples=2000, seed=5, top_k=2)
+    assert code == COMPOSER_OK, out
+    lb = json.loads(Path(out["leaderboard_path"]).read_text(encoding="utf-8"))
+    assert lb["schema_version"] == "composer_leaderboard_v1"
+    assert contracts_validate.main([out["leaderboard_path"]]) == contracts_validate.EXIT_OK
+    assert contracts_validate.validate_payload({**lb, "top_k": -1})[0] == contracts_validate.EXIT_INVALID
+    assert lb["candidates_total"] == 2000 and len(lb["top"]) == 2
+    # Only the top-k candidates become dossiers.
+    assert len(list((art_root / "dossiers").iterdir())) <= n_before + 2
+    metrics_sorted = [t["search_metric"] for t in lb["top"]]
+    assert metrics_sorted == sorted(metrics_sorted, reverse=True)
+    for t in lb["top"]:
+        assert t["composer_exit_code"] == COMPOSER_OK
+        assert abs(sum(t["weights"].values()) - 1.0) <= 1e-9
+        assert Path(t["dossier_path"], "gate_results.json").is_file()
+        assert np.isclose(t["test_metric"], t["search_metric"], rtol=1e-4)
+    assert lb["best"]["run_id"] == lb["top"][0]["run_id"]
+
+    # Same spec again: noop on the recorded leaderboard.
+    code2, out2 = search_once(card_ids=[c1, c2], policy_bundle_path=bundle, mode="random", samples=2000, seed=5, top_k=2)
+    assert code2 == COMPOSER_OK and out2["noop"] is True and out2["search_id"] == out["search_id"]
@@ -119,3 +119,114 @@ def test_phase29_search_ranking_stable_and_job_ui_renders_pack(tmp_path: Path, m
     assert "ExperiencePack" in r.text
     assert "card_aaaa1111bbbb" in r.text
 
+
+def test_experience_index_matches_linear_scan_and_tracks_card_events(tmp_path: Path, monkeypatch) -> None:
+    from quant_eam.registry import experience_index
+    from quant_eam.registry.cards import annotate_card, promote_card
+    from quant_eam.registry.experience_index import experience_index_path
+
+    art = tmp_path / "artifacts"
+    reg = art / "registry"
+    dossiers = art / "dossiers"
+    (reg / "cards").mkdir(parents=True, exist_ok=True)
+    dossiers.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art))
+    monkeypatch.setenv("EAM_REGISTRY_ROOT", str(reg))
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    words = ["momentum", "crossover", "rsi", "meanrev", "breakout", "carry", "value", "buyhold"]
+    for i in range(40):
+        run_id = f"run{i:09d}"
+        if i % 3:
+            _write_json(
+                dossiers / run_id / "config_snapshot.json",
+                {"runspec": {"extensions": {"symbols": [f"S{i % 5}", f"S{(i + 1) % 5}"]}}},
+            )
+        cdir = reg / "cards" / f"card_{run_id}"
+        _write_json(
+            cdir / "card_v1.json",
+            {
+                "card_id": f"card_{run_id}",
+                "title": f"{words[i % 8].title()} {words[(i * 3) % 8]} #{i}",
+                "status": "draft",
+                "primary_run_id": run_id,
+                "policy_bundle_id": "policy_bundle_v1_default",
+                "applicability": {"freq": "ohlcv_1d" if i % 2 else "ohlcv_1h"},
+                "extensions": {"tags": [words[(i + 2) % 8]]},
+            },
+        )
+        status = ["champion", "challenger", "retired"][i % 3] if i % 4 == 0 else None
+        ev = {"event_type": "PROMOTED", "new_status": status} if status else {"event_type": "CREATED", "notes": f"note {words[i % 8]}"}
+        (cdir / "events.jsonl").write_text(json.dumps(ev) + "\n", encoding="utf-8")
+
+    queries = [
+        ExperienceQuery(query="", top_k=50),
+        ExperienceQuery(query="cross mom", top_k=50),
+        ExperienceQuery(query="s1 breakout", symbols=["S2"], frequency="ohlcv_1h", tags=["carry"], top_k=50),
+        ExperienceQuery(query="note rev", top_k=7),
+        ExperienceQuery(query="zzz_nohit", top_k=50),
+    ]
+
+    def both(q: ExperienceQuery) -> tuple[list, list]:
+        return search_experience_cards(q=q, reg_root=reg), search_experience_cards(q=q, reg_root=reg, use_index=False)
+
+    for q in queries:
+        fast, slow = both(q)
+        assert fast == slow
+    # Searches reconcile in memory only; the journal is written by registry writers.
+    assert not experience_index_path(reg).is_file()
+
+    # Index follows promotion / annotation through the registry API.
+    promote_card(card_id="card_run000000001", new_status="champion", registry_root=reg, allow_skip=True)
+    annotate_card(card_id="card_run000000002", notes="Uniquetoken regime filter", registry_root=reg)
+    fast, slow = both(ExperienceQuery(query="uniquetok", top_k=50))
+    assert fast == slow
+    assert fast[0].card_id == "card_run000000002"
+    assert any(m.card_id == "card_run000000001" and m.effective_status == "champion" for m in fast)
+    assert experience_index_path(reg).is_file()
+
+    # Unchanged registry: a search lists and stats no card dir.
+    sigs: list[Path] = []
+    real_sig = experience_index._card_sig
+    monkeypatch.setattr(experience_index, "_card_sig", lambda d: (sigs.append(d), real_sig(d))[1])
+    search_experience_cards(q=ExperienceQuery(query="mom", top_k=5), reg_root=reg)
+    sigs.clear()
+    search_experience_cards(q=ExperienceQuery(query="mom", top_k=5), reg_root=reg)
+    assert sigs == []
+
+    # Edits inside an existing card dir (no cards dir mtime change) bypass the writers; an audit sees them.
+    with (reg / "cards" / "card_run000000005" / "events.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"event_type": "ANNOTATED", "notes": "Outofband zebra"}) + "\n")
+    stale = search_experience_cards(q=ExperienceQuery(query="zebra", top_k=50), reg_root=reg)
+    assert "card_run000000005" not in [m.card_id for m in stale]
+    experience_index.load_experience_index(reg, audit=True)
+    fast, slow = both(ExperienceQuery(query="zebra", top_k=50))
+    assert fast == slow and fast[0].card_id == "card_run000000005"
+    # Substring matches inside indexed tokens still select candidates.
+    fast, slow = both(ExperienceQuery(query="ebr ofba", top_k=50))
+    assert fast == slow and fast[0].card_id == "card_run000000005"
+
+    # Cards written out-of-band are picked up once the cards dir changes.
+    _write_json(reg / "cards" / "card_late" / "card_v1.json", {"card_id": "card_late", "title": "Late Arrival", "primary_run_id": "late"})
+    fast, slow = both(ExperienceQuery(query="arrival", top_k=50))
+    assert fast == slow and fast[0].card_id == "card_late"
+
+
+def test_card_reindex_failure_is_logged_and_marks_index_dirty(tmp_path: Path, monkeypatch, caplog) -> None:
+    from quant_eam.registry import experience_index
+    from quant_eam.registry.cards import _reindex_card
+    from quant_eam.registry.storage import registry_paths
+
+    reg = tmp_path / "registry"
+    (reg / "cards").mkdir(parents=True)
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(tmp_path))
+    idx = experience_index.load_experience_index(reg)
+
+    def _boom(*_a, **_k):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(experience_index, "update_experience_card", _boom)
+    with caplog.at_level("ERROR"):
+        _reindex_card(registry_paths(reg), "card_x")
+    assert "card_x" in caplog.text
+    assert idx.dirty
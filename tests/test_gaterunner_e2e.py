@@ -171,3 +171,171 @@ def test_gate_cost_x2_does_not_modify_policy_files(tmp_path: Path, monkeypatch)
 
     after = _sha256_file(cost)
     assert before == after
+
+
+def _walk_forward_dossier(tmp_path: Path, monkeypatch, snap: str) -> tuple[Path, Path]:
+    from quant_eam.compiler.compile import compile_blueprint_to_runspec
+    from quant_eam.runner.run import run_once as runner_run_once
+
+    data_root = tmp_path / "data"
+    art_root = tmp_path / "artifacts"
+    monkeypatch.setenv("EAM_DATA_ROOT", str(data_root))
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art_root))
+    assert demo_ingest_main(["--root", str(data_root), "--snapshot-id", snap]) == 0
+
+    # Walk-forward segments exercise run-level, per-segment and holdout gates in one plan.
+    bp = json.loads((_repo_root() / "contracts" / "examples" / "blueprint_buyhold_demo_ok.json").read_text(encoding="utf-8"))
+    ep = bp["evaluation_protocol"]
+    ep["segments"]["train"] = {"start": "2024-01-01", "end": "2024-01-10"}
+    ep["segments"]["test"] = {"start": "2024-01-05", "end": "2024-01-10"}
+    ep["segments"]["holdout"] = {"start": "2024-01-08", "end": "2024-01-10"}
+    ep.update({"protocol": "walk_forward", "train_window_days": 4, "test_window_days": 3, "step_days": 2, "purge_days": 1, "embargo_days": 1})
+    ep["holdout_range"] = {"start": "2024-01-08", "end": "2024-01-10"}
+    bp_path = tmp_path / "bp.json"
+    bp_path.write_text(json.dumps(bp, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    bundle = _repo_root() / "policies" / "policy_bundle_v1.yaml"
+    rs_path = tmp_path / "runspec.json"
+    code, msg = compile_blueprint_to_runspec(
+        blueprint_path=bp_path, snapshot_id=snap, policy_bundle_path=bundle, out_path=rs_path, check_availability=False, data_root=data_root
+    )
+    assert code == COMPILER_OK, msg
+    code, msg = runner_run_once(
+        runspec_path=rs_path, policy_bundle_path=bundle, snapshot_id_override=None, data_root=data_root, artifact_root=art_root, behavior_if_exists="noop"
+    )
+    assert code == RUNNER_OK, msg
+    return Path(json.loads(msg)["dossier_path"]), bundle
+
+
+def test_parallel_gate_plan_is_byte_identical_to_serial(tmp_path: Path, monkeypatch) -> None:
+    import shutil
+
+    from quant_eam.gaterunner.run import run_once as gaterunner_run_once
+
+    d_serial, bundle = _walk_forward_dossier(tmp_path, monkeypatch, "demo_snap_gate_parallel_001")
+    d_parallel = tmp_path / "copy" / d_serial.name
+    shutil.copytree(d_serial, d_parallel)
+
+    c1, _ = gaterunner_run_once(dossier_dir=d_serial, policy_bundle_path=bundle, workers=1)
+    c2, _ = gaterunner_run_once(dossier_dir=d_parallel, policy_bundle_path=bundle, workers=4)
+    assert c1 == c2
+    doc = json.loads((d_serial / "gate_results.json").read_text(encoding="utf-8"))
+    assert doc.get("segment_results")
+    assert (d_serial / "gate_results.json").read_bytes() == (d_parallel / "gate_results.json").read_bytes()
+    assert (d_serial / "risk_report.json").read_bytes() == (d_parallel / "risk_report.json").read_bytes()
+
+
+def test_gate_data_provider_loads_each_price_frame_once(tmp_path: Path, monkeypatch) -> None:
+    from quant_eam.gaterunner.run import run_once as gaterunner_run_once
+    from quant_eam.gates import data_provider
+
+    d, bundle = _walk_forward_dossier(tmp_path, monkeypatch, "demo_snap_gate_provider_001")
+    real_query = data_provider.query_prices_df
+    keys: list[tuple[str, str, str]] = []
+
+    def _counting_query(**kw):
+        keys.append((kw["seg"].start, kw["seg"].end, kw["seg"].as_of))
+        return real_query(**kw)
+
+    monkeypatch.setattr(data_provider, "query_prices_df", _counting_query)
+    code, msg = gaterunner_run_once(dossier_dir=d, policy_bundle_path=bundle, workers=4)
+    assert code == GATE_OK, msg
+    doc = json.loads((d / "gate_results.json").read_text(encoding="utf-8"))
+    n_test_segments = sum(1 for sr in doc["segment_results"] if sr["kind"] == "test")
+    # One load per distinct segment (run-level test segment + each walk-forward test segment), not per gate.
+    assert len(keys) == len(set(keys))
+    assert len(keys) <= n_test_segments + 1
+
+    # Shared frames build each derived structure once, also under concurrent gates.
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    provider = data_provider.GateDataProvider()
+    from quant_eam.gates.util import Segment
+
+    seg = Segment(start="2024-01-01", end="2024-01-10", as_of="2024-01-11T00:00:00+08:00")
+    pf = provider.prices(data_root=tmp_path / "data", snapshot_id="demo_snap_gate_provider_001", symbols=["AAA", "BBB"], seg=seg)
+    assert provider.prices(data_root=tmp_path / "data", snapshot_id="demo_snap_gate_provider_001", symbols=["AAA", "BBB"], seg=seg) is pf
+    assert provider.loads == 1
+    builds: list[int] = []
+    lock = threading.Lock()
+
+    def _build() -> object:
+        with lock:
+            builds.append(1)
+        time.sleep(0.05)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        got = list(pool.map(lambda _i: pf.derived("backtest.prepared_prices", _build), range(4)))
+    assert len(builds) == 1 and all(g is got[0] for g in got)
+
+
+def test_gate_result_cache_hits_on_regate_and_force_recompute(tmp_path: Path, monkeypatch) -> None:
+    import shutil
+
+    import quant_eam.gates.registry as gate_registry
+    from quant_eam.gaterunner.run import run_once as gaterunner_run_once
+    from quant_eam.gates.result_cache import GateResultCache
+
+    d, bundle = _walk_forward_dossier(tmp_path, monkeypatch, "demo_snap_gate_cache_001")
+    pristine = tmp_path / "pristine"
+    shutil.copytree(d, pristine)
+    monkeypatch.setenv("EAM_GATE_CACHE", "1")
+
+    def _regate(**kw) -> dict:
+        shutil.rmtree(d)
+        shutil.copytree(pristine, d)
+        code, msg = gaterunner_run_once(dossier_dir=d, policy_bundle_path=bundle, workers=2, **kw)
+        assert code == GATE_OK, msg
+        return json.loads((d / "gate_results.json").read_text(encoding="utf-8"))
+
+    def _strip_cache(doc: dict) -> dict:
+        rows = list(doc["results"]) + [g for sr in doc["segment_results"] for g in sr["gates"]]
+        for r in rows:
+            r.get("evidence", {}).pop("cache", None)
+        return doc
+
+    def _cached_rows(doc: dict) -> list[str]:
+        rows = list(doc["results"]) + [g for sr in doc["segment_results"] for g in sr["gates"]]
+        return [r["gate_id"] for r in rows if r.get("evidence", {}).get("cache", {}).get("hit")]
+
+    first = _regate()
+    assert _cached_rows(first) == []
+    entries = sorted((tmp_path / "artifacts" / "gate_cache").glob("*.json"))
+    assert entries
+
+    ran: list[str] = []
+    real_get = gate_registry.get_gate
+
+    def _counting_get(gate_id: str, gate_version: str):
+        fn = real_get(gate_id, gate_version)
+        return lambda ctx, params: (ran.append(gate_id), fn(ctx, params))[1]
+
+    monkeypatch.setattr(gate_registry, "get_gate", _counting_get)
+    second = _regate()
+    cached = _cached_rows(second)
+    assert "gate_holdout_passfail_v1" in cached and "gate_cost_x2_v1" in cached
+    assert _strip_cache(second) == first
+    # Cacheable gates were served without running; the others (e.g. risk compliance) still ran.
+    assert not set(ran) & set(cached)
+    assert "risk_policy_compliance_v1" in ran
+
+    audited = _regate(force_recompute=True)
+    assert _cached_rows(audited) == []
+    assert audited == first
+
+    # Size bound: least recently used entries are evicted first.
+    import os
+
+    from quant_eam.gates.types import GateResult
+
+    cache = GateResultCache(tmp_path / "small_cache", max_entries=2)
+    gr = GateResult(gate_id="g", gate_version="v1", passed=True, status="pass", metrics={})
+    for i, key in enumerate(["a" * 64, "b" * 64, "c" * 64]):
+        cache.put(key, gr)
+        os.utime(cache.root / f"{key}.json", ns=(i * 10**9, i * 10**9))
+        if i == 1:
+            assert cache.get("a" * 64) == gr
+            os.utime(cache.root / f"{'a' * 64}.json", ns=(5 * 10**9, 5 * 10**9))
+    assert sorted(p.stem[0] for p in cache.root.glob("*.json")) == ["a", "c"]
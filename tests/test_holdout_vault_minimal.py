@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from quant_eam.backtest.vectorbt_adapter_mvp import ADAPTER_ID_VECTORBT_SIGNAL_V1, run_adapter
+from quant_eam.data_lake.demo_ingest import main as demo_ingest_main
+from quant_eam.gates.util import Segment, query_prices_df
+from quant_eam.holdout.vault import (
+    HoldoutInvalid,
+    HoldoutRequest,
+    evaluate_holdout_minimal,
+    evaluate_holdouts_minimal,
+)
+from quant_eam.policies.load import load_yaml
+
+
+def test_minimal_holdout_path_matches_adapter_and_batches_in_parallel(tmp_path: Path) -> None:
+    data_root = tmp_path / "data"
+    data_root.mkdir()
+    snapshot_id = "snap_holdout_minimal_001"
+    assert demo_ingest_main(["--root", str(data_root), "--snapshot-id", snapshot_id]) == 0
+
+    execution_policy = load_yaml(Path("policies/execution_policy_v1.yaml"))
+    cost_policy = load_yaml(Path("policies/cost_policy_v1.yaml"))
+    segs = [
+        Segment(start="2024-01-05", end="2024-01-10", as_of="2024-01-11T00:00:00+08:00"),
+        Segment(start="2024-01-07", end="2024-01-10", as_of="2024-01-11T00:00:00+08:00"),
+    ]
+
+    requests: list[HoldoutRequest] = []
+    for seg in segs:
+        for lag in (1, 2):
+            for symbols in (("AAA",), ("AAA", "BBB")):
+                requests.append(
+                    HoldoutRequest(
+                        data_root=data_root,
+                        snapshot_id=snapshot_id,
+                        dataset_id="ohlcv_1d",
+                        symbols=symbols,
+                        seg=seg,
+                        adapter_id=ADAPTER_ID_VECTORBT_SIGNAL_V1,
+                        lag_bars=lag,
+                        execution_policy=execution_policy,
+                        cost_policy=cost_policy,
+                        params={"min_total_return": 0.0},
+                    )
+                )
+    requests.append(
+        HoldoutRequest(
+            data_root=data_root,
+            snapshot_id=snapshot_id,
+            dataset_id="ohlcv_1d",
+            symbols=("AAA",),
+            seg=segs[0],
+            adapter_id="no_such_adapter",
+            lag_bars=1,
+            execution_policy=execution_policy,
+            cost_policy=cost_policy,
+        )
+    )
+
+    serial = evaluate_holdouts_minimal(requests, workers=1)
+    parallel = evaluate_holdouts_minimal(requests, workers=4)
+    assert isinstance(serial[-1], HoldoutInvalid) and isinstance(parallel[-1], HoldoutInvalid)
+    assert str(serial[-1]) == str(parallel[-1])
+    assert serial[:-1] == parallel[:-1]
+
+    for req, h in zip(requests[:-1], serial[:-1]):
+        # Same numbers as the full reference adapter, restricted to the minimal keys.
+        prices, _ = query_prices_df(data_root=data_root, snapshot_id=snapshot_id, symbols=list(req.symbols), seg=req.seg)
+        bt = run_adapter(
+            adapter_id=req.adapter_id, prices=prices, lag_bars=req.lag_bars, execution_policy=execution_policy, cost_policy=cost_policy
+        )
+        assert set(h.metrics_minimal) == {"total_return", "trade_count", "lag_bars"}
+        assert h.metrics_minimal["total_return"] == float(bt.stats["total_return"])
+        assert h.metrics_minimal["trade_count"] == int(bt.stats["trade_count"])
+        assert h.passed == (float(bt.stats["total_return"]) >= 0.0)
+        single = evaluate_holdout_minimal(
+            data_root=data_root,
+            snapshot_id=snapshot_id,
+            dataset_id="ohlcv_1d",
+            symbols=list(req.symbols),
+            seg=req.seg,
+            adapter_id=req.adapter_id,
+            lag_bars=req.lag_bars,
+            execution_policy=execution_policy,
+            cost_policy=cost_policy,
+            params=req.params,
+        )
+        assert single == h
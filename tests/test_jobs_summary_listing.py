@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from quant_eam.api.app import app
+from quant_eam.jobstore import summary
+from quant_eam.jobstore.store import iter_jsonl
+from quant_eam.jobstore.summary import list_job_summaries, read_last_jsonl_row
+
+
+def _make_job(jr: Path, jid: str, *, spec: dict, events: list[dict], mtime_s: int) -> None:
+    d = jr / jid
+    d.mkdir(parents=True)
+    (d / "job_spec.json").write_text(json.dumps(spec), encoding="utf-8")
+    if events:
+        p = d / "events.jsonl"
+        p.write_text("".join(json.dumps(e) + "\n\n" for e in events), encoding="utf-8")
+        os.utime(p, (mtime_s, mtime_s))
+
+
+def test_job_listing_reads_only_summaries(tmp_path: Path, monkeypatch) -> None:
+    jr = tmp_path / "jobs"
+    monkeypatch.setenv("EAM_JOB_ROOT", str(jr))
+    states = ["BLUEPRINT_SUBMITTED", "WAITING_APPROVAL", "DONE"]
+    for i in range(12):
+        spec = (
+            {"schema_version": "job_spec_v1", "blueprint": {"blueprint_id": f"bp_{i}", "title": f"T{i}"}}
+            if i % 2 == 0
+            else {"schema_version": "idea_spec_v1", "title": f"idea {i}"}
+        )
+        # Long histories with a large padding field: the tail read must not depend on event count.
+        events = [{"event_type": states[k % 3], "pad": "x" * 5000} for k in range(i + 1)] if i != 5 else []
+        _make_job(jr, f"job{i:02d}", spec=spec, events=events, mtime_s=1_700_000_000 + ((i * 7) % 12))
+
+    for i in range(12):
+        p = jr / f"job{i:02d}" / "events.jsonl"
+        if p.is_file():
+            assert read_last_jsonl_row(p, block_size=64) == list(iter_jsonl(p))[-1]
+
+    client = TestClient(app)
+    body = client.get("/jobs").json()
+    assert body["total"] == 12 and body["next_offset"] is None
+    jobs = body["jobs"]
+    assert [j["job_id"] for j in jobs] == [f"job{i:02d}" for i in range(12)]
+    assert jobs[5]["state"] == "unknown"
+    assert jobs[4]["state"] == states[4 % 3] and jobs[4]["blueprint_id"] == "bp_4" and jobs[4]["title"] == "T4"
+    assert jobs[3]["blueprint_id"] == "idea 3" and jobs[3]["schema_version"] == "idea_spec_v1"
+
+    # Pages, state filter and newest-first sort.
+    page = client.get("/jobs", params={"limit": 5, "offset": 5}).json()
+    assert [j["job_id"] for j in page["jobs"]] == [f"job{i:02d}" for i in range(5, 10)] and page["next_offset"] == 10
+    done = client.get("/jobs", params={"state": "DONE"}).json()
+    assert [j["job_id"] for j in done["jobs"]] == [j["job_id"] for j in jobs if j["state"] == "DONE"]
+    by_update = client.get("/jobs", params={"sort": "updated", "limit": 3}).json()["jobs"]
+    assert [j["job_id"] for j in by_update] == [j["job_id"] for j in sorted(jobs, key=lambda j: (j["updated_at"], -int(j["job_id"][3:])), reverse=True)][:3]
+    assert client.get("/jobs", params={"sort": "bogus"}).status_code == 422
+
+    # Appending an event is picked up (stat-keyed cache).
+    with (jr / "job00" / "events.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"event_type": "DONE"}) + "\n")
+    page, total = list_job_summaries(job_root=jr, states=["DONE"], sort="job_id")
+    assert "job00" in [s.job_id for s in page] and total == len(page)
+
+    r = client.get("/ui/jobs", params={"limit": 2, "state": "DONE"})
+    assert r.status_code == 200 and "next &rarr;" in r.text
+
+    # Without a filter only the page is summarized: unreadable jobs (bad spec, corrupt last event) are
+    # skipped inside the page and the total counts job directories.
+    (jr / "job03" / "job_spec.json").write_text("{not json", encoding="utf-8")
+    with (jr / "job04" / "events.jsonl").open("a", encoding="utf-8") as f:
+        f.write('{"event_type": "DO\n')
+    loads: list[str] = []
+    real_load = summary.load_job_summary
+    monkeypatch.setattr(summary, "load_job_summary", lambda jid, **kw: (loads.append(jid), real_load(jid, **kw))[1])
+    page, total = list_job_summaries(job_root=jr, offset=2, limit=4)
+    assert total == 12 and loads == ["job02", "job03", "job04", "job05"]
+    assert [s.job_id for s in page] == ["job02", "job05"]
+    body = client.get("/jobs", params={"offset": 2, "limit": 4}).json()
+    assert body["total"] == 12 and body["next_offset"] == 6
+    # A state filter summarizes every job and counts only readable matches.
+    page, total = list_job_summaries(job_root=jr, states=["unknown", *states])
+    assert total == 10 and "job03" not in [s.job_id for s in page]
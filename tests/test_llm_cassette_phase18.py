@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import itertools
 import json
 from pathlib import Path
 
 import pytest
 
 from quant_eam.agents.harness import run_agent
+from quant_eam.llm import cassette as cassette_mod
+from quant_eam.llm.cassette import (
+    CassetteStore,
+    _tail_jsonl,
+    build_cassette_index,
+    compact_cassette,
+)
 from quant_eam.llm.redaction import sanitize_for_llm
 
 
@@ -103,3 +111,82 @@ def test_phase18_replay_missing_cassette_fails(tmp_path: Path, monkeypatch) -> N
     with pytest.raises(ValueError, match="cassette miss"):
         _ = run_agent(agent_id="intent_agent_v1", input_path=in_path, out_dir=out, provider="mock")
 
+
+
+def _call(prompt_hash: str, n: int) -> dict:
+    return {"prompt_hash": prompt_hash, "request": {"n": n}, "response_json": {"n": n}}
+
+
+def test_cassette_index_first_match_tail_and_external_append(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    store = CassetteStore(path=path)
+    assert store.replay_response("h0") is None
+    assert store.tail_calls(5) == []
+
+    for i in range(200):
+        store.append_call(_call(f"h{i % 50}", i))
+    # First matching line wins (same semantics as the original linear scan).
+    assert store.replay_response("h3") == {"n": 3}
+    assert store.replay_response("missing") is None
+
+    # A writer outside this store appends; the index is extended lazily.
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n" + json.dumps(_call("late", 999), sort_keys=True) + "\n")
+    assert store.replay_response("late") == {"n": 999}
+
+    tail = store.tail_calls(3)
+    assert [d["request"]["n"] for d in tail] == [198, 199, 999]
+    assert len(store.tail_calls(10_000)) == 201
+    assert _tail_jsonl(path, 7, block_size=16) == store.tail_calls(7)
+
+
+def test_cassette_sidecar_index_survives_replacement_and_compaction(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    store = CassetteStore(path=path)
+    for i in range(10):
+        store.append_call(_call(f"h{i % 4}", i))
+    idx_path = build_cassette_index(path)
+    assert idx_path == tmp_path / "cassette.index.jsonl"
+    n_entries = len(idx_path.read_text(encoding="utf-8").splitlines())
+    store.append_call(_call("new", 10))
+    assert len(idx_path.read_text(encoding="utf-8").splitlines()) == n_entries + 1
+    assert store.replay_response("new") == {"n": 10}
+
+    # Rewriting the cassette in place invalidates stale offsets; lookups must still be correct.
+    path.write_text(json.dumps(_call("h1", 42), sort_keys=True) + "\n", encoding="utf-8")
+    assert store.replay_response("h1") == {"n": 42}
+    assert store.replay_response("new") is None
+
+    src = tmp_path / "src.jsonl"
+    src_store = CassetteStore(path=src)
+    for i in range(12):
+        src_store.append_call(_call(f"h{i % 3}", i))
+    dest = tmp_path / "out" / "cassette.jsonl"
+    stats = compact_cassette(src, dest)
+    assert stats == {"lines_in": 12, "lines_out": 3, "dropped": 9}
+    assert (dest.parent / "cassette.index.jsonl").is_file()
+    for h in ("h0", "h1", "h2"):
+        assert CassetteStore(path=dest).replay_response(h) == src_store.replay_response(h)
+
+
+def test_cassette_sidecar_never_skips_external_appends(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    store = CassetteStore(path=path)
+    store.append_call(_call("h1", 1))
+    idx_path = build_cassette_index(path)
+    cassette_mod._jsonl_append(path, _call("h2", 2))  # a writer that bypasses the store
+    cassette_mod._INDEX_CACHE.clear()
+    store.append_call(_call("h3", 3))
+
+    rows = [json.loads(ln) for ln in idx_path.read_text(encoding="utf-8").splitlines()]
+    assert [r["key"] for r in rows] == ["h1", "h2", "h3"]
+    assert all(a["end"] == b["offset"] for a, b in itertools.pairwise(rows))
+    assert rows[-1]["end"] == path.stat().st_size
+    for i in (1, 2, 3):
+        cassette_mod._INDEX_CACHE.clear()
+        assert store.replay_response(f"h{i}") == {"n": i}
+
+    # A sidecar with a gap is rejected and rebuilt rather than trusted.
+    idx_path.write_text("\n".join(json.dumps(r) for r in (rows[0], rows[2])) + "\n", encoding="utf-8")
+    cassette_mod._INDEX_CACHE.clear()
+    assert store.replay_response("h2") == {"n": 2}
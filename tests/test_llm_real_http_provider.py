@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from quant_eam.jobstore.llm_usage import BudgetThresholds
+from quant_eam.llm.providers.real_http import (
+    RealHTTPProvider,
+    aclose_shared_async_clients,
+    close_shared_clients,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        n = int(self.headers.get("content-length", "0"))
+        req = json.loads(self.rfile.read(n).decode("utf-8"))
+        srv = self.server
+        with srv.lock:  # type: ignore[attr-defined]
+            srv.peers.add(self.client_address)  # type: ignore[attr-defined]
+            srv.inflight += 1  # type: ignore[attr-defined]
+            srv.max_inflight = max(srv.max_inflight, srv.inflight)  # type: ignore[attr-defined]
+        time.sleep(float(srv.delay_s))  # type: ignore[attr-defined]
+        with srv.lock:  # type: ignore[attr-defined]
+            srv.inflight -= 1  # type: ignore[attr-defined]
+        body = json.dumps({"json": {"echo": req["user"], "model": req["model"]}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs) -> None:
+        return
+
+
+@pytest.fixture()
+def stub_server(monkeypatch):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    srv.lock = threading.Lock()  # type: ignore[attr-defined]
+    srv.peers = set()  # type: ignore[attr-defined]
+    srv.inflight = 0  # type: ignore[attr-defined]
+    srv.max_inflight = 0  # type: ignore[attr-defined]
+    srv.delay_s = 0.0  # type: ignore[attr-defined]
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    monkeypatch.setenv("EAM_LLM_REAL_BASE_URL", f"http://127.0.0.1:{srv.server_address[1]}")
+    monkeypatch.setenv("EAM_LLM_REAL_MODEL", "stub-model")
+    monkeypatch.setenv("EAM_LLM_REAL_RETRIES", "0")
+    monkeypatch.setenv("EAM_LLM_TEST_ALLOW_LOOPBACK", "1")
+    monkeypatch.delenv("EAM_LLM_DISABLE_NETWORK", raising=False)
+    yield srv
+    close_shared_clients()
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_real_http_reuses_pooled_connection(stub_server) -> None:
+    prov = RealHTTPProvider()
+    for i in range(5):
+        out = prov.complete_json(system="s", user=f"u{i}", schema={"type": "object"})
+        assert out == {"echo": f"u{i}", "model": "stub-model"}
+    # Sequential calls ride one keep-alive connection (one client port).
+    assert len(stub_server.peers) == 1
+
+
+def test_real_http_network_guard_under_pytest(monkeypatch) -> None:
+    monkeypatch.delenv("EAM_LLM_TEST_ALLOW_LOOPBACK", raising=False)
+    monkeypatch.setenv("EAM_LLM_REAL_BASE_URL", "https://llm.example.com")
+    with pytest.raises(ValueError, match="disabled in tests"):
+        RealHTTPProvider().complete_json(system="s", user="u", schema={"type": "object"})
+    # Loopback is only reachable from tests that opt in explicitly; the opt-in never admits remote hosts.
+    monkeypatch.setenv("EAM_LLM_REAL_BASE_URL", "http://127.0.0.1:9")
+    with pytest.raises(ValueError, match="disabled in tests"):
+        RealHTTPProvider().complete_json(system="s", user="u", schema={"type": "object"})
+    monkeypatch.setenv("EAM_LLM_TEST_ALLOW_LOOPBACK", "1")
+    monkeypatch.setenv("EAM_LLM_REAL_BASE_URL", "https://llm.example.com")
+    with pytest.raises(ValueError, match="disabled in tests"):
+        RealHTTPProvider().complete_json(system="s", user="u", schema={"type": "object"})
+
+
+def test_real_http_complete_json_many_parallel_and_budget(stub_server, tmp_path: Path) -> None:
+    stub_server.delay_s = 0.2
+    prov = RealHTTPProvider()
+    calls = [{"system": "s", "user": f"u{i}", "schema": {"type": "object"}} for i in range(4)]
+
+    t0 = time.perf_counter()
+    res = asyncio.run(prov.complete_json_many(calls, max_concurrency=4))
+    elapsed = time.perf_counter() - t0
+    assert [r.json for r in res] == [{"echo": f"u{i}", "model": "stub-model"} for i in range(4)]
+    assert all(r.ok for r in res)
+    assert stub_server.max_inflight > 1
+    assert elapsed < 0.2 * 4
+
+    # Job budget: only the first two calls are admitted (input order), the rest are blocked pre-call.
+    thresholds = BudgetThresholds(
+        policy_id="llm_budget_test",
+        max_calls_per_job=2,
+        max_prompt_chars_per_job=10_000,
+        max_response_chars_per_job=10_000,
+        max_wall_seconds_per_job=60,
+    )
+    stub_server.delay_s = 0.0
+    res = asyncio.run(
+        prov.complete_json_many(calls, job_id="job000000001", job_root=tmp_path / "jobs", thresholds=thresholds)
+    )
+    assert [r.ok for r in res] == [True, True, False, False]
+    assert [r.stop_reason for r in res] == [None, None, "exceeded_max_calls_per_job", "exceeded_max_calls_per_job"]
+
+
+def test_real_http_batches_share_async_client_and_cap_agent_run(stub_server, tmp_path: Path) -> None:
+    prov = RealHTTPProvider()
+    calls = [{"system": "s", "user": f"u{i}", "schema": {"type": "object"}} for i in range(3)]
+
+    async def _two_batches() -> list:
+        try:
+            a = await prov.complete_json_many(calls, max_concurrency=1)
+            b = await prov.complete_json_many(calls, max_concurrency=1)
+            return a + b
+        finally:
+            await aclose_shared_async_clients()
+
+    res = asyncio.run(_two_batches())
+    assert all(r.ok for r in res)
+    # Both batches ride one keep-alive connection of the loop's shared async client.
+    assert len(stub_server.peers) == 1
+    # Response chars use the canonical usage serializer (compact separators).
+    assert res[0].response_chars == len('{"echo":"u0","model":"stub-model"}')
+
+    thresholds = BudgetThresholds(
+        policy_id="llm_budget_test",
+        max_calls_per_job=10,
+        max_prompt_chars_per_job=10_000,
+        max_response_chars_per_job=10_000,
+        max_wall_seconds_per_job=60,
+        max_calls_per_agent_run=2,
+    )
+    res = asyncio.run(
+        prov.complete_json_many(calls, job_id="job000000002", job_root=tmp_path / "jobs", thresholds=thresholds)
+    )
+    assert [r.ok for r in res] == [True, True, False]
+    assert res[2].stop_reason == "exceeded_max_calls_per_agent_run"
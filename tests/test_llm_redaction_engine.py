@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from quant_eam.llm.redaction import (
+    RootReplacer,
+    root_replacer,
+    sanitize_for_llm,
+    sanitize_for_llm_reference,
+)
+
+ENVS = [
+    {},
+    {"EAM_DATA_ROOT": "/srv/eam/data", "EAM_ARTIFACT_ROOT": "/srv/eam/artifacts", "EAM_JOB_ROOT": "/srv/eam/artifacts/jobs"},
+    {"EAM_DATA_ROOT": "/artifacts", "EAM_ARTIFACT_ROOT": "/data"},
+    {"EAM_DATA_ROOT": "/x/ab", "EAM_ARTIFACT_ROOT": "/x/abc", "EAM_JOB_ROOT": "bc/d"},
+    {"EAM_DATA_ROOT": "/mnt/d", "EAM_ARTIFACT_ROOT": "/mnt/a", "EAM_JOB_ROOT": "/mnt/j"},
+]
+KEYS = ["a", "b", "title", "holdout_x", "Vault", "api_key", "AuthHeader", "path", "rows", "x_token_y", "cfg"]
+FRAGMENTS = ["/data", "/artifacts", "/srv/eam/data", "/srv/eam/artifacts/jobs/j1", "/x/abc/d", "bc/d", "/mnt/d/a", "/mnt/j", "<EAM", "plain", " "]
+
+
+def _rand_str(rng: random.Random) -> str:
+    return "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 6)))
+
+
+def _rand_obj(rng: random.Random, depth: int) -> object:
+    r = rng.random()
+    if depth < 6 and r < 0.25:
+        d: dict[object, object] = {rng.choice(KEYS): _rand_obj(rng, depth + 1) for _ in range(rng.randint(0, 8))}
+        if rng.random() < 0.2:
+            d[rng.randint(0, 3)] = _rand_obj(rng, depth + 1)
+        return d
+    if depth < 6 and r < 0.45:
+        return [_rand_obj(rng, depth + 1) for _ in range(rng.randint(0, 8))]
+    return rng.choice(
+        [
+            lambda: _rand_str(rng),
+            lambda: Path("/data") / _rand_str(rng).strip("/ "),
+            lambda: (1, _rand_str(rng)),
+            lambda: rng.randint(-5, 5),
+            lambda: rng.random(),
+            lambda: rng.random() < 0.5,
+            lambda: None,
+        ]
+    )()
+
+
+@pytest.mark.parametrize("env", ENVS)
+def test_compiled_redaction_matches_reference(monkeypatch, env: dict[str, str]) -> None:
+    for name in ("EAM_DATA_ROOT", "EAM_ARTIFACT_ROOT", "EAM_JOB_ROOT"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    rng = random.Random(len(env))
+    limits = {"max_depth": 4, "max_str_chars": 40, "max_list_items": 5, "max_dict_items": 6}
+    for _ in range(300):
+        obj = _rand_obj(rng, 0)
+        for kw in ({}, limits):
+            got, got_summary = sanitize_for_llm(obj, **kw)
+            want, want_summary = sanitize_for_llm_reference(obj, **kw)
+            assert got == want and got_summary == want_summary
+
+
+def test_root_replacer_single_pass_only_for_independent_roots(monkeypatch) -> None:
+    for name in ("EAM_DATA_ROOT", "EAM_ARTIFACT_ROOT", "EAM_JOB_ROOT"):
+        monkeypatch.delenv(name, raising=False)
+    assert root_replacer().single_pass
+    assert root_replacer()("/data/a:/artifacts/b:/data") == ("<EAM_DATA_ROOT>/a:<EAM_ARTIFACT_ROOT>/b:<EAM_DATA_ROOT>", 2)
+
+    # A job root under the artifact root: the artifact pass runs first and wins.
+    nested = RootReplacer((("/a", "<EAM_ARTIFACT_ROOT>"), ("/a/jobs", "<EAM_JOB_ROOT>")))
+    assert not nested.single_pass
+    assert nested("/a/jobs/1") == ("<EAM_ARTIFACT_ROOT>/jobs/1", 1)
+
+
+def test_sanitize_deep_payload_is_walked_iteratively() -> None:
+    obj: object = "/data/leaf"
+    for _ in range(300):
+        obj = {"k": [obj]}
+    out, summary = sanitize_for_llm(obj, max_depth=1_000)
+    assert (out, summary) == sanitize_for_llm_reference(obj, max_depth=1_000)
+    for _ in range(300):
+        out = out["k"][0]
+    assert out == "<EAM_DATA_ROOT>/leaf" and summary.replaced_paths == 1
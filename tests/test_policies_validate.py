@@ -158,3 +158,55 @@ def test_validate_directory_fails_if_any_bad_present(tmp_path: Path) -> None:
     (pol_dir / "asof_latency_policy_v1.yaml").write_text(bad.read_text(encoding="utf-8"), encoding="utf-8")
 
     assert validate.main([str(pol_dir)]) == validate.EXIT_INVALID
+
+
+def test_policy_store_parses_once_per_file_version(tmp_path: Path) -> None:
+    import copy
+    import json
+    import os
+
+    import pytest
+    import yaml
+
+    from quant_eam.policies.load import load_yaml
+    from quant_eam.policies.store import PolicyStore
+
+    store = PolicyStore()
+    pdir = tmp_path / "policies"
+    pdir.mkdir()
+    p = pdir / "cost_policy_v1.yaml"
+    p.write_text("policy_id: cost_v1\npolicy_version: v1\nparams:\n  bps: [1, 2]\n", encoding="utf-8")
+    (pdir / "gate_suite_v1.yaml").write_text("policy_id: gates_v1\n", encoding="utf-8")
+
+    view = store.view(p)
+    assert view == yaml.safe_load(p.read_text(encoding="utf-8"))
+    assert store.view(p) is view and store.stats()["parses"] == 1
+    assert isinstance(view, dict) and isinstance(view["params"]["bps"], list)
+    assert json.loads(json.dumps(view)) == view
+    with pytest.raises(TypeError):
+        view["params"]["bps"].append(3)
+    with pytest.raises(TypeError):
+        view["policy_id"] = "x"
+
+    # load() and deepcopy give independent mutable documents.
+    doc = store.load(p)
+    doc["params"]["bps"].append(3)
+    copy.deepcopy(view)["policy_id"] = "y"
+    assert store.view(p)["params"]["bps"] == [1, 2] and store.view(p)["policy_id"] == "cost_v1"
+
+    assert store.index(pdir) == {"cost_v1": p, "gates_v1": pdir / "gate_suite_v1.yaml"}
+
+    # Editing the file (new fingerprint) or adding a file (new dir mtime) is picked up.
+    st = p.stat()
+    p.write_text("policy_id: cost_v2\npolicy_version: v1\n", encoding="utf-8")
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert store.view(p)["policy_id"] == "cost_v2" and store.stats()["parses"] == 3
+    dst = pdir.stat()
+    (pdir / "risk_policy_v1.yaml").write_text("policy_id: risk_v1\n", encoding="utf-8")
+    os.utime(pdir, ns=(dst.st_atime_ns, dst.st_mtime_ns + 1_000_000_000))
+    assert set(store.index(pdir)) == {"cost_v2", "gates_v1", "risk_v1"}
+
+    # The module-level loader returns mutable documents as before.
+    bundle = load_yaml(_repo_root() / "policies" / "policy_bundle_v1.yaml")
+    bundle["scratch"] = 1
+    assert "scratch" not in load_yaml(_repo_root() / "policies" / "policy_bundle_v1.yaml")
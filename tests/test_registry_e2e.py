@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import json
 from pathlib import Path
 
@@ -163,3 +164,97 @@ def test_append_only_semantics_triallog_and_card_events(tmp_path: Path, monkeypa
     assert h1["card_v1.json"] == h2["card_v1.json"]
     assert h1.get("events.jsonl") != h2.get("events.jsonl")
 
+
+
+def test_triallog_offset_index_lookup_and_pagination(tmp_path: Path, monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from quant_eam.api.app import app
+    from quant_eam.registry.triallog import (
+        _append_trial,
+        get_trial,
+        list_trials_page,
+        rebuild_trial_index,
+    )
+
+    reg_root = tmp_path / "registry"
+    monkeypatch.setenv("EAM_REGISTRY_ROOT", str(reg_root))
+    paths = registry_paths(reg_root)
+    for i in range(30):
+        _append_trial(paths, {"schema_version": "trial_event_v1", "run_id": f"run{i % 25:04d}", "n": i})
+    assert paths.trial_index.is_file()
+    assert len(_jsonl_lines(paths.trial_index)) == 30
+
+    # First recorded event wins (idempotency semantics of the original scan).
+    assert get_trial(registry_root=reg_root, run_id="run0003")["n"] == 3
+    assert get_trial(registry_root=reg_root, run_id="missing") is None
+
+    # External appends (incl. a malformed line) are picked up by extending the index.
+    with paths.trial_log.open("a", encoding="utf-8") as f:
+        f.write("not json\n" + json.dumps({"run_id": "late", "n": 99}) + "\n")
+    assert get_trial(registry_root=reg_root, run_id="late")["n"] == 99
+    # Reads keep the extended index in memory; only writers touch the sidecar.
+    assert len(_jsonl_lines(paths.trial_index)) == 30
+
+    page, total = list_trials_page(registry_root=reg_root, limit=3, offset=1)
+    assert total == 31
+    assert [d["n"] for d in page] == [29, 28, 27]
+    r = TestClient(app).get("/registry/trials", params={"limit": 2, "offset": 30})
+    assert r.status_code == 200
+    assert r.json()["total"] == 31 and [d["n"] for d in r.json()["trials"]] == [0]
+
+    # Sidecar is rebuildable from the log; a stale sidecar after a log rewrite is detected.
+    paths.trial_index.unlink()
+    assert rebuild_trial_index(registry_root=reg_root) == 31
+    paths.trial_log.write_text(json.dumps({"run_id": "only", "n": 1}) + "\n", encoding="utf-8")
+    assert get_trial(registry_root=reg_root, run_id="run0003") is None
+    assert get_trial(registry_root=reg_root, run_id="only")["n"] == 1
+
+
+def test_triallog_index_rejects_gaps_and_rechecks_misses(tmp_path: Path) -> None:
+    from quant_eam.registry import triallog
+    from quant_eam.registry.triallog import _append_trial, _find_existing_trial
+
+    reg_root = tmp_path / "registry"
+    paths = registry_paths(reg_root)
+    for i in range(3):
+        _append_trial(paths, {"schema_version": "trial_event_v1", "run_id": f"r{i}", "n": i})
+    rows = [json.loads(ln) for ln in _jsonl_lines(paths.trial_index)]
+    assert [r["key"] for r in rows] == ["r0", "r1", "r2"]
+
+    # Drop the middle row: the gap must be detected instead of hiding r1 (which would let
+    # record_trial(if_exists="noop") append a duplicate).
+    paths.trial_index.write_text(json.dumps(rows[0]) + "\n" + json.dumps(rows[2]) + "\n", encoding="utf-8")
+    triallog._INDEX_CACHE.clear()
+    assert _find_existing_trial(paths, "r1")["n"] == 1
+
+    # A stale in-memory index (log appended behind its back) is rebuilt on a miss.
+    with paths.trial_log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"run_id": "ext", "n": 9}) + "\n")
+    idx = triallog._INDEX_CACHE[paths.trial_log.as_posix()]
+    idx.mtime_ns, idx.size = paths.trial_log.stat().st_mtime_ns, paths.trial_log.stat().st_size
+    assert _find_existing_trial(paths, "ext")["n"] == 9
+
+    # A writer that finds the log ahead of its index rescans before adding its own row.
+    _append_trial(paths, {"schema_version": "trial_event_v1", "run_id": "r3", "n": 3})
+    rows = [json.loads(ln) for ln in _jsonl_lines(paths.trial_index)]
+    assert [r["key"] for r in rows] == ["r0", "r1", "r2", "ext", "r3"]
+    assert rows[0]["offset"] == 0 and all(a["end"] == b["offset"] for a, b in itertools.pairwise(rows))
+    assert rows[-1]["end"] == paths.trial_log.stat().st_size
+
+
+def test_registry_trials_api_does_not_write_index(tmp_path: Path, monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from quant_eam.api.app import app
+
+    reg_root = tmp_path / "registry"
+    reg_root.mkdir()
+    (reg_root / "trial_log.jsonl").write_text(
+        "".join(json.dumps({"run_id": f"r{i}", "n": i}) + "\n" for i in range(5)), encoding="utf-8"
+    )
+    monkeypatch.setenv("EAM_REGISTRY_ROOT", str(reg_root))
+    r = TestClient(app).get("/registry/trials", params={"limit": 2})
+    assert r.status_code == 200
+    assert [d["n"] for d in r.json()["trials"]] == [4, 3]
+    assert not (reg_root / "trial_log.index.jsonl").exists()
@@ -78,3 +78,24 @@ def test_risk_gate_fails_on_max_turnover_violation(tmp_path: Path, monkeypatch)
     assert float(doc["max_observed"]["max_turnover_observed"]) > 0.5
     assert int(doc["violation_count_by_rule"]["max_turnover"]) > 0
 
+
+def test_risk_evidence_parsing_on_malformed_rows(tmp_path: Path) -> None:
+    from quant_eam.gates import risk_policy_compliance as rpc
+
+    # csv.DictReader semantics: extra fields go to the None key and short rows leave missing columns as
+    # None; neither shifts values between columns.
+    to_p = tmp_path / "turnover.csv"
+    to_p.write_text(
+        "dt,turnover\n2024-01-02,0.5\n2024-01-03,0.25,EXTRA,MORE\n2024-01-04\n2024-01-05T00:00:00,bad\n,0.9\n2024-01-08, \n",
+        encoding="utf-8",
+    )
+    pos_p = tmp_path / "positions.csv"
+    pos_p.write_text(
+        "dt,symbol,qty\n2024-01-02,AAA,5\n2024-01-02,BBB,3,-7\n2024-01-03,AAA\n2024-01-03,BBB,x\n,AAA,4\n2024-01-04,AAA,-1\n",
+        encoding="utf-8",
+    )
+    assert rpc._load_turnover_series(to_p) == (
+        ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08"],
+        [0.5, 0.25, None, None, None],
+    )
+    assert rpc._load_positions_count_series(pos_p) == (["2024-01-02", "2024-01-04"], [2, 1])
@@ -211,3 +211,56 @@ def test_phase20_strategy_spec_fixtures_guard_pass(tmp_path: Path, monkeypatch)
         _ = run_agent(agent_id="strategy_spec_agent_v1", input_path=in_path, out_dir=out_dir, provider="mock")
         guard = json.loads((out_dir / "output_guard_report.json").read_text(encoding="utf-8"))
         assert guard.get("passed") is True
+
+
+def test_scenario_batch_matches_per_scenario_run_adapter() -> None:
+    import math
+
+    from quant_eam.backtest.scenario_batch import StressScenario, run_adapter_scenarios
+
+    rows = []
+    for k, sym in enumerate(["AAA", "BBB", "CCC"]):
+        for i in range(40):
+            if sym == "CCC" and i % 7 == 3:
+                continue  # ragged dt grid
+            close = 10.0 + k + 3.0 * math.sin(i / (3.0 + k))
+            rows.append({"dt": f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}", "symbol": sym, "open": close * 1.001, "close": close})
+    prices = pd.DataFrame(rows)
+    cost = {"params": {"commission_bps": 5, "slippage_bps": 3}}
+    scenarios = [StressScenario(lag_bars=1), StressScenario(lag_bars=2), StressScenario(lag_bars=1, cost_multiplier=2.0), StressScenario(lag_bars=3, cost_multiplier=0.0)]
+
+    for dsl in (None, _ma_crossover_dsl(fast=2, slow=5), _rsi_mr_dsl(n=4, entry_th=40.0, exit_th=60.0)):
+        for ep in ({"params": {"order_timing": "next_open", "fill_price": "open"}}, {"params": {"order_timing": "close"}}):
+            batch = run_adapter_scenarios(
+                adapter_id="vectorbt_signal_v1", prices=prices, scenarios=scenarios, execution_policy=ep, cost_policy=cost, signal_dsl=dsl
+            )
+            for sc, got in zip(scenarios, batch):
+                scaled = {"params": {k: float(v) * sc.cost_multiplier for k, v in cost["params"].items()}}
+                ref = run_adapter(
+                    adapter_id="vectorbt_signal_v1", prices=prices, lag_bars=sc.lag_bars, execution_policy=ep, cost_policy=scaled, signal_dsl=dsl
+                ).stats
+                for key in ("strategy_id", "lag_bars", "total_return", "max_drawdown", "sharpe", "trade_count", "execution", "cost"):
+                    assert got[key] == ref[key], (dsl is not None, ep, sc, key)
+
+
+def test_stress_gates_report_adapter_errors_before_price_errors(tmp_path: Path, monkeypatch) -> None:
+    from quant_eam.backtest.vectorbt_adapter_mvp import BacktestInvalid
+    from quant_eam.gates import stress_cost, stress_lag
+    from quant_eam.gates.data_provider import PriceFrame
+    from quant_eam.gates.types import GateContext
+
+    # Invalid in two ways: unknown adapter and prices without the required columns.
+    bad = pd.DataFrame({"dt": ["2024-01-02"], "symbol": ["AAA"]})
+    seg = {"start": "2024-01-01", "end": "2024-01-31", "as_of": "2024-02-01"}
+    ctx = GateContext(
+        dossier_dir=tmp_path, policies_dir=tmp_path, policy_bundle={}, execution_policy={}, cost_policy={},
+        asof_latency_policy={}, risk_policy=None, gate_suite={},
+        runspec={"adapter": {"adapter_id": "bogus_v1"}, "segments": {"test": seg}, "data_snapshot_id": "s"},
+        dossier_manifest={}, config_snapshot={}, metrics={},
+    )
+    with pytest.raises(BacktestInvalid) as ref:
+        run_adapter(adapter_id="bogus_v1", prices=bad, lag_bars=1, execution_policy={}, cost_policy={})
+    for mod, fn in ((stress_cost, stress_cost.run_gate_cost_x2_v1), (stress_lag, stress_lag.run_gate_delay_plus_1bar_v1)):
+        monkeypatch.setattr(mod, "load_prices", lambda *_a, **_k: PriceFrame(bad, {"rows_before_asof": 1, "rows": 1}))
+        gr = fn(ctx, {})
+        assert not gr.passed and gr.metrics["error"] == str(ref.value)
@@ -166,3 +166,96 @@ def test_phase17_data_snapshot_integrity_gate_detects_tamper(tmp_path: Path, mon
     metrics = r[0].get("metrics") if isinstance(r[0].get("metrics"), dict) else {}
     assert any("sha256 mismatch" in str(e) for e in (metrics.get("errors") or []))
 
+
+def test_snapshot_integrity_hash_cache_and_chunk_localization(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import quant_eam.gates.data_snapshot_integrity as integrity
+    from quant_eam.core.hashing import build_chunk_manifest, verified_hash_cache
+    from quant_eam.data_lake.demo_ingest import main as demo_ingest_main
+    from quant_eam.gates.types import GateContext
+
+    data_root = tmp_path / "data"
+    monkeypatch.setenv("EAM_DATA_ROOT", str(data_root))
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    snap = "snap_gate_chunks_001"
+    assert demo_ingest_main(["--root", str(data_root), "--snapshot-id", snap]) == 0
+    csv_path = data_root / "lake" / snap / "ohlcv_1d.csv"
+    chunks_path = data_root / "lake" / snap / "ohlcv_1d.chunks.json"
+    assert json.loads(chunks_path.read_text(encoding="utf-8"))["sha256"] == json.loads(
+        (data_root / "lake" / snap / "manifest.json").read_text(encoding="utf-8")
+    )["datasets"][0]["sha256"]
+
+    empty: dict = {}
+    ctx = GateContext(
+        dossier_dir=tmp_path, policies_dir=tmp_path, policy_bundle=empty, execution_policy=empty, cost_policy=empty,
+        asof_latency_policy=empty, risk_policy=None, gate_suite=empty, runspec={"data_snapshot_id": snap},
+        dossier_manifest=empty, config_snapshot=empty, metrics=empty,
+    )
+    reads: list[Path] = []
+    chunk_checks: list[Path] = []
+    real_full = integrity.sha256_file_uncached
+    real_chunks = integrity.verify_chunk_manifest
+    monkeypatch.setattr(integrity, "sha256_file_uncached", lambda p: (reads.append(Path(p)), real_full(p))[1])
+    monkeypatch.setattr(
+        integrity, "verify_chunk_manifest", lambda p, cm: (chunk_checks.append(Path(p)), real_chunks(p, cm))[1]
+    )
+
+    # Default: every run verifies the chunk manifest anchored by the snapshot manifest (in parallel).
+    assert integrity.run_data_snapshot_integrity_v1(ctx, {}).passed
+    assert integrity.run_data_snapshot_integrity_v1(ctx, {}).passed
+    assert chunk_checks == [csv_path, csv_path] and reads == []
+
+    # full_verify always re-reads the whole file, whatever the cache flag says.
+    assert integrity.run_data_snapshot_integrity_v1(ctx, {"full_verify": True, "trust_stat_cache": True}).passed
+    assert reads == [csv_path] and len(chunk_checks) == 2
+
+    # Explicit opt-in: a verified digest is reused for the same fingerprint, up to max_uses times.
+    limits = {"trust_stat_cache": True, "stat_cache_max_uses": 2}
+    assert integrity.run_data_snapshot_integrity_v1(ctx, limits).passed
+    assert integrity.run_data_snapshot_integrity_v1(ctx, limits).passed
+    assert len(chunk_checks) == 2
+    assert integrity.run_data_snapshot_integrity_v1(ctx, limits).passed
+    assert len(chunk_checks) == 3
+    # ... and never past max_age_s.
+    assert integrity.run_data_snapshot_integrity_v1(ctx, {"trust_stat_cache": True, "stat_cache_max_age_s": 0}).passed
+    assert len(chunk_checks) == 4 and len(reads) == 1
+
+    # Same-size corruption under the anchored chunk manifest: the parallel check localizes it.
+    original = csv_path.read_bytes()
+    st = os.stat(csv_path)
+    bad = bytearray(original)
+    bad[600] = ord("9") if bad[600] != ord("9") else ord("8")
+    csv_path.write_bytes(bytes(bad))
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    gr = integrity.run_data_snapshot_integrity_v1(ctx, {})
+    assert not gr.passed
+    assert gr.metrics["corrupt_chunks"] == [{"index": 0, "offset": 0, "length": len(original)}]
+    assert gr.metrics["actual_sha256"] != gr.metrics["manifest_sha256"]
+    csv_path.write_bytes(original)
+
+    # Same-size corruption with size/mtime restored (and a matching forged chunk fingerprint) is still
+    # caught by default; the chunk manifest localizes it.
+    cm = build_chunk_manifest(csv_path, chunk_bytes=256)
+    chunks_path.write_text(json.dumps(cm), encoding="utf-8")
+    st = os.stat(csv_path)
+    bad = bytearray(original)
+    bad[600] = ord("9") if bad[600] != ord("9") else ord("8")
+    csv_path.write_bytes(bytes(bad))
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    cm["fingerprint"] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "inode": os.stat(csv_path).st_ino}
+    chunks_path.write_text(json.dumps(cm), encoding="utf-8")
+    gr = integrity.run_data_snapshot_integrity_v1(ctx, {})
+    assert not gr.passed
+    assert gr.metrics["corrupt_chunks"] == [{"index": 2, "offset": 512, "length": 256}]
+    assert any("sha256 mismatch" in e for e in gr.metrics["errors"])
+
+    # A chunk sidecar forged together with the data cannot make the gate pass either.
+    forged = build_chunk_manifest(csv_path, chunk_bytes=256)
+    forged["sha256"] = cm["sha256"]
+    chunks_path.write_text(json.dumps(forged), encoding="utf-8")
+    verified_hash_cache().clear()
+    assert not integrity.run_data_snapshot_integrity_v1(ctx, {}).passed
+    monkeypatch.setenv("EAM_SNAPSHOT_FULL_VERIFY", "1")
+    gr = integrity.run_data_snapshot_integrity_v1(ctx, {"trust_stat_cache": True})
+    assert not gr.passed and reads[-1] == csv_path
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from quant_eam.api.app import app
+from quant_eam.compiler.compile import EXIT_OK as COMPILER_OK
+from quant_eam.compiler.compile import main as compiler_main
+from quant_eam.core.timing import (
+    collect_spans,
+    incr,
+    reset_timings,
+    set_timings_enabled,
+    span,
+    timed,
+    timing_snapshot,
+)
+from quant_eam.data_lake.demo_ingest import main as demo_ingest_main
+from quant_eam.gaterunner.run import main as gaterunner_main
+from quant_eam.runner.run import EXIT_OK as RUNNER_OK
+from quant_eam.runner.run import main as runner_main
+
+
+@pytest.fixture
+def timings_on():
+    set_timings_enabled(True)
+    reset_timings()
+    yield
+    set_timings_enabled(None)
+    reset_timings()
+
+
+def test_spans_are_noops_when_disabled() -> None:
+    set_timings_enabled(False)
+    try:
+        reset_timings()
+
+        @timed("t.fn")
+        def fn(x: int) -> int:
+            return x + 1
+
+        with span("t.block"), collect_spans() as col:
+            assert fn(1) == 2
+            incr("t.count")
+        assert col is None and timing_snapshot()["spans"] == {} and timing_snapshot()["counters"] == {}
+    finally:
+        set_timings_enabled(None)
+
+
+def test_runner_gates_and_metrics_endpoint(tmp_path: Path, monkeypatch, timings_on) -> None:
+    data_root = tmp_path / "data"
+    art_root = tmp_path / "artifacts"
+    data_root.mkdir()
+    art_root.mkdir()
+    monkeypatch.setenv("EAM_DATA_ROOT", str(data_root))
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art_root))
+    monkeypatch.setenv("EAM_DOSSIER_TIMINGS", "1")
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    snap = "demo_snap_timing_001"
+    assert demo_ingest_main(["--root", str(data_root), "--snapshot-id", snap]) == 0
+    repo = Path(__file__).resolve().parents[1]
+    bundle = repo / "policies" / "policy_bundle_v1.yaml"
+    out = tmp_path / "runspec.json"
+    bp = repo / "contracts" / "examples" / "blueprint_buyhold_demo_ok.json"
+    assert compiler_main(["--blueprint", str(bp), "--snapshot-id", snap, "--out", str(out), "--policy-bundle", str(bundle)]) == COMPILER_OK
+    assert runner_main(["--runspec", str(out), "--policy-bundle", str(bundle)]) == RUNNER_OK
+
+    d = next(p for p in (art_root / "dossiers").iterdir() if p.is_dir())
+    timings = json.loads((d / "timings.json").read_text(encoding="utf-8"))
+    assert timings["schema_version"] == "timings_v1" and timings["run_id"] == d.name
+    names = {s["name"] for s in timings["spans"]}
+    assert {"runner.load_policies", "runner.segment", "datacatalog.query_dataset", "dossier.write"} <= names
+    assert all(s["parent"] == "runner.run_once" for s in timings["spans"] if s["name"] == "runner.segment")
+    # timings.json sits next to the immutable dossier files; it is not part of the manifest.
+    assert "timings.json" not in (d / "dossier_manifest.json").read_text(encoding="utf-8")
+
+    assert gaterunner_main(["--dossier", str(d), "--policy-bundle", str(bundle)]) in (0, 2)
+
+    r = TestClient(app).get("/metrics")
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/plain")
+    body = r.text
+    assert "eam_timings_enabled 1" in body
+    for name in ("runner.run_once", "gaterunner.run_once"):
+        assert f'eam_span_seconds_count{{span="{name}"}} 1' in body
+    assert 'eam_span_seconds_count{span="datacatalog.query_dataset"}' in body
+    assert 'eam_span_seconds_bucket{span="runner.run_once",le="+Inf"} 1' in body
+    assert 'eam_events_total{name="datacatalog.rows_returned"}' in body
+    assert any(line.startswith('eam_span_seconds_count{span="gate.') for line in body.splitlines())
+    assert 'eam_span_seconds_count{span="http GET /metrics"}' not in body  # recorded after the response body is built
+    assert 'eam_span_seconds_count{span="http GET /metrics"} 1' in TestClient(app).get("/metrics").text
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from quant_eam.api import doc_cache
+from quant_eam.api.ui_routes import _extract_playbook_bullets, _extract_whole_view_constraints
+
+DOC_V1 = """# Whole View
+
+## 1. Hard Constraints
+1) Policies are read-only
+- no inline overrides
+2) Holdout is sealed
+
+## 2. Next
+### 0.1 Task rules
+- small diffs
+- evidence first
+"""
+
+
+def test_extractor_outputs_are_cached_per_file_version(tmp_path: Path, monkeypatch) -> None:
+    doc_cache.clear_doc_cache()
+    p = tmp_path / "Whole View Framework.md"
+    p.write_text(DOC_V1, encoding="utf-8")
+
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def _counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+
+    rows = _extract_whole_view_constraints(p)
+    assert [r["check_id"] for r in rows] == ["WV-1", "WV-2"]
+    assert rows[0]["detail"] == "no inline overrides"
+    assert _extract_playbook_bullets(p, "0.1") == ["small diffs", "evidence first"]
+    assert len(reads) == 1  # one parse serves every extractor
+
+    # Callers may decorate returned rows; the cached value is not affected.
+    rows[0]["status"] = "pass"
+    again = _extract_whole_view_constraints(p)
+    assert "status" not in again[0]
+    assert len(reads) == 1
+
+    # Any edit (new mtime/size) invalidates both the parsed document and the extractor outputs.
+    p.write_text(DOC_V1.replace("2) Holdout is sealed", "2) Holdout is sealed\n3) Gates arbitrate"), encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert [r["check_id"] for r in _extract_whole_view_constraints(p)] == ["WV-1", "WV-2", "WV-3"]
+    assert len(reads) == 2
+    assert _extract_whole_view_constraints(tmp_path / "missing.md") == []
@@ -420,3 +420,118 @@ def test_holdout_leak_not_rendered(tmp_path: Path, monkeypatch) -> None:
     # UI must not render holdout curve/trades artifacts.
     assert "holdout_curve" not in r.text
     assert "holdout_trades" not in r.text
+
+
+def test_curve_endpoint_downsamples_on_request(tmp_path: Path, monkeypatch) -> None:
+    import numpy as np
+
+    art_root = tmp_path / "artifacts"
+    d = art_root / "dossiers" / "run_curve_ds_001"
+    d.mkdir(parents=True)
+    monkeypatch.setenv("EAM_ARTIFACT_ROOT", str(art_root))
+    eq = np.cumprod(1.0 + np.random.default_rng(0).normal(0.0, 0.01, size=2000))
+    eq[1234] = eq[1233] * 0.5  # a spike both methods must keep
+    lines = ["dt,equity"] + [f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}+{i // 3600:02d}:00,{v!r}" for i, v in enumerate(eq.tolist())]
+    (d / "curve.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    client = TestClient(app)
+
+    # Default: every row, strings, no downsampling header.
+    r = client.get("/runs/run_curve_ds_001/curve")
+    assert r.status_code == 200
+    assert len(r.json()["rows"]) == 2000 and isinstance(r.json()["rows"][0]["equity"], str)
+    assert "x-original-row-count" not in r.headers
+
+    for method in ("lttb", "minmax"):
+        r = client.get("/runs/run_curve_ds_001/curve", params={"max_points": 200, "method": method})
+        assert r.status_code == 200
+        assert r.headers["x-original-row-count"] == "2000"
+        body = r.json()
+        rows = body["rows"]
+        assert 3 <= len(rows) <= 200
+        assert body["downsample"] == {"method": method, "max_points": 200, "original_rows": 2000, "returned_rows": len(rows)}
+        assert rows[0]["dt"] == lines[1].split(",")[0] and rows[-1]["dt"] == lines[-1].split(",")[0]
+        assert all(isinstance(x["equity"], float) for x in rows)
+        assert float(eq[1234]) in [x["equity"] for x in rows]
+        pos = {ln.split(",")[0]: i for i, ln in enumerate(lines[1:])}
+        kept = [pos[x["dt"]] for x in rows]
+        assert kept == sorted(set(kept))
+
+    assert client.get("/runs/run_curve_ds_001/curve", params={"max_points": 50000}).json()["downsample"]["returned_rows"] == 2000
+    assert client.get("/runs/run_curve_ds_001/curve", params={"max_points": 200, "method": "bogus"}).status_code == 422
+    assert client.get("/runs/run_curve_ds_001/curve", params={"max_points": 2}).status_code == 422
+
+
+def test_downsample_indices_respect_max_points_at_the_boundary() -> None:
+    import numpy as np
+
+    from quant_eam.api.curve_downsample import MIN_POINTS, downsample_indices
+
+    rng = np.random.default_rng(1)
+    for n in range(MIN_POINTS + 1, 24):
+        y = rng.normal(size=n)
+        x = np.arange(n, dtype=float)
+        for max_points in range(MIN_POINTS, n + 2):
+            for method in ("lttb", "minmax"):
+                idx = downsample_indices(x, y, max_points=max_points, method=method)
+                assert len(idx) <= max(max_points, MIN_POINTS), (n, max_points, method)
+                assert idx[0] == 0 and idx[-1] == n - 1
+                assert list(idx) == sorted(set(idx.tolist()))
+    # max_points == 3 keeps the spike as the single inner row.
+    y = np.array([1.0, 1.0, 1.1, 9.0, 1.2, 1.0])
+    assert downsample_indices(np.arange(6.0), y, max_points=3, method="minmax").tolist() == [0, 3, 5]
+
+
+def test_dossier_responses_support_conditional_get(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    run_id, _card_id = _build_demo_evidence(tmp_path, monkeypatch)
+    client = TestClient(app)
+    d = tmp_path / "artifacts" / "dossiers" / run_id
+
+    # curve.csv is manifest-hashed: strong ETag + immutable caching, 304 on revalidation.
+    r = client.get(f"/runs/{run_id}/curve")
+    etag = r.headers["etag"]
+    assert r.status_code == 200 and etag.startswith('"') and "immutable" in r.headers["cache-control"]
+    r304 = client.get(f"/runs/{run_id}/curve", headers={"If-None-Match": etag})
+    assert r304.status_code == 304 and r304.content == b"" and r304.headers["etag"] == etag
+    assert client.get(f"/runs/{run_id}/curve", headers={"If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+    assert client.get(f"/runs/{run_id}/curve", params={"max_points": 10}, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(f"/runs/{run_id}/trades", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(f"/runs/{run_id}/curve", headers={"If-Modified-Since": r.headers["last-modified"]}).status_code == 304
+
+    # /runs/{id} includes gate_results.json (written after the manifest): revalidate, new ETag on change.
+    r = client.get(f"/runs/{run_id}")
+    etag = r.headers["etag"]
+    assert r.headers["cache-control"] == "no-cache"
+    assert client.get(f"/runs/{run_id}", headers={"If-None-Match": etag}).status_code == 304
+    gp = d / "gate_results.json"
+    st = gp.stat()
+    gp.write_text(gp.read_text(encoding="utf-8") + " ", encoding="utf-8")
+    os.utime(gp, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    r = client.get(f"/runs/{run_id}", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.headers["etag"] != etag
+
+    # Artifacts listing, diagnostics listing and the UI run page.
+    for url in (f"/runs/{run_id}/artifacts", f"/runs/{run_id}/diagnostics", f"/ui/runs/{run_id}"):
+        r = client.get(url)
+        assert r.status_code == 200, url
+        assert client.get(url, headers={"If-None-Match": r.headers["etag"]}).status_code == 304, url
+    ui_etag = client.get(f"/ui/runs/{run_id}").headers["etag"]
+    (d / "diagnostics").mkdir(exist_ok=True)
+    (d / "diagnostics" / "note.txt").write_text("x", encoding="utf-8")
+    assert client.get(f"/ui/runs/{run_id}", headers={"If-None-Match": ui_etag}).status_code == 200
+
+    # The tree listing cache sees entries added to an existing subdirectory (its mtime changes).
+    ui_etag = client.get(f"/ui/runs/{run_id}").headers["etag"]
+    (d / "diagnostics" / "note2.txt").write_text("y", encoding="utf-8")
+    assert client.get(f"/ui/runs/{run_id}", headers={"If-None-Match": ui_etag}).status_code == 200
+
+    # Files the page does not read do not change its ETag; the candle snapshot data does.
+    ui_etag = client.get(f"/ui/runs/{run_id}").headers["etag"]
+    (d / "unrelated.txt").write_text("z", encoding="utf-8")
+    assert client.get(f"/ui/runs/{run_id}", headers={"If-None-Match": ui_etag}).status_code == 304
+    snap_id = json.loads((d / "dossier_manifest.json").read_text(encoding="utf-8"))["data_snapshot_id"]
+    ohlcv = tmp_path / "data" / "lake" / snap_id / "ohlcv_1d.csv"
+    st = ohlcv.stat()
+    os.utime(ohlcv, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert client.get(f"/ui/runs/{run_id}", headers={"If-None-Match": ui_etag}).status_code == 200